@@ -2,6 +2,7 @@ from .data import Data
 from .lineage import CellLineage, CycleLineage
 from .model import Model
 from .model_metadata import ModelMetadata
+from .neighbor_graph import NeighborGraph
 from .property import Property
 from .property_calculator import (
     EdgeGlobalPropCalculator,
@@ -19,6 +20,7 @@ __all__ = [
     "Property",
     "PropsMetadata",
     "Model",
+    "NeighborGraph",
     "NodeLocalPropCalculator",
     "EdgeLocalPropCalculator",
     "LineageLocalPropCalculator",
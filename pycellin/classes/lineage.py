@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import warnings
 from abc import ABCMeta, abstractmethod
-from itertools import pairwise
-from typing import Any, Generator, Literal, Tuple
+from itertools import combinations, pairwise
+from typing import Any, Callable, Generator, Literal, Tuple
 
 import networkx as nx
+import numpy as np
 import plotly.graph_objects as go
 from igraph import Graph
 
@@ -19,6 +20,43 @@ from pycellin.classes.exceptions import (
 from pycellin.classes.property import Property
 from pycellin.custom_types import PropertyType
 
+# Named operations of `Lineage.scan()` and `Lineage.reduce_subtree()`.
+_SCAN_OPS = {
+    "sum": np.add,
+    "prod": np.multiply,
+    "max": np.maximum,
+    "min": np.minimum,
+}
+
+
+def _get_scan_op(op: str | Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """
+    Return the binary operation to use in a scan or a reduction.
+
+    Parameters
+    ----------
+    op : str or Callable[[Any, Any], Any]
+        Name of the operation ("sum", "prod", "max", "min") or binary function.
+
+    Returns
+    -------
+    Callable[[Any, Any], Any]
+        The binary function.
+
+    Raises
+    ------
+    ValueError
+        If the name of the operation is unknown.
+    """
+    if not isinstance(op, str):
+        return op
+    try:
+        return _SCAN_OPS[op]
+    except KeyError:
+        raise ValueError(
+            f"Unknown operation: '{op}'. Should be one of: {', '.join(_SCAN_OPS)}."
+        ) from None
+
 
 class Lineage(nx.DiGraph, metaclass=ABCMeta):
     """
@@ -248,6 +286,355 @@ class Lineage(nx.DiGraph, metaclass=ABCMeta):
         """
         return [n for n in self.nodes() if self.in_degree(n) > 1]  # type: ignore
 
+    def _get_tree_arrays(self) -> tuple[list[int], np.ndarray, np.ndarray]:
+        """
+        Traverse the lineage from its roots and return it as arrays.
+
+        The lineage is decomposed into chains, i.e. maximal paths of nodes
+        with a single child. Nodes are returned in topological order,
+        with the nodes of each chain stored contiguously.
+
+        Returns
+        -------
+        tuple[list[int], np.ndarray, np.ndarray]
+            The node IDs, the index of the parent of each node in this order
+            (-1 for roots), and the index of the first node of each chain
+            followed by the number of nodes.
+
+        Raises
+        ------
+        FusionError
+            If a node of the lineage has more than one parent.
+        """
+        lid = self.graph.get("lineage_ID")
+        # The adjacency dicts of the graph are used directly since going through
+        # the networkx views dominates the cost of the traversal.
+        succ = self._succ
+        roots = [n for n, pred in self._pred.items() if not pred]
+        nodes: list[int] = []
+        parents: list[int] = []
+        starts: list[int] = []
+        index: dict[int, int] = {}
+        stack = [(root, -1) for root in reversed(roots)]
+        while stack:
+            nid, parent = stack.pop()
+            starts.append(len(nodes))
+            while True:
+                if nid in index:
+                    raise FusionError(nid, lid)
+                index[nid] = len(nodes)
+                nodes.append(nid)
+                parents.append(parent)
+                children = list(succ[nid])
+                if len(children) != 1:
+                    break
+                parent = index[nid]
+                nid = children[0]
+            stack.extend((child, index[nid]) for child in reversed(children))
+        if len(nodes) != len(self):
+            # Nodes unreachable from a root belong to a cycle, so one of
+            # them has more than one parent.
+            fusion = next(n for n in self.nodes() if n not in index)
+            raise FusionError(fusion, lid)
+        starts.append(len(nodes))
+        return nodes, np.array(parents, dtype=np.intp), np.array(starts, dtype=np.intp)
+
+    def _get_prop_array(
+        self,
+        nodes: list[int],
+        parents: np.ndarray,
+        prop: str | None,
+        on: Literal["node", "edge"],
+    ) -> np.ndarray:
+        """
+        Gather the values of a property in an array, in the order of the given nodes.
+
+        Parameters
+        ----------
+        nodes : list[int]
+            IDs of the nodes.
+        parents : np.ndarray
+            Index of the parent of each node, -1 for roots.
+        prop : str | None
+            Identifier of the property, or None to use 1 for each node.
+        on : {"node", "edge"}
+            Type of the property. The value of an edge property for a node
+            is the value of its incoming edge, None for roots.
+
+        Returns
+        -------
+        np.ndarray
+            Values of the property.
+        """
+        if prop is None:
+            return np.ones(len(nodes), dtype=np.int64)
+        if on == "node":
+            attrs = self._node
+            values = [attrs[nid][prop] for nid in nodes]
+        else:
+            succ = self._succ
+            values = [
+                None if p < 0 else succ[nodes[p]][nid][prop]
+                for nid, p in zip(nodes, parents)
+            ]
+        arr = np.array(values, dtype=object if on == "edge" else None)
+        if arr.dtype == bool:
+            arr = arr.astype(np.int64)
+        return arr
+
+    def get_tree_levels(self) -> dict[int, tuple[int, int]]:
+        """
+        Return the depth and the generation of all the nodes of the lineage.
+
+        The depth of a node is its number of ancestors, and its generation
+        the number of divisions among its ancestors. Both are computed
+        in a single traversal of the lineage from its roots.
+
+        Returns
+        -------
+        dict[int, tuple[int, int]]
+            The depth and the generation of each node.
+
+        Raises
+        ------
+        FusionError
+            If a node of the lineage has more than one parent.
+        """
+        nodes, parents, starts = self._get_tree_arrays()
+        depths = np.empty(len(nodes), dtype=np.int64)
+        generations = np.empty(len(nodes), dtype=np.int64)
+        for start, end in pairwise(starts):
+            # Nodes of a chain have a single child, so only the first node
+            # of a chain can follow a division.
+            parent = parents[start]
+            if parent < 0:
+                depth, generation = 0, 0
+            else:
+                depth, generation = depths[parent] + 1, generations[parent] + 1
+            depths[start:end] = np.arange(depth, depth + end - start)
+            generations[start:end] = generation
+        return dict(zip(nodes, zip(depths.tolist(), generations.tolist())))
+
+    def scan(
+        self,
+        prop: str | None = None,
+        op: str | Callable[[Any, Any], Any] = "sum",
+        on: Literal["node", "edge"] = "node",
+        initial: Any = None,
+    ) -> dict[int, Any]:
+        """
+        Accumulate the values of a property along the paths from the root to the leaves.
+
+        The value of a node is `op(value of its parent, property value of the node)`.
+        This is a prefix scan: with `op="sum"`, each node gets the sum of the
+        property values of its ancestors and of itself. All the nodes are computed
+        in a single pass over the lineage. Named operations and numpy ufuncs are
+        applied to whole chains of nodes without division at once.
+
+        Parameters
+        ----------
+        prop : str, optional
+            Identifier of the property to accumulate. If None, each node has
+            a value of 1, e.g. `scan()` gives the depth of each node plus one.
+        op : str or Callable[[Any, Any], Any], optional
+            Binary operation: "sum", "prod", "max", "min", a binary numpy ufunc
+            or any function of two arguments. "sum" by default.
+        on : {"node", "edge"}, optional
+            Type of the property. For an edge property, the value of a node
+            is accumulated from the value of its incoming edge. "node" by default.
+        initial : Any, optional
+            Value accumulated before the root. Required for edge properties
+            when `op` has no identity element (e.g. "max").
+
+        Returns
+        -------
+        dict[int, Any]
+            The accumulated value of each node.
+
+        Raises
+        ------
+        FusionError
+            If a node of the lineage has more than one parent.
+        ValueError
+            If `on` is invalid, or if `initial` is required but not provided.
+
+        Examples
+        --------
+        Cumulative displacement of the cells since the root:
+        >>> lineage.scan("cell_displacement", on="edge")
+        Maximum area of the cells since the root:
+        >>> lineage.scan("cell_area", op="max")
+        """
+        if on not in ("node", "edge"):
+            raise ValueError(f"`on` must be 'node' or 'edge', not '{on}'.")
+        ufunc = _get_scan_op(op)
+        nodes, parents, starts = self._get_tree_arrays()
+        values = self._get_prop_array(nodes, parents, prop, on)
+        roots = parents < 0
+        if on == "edge":
+            if initial is None:
+                if getattr(ufunc, "identity", None) is None:
+                    raise ValueError(
+                        "`initial` must be provided to scan an edge property "
+                        "with an operation that has no identity element."
+                    )
+                initial = ufunc.identity
+            values[roots] = initial
+        elif initial is not None:
+            values[roots] = [ufunc(initial, v) for v in values[roots]]
+
+        if isinstance(ufunc, np.ufunc):
+            if on == "edge":
+                values = np.array(values.tolist())
+            for start, end in pairwise(starts):
+                # The operation is associative, so a chain can be accumulated
+                # on its own and then combined with the value of its parent.
+                chain = ufunc.accumulate(values[start:end])
+                parent = parents[start]
+                values[start:end] = chain if parent < 0 else ufunc(values[parent], chain)
+            return dict(zip(nodes, values.tolist()))
+        values_list = values.tolist()
+        for i in np.flatnonzero(~roots):
+            values_list[i] = ufunc(values_list[parents[i]], values_list[i])
+        return dict(zip(nodes, values_list))
+
+    def reduce_subtree(
+        self,
+        prop: str | None = None,
+        op: str | Callable[[Any, Any], Any] = "sum",
+    ) -> dict[int, Any]:
+        """
+        Reduce the values of a node property over the subtree rooted at each node.
+
+        The value of a node is the reduction with `op` of the property values
+        of the node and of all its descendants. All the nodes are computed
+        in a single pass over the lineage, from the leaves to the root.
+        Named operations and numpy ufuncs are applied to whole chains of nodes
+        without division at once.
+
+        Parameters
+        ----------
+        prop : str, optional
+            Identifier of the node property to reduce. If None, each node has
+            a value of 1, e.g. `reduce_subtree()` gives the number of nodes
+            in the subtree of each node.
+        op : str or Callable[[Any, Any], Any], optional
+            Binary operation: "sum", "prod", "max", "min", a binary numpy ufunc
+            or any function of two arguments. It must be commutative
+            and associative. "sum" by default.
+
+        Returns
+        -------
+        dict[int, Any]
+            The reduced value of each node.
+
+        Raises
+        ------
+        FusionError
+            If a node of the lineage has more than one parent.
+
+        Examples
+        --------
+        Number of descendants of each cell:
+        >>> {nid: n - 1 for nid, n in lineage.reduce_subtree().items()}
+        Last timepoint reached by the progeny of each cell:
+        >>> lineage.reduce_subtree("frame", op="max")
+        """
+        ufunc = _get_scan_op(op)
+        nodes, parents, starts = self._get_tree_arrays()
+        values = self._get_prop_array(nodes, parents, prop, "node")
+        if isinstance(ufunc, np.ufunc):
+            # Chains are processed from the leaves, so the last node of a chain
+            # already holds the reduction of its children chains.
+            for start, end in reversed(list(pairwise(starts))):
+                values[start:end] = ufunc.accumulate(values[start:end][::-1])[::-1]
+                parent = parents[start]
+                if parent >= 0:
+                    values[parent] = ufunc(values[parent], values[start])
+            return dict(zip(nodes, values.tolist()))
+        values_list = values.tolist()
+        for i in reversed(np.flatnonzero(parents >= 0)):
+            values_list[parents[i]] = ufunc(values_list[parents[i]], values_list[i])
+        return dict(zip(nodes, values_list))
+
+    def _get_cycle_arrays(self) -> tuple[list[int], list[int], list[int]]:
+        """
+        Return the cell cycles of the lineage and the index of their mother cycle.
+
+        In a cell lineage, the cell cycles are the chains of nodes
+        of `_get_tree_arrays()`.
+
+        Returns
+        -------
+        tuple[list[int], list[int], list[int]]
+            The first and the last node of each cell cycle, and the index
+            of the mother cycle of each cycle (-1 for root cycles).
+        """
+        nodes, parents, starts = self._get_tree_arrays()
+        heads = starts[:-1]
+        chain_of_node = np.repeat(np.arange(len(heads)), np.diff(starts))
+        head_parents = parents[heads]
+        mothers = np.where(head_parents >= 0, chain_of_node[head_parents], -1)
+        firsts = [nodes[i] for i in heads.tolist()]
+        lasts = [nodes[i] for i in (starts[1:] - 1).tolist()]
+        return firsts, lasts, mothers.tolist()
+
+    def get_related_pairs(
+        self,
+        relation: Literal["mother-daughter", "sisters", "cousins"] = "mother-daughter",
+    ) -> tuple[list[int], list[int]]:
+        """
+        Return all the pairs of related cell cycles of the lineage.
+
+        Pairs are built from the mother cycle of each cell cycle, computed
+        in a single traversal of the lineage. Sisters are cell cycles sharing
+        the same mother, and cousins cell cycles whose mothers are sisters.
+        Each pair of sisters or cousins is returned once.
+
+        Parameters
+        ----------
+        relation : {"mother-daughter", "sisters", "cousins"}, optional
+            Relation between the cell cycles of a pair. "mother-daughter" by default.
+
+        Returns
+        -------
+        tuple[list[int], list[int]]
+            The node IDs of the first and of the second member of each pair.
+            In a cell lineage, a mother is represented by its last cell,
+            i.e. the dividing cell, and other cell cycles by their first cell.
+
+        Raises
+        ------
+        ValueError
+            If the relation is not supported.
+        FusionError
+            If a node of the lineage has more than one parent.
+        """
+        if relation not in ("mother-daughter", "sisters", "cousins"):
+            raise ValueError(
+                f"Unknown relation '{relation}'. "
+                "Expected 'mother-daughter', 'sisters' or 'cousins'."
+            )
+        firsts, lasts, mothers = self._get_cycle_arrays()
+        daughters: dict[int, list[int]] = {}
+        for cycle, mother in enumerate(mothers):
+            if mother >= 0:
+                daughters.setdefault(mother, []).append(cycle)
+        if relation == "mother-daughter":
+            pairs = [(m, d) for m, ds in daughters.items() for d in ds]
+            return [lasts[m] for m, _ in pairs], [firsts[d] for _, d in pairs]
+        if relation == "sisters":
+            pairs = [pair for ds in daughters.values() for pair in combinations(ds, 2)]
+        else:
+            pairs = [
+                (c1, c2)
+                for ds in daughters.values()
+                for s1, s2 in combinations(ds, 2)
+                for c1 in daughters.get(s1, [])
+                for c2 in daughters.get(s2, [])
+            ]
+        return [firsts[a] for a, _ in pairs], [firsts[b] for _, b in pairs]
+
     def _get_nodes_position(self, positions: dict) -> tuple[list, list]:
         """Extract x and y coordinates from positions dict."""
         x_nodes = [x for (x, _) in positions.values()]
@@ -1710,12 +2097,15 @@ class CycleLineage(Lineage):
                     )
                     + 1
                 ) * time_step
-                root = self.get_root()
-                if isinstance(root, list):
-                    raise LineageStructureError(
-                        "A cycle lineage cannot have multiple roots."
-                    )
-                self.nodes[n]["level"] = nx.shortest_path_length(self, root, n)
+
+            # Levels of all the cell cycles are computed in a single traversal.
+            root = self.get_root()
+            if isinstance(root, list) and len(root) > 1:
+                raise LineageStructureError(
+                    "A cycle lineage cannot have multiple roots."
+                )
+            for n, (level, _) in self.get_tree_levels().items():
+                self.nodes[n]["level"] = level
 
     def __str__(self) -> str:
         name_txt = f" named {self.graph['name']}" if "name" in self.graph else ""
@@ -1727,6 +2117,21 @@ class CycleLineage(Lineage):
 
     # Methods to freeze / unfreeze?
 
+    def _get_cycle_arrays(self) -> tuple[list[int], list[int], list[int]]:
+        """
+        Return the cell cycles of the lineage and the index of their mother cycle.
+
+        In a cycle lineage, each node is a cell cycle.
+
+        Returns
+        -------
+        tuple[list[int], list[int], list[int]]
+            The node IDs of the cell cycles, twice, and the index of the mother
+            cycle of each cycle (-1 for the root cycle).
+        """
+        nodes, parents, _ = self._get_tree_arrays()
+        return nodes, nodes, parents.tolist()
+
     def get_ancestors(self, ccid: int, sorted=True) -> list[int]:
         """
         Return all the ancestor cell cycles of a given cell cycle.
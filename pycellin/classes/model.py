@@ -6,22 +6,33 @@ import warnings
 from decimal import Decimal
 from itertools import pairwise
 from math import gcd
+from pathlib import Path
 from typing import Any, Callable, Literal, TypeVar
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 
 import pycellin.graph.properties.morphology as morpho
 import pycellin.graph.properties.motion as motion
+import pycellin.graph.properties.neighborhood as neighborhood
+import pycellin.graph.properties.shape as shape
 import pycellin.graph.properties.tracking as tracking
 import pycellin.graph.properties.utils as futils
 from pycellin.classes.data import Data
-from pycellin.classes.exceptions import FusionError, ProtectedPropertyError
+from pycellin.classes.exceptions import (
+    FusionError,
+    ProtectedPropertyError,
+    TimeFlowError,
+)
 from pycellin.classes.lineage import CellLineage, CycleLineage, Lineage
 from pycellin.classes.model_metadata import ModelMetadata
+from pycellin.classes.neighbor_graph import NeighborGraph
 from pycellin.classes.property import Property
 from pycellin.classes.property_calculator import PropertyCalculator
 from pycellin.classes.props_metadata import PropsMetadata
+from pycellin.classes.snapshot import LazyLineages, read_snapshot, write_snapshot
+from pycellin.classes.update_report import UpdateReport
 from pycellin.classes.updater import ModelUpdater
 from pycellin.custom_types import Cell, Link, PropertyType, property_type_from_string
 from pycellin.graph.properties.core import (
@@ -29,6 +40,10 @@ from pycellin.graph.properties.core import (
     create_timepoint_property,
 )
 from pycellin.graph.properties.topology import (
+    Depth,
+    create_depth_property,
+    Generation,
+    create_generation_property,
     IsDivision,
     create_is_division_property,
     IsLeaf,
@@ -166,6 +181,7 @@ class Model:
         )
         self._updater = ModelUpdater()
         self.variable_time_step = variable_time_step
+        self.neighbor_graph: NeighborGraph | None = None
 
         # Update to actually compute the "timepoint" property.
         if self.data.cell_data and "timepoint" not in self.get_node_properties():
@@ -279,6 +295,8 @@ class Model:
         """
         if "model_metadata" in state and isinstance(state["model_metadata"], dict):
             state["model_metadata"] = ModelMetadata.from_dict(state["model_metadata"])
+        # Models pickled before the introduction of the neighbor graph.
+        state.setdefault("neighbor_graph", None)
         self.__dict__.update(state)
 
     @property
@@ -1019,7 +1037,8 @@ class Model:
         Check if the model requires an update.
 
         The model requires an update if new properties have been added to the model,
-        or if cells, links or lineages have been added or removed.
+        if cells, links or lineages have been added or removed, or if property
+        values have been modified with `set_cell_props()` or `set_link_props()`.
         In that case, some properties need to be recomputed to account for the changes.
 
         Returns
@@ -1029,7 +1048,9 @@ class Model:
         """
         return self._updater._update_required
 
-    def update(self, props_to_update: list[str] | None = None) -> None:
+    def update(
+        self, props_to_update: list[str] | None = None, profile: bool = False
+    ) -> UpdateReport | None:
         """
         Bring the model up to date by recomputing properties.
 
@@ -1040,6 +1061,16 @@ class Model:
         ----------
         props_to_update : list[str], optional
             List of properties to update. If None, all properties are updated.
+        profile : bool, optional
+            If True, measure the time spent in each phase of the update and
+            in each property calculator (default is False).
+
+        Returns
+        -------
+        UpdateReport | None
+            If `profile` is True and the update was performed, a report containing
+            the profiling information. It can be printed or converted to a DataFrame
+            with `to_dataframe()`. None otherwise.
 
         Warns
         -----
@@ -1053,7 +1084,7 @@ class Model:
         """
         if not self._updater._update_required:
             warnings.warn("Model is already up to date.")
-            return
+            return None
 
         if props_to_update is not None:
             missing_props = [
@@ -1073,7 +1104,7 @@ class Model:
                     warnings.warn(
                         "No properties to update. The model will not be updated."
                     )
-                    return
+                    return None
 
         # self.data._freeze_lineage_data()
 
@@ -1089,15 +1120,19 @@ class Model:
                 "The time step of the model is currently not defined "
                 "but is required for cycle lineage computation."
             )
+        report = UpdateReport() if profile else None
         self._updater._update(
             self.data,
             time_prop=self.model_metadata.reference_time_property,
             time_step=time_step,
             props_to_update=props_to_update,
+            report=report,
         )
 
         # self.data._unfreeze_lineage_data()
 
+        return report
+
     def add_lineage(
         self,
         lineage: CellLineage | None = None,
@@ -1371,11 +1406,19 @@ class Model:
         except KeyError as err:
             raise KeyError(f"Lineage with ID {lid} does not exist.") from err
 
+        # The links of the cell are removed along with it.
+        removed_links = []
+        if cid in lineage:
+            removed_links = [
+                Link(source, target, lid)
+                for source, target in [*lineage.in_edges(cid), *lineage.out_edges(cid)]
+            ]
         cell_attrs = lineage._remove_cell(cid)
 
         # Notify that an update of the property values may be required.
         self._updater._update_required = True
         self._updater._removed_cells.add(Cell(cid, lid))
+        self._updater._removed_links.update(removed_links)
         self._updater._modified_lineages.add(lid)
 
         return cell_attrs
@@ -1483,6 +1526,137 @@ class Model:
 
         return link_attrs
 
+    def _check_settable_props(self, prop_values: dict[str, Any]) -> None:
+        """
+        Check that property values can be set on existing objects.
+
+        Parameters
+        ----------
+        prop_values : dict[str, Any]
+            A dictionary containing the property values to set.
+
+        Raises
+        ------
+        KeyError
+            If a property in the prop_values is not declared.
+        ProtectedPropertyError
+            If a property in the prop_values is protected.
+        """
+        for prop in prop_values:
+            if not self.props_metadata._has_prop(prop):
+                raise KeyError(f"The property {prop} has not been declared.")
+            if prop in self.props_metadata._get_protected_props():
+                raise ProtectedPropertyError(prop)
+
+    def set_cell_props(self, cid: int, lid: int, prop_values: dict[str, Any]) -> None:
+        """
+        Set property values of a cell.
+
+        The modified properties are recorded so that the next update only recomputes
+        the properties that depend on them, and only for the impacted objects.
+        Modifying the reference time property of a cell is considered
+        as a modification of the structure of its lineage.
+
+        Parameters
+        ----------
+        cid : int
+            The ID of the cell to modify.
+        lid : int
+            The ID of the lineage to which the cell belongs.
+        prop_values : dict[str, Any]
+            A dictionary containing the new property values of the cell.
+
+        Raises
+        ------
+        KeyError
+            If the lineage or the cell does not exist in the model.
+        KeyError
+            If a property in the prop_values is not declared.
+        ProtectedPropertyError
+            If a property in the prop_values is protected.
+        TimeFlowError
+            If the new time value is not between the time values
+            of the parent and the children of the cell.
+        """
+        try:
+            lineage = self.data.cell_data[lid]
+        except KeyError as err:
+            raise KeyError(f"Lineage with ID {lid} does not exist.") from err
+        if cid not in lineage:
+            raise KeyError(f"Cell {cid} does not exist in lineage {lid}.")
+        self._check_settable_props(prop_values)
+
+        time_prop = self.model_metadata.reference_time_property
+        if time_prop in prop_values:
+            time_value = prop_values[time_prop]
+            for pred in lineage.predecessors(cid):
+                if lineage.nodes[pred][time_prop] >= time_value:
+                    raise TimeFlowError(pred, cid, lid, lid)
+            for succ in lineage.successors(cid):
+                if time_value >= lineage.nodes[succ][time_prop]:
+                    raise TimeFlowError(cid, succ, lid, lid)
+
+        lineage.nodes[cid].update(prop_values)
+
+        # Notify that an update of the property values may be required.
+        self._updater._update_required = True
+        modified_props = self._updater._modified_cell_props.setdefault(
+            Cell(cid, lid), set()
+        )
+        modified_props.update(prop_values)
+        if time_prop in prop_values:
+            # Time values define the cell cycles duration.
+            self._updater._modified_lineages.add(lid)
+
+    def set_link_props(
+        self, source_cid: int, target_cid: int, lid: int, prop_values: dict[str, Any]
+    ) -> None:
+        """
+        Set property values of a link.
+
+        The modified properties are recorded so that the next update only recomputes
+        the properties that depend on them, and only for the impacted objects.
+
+        Parameters
+        ----------
+        source_cid : int
+            The ID of the source cell.
+        target_cid : int
+            The ID of the target cell.
+        lid : int
+            The ID of the lineage to which the cells belong.
+        prop_values : dict[str, Any]
+            A dictionary containing the new property values of the link.
+
+        Raises
+        ------
+        KeyError
+            If the lineage or the link does not exist in the model.
+        KeyError
+            If a property in the prop_values is not declared.
+        ProtectedPropertyError
+            If a property in the prop_values is protected.
+        """
+        try:
+            lineage = self.data.cell_data[lid]
+        except KeyError as err:
+            raise KeyError(f"Lineage with ID {lid} does not exist.") from err
+        if not lineage.has_edge(source_cid, target_cid):
+            raise KeyError(
+                f"Link from cell {source_cid} to cell {target_cid} "
+                f"does not exist in lineage {lid}."
+            )
+        self._check_settable_props(prop_values)
+
+        lineage.edges[source_cid, target_cid].update(prop_values)
+
+        # Notify that an update of the property values may be required.
+        self._updater._update_required = True
+        modified_props = self._updater._modified_link_props.setdefault(
+            Link(source_cid, target_cid, lid), set()
+        )
+        modified_props.update(prop_values)
+
     def get_fusions(self, lids: list[int] | None = None) -> list[Cell]:
         """
         Return fusion cells, i.e. cells with more than one parent.
@@ -1553,6 +1727,246 @@ class Model:
                 divisions.extend([Cell(cell_ID, lin_ID) for cell_ID in tmp])
         return divisions
 
+    def paired_values(
+        self,
+        prop: str,
+        relation: Literal["mother-daughter", "sisters", "cousins"] = "mother-daughter",
+        level: Literal["cycle", "cell"] = "cycle",
+        lids: list[int] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the values of a property for all the pairs of related cells.
+
+        Pairs are built from the mother cycle of each cell cycle, computed
+        in a single traversal of each lineage. Sisters are cell cycles sharing
+        the same mother, and cousins cell cycles whose mothers are sisters.
+        Each pair of sisters or cousins is returned once.
+
+        Parameters
+        ----------
+        prop : str
+            Identifier of the node property to pair.
+        relation : {"mother-daughter", "sisters", "cousins"}, optional
+            Relation between the members of a pair. "mother-daughter" by default.
+        level : {"cycle", "cell"}, optional
+            "cycle" to pair a property of the cycle lineages, "cell" to pair
+            a property of the cell lineages. At the cell level, a mother is
+            represented by its dividing cell, and the other members of a pair
+            by the first cell of their cell cycle. "cycle" by default.
+        lids : list[int], optional
+            IDs of the lineages to consider. If not specified, all lineages
+            are considered (default is None).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Aligned arrays of the values of the first and of the second member
+            of each pair, e.g. the mother and the daughter.
+
+        Raises
+        ------
+        ValueError
+            If the relation or the level is not supported, or if the level is
+            "cycle" and the cycle lineages have not been computed yet.
+        KeyError
+            If a lineage with the specified ID does not exist in the model.
+
+        Examples
+        --------
+        Mother-daughter correlation of the cell cycle duration:
+        >>> mothers, daughters = model.paired_values("cycle_duration")
+        >>> np.corrcoef(mothers, daughters)
+        """
+        if level == "cycle":
+            if not self.data.cycle_data:
+                raise ValueError(
+                    "The cycle lineages have not been computed yet. "
+                    "Please compute the cycle lineages first with "
+                    "`model.add_cycle_data()`."
+                )
+            lineages: dict[int, Lineage] = self.data.cycle_data  # type: ignore
+        elif level == "cell":
+            lineages = self.data.cell_data  # type: ignore
+        else:
+            raise ValueError(f"Unknown level '{level}'. Expected 'cycle' or 'cell'.")
+        if lids is None:
+            lids = list(lineages.keys())
+        firsts = []
+        seconds = []
+        for lin_ID in lids:
+            try:
+                lineage = lineages[lin_ID]
+            except KeyError as err:
+                msg = f"Lineage with ID {lin_ID} does not exist."
+                raise KeyError(msg) from err
+            first_nids, second_nids = lineage.get_related_pairs(relation)
+            firsts.extend(lineage.nodes[nid][prop] for nid in first_nids)
+            seconds.extend(lineage.nodes[nid][prop] for nid in second_nids)
+        return np.array(firsts), np.array(seconds)
+
+    def ensemble_msd(
+        self,
+        lids: list[int] | None = None,
+        max_lag: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the ensemble mean squared displacement (MSD) of the cell cycles.
+
+        The squared displacements of all the cell cycles are averaged
+        for each lag, so that each displacement has the same weight.
+        The MSD of each cell cycle is computed with FFTs, and gaps
+        in the detections are taken into account through the reference time
+        property of the model.
+
+        Parameters
+        ----------
+        lids : list[int], optional
+            IDs of the lineages to consider. If not specified, all lineages
+            are considered (default is None).
+        max_lag : int, optional
+            Largest lag to compute, in number of time steps. If None, all lags are
+            computed.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The lag times, in the unit of the reference time property,
+            and the MSD for each lag, NaN for lags without data.
+
+        Raises
+        ------
+        ValueError
+            If the cycle lineages have not been computed yet.
+        KeyError
+            If a lineage with the specified ID does not exist in the model.
+        """
+        if not self.data.cycle_data:
+            raise ValueError(
+                "The cycle lineages have not been computed yet. "
+                "Please compute the cycle lineages first with "
+                "`model.add_cycle_data()`."
+            )
+        time_step = self.model_metadata.time_step
+        if time_step is None:
+            raise ValueError("The time step of the model is currently not defined.")
+        if lids is None:
+            lids = list(self.data.cycle_data.keys())
+        sums = np.zeros(0)
+        counts = np.zeros(0)
+        for lin_ID in lids:
+            try:
+                lineage = self.data.cycle_data[lin_ID]
+            except KeyError as err:
+                msg = f"Lineage with ID {lin_ID} does not exist."
+                raise KeyError(msg) from err
+            lin_sums, lin_counts = motion.get_cycles_correlation_sums(
+                "msd",
+                self.data,
+                lineage,
+                list(lineage.nodes),
+                self.reference_time_property,
+                time_step,
+                max_lag,
+            )
+            sums, counts = motion._add_sums(sums, counts, lin_sums, lin_counts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            msd = np.where(counts > 0, sums / counts, np.nan)
+        return np.arange(len(msd)) * time_step, msd
+
+    def build_neighbor_graph(
+        self,
+        method: Literal["delaunay", "contact"] = "delaunay",
+        ndim: Literal[2, 3] = 2,
+        max_distance: float | None = None,
+        tolerance: float = 0.0,
+        custom_time_property: str | None = None,
+    ) -> NeighborGraph:
+        """
+        Build the spatial neighbor graph of the cells of each timepoint.
+
+        The graph links cells of the same timepoint, across all lineages.
+        It is stored in the `neighbor_graph` attribute of the model as CSR
+        arrays, one set per timepoint, and not as edges of the lineages.
+        It is a snapshot of the current cells: it must be rebuilt after
+        a modification of the cells or of their positions.
+
+        Parameters
+        ----------
+        method : {"delaunay", "contact"}, optional
+            "delaunay" links the cells sharing an edge of the Delaunay
+            triangulation of the cell centroids. "contact" links the cells
+            whose ROIs touch. "delaunay" by default.
+        ndim : {2, 3}, optional
+            Number of spatial dimensions of the triangulation. Only used with
+            the "delaunay" method. 2 by default.
+        max_distance : float, optional
+            Largest distance between the centroids of two neighbors.
+            Only used with the "delaunay" method. No limit by default.
+        tolerance : float, optional
+            Largest distance between two ROIs considered as a contact.
+            Only used with the "contact" method. 0 by default.
+        custom_time_property : str, optional
+            Identifier of the time property used to group cells by timepoint.
+            If None, the reference time property of the model is used.
+
+        Returns
+        -------
+        NeighborGraph
+            The neighbor graph of the cells.
+
+        Raises
+        ------
+        ValueError
+            If the method is not supported.
+        KeyError
+            If the time property has not been declared.
+        """
+        time_prop = self._get_time_property(custom_time_property).identifier
+        if method == "delaunay":
+            graph = NeighborGraph.from_delaunay(
+                self.data, time_prop, ndim, max_distance
+            )
+        elif method == "contact":
+            graph = NeighborGraph.from_roi_contacts(self.data, time_prop, tolerance)
+        else:
+            raise ValueError(
+                f"Unsupported method '{method}'. "
+                "Supported methods are 'delaunay' and 'contact'."
+            )
+        self.neighbor_graph = graph
+        return graph
+
+    def neighbors(self, cid: int, lid: int) -> list[Cell]:
+        """
+        Return the spatial neighbors of a cell.
+
+        Parameters
+        ----------
+        cid : int
+            ID of the cell.
+        lid : int
+            ID of the lineage of the cell.
+
+        Returns
+        -------
+        list[Cell]
+            The cells of the same timepoint neighboring the cell. Each cell
+            is a named tuple: (cell_ID, lineage_ID).
+
+        Raises
+        ------
+        ValueError
+            If the neighbor graph has not been built yet.
+        KeyError
+            If the cell is not in the neighbor graph.
+        """
+        if self.neighbor_graph is None:
+            raise ValueError(
+                "The neighbor graph has not been built yet. "
+                "Please build it first with `model.build_neighbor_graph()`."
+            )
+        return self.neighbor_graph.neighbors(cid, lid)
+
     def add_custom_property(
         self,
         calculator: PropertyCalculator,
@@ -1840,6 +2254,21 @@ class Model:
         )
         self.add_custom_property(motion.CellDisplacement(prop))
 
+    def _get_rod_dimensions_cache(self) -> morpho.RodDimensionsCache:
+        """
+        Return the cache of cell dimensions shared by rod calculators.
+
+        Returns
+        -------
+        morpho.RodDimensionsCache
+            The cache of an already registered rod calculator if any,
+            a new cache otherwise.
+        """
+        for calc in self._updater._calculators.values():
+            if isinstance(calc, (morpho.RodWidth, morpho.RodLength)):
+                return calc.cache
+        return morpho.RodDimensionsCache()
+
     def add_rod_length(
         self,
         skel_algo: str = "zhang",
@@ -1849,6 +2278,8 @@ class Model:
         custom_identifier: str | None = None,
         custom_name: str | None = None,
         custom_description: str | None = None,
+        workers: int = 1,
+        progress: bool = False,
     ) -> None:
         prop = morpho.create_rod_length_property(
             custom_identifier=custom_identifier,
@@ -1867,6 +2298,9 @@ class Model:
             tolerance=tolerance,
             method_width=method_width,
             width_ignore_tips=width_ignore_tips,
+            cache=self._get_rod_dimensions_cache(),
+            workers=workers,
+            progress=progress,
         )
         self.add_custom_property(calc)
 
@@ -1924,6 +2358,8 @@ class Model:
         custom_identifier: str | None = None,
         custom_name: str | None = None,
         custom_description: str | None = None,
+        workers: int = 1,
+        progress: bool = False,
     ) -> None:
         prop = morpho.create_rod_width_property(
             custom_identifier=custom_identifier,
@@ -1942,139 +2378,393 @@ class Model:
             tolerance=tolerance,
             method_width=method_width,
             width_ignore_tips=width_ignore_tips,
+            cache=self._get_rod_dimensions_cache(),
+            workers=workers,
+            progress=progress,
         )
         self.add_custom_property(calc)
 
-    def add_division_rate(
+    def add_cell_area(
         self,
-        custom_time_property: str | None = None,
         custom_identifier: str | None = None,
         custom_name: str | None = None,
         custom_description: str | None = None,
     ) -> None:
         """
-        Add the division rate property to the model.
+        Add the cell area property to the model.
 
-        Division rate is defined as the number of divisions per time unit.
-        It is the inverse of the division time. By default, division rate
-        is given in the time unit of the model, but a custom time property can be
-        specified.
+        The area is computed from the ROI of the cells, in the spatial unit
+        of the model.
 
         Parameters
         ----------
-        custom_time_property : str, optional
-            Identifier of the time property to use for the computation.
-            If None, the reference time property of the model will be used.
         custom_identifier : str, optional
             New identifier for the property. If None, the identifier will be
-            "division_rate".
+            "cell_area".
         custom_name : str, optional
-            New name for the property. If None, the name will be "Division rate".
+            New name for the property. If None, the name will be "Cell area".
         custom_description : str, optional
             New description for the property. If None, the description will be
-            "Number of divisions per time unit".
+            "Area of the cell ROI".
         """
-        if custom_time_property is None:
-            time_prop = self.props_metadata.props.get(
-                self.model_metadata.reference_time_property
-            )
-        else:
-            time_prop = self.props_metadata.props.get(custom_time_property)
-        if time_prop is None:
-            time_prop = (
-                custom_time_property or self.model_metadata.reference_time_property
-            )
-            raise KeyError(f"The time property '{time_prop}' has not been declared.")
-
-        prop = tracking.create_division_rate_property(
+        prop = shape.create_cell_area_property(
             custom_identifier=custom_identifier,
             custom_name=custom_name,
             custom_description=custom_description,
-            unit=f"1/{time_prop.unit}",
+            unit=f"{self.model_metadata.space_unit or 'pixel'}^2",
         )
-        self.add_custom_property(tracking.DivisionRate(prop, time_prop.identifier))
+        self.add_custom_property(shape.CellArea(prop))
 
-    def add_division_time(
+    def add_cell_perimeter(
         self,
-        custom_time_property: str | None = None,
         custom_identifier: str | None = None,
         custom_name: str | None = None,
         custom_description: str | None = None,
     ) -> None:
         """
-        Add the division time property to the model.
+        Add the cell perimeter property to the model.
 
-        Division time is defined as the time elapsed between two successive divisions.
-        By default, division time is given in the time unit of the model,
-        but a custom time property can be specified.
+        The perimeter is computed from the ROI of the cells, in the spatial unit
+        of the model.
 
         Parameters
         ----------
-        custom_time_property : str, optional
-            Identifier of the time property to use for the computation.
-            If None, the reference time property of the model will be used.
         custom_identifier : str, optional
             New identifier for the property. If None, the identifier will be
-            "division_time".
+            "cell_perimeter".
         custom_name : str, optional
-            New name for the property. If None, the name will be "Division time".
+            New name for the property. If None, the name will be "Cell perimeter".
         custom_description : str, optional
             New description for the property. If None, the description will be
-            "Time elapsed between two successive divisions".
+            "Perimeter of the cell ROI".
         """
-        if custom_time_property is None:
-            time_prop = self.props_metadata.props.get(
-                self.model_metadata.reference_time_property
-            )
-        else:
-            time_prop = self.props_metadata.props.get(custom_time_property)
-        if time_prop is None:
-            time_prop = (
-                custom_time_property or self.model_metadata.reference_time_property
-            )
-            raise KeyError(f"The time property '{time_prop}' has not been declared.")
-
-        prop = tracking.create_division_time_property(
+        prop = shape.create_cell_perimeter_property(
             custom_identifier=custom_identifier,
             custom_name=custom_name,
             custom_description=custom_description,
-            dtype=time_prop.dtype,
-            unit=time_prop.unit,
+            unit=self.model_metadata.space_unit or "pixel",
         )
+        self.add_custom_property(shape.CellPerimeter(prop))
 
-        self.add_custom_property(tracking.DivisionTime(prop, time_prop.identifier))
-
-    def add_is_division(
+    def add_cell_solidity(
         self,
         custom_identifier: str | None = None,
         custom_name: str | None = None,
         custom_description: str | None = None,
     ) -> None:
         """
-        Add the is_division property to the model.
+        Add the cell solidity property to the model.
 
-        The is_division property is a boolean property that indicates whether the cell
-        is a division event, i.e. has more than one daughter cell.
+        The solidity is the ratio of the area of the cell ROI to the area
+        of its convex hull. It is 1 for convex cells.
 
         Parameters
         ----------
         custom_identifier : str, optional
             New identifier for the property. If None, the identifier will be
-            "is_division".
+            "cell_solidity".
         custom_name : str, optional
-            New name for the property. If None, the name will be "is division".
+            New name for the property. If None, the name will be "Cell solidity".
         custom_description : str, optional
             New description for the property. If None, the description will be
-            "Whether the cell is a division event, i.e. has more than one daughter cell".
+            "Ratio of the area of the cell ROI to the area of its convex hull".
         """
-        prop = create_is_division_property(
+        prop = shape.create_cell_solidity_property(
             custom_identifier=custom_identifier,
             custom_name=custom_name,
             custom_description=custom_description,
         )
+        self.add_custom_property(shape.CellSolidity(prop))
+
+    def add_cell_eccentricity(
+        self,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the cell eccentricity property to the model.
+
+        The eccentricity is the one of the ellipse with the same second moments
+        as the cell ROI. It is 0 for a disk and tends to 1 for elongated cells.
+
+        Parameters
+        ----------
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "cell_eccentricity".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Cell eccentricity".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Eccentricity of the ellipse with the same second moments as the cell ROI".
+        """
+        prop = shape.create_cell_eccentricity_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+        )
+        self.add_custom_property(shape.CellEccentricity(prop))
+
+    def add_min_rect_length(
+        self,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the minimum rectangle length property to the model.
+
+        The minimum rectangle length is the length of the longest side
+        of the minimum rotated rectangle enclosing the cell ROI.
+
+        Parameters
+        ----------
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "min_rect_length".
+        custom_name : str, optional
+            New name for the property. If None, the name will be
+            "Minimum rectangle length".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Length of the minimum rotated rectangle enclosing the cell ROI".
+        """
+        prop = shape.create_min_rect_length_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=self.model_metadata.space_unit or "pixel",
+        )
+        self.add_custom_property(shape.MinRectLength(prop))
+
+    def add_min_rect_width(
+        self,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the minimum rectangle width property to the model.
+
+        The minimum rectangle width is the length of the shortest side
+        of the minimum rotated rectangle enclosing the cell ROI.
+
+        Parameters
+        ----------
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "min_rect_width".
+        custom_name : str, optional
+            New name for the property. If None, the name will be
+            "Minimum rectangle width".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Width of the minimum rotated rectangle enclosing the cell ROI".
+        """
+        prop = shape.create_min_rect_width_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=self.model_metadata.space_unit or "pixel",
+        )
+        self.add_custom_property(shape.MinRectWidth(prop))
+
+    def add_depth(
+        self,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the depth property to the model.
+
+        The depth of a cell is its number of ancestors in the lineage.
+        Depth of the root is 0. Depths of all the cells of a lineage are computed
+        in a single traversal of the lineage.
+
+        Parameters
+        ----------
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "depth".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Depth".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Number of cells upstream of the current one in the lineage".
+        """
+        prop = create_depth_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+        )
+
+        self.add_custom_property(Depth(prop))
+
+    def add_division_rate(
+        self,
+        custom_time_property: str | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the division rate property to the model.
+
+        Division rate is defined as the number of divisions per time unit.
+        It is the inverse of the division time. By default, division rate
+        is given in the time unit of the model, but a custom time property can be
+        specified.
+
+        Parameters
+        ----------
+        custom_time_property : str, optional
+            Identifier of the time property to use for the computation.
+            If None, the reference time property of the model will be used.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "division_rate".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Division rate".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Number of divisions per time unit".
+        """
+        if custom_time_property is None:
+            time_prop = self.props_metadata.props.get(
+                self.model_metadata.reference_time_property
+            )
+        else:
+            time_prop = self.props_metadata.props.get(custom_time_property)
+        if time_prop is None:
+            time_prop = (
+                custom_time_property or self.model_metadata.reference_time_property
+            )
+            raise KeyError(f"The time property '{time_prop}' has not been declared.")
+
+        prop = tracking.create_division_rate_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=f"1/{time_prop.unit}",
+        )
+        self.add_custom_property(tracking.DivisionRate(prop, time_prop.identifier))
+
+    def add_division_time(
+        self,
+        custom_time_property: str | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the division time property to the model.
+
+        Division time is defined as the time elapsed between two successive divisions.
+        By default, division time is given in the time unit of the model,
+        but a custom time property can be specified.
+
+        Parameters
+        ----------
+        custom_time_property : str, optional
+            Identifier of the time property to use for the computation.
+            If None, the reference time property of the model will be used.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "division_time".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Division time".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Time elapsed between two successive divisions".
+        """
+        if custom_time_property is None:
+            time_prop = self.props_metadata.props.get(
+                self.model_metadata.reference_time_property
+            )
+        else:
+            time_prop = self.props_metadata.props.get(custom_time_property)
+        if time_prop is None:
+            time_prop = (
+                custom_time_property or self.model_metadata.reference_time_property
+            )
+            raise KeyError(f"The time property '{time_prop}' has not been declared.")
+
+        prop = tracking.create_division_time_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            dtype=time_prop.dtype,
+            unit=time_prop.unit,
+        )
+
+        self.add_custom_property(tracking.DivisionTime(prop, time_prop.identifier))
+
+    def add_generation(
+        self,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the generation property to the model.
+
+        The generation of a cell is the number of divisions among its ancestors,
+        i.e. the level of its cell cycle. Generation of the root is 0.
+        Generations of all the cells of a lineage are computed in a single
+        traversal of the lineage.
+
+        Parameters
+        ----------
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "generation".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Generation".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Number of divisions upstream of the current cell in the lineage".
+        """
+        prop = create_generation_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+        )
+
+        self.add_custom_property(Generation(prop))
+
+    def add_is_division(
+        self,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the is_division property to the model.
+
+        The is_division property is a boolean property that indicates whether the cell
+        is a division event, i.e. has more than one daughter cell.
+
+        Parameters
+        ----------
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "is_division".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "is division".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Whether the cell is a division event, i.e. has more than one daughter cell".
+        """
+        prop = create_is_division_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+        )
+
+        self.add_custom_property(IsDivision(prop))
 
-        self.add_custom_property(IsDivision(prop))
-
     def add_is_leaf(
         self,
         custom_identifier: str | None = None,
@@ -2137,6 +2827,135 @@ class Model:
 
         self.add_custom_property(IsRoot(prop))
 
+    def add_neighbor_count(
+        self,
+        radius: float,
+        custom_time_property: str | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the neighbor count property to the model.
+
+        The neighbor count of a cell is the number of other cells of the same
+        timepoint, from all the lineages, whose center is within `radius`
+        from the center of the cell. The cells of each timepoint are indexed
+        once in a KD-tree shared by all the neighborhood properties.
+
+        Parameters
+        ----------
+        radius : float
+            Maximum distance between the centers of neighboring cells,
+            in the spatial unit of the model.
+        custom_time_property : str, optional
+            Identifier of the time property used to group cells by timepoint.
+            If None, the reference time property of the model will be used.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "neighbor_count".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Neighbor count".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Number of other cells within a given distance at the same timepoint".
+        """
+        time_prop = self._get_time_property(custom_time_property)
+        prop = neighborhood.create_neighbor_count_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+        )
+        self.add_custom_property(
+            neighborhood.NeighborCount(prop, radius, time_prop.identifier)
+        )
+
+    def add_local_density(
+        self,
+        radius: float,
+        ndim: Literal[2, 3] = 2,
+        custom_time_property: str | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the local density property to the model.
+
+        The local density around a cell is the number of cells of the same
+        timepoint, the cell itself included, whose center is within `radius`
+        from the center of the cell, divided by the area (2D) or the volume (3D)
+        of the neighborhood.
+
+        Parameters
+        ----------
+        radius : float
+            Radius of the neighborhood, in the spatial unit of the model.
+        ndim : {2, 3}, optional
+            Number of spatial dimensions of the data. 2 by default.
+        custom_time_property : str, optional
+            Identifier of the time property used to group cells by timepoint.
+            If None, the reference time property of the model will be used.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "local_density".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Local density".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Number of cells per unit area or volume around the cell".
+        """
+        time_prop = self._get_time_property(custom_time_property)
+        prop = neighborhood.create_local_density_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=f"1/{self.get_space_unit()}^{ndim}",
+        )
+        self.add_custom_property(
+            neighborhood.LocalDensity(prop, radius, time_prop.identifier, ndim=ndim)
+        )
+
+    def add_nearest_non_sister_distance(
+        self,
+        custom_time_property: str | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the nearest non-sister distance property to the model.
+
+        The nearest non-sister distance of a cell is the distance between
+        its center and the center of the closest other cell of the same timepoint,
+        from all the lineages, that is not one of its sister cells.
+
+        Parameters
+        ----------
+        custom_time_property : str, optional
+            Identifier of the time property used to group cells by timepoint.
+            If None, the reference time property of the model will be used.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "nearest_non_sister_distance".
+        custom_name : str, optional
+            New name for the property. If None, the name will be
+            "Nearest non-sister distance".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Distance to the closest cell of the same timepoint that is not a sister".
+        """
+        time_prop = self._get_time_property(custom_time_property)
+        prop = neighborhood.create_nearest_non_sister_distance_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=self.get_space_unit(),
+        )
+        self.add_custom_property(
+            neighborhood.NearestNonSisterDistance(prop, time_prop.identifier)
+        )
+
     def add_relative_age(
         self,
         custom_time_property: str | None = None,
@@ -2224,6 +3043,214 @@ class Model:
         )
         self.add_custom_property(motion.Straightness(prop, include_incoming_edge))
 
+    def _get_time_property(self, custom_time_property: str | None = None) -> Property:
+        """
+        Return the time property to use for a computation.
+
+        Parameters
+        ----------
+        custom_time_property : str, optional
+            Identifier of the time property. If None, the reference time property
+            of the model is returned.
+
+        Returns
+        -------
+        Property
+            The time property.
+
+        Raises
+        ------
+        KeyError
+            If the time property has not been declared.
+        """
+        time_prop_id = custom_time_property or self.reference_time_property
+        time_prop = self.get_properties().get(time_prop_id)
+        if time_prop is None:
+            raise KeyError(f"The time property '{time_prop_id}' has not been declared.")
+        return time_prop
+
+    def _get_reference_time_sampling(self) -> tuple[Property, float]:
+        """
+        Return the reference time property of the model and its time step.
+
+        Returns
+        -------
+        tuple[Property, float]
+            The reference time property and the time step of the model.
+
+        Raises
+        ------
+        KeyError
+            If the reference time property has not been declared.
+        ValueError
+            If the time step of the model is not defined.
+        """
+        time_prop = self._get_time_property()
+        time_step = self.model_metadata.time_step
+        if time_step is None:
+            raise ValueError("The time step of the model is currently not defined.")
+        return time_prop, time_step
+
+    def add_cycle_msd(
+        self,
+        max_lag: int | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the cycle MSD property to the model.
+
+        The mean squared displacement (MSD) of a cell cycle is given for each lag k,
+        i.e. for a time of k times the time step of the model. It is computed
+        with FFTs from the positions of the cells of the cell cycle, and gaps
+        in the detections are taken into account through the reference time
+        property of the model.
+
+        Parameters
+        ----------
+        max_lag : int, optional
+            Largest lag to compute, in number of time steps. If None, all lags are
+            computed.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "cycle_msd".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Cycle MSD".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Mean squared displacement of the cell during the cell cycle, for each lag".
+        """
+        time_prop, time_step = self._get_reference_time_sampling()
+        prop = motion.create_cycle_msd_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=f"{self.get_space_unit()}^2",
+        )
+        self.add_custom_property(
+            motion.CycleMSD(prop, time_prop.identifier, time_step, max_lag=max_lag)
+        )
+
+    def add_cycle_vacf(
+        self,
+        max_lag: int | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the cycle VACF property to the model.
+
+        The velocity autocorrelation function (VACF) of a cell cycle is given
+        for each lag k, i.e. for a time of k times the time step of the model.
+        It is computed with FFTs from the velocities of the cell between
+        consecutive time steps. Velocities across gaps in the detections
+        are ignored.
+
+        Parameters
+        ----------
+        max_lag : int, optional
+            Largest lag to compute, in number of time steps. If None, all lags are
+            computed.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "cycle_vacf".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Cycle VACF".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Velocity autocorrelation of the cell during the cell cycle, for each lag".
+        """
+        time_prop, time_step = self._get_reference_time_sampling()
+        prop = motion.create_cycle_vacf_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=f"{self.get_space_unit()}^2/{time_prop.unit}^2",
+        )
+        self.add_custom_property(
+            motion.CycleVACF(prop, time_prop.identifier, time_step, max_lag=max_lag)
+        )
+
+    def add_lineage_msd(
+        self,
+        max_lag: int | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the lineage MSD property to the model.
+
+        The mean squared displacement (MSD) of a lineage averages
+        the squared displacements of all its cell cycles for each lag.
+        See `add_cycle_msd()`.
+
+        Parameters
+        ----------
+        max_lag : int, optional
+            Largest lag to compute, in number of time steps. If None, all lags are
+            computed.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "lineage_msd".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Lineage MSD".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Mean squared displacement over all the cell cycles, for each lag".
+        """
+        time_prop, time_step = self._get_reference_time_sampling()
+        prop = motion.create_lineage_msd_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=f"{self.get_space_unit()}^2",
+        )
+        self.add_custom_property(
+            motion.LineageMSD(prop, time_prop.identifier, time_step, max_lag=max_lag)
+        )
+
+    def add_lineage_vacf(
+        self,
+        max_lag: int | None = None,
+        custom_identifier: str | None = None,
+        custom_name: str | None = None,
+        custom_description: str | None = None,
+    ) -> None:
+        """
+        Add the lineage VACF property to the model.
+
+        The velocity autocorrelation function (VACF) of a lineage averages
+        the velocity products of all its cell cycles for each lag.
+        See `add_cycle_vacf()`.
+
+        Parameters
+        ----------
+        max_lag : int, optional
+            Largest lag to compute, in number of time steps. If None, all lags are
+            computed.
+        custom_identifier : str, optional
+            New identifier for the property. If None, the identifier will be
+            "lineage_vacf".
+        custom_name : str, optional
+            New name for the property. If None, the name will be "Lineage VACF".
+        custom_description : str, optional
+            New description for the property. If None, the description will be
+            "Velocity autocorrelation over all the cell cycles, for each lag".
+        """
+        time_prop, time_step = self._get_reference_time_sampling()
+        prop = motion.create_lineage_vacf_property(
+            custom_identifier=custom_identifier,
+            custom_name=custom_name,
+            custom_description=custom_description,
+            unit=f"{self.get_space_unit()}^2/{time_prop.unit}^2",
+        )
+        self.add_custom_property(
+            motion.LineageVACF(prop, time_prop.identifier, time_step, max_lag=max_lag)
+        )
+
     def _get_prop_method(self, prop_identifier: str) -> Callable:
         """
         Return the method to compute the property from its identifier.
@@ -2798,17 +3825,22 @@ class Model:
         ValueError
             If the `lineage_ID`, `frame` or `cell_ID` property is not found in the model.
         """
-        list_df = []
-        nb_nodes = 0
-        for lin_ID, lineage in self.data.cell_data.items():
-            if lids and lin_ID not in lids:
-                continue
-            nb_nodes += len(lineage)
-            tmp_df = pd.DataFrame(dict(lineage.nodes(data=True)).values())
-            tmp_df["lineage_ID"] = lin_ID
-            list_df.append(tmp_df)
-        df = pd.concat(list_df, ignore_index=True)
-        assert nb_nodes == len(df)
+        df = None
+        if isinstance(self.data.cell_data, LazyLineages):
+            # Read from the snapshot tables without building the lineages.
+            df = self.data.cell_data.get_dataframe("nodes", lids)
+        if df is None:
+            list_df = []
+            nb_nodes = 0
+            for lin_ID, lineage in self.data.cell_data.items():
+                if lids and lin_ID not in lids:
+                    continue
+                nb_nodes += len(lineage)
+                tmp_df = pd.DataFrame(dict(lineage.nodes(data=True)).values())
+                tmp_df["lineage_ID"] = lin_ID
+                list_df.append(tmp_df)
+            df = pd.concat(list_df, ignore_index=True)
+            assert nb_nodes == len(df)
 
         # Reoder the columns to have pycellin mandatory properties first.
         time_prop = self.model_metadata.reference_time_property
@@ -2842,21 +3874,26 @@ class Model:
         pd.DataFrame
             DataFrame containing the link data.
         """
-        list_df = []
-        nb_edges = 0
-        for lin_ID, lineage in self.data.cell_data.items():
-            if lids and lin_ID not in lids:
-                continue
-            nb_edges += len(lineage.edges)
-            tmp_df = nx.to_pandas_edgelist(
-                lineage, source="source_cell_ID", target="target_cell_ID"
-            )
-            tmp_df["source_cell_ID"] = tmp_df["source_cell_ID"].astype(int)
-            tmp_df["target_cell_ID"] = tmp_df["target_cell_ID"].astype(int)
-            tmp_df["lineage_ID"] = lin_ID
-            list_df.append(tmp_df)
-        df = pd.concat(list_df, ignore_index=True)
-        assert nb_edges == len(df)
+        df = None
+        if isinstance(self.data.cell_data, LazyLineages):
+            # Read from the snapshot tables without building the lineages.
+            df = self.data.cell_data.get_dataframe("edges", lids)
+        if df is None:
+            list_df = []
+            nb_edges = 0
+            for lin_ID, lineage in self.data.cell_data.items():
+                if lids and lin_ID not in lids:
+                    continue
+                nb_edges += len(lineage.edges)
+                tmp_df = nx.to_pandas_edgelist(
+                    lineage, source="source_cell_ID", target="target_cell_ID"
+                )
+                tmp_df["source_cell_ID"] = tmp_df["source_cell_ID"].astype(int)
+                tmp_df["target_cell_ID"] = tmp_df["target_cell_ID"].astype(int)
+                tmp_df["lineage_ID"] = lin_ID
+                list_df.append(tmp_df)
+            df = pd.concat(list_df, ignore_index=True)
+            assert nb_edges == len(df)
 
         # Reoder the columns to have pycellin mandatory properties first.
         columns = df.columns.tolist()
@@ -2890,13 +3927,18 @@ class Model:
         ValueError
             If the `lineage_ID` is not found in the model.
         """
-        list_df = []
-        for lin_ID, lineage in self.data.cell_data.items():
-            if lids and lin_ID not in lids:
-                continue
-            tmp_df = pd.DataFrame([lineage.graph])
-            list_df.append(tmp_df)
-        df = pd.concat(list_df, ignore_index=True)
+        df = None
+        if isinstance(self.data.cell_data, LazyLineages):
+            # Read from the snapshot tables without building the lineages.
+            df = self.data.cell_data.get_dataframe("lineages", lids)
+        if df is None:
+            list_df = []
+            for lin_ID, lineage in self.data.cell_data.items():
+                if lids and lin_ID not in lids:
+                    continue
+                tmp_df = pd.DataFrame([lineage.graph])
+                list_df.append(tmp_df)
+            df = pd.concat(list_df, ignore_index=True)
 
         # Reoder the columns to have pycellin mandatory properties first.
         columns = df.columns.tolist()
@@ -2932,22 +3974,27 @@ class Model:
             If the `lineage_ID`, `level` or `cycle_ID` property is not found
             in the model.
         """
-        list_df = []  # type: list[pd.DataFrame]
-        nb_nodes = 0
         if not self.data.cycle_data:
             raise ValueError(
                 "Cycle lineages have not been computed yet. "
                 "Please compute the cycle lineages first with `model.add_cycle_data()`."
             )
-        for lin_ID, lineage in self.data.cycle_data.items():
-            if lids and lin_ID not in lids:
-                continue
-            nb_nodes += len(lineage)
-            tmp_df = pd.DataFrame(dict(lineage.nodes(data=True)).values())
-            tmp_df["lineage_ID"] = lin_ID
-            list_df.append(tmp_df)
-        df = pd.concat(list_df, ignore_index=True)
-        assert nb_nodes == len(df)
+        df = None
+        if isinstance(self.data.cycle_data, LazyLineages):
+            # Read from the snapshot tables without building the lineages.
+            df = self.data.cycle_data.get_dataframe("nodes", lids)
+        if df is None:
+            list_df = []  # type: list[pd.DataFrame]
+            nb_nodes = 0
+            for lin_ID, lineage in self.data.cycle_data.items():
+                if lids and lin_ID not in lids:
+                    continue
+                nb_nodes += len(lineage)
+                tmp_df = pd.DataFrame(dict(lineage.nodes(data=True)).values())
+                tmp_df["lineage_ID"] = lin_ID
+                list_df.append(tmp_df)
+            df = pd.concat(list_df, ignore_index=True)
+            assert nb_nodes == len(df)
 
         # Reoder the columns to have pycellin mandatory properties first.
         columns = df.columns.tolist()
@@ -3003,6 +4050,141 @@ class Model:
         with open(path, "rb") as file:
             return pickle.load(file)
 
+    def save(self, path: str | Path, incremental: bool = False) -> None:
+        """
+        Save the model as a columnar snapshot directory.
+
+        The nodes, edges and lineages of the cell and cycle lineages are stored
+        as concatenated columnar arrays, in `.npy` files that can be memory-mapped
+        on loading. Unlike `save_to_pickle()`, the lineages do not depend on
+        the internal structure of the networkx graphs, and `load()` only builds
+        each lineage graph when it is accessed, so a snapshot loads much faster
+        than a pickle. Saving is however slower than pickling, since every
+        property value is encoded into arrays. On the E. coli sample replicated
+        to about 26,000 cells, `load()` took 0.02 s against 0.73 s for
+        `load_from_pickle()`, before any lineage graph is built, and `save()`
+        took 0.84 s against 0.36 s for `save_to_pickle()`.
+
+        By default, any previous snapshot at `path` is replaced. With
+        `incremental=True`, if the model was last saved to or loaded from `path`,
+        only the lineages modified since then are written, in a new segment
+        of the snapshot. The whole model is written instead when the properties,
+        the cycle data or the time settings of the model have changed, or
+        to compact the snapshot when it has too many segments.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the snapshot directory.
+        incremental : bool, optional
+            True to only write the lineages modified since the model was last
+            saved to or loaded from `path`. False by default.
+
+        Raises
+        ------
+        FileExistsError
+            If `path` exists and is not a snapshot directory.
+        TypeError
+            If the model metadata is not JSON serializable.
+
+        Warnings
+        --------
+        The property calculators and the neighbor graph of the model are still
+        pickled in the snapshot, so a snapshot of a model with custom calculators
+        can fail to load when their classes change.
+
+        Only the modifications made through the methods of the model, e.g.
+        `add_cell()` or `set_cell_props()`, and by `update()` are tracked.
+        Lineages modified directly, e.g. through `lineage.nodes[cid][prop] = value`,
+        are not rewritten by an incremental save.
+        """
+        unsaved = self._updater._get_unsaved_lineages(path) if incremental else None
+        generation = write_snapshot(path, self.__getstate__(), unsaved)
+        self._updater._set_snapshot(path, generation)
+
+    @staticmethod
+    def load(path: str | Path, mmap: bool = False, lazy: bool = True) -> "Model":
+        """
+        Load a model from a snapshot directory written by `Model.save()`.
+
+        By default, the arrays of the snapshot are read into memory but each
+        lineage graph is only built when it is accessed, e.g. with
+        `model.data.cell_data[lin_ID]`, while the `to_*_dataframe()` methods
+        read the properties of the lineages not built yet directly from the arrays.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the snapshot directory.
+        mmap : bool, optional
+            True to memory-map the arrays of the snapshot instead of reading them
+            into memory. Array property values are then read-only views
+            of the snapshot files. False by default.
+        lazy : bool, optional
+            True to only build each lineage graph when it is accessed,
+            False to build all of them on loading. True by default.
+
+        Returns
+        -------
+        Model
+            The loaded model.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no snapshot at `path`.
+        ValueError
+            If the snapshot was written by a more recent version of pycellin.
+        """
+        state, generation = read_snapshot(path, mmap=mmap, lazy=lazy)
+        model = Model.__new__(Model)
+        model.__setstate__(state)
+        model._updater._set_snapshot(path, generation)
+        return model
+
+    @staticmethod
+    def open(path: str | Path, mode: Literal["r"] = "r") -> "Model":
+        """
+        Open a snapshot directory written by `Model.save()` without loading it.
+
+        The arrays of the snapshot are memory-mapped, so the processes opening
+        the same snapshot share the OS page cache instead of each holding a copy
+        of the model. Each lineage is only built when it is accessed as a graph,
+        e.g. with `model.data.cell_data[lin_ID]`, while the `to_*_dataframe()`
+        methods read the properties of the lineages not built yet directly from
+        the snapshot arrays. The snapshot files are never modified: changes
+        made to the opened model are only persisted by saving it, e.g. with
+        `save(path, incremental=True)` to only write the modified lineages.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the snapshot directory.
+        mode : {"r"}, optional
+            Mode in which the snapshot is opened. Only read-only mode, "r",
+            is supported. "r" by default.
+
+        Returns
+        -------
+        Model
+            The opened model.
+
+        Raises
+        ------
+        ValueError
+            If `mode` is not "r".
+            If the snapshot was written by a more recent version of pycellin.
+        FileNotFoundError
+            If there is no snapshot at `path`.
+        """
+        if mode != "r":
+            raise ValueError(f"Unsupported mode '{mode}', only 'r' is supported.")
+        state, generation = read_snapshot(path, mmap=True, lazy=True)
+        model = Model.__new__(Model)
+        model.__setstate__(state)
+        model._updater._set_snapshot(path, generation)
+        return model
+
     def export(self, path: str, format: str) -> None:
         """
         Export the model to a file in a specific format (e.g. TrackMate).
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Spatial neighbor graph of the cells of a model.
+
+Unlike lineage edges, which link a cell to itself or to its daughters
+at the next timepoints, spatial neighbors are cells of the same timepoint,
+possibly from different lineages. They are not stored as networkx edges:
+for each timepoint, the adjacency of the cells is stored in compressed sparse
+row (CSR) format, i.e. the neighbors of the cell at row `i` of a frame are
+`indices[indptr[i]:indptr[i + 1]]`. The graph is built in bulk for all the cells
+of a timepoint, either from a Delaunay triangulation of the cell centroids
+or from the contacts between the cell ROIs.
+"""
+
+from typing import Any, Literal, NamedTuple
+
+import numpy as np
+import shapely
+from scipy.sparse import csr_array
+from scipy.spatial import Delaunay, QhullError
+
+from pycellin.classes.data import Data
+from pycellin.custom_types import Cell
+from pycellin.graph.properties.shape import from_rois_to_polygons
+
+
+class FrameNeighbors(NamedTuple):
+    """
+    Neighbor graph of the cells of a single timepoint, in CSR format.
+
+    Attributes
+    ----------
+    cell_IDs : np.ndarray
+        IDs of the cells.
+    lineage_IDs : np.ndarray
+        IDs of the lineages of the cells.
+    indptr : np.ndarray
+        Row pointers: the neighbors of the cell at row `i` are stored
+        in `indices[indptr[i]:indptr[i + 1]]`.
+    indices : np.ndarray
+        Rows of the neighbors of each cell, sorted for each cell.
+    """
+
+    cell_IDs: np.ndarray
+    lineage_IDs: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+
+
+class NeighborGraph:
+    """
+    Spatial neighbor graph of the cells, with one CSR adjacency per timepoint.
+
+    The graph is undirected: if a cell is a neighbor of another cell,
+    the reverse is also true. It is a snapshot of the cells at the time
+    it was built and is not updated when the lineages are modified.
+    """
+
+    def __init__(self, frames: dict[Any, FrameNeighbors]):
+        """
+        Parameters
+        ----------
+        frames : dict[Any, FrameNeighbors]
+            Neighbor graph of each timepoint.
+        """
+        self.frames = frames
+        # {(cell_ID, lineage_ID): (time, row of the cell in the frame)}
+        self._rows: dict[tuple[int, int], tuple[Any, int]] = {}
+        for time, frame in frames.items():
+            keys = zip(frame.cell_IDs.tolist(), frame.lineage_IDs.tolist())
+            for row, key in enumerate(keys):
+                self._rows[key] = (time, row)
+
+    def __repr__(self) -> str:
+        return (
+            f"NeighborGraph({len(self.frames)} timepoints, "
+            f"{len(self._rows)} cells, {self.number_of_edges()} edges)"
+        )
+
+    @classmethod
+    def from_delaunay(
+        cls,
+        data: Data,
+        time_prop: str,
+        ndim: Literal[2, 3] = 2,
+        max_distance: float | None = None,
+    ) -> "NeighborGraph":
+        """
+        Build the neighbor graph from a Delaunay triangulation of the cell centroids.
+
+        Two cells of the same timepoint are neighbors when they share an edge
+        of the triangulation of the centroids of all the cells of this timepoint.
+        Degenerate timepoints, e.g. with aligned cells, are triangulated
+        in the subspace spanned by the cells: aligned cells are linked
+        to the next cell along the line.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the cell lineages.
+        time_prop : str
+            The name of the time property (e.g. "frame", "time", etc.) used
+            to group cells by timepoint.
+        ndim : {2, 3}, optional
+            Number of spatial dimensions to consider. With 2, the `cell_z`
+            coordinate is ignored. 2 by default.
+        max_distance : float, optional
+            If provided, neighbors further apart than this distance
+            are discarded, e.g. to remove the long edges of the convex hull.
+
+        Returns
+        -------
+        NeighborGraph
+            The neighbor graph of the cells.
+
+        Raises
+        ------
+        ValueError
+            If `ndim` is not 2 or 3.
+        KeyError
+            If a cell is missing the time property or one of the coordinates.
+        """
+        if ndim not in (2, 3):
+            raise ValueError(f"`ndim` must be 2 or 3, got {ndim}.")
+        axes = ["cell_x", "cell_y", "cell_z"][:ndim]
+        frames = {}
+        for time, (cell_IDs, lineage_IDs, attrs) in _group_cells_by_time(
+            data, time_prop
+        ).items():
+            coords = np.array([[a[axis] for axis in axes] for a in attrs], dtype=float)
+            indptr, indices = _triangulate(coords)
+            if max_distance is not None:
+                sources = np.repeat(np.arange(len(coords)), np.diff(indptr))
+                lengths = np.linalg.norm(coords[indices] - coords[sources], axis=1)
+                keep = lengths <= max_distance
+                indptr, indices = _pairs_to_csr(
+                    sources[keep], indices[keep], len(coords)
+                )
+            frames[time] = FrameNeighbors(cell_IDs, lineage_IDs, indptr, indices)
+        return cls(frames)
+
+    @classmethod
+    def from_roi_contacts(
+        cls,
+        data: Data,
+        time_prop: str,
+        tolerance: float = 0.0,
+    ) -> "NeighborGraph":
+        """
+        Build the neighbor graph from the contacts between the cell ROIs.
+
+        Two cells of the same timepoint are neighbors when their ROIs touch
+        or overlap, or are closer than `tolerance`. The ROIs of each timepoint
+        are indexed in a shapely STRtree and all the contacts are found
+        in a single bulk query.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the cell lineages.
+        time_prop : str
+            The name of the time property (e.g. "frame", "time", etc.) used
+            to group cells by timepoint.
+        tolerance : float, optional
+            Largest distance between two ROIs considered as a contact.
+            0 by default, i.e. the ROIs must touch.
+
+        Returns
+        -------
+        NeighborGraph
+            The neighbor graph of the cells.
+
+        Raises
+        ------
+        KeyError
+            If a cell is missing the time property or its ROI.
+        """
+        frames = {}
+        for time, (cell_IDs, lineage_IDs, attrs) in _group_cells_by_time(
+            data, time_prop
+        ).items():
+            polygons = from_rois_to_polygons([a["ROI_coords"] for a in attrs])
+            tree = shapely.STRtree(polygons)
+            if tolerance > 0:
+                pairs = tree.query(polygons, predicate="dwithin", distance=tolerance)
+            else:
+                pairs = tree.query(polygons, predicate="intersects")
+            sources, targets = pairs
+            not_self = sources != targets
+            indptr, indices = _pairs_to_csr(
+                sources[not_self], targets[not_self], len(polygons)
+            )
+            frames[time] = FrameNeighbors(cell_IDs, lineage_IDs, indptr, indices)
+        return cls(frames)
+
+    def neighbors(self, nid: int, lin_ID: int) -> list[Cell]:
+        """
+        Return the spatial neighbors of a cell.
+
+        Parameters
+        ----------
+        nid : int
+            ID of the cell.
+        lin_ID : int
+            ID of the lineage of the cell.
+
+        Returns
+        -------
+        list[Cell]
+            The neighbors of the cell. Each cell is a named tuple:
+            (cell_ID, lineage_ID).
+
+        Raises
+        ------
+        KeyError
+            If the cell is not in the graph.
+        """
+        try:
+            time, row = self._rows[(nid, lin_ID)]
+        except KeyError as err:
+            msg = f"Cell {nid} from lineage {lin_ID} is not in the neighbor graph."
+            raise KeyError(msg) from err
+        frame = self.frames[time]
+        rows = frame.indices[frame.indptr[row] : frame.indptr[row + 1]]
+        return [
+            Cell(cell_ID, lineage_ID)
+            for cell_ID, lineage_ID in zip(
+                frame.cell_IDs[rows].tolist(), frame.lineage_IDs[rows].tolist()
+            )
+        ]
+
+    def get_adjacency(self, time: Any) -> csr_array:
+        """
+        Return the adjacency matrix of the cells of a timepoint.
+
+        Rows and columns follow the order of the `cell_IDs` and `lineage_IDs`
+        arrays of the frame.
+
+        Parameters
+        ----------
+        time : Any
+            Timepoint of interest.
+
+        Returns
+        -------
+        csr_array
+            The boolean adjacency matrix of the cells of the timepoint.
+
+        Raises
+        ------
+        KeyError
+            If there is no cell at this timepoint.
+        """
+        frame = self.frames[time]
+        size = len(frame.cell_IDs)
+        values = np.ones(len(frame.indices), dtype=bool)
+        return csr_array((values, frame.indices, frame.indptr), shape=(size, size))
+
+    def number_of_edges(self) -> int:
+        """
+        Return the number of neighbor pairs over all timepoints.
+
+        Returns
+        -------
+        int
+            The number of neighbor pairs.
+        """
+        return sum(len(frame.indices) for frame in self.frames.values()) // 2
+
+
+def _group_cells_by_time(
+    data: Data, time_prop: str
+) -> dict[Any, tuple[np.ndarray, np.ndarray, list[dict[str, Any]]]]:
+    """
+    Group the cells of all the cell lineages by timepoint.
+
+    Parameters
+    ----------
+    data : Data
+        Data object containing the cell lineages.
+    time_prop : str
+        The name of the time property used to group cells by timepoint.
+
+    Returns
+    -------
+    dict[Any, tuple[np.ndarray, np.ndarray, list[dict[str, Any]]]]
+        For each timepoint, the IDs of the cells, the IDs of their lineages
+        and their attributes.
+    """
+    groups: dict[Any, tuple[list[int], list[int], list[dict[str, Any]]]] = {}
+    for lin_ID, lineage in data.cell_data.items():
+        for nid, attrs in lineage.nodes(data=True):
+            cell_IDs, lineage_IDs, cell_attrs = groups.setdefault(
+                attrs[time_prop], ([], [], [])
+            )
+            cell_IDs.append(nid)
+            lineage_IDs.append(lin_ID)
+            cell_attrs.append(attrs)
+    return {
+        time: (np.array(cell_IDs), np.array(lineage_IDs), cell_attrs)
+        for time, (cell_IDs, lineage_IDs, cell_attrs) in groups.items()
+    }
+
+
+def _triangulate(coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the Delaunay neighbors of a set of points in CSR format.
+
+    Degenerate sets of points, e.g. aligned points in 2D or coplanar points
+    in 3D, are triangulated in the subspace they span.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        Coordinates of the points, of shape (number of points, number of dimensions).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The row pointers and the indices of the neighbors of each point.
+    """
+    nb_points = len(coords)
+    if nb_points < 2:
+        return np.zeros(nb_points + 1, dtype=np.intp), np.zeros(0, dtype=np.intp)
+    centered = coords - coords.mean(axis=0)
+    _, singular_values, axes = np.linalg.svd(centered, full_matrices=False)
+    rank = int(np.sum(singular_values > singular_values[0] * 1e-10))
+    if rank <= 1:
+        # Aligned points: each point is linked to the next one along the line.
+        order = np.argsort(centered @ axes[0], kind="stable")
+        sources = np.concatenate((order[:-1], order[1:]))
+        targets = np.concatenate((order[1:], order[:-1]))
+        return _pairs_to_csr(sources, targets, nb_points)
+    projected = centered @ axes[:rank].T
+    try:
+        tri = Delaunay(projected)
+    except QhullError:
+        # Nearly degenerate configuration.
+        tri = Delaunay(projected, qhull_options="QJ")
+    indptr, indices = tri.vertex_neighbor_vertices
+    sources = np.repeat(np.arange(nb_points), np.diff(indptr))
+    return _pairs_to_csr(sources, indices, nb_points)
+
+
+def _pairs_to_csr(
+    sources: np.ndarray, targets: np.ndarray, size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert pairs of neighbors into CSR arrays.
+
+    Parameters
+    ----------
+    sources : np.ndarray
+        Rows of the first cell of each pair.
+    targets : np.ndarray
+        Rows of the second cell of each pair.
+    size : int
+        Number of cells.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The row pointers and the indices of the neighbors of each cell,
+        sorted for each cell.
+    """
+    sources = np.asarray(sources, dtype=np.intp)
+    targets = np.asarray(targets, dtype=np.intp)
+    order = np.lexsort((targets, sources))
+    counts = np.bincount(sources, minlength=size)
+    indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.intp)
+    return indptr, targets[order]
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import inspect
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 from pycellin.classes.data import Data
 from pycellin.classes.property import Property
 from pycellin.classes.lineage import Lineage
+from pycellin.classes.update_context import UpdateContext
+from pycellin.classes.update_report import CalculatorRun
+from pycellin.custom_types import Footprint
 
 
 def _get_lin_data_from_lin_type(data: Data, lineage_type: str) -> dict[int, Lineage]:
@@ -68,6 +73,48 @@ class PropertyCalculator(ABC):
         """
         return cls._PROPERTY_TYPE
 
+    def _get_context_kwargs(self, context: UpdateContext | None) -> dict[str, Any]:
+        """
+        Return the keyword arguments to pass the update context to `compute()`.
+
+        The context is only passed to calculators whose `compute()` method
+        declares a `context` parameter, so that calculators that don't need it
+        keep a simple signature.
+
+        Parameters
+        ----------
+        context : UpdateContext | None
+            The context of the current update, if any.
+
+        Returns
+        -------
+        dict[str, Any]
+            {"context": context} if the context can be passed, an empty dict otherwise.
+        """
+        if context is None:
+            return {}
+        if "context" in inspect.signature(self.compute).parameters:
+            return {"context": context}
+        return {}
+
+    def get_inputs(self) -> set[str] | None:
+        """
+        Return the identifiers of the properties read by the calculator.
+
+        The updater uses the inputs to only recompute the property when one of them
+        has been modified (see `Model.set_cell_props()`). Changes in the structure
+        of the lineages always trigger a recomputation, so properties that only
+        depend on the structure have no inputs.
+
+        Returns
+        -------
+        set[str] | None
+            Identifiers of the input properties, or None if they are unknown.
+            In that case, the property is recomputed whenever any property
+            value is modified.
+        """
+        return None
+
     @abstractmethod
     def compute(self, *args, **kwargs) -> Any:
         """
@@ -111,6 +158,22 @@ class LocalPropCalculator(PropertyCalculator):
 
     _LOCAL_PROPERTY = True
 
+    def is_fusable(self) -> bool:
+        """
+        Return True if the calculator can be fused with other local calculators.
+
+        Fused calculators are run object by object in a single traversal
+        (see `enrich_fused()`), so their own `enrich()` method is not called.
+        Calculators with a specific `enrich()` implementation, e.g. a parallel one,
+        must not be fused.
+
+        Returns
+        -------
+        bool
+            True if the calculator can be fused, False otherwise.
+        """
+        return True
+
     @abstractmethod
     def compute(self, lineage: Lineage, *args, **kwargs) -> Any:
         """
@@ -166,7 +229,11 @@ class NodeLocalPropCalculator(LocalPropCalculator):
         pass
 
     def enrich(
-        self, data: Data, nodes_to_enrich: list[tuple[int, int]], **kwargs
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]],
+        context: UpdateContext | None = None,
+        **kwargs,
     ) -> None:
         """
         Enrich the data with the value of a local property for a list of nodes.
@@ -178,11 +245,14 @@ class NodeLocalPropCalculator(LocalPropCalculator):
         nodes_to_enrich : list of tuple[int, int]
             List of tuples containing the node ID and the lineage ID of the nodes
             to enrich with the property value.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
         """
         lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
+        ctx_kwargs = self._get_context_kwargs(context)
         for nid, lin_ID in nodes_to_enrich:
             lin = lineages[lin_ID]
-            lin.nodes[nid][self.prop.identifier] = self.compute(lin, nid)
+            lin.nodes[nid][self.prop.identifier] = self.compute(lin, nid, **ctx_kwargs)
 
 
 class EdgeLocalPropCalculator(LocalPropCalculator):
@@ -209,7 +279,11 @@ class EdgeLocalPropCalculator(LocalPropCalculator):
         pass
 
     def enrich(
-        self, data: Data, edges_to_enrich: list[tuple[int, int, int]], **kwargs
+        self,
+        data: Data,
+        edges_to_enrich: list[tuple[int, int, int]],
+        context: UpdateContext | None = None,
+        **kwargs,
     ) -> None:
         """
         Enrich the data with the value of a local property for a list of edges.
@@ -221,12 +295,17 @@ class EdgeLocalPropCalculator(LocalPropCalculator):
         edges_to_enrich : list of tuple[int, int, int]
             List of tuples containing the source node ID, the target node ID and
             the lineage ID of the edges to enrich with the property value.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
         """
         lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
+        ctx_kwargs = self._get_context_kwargs(context)
         for source, target, lin_ID in edges_to_enrich:
             link = (source, target)
             lin = lineages[lin_ID]
-            lin.edges[link][self.prop.identifier] = self.compute(lin, link)
+            lin.edges[link][self.prop.identifier] = self.compute(
+                lin, link, **ctx_kwargs
+            )
 
 
 class LineageLocalPropCalculator(LocalPropCalculator):
@@ -250,7 +329,13 @@ class LineageLocalPropCalculator(LocalPropCalculator):
         """
         pass
 
-    def enrich(self, data: Data, lineages_to_enrich: list[int], **kwargs) -> None:
+    def enrich(
+        self,
+        data: Data,
+        lineages_to_enrich: list[int],
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
         """
         Enrich the data with the value of a local property for all lineages.
 
@@ -258,11 +343,16 @@ class LineageLocalPropCalculator(LocalPropCalculator):
         ----------
         data : Data
             Data object containing the lineages.
+        lineages_to_enrich : list of int
+            List of the IDs of the lineages to enrich with the property value.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
         """
         lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
+        ctx_kwargs = self._get_context_kwargs(context)
         for lin_ID in lineages_to_enrich:
             lin = lineages[lin_ID]
-            lin.graph[self.prop.identifier] = self.compute(lin)
+            lin.graph[self.prop.identifier] = self.compute(lin, **ctx_kwargs)
 
 
 class GlobalPropCalculator(PropertyCalculator):
@@ -274,9 +364,35 @@ class GlobalPropCalculator(PropertyCalculator):
     - cell age (node property) needs data from all its ancestor cells in the lineage;
     - TODO: edge property, find relevant example?
     - TODO: lineage property, find relevant example?
+
+    The footprint of a global property is the region of the lineage that
+    the value of an object depends on. It is used by the updater to only
+    recompute the objects impacted by a modification of the lineages:
+    - "ancestors": the value depends on the ancestors of the object
+      (a modification is propagated to the descendants);
+    - "descendants": the value depends on the descendants of the object
+      (a modification is propagated to the ancestors);
+    - "cycle": the value depends on the cell cycle of the object and
+      on its direct neighbors;
+    - "lineage": the value depends on the whole lineage of the object;
+    - "model": the value depends on all the lineages of the model.
+    Subclasses should override `_FOOTPRINT` with the smallest footprint that is
+    valid for their property. By default, all the objects of the model
+    are recomputed at each update.
     """
 
     _LOCAL_PROPERTY = False
+    _FOOTPRINT = "model"  # type: Footprint
+
+    @classmethod
+    def get_footprint(cls) -> Footprint:
+        """
+        Accessor to the _FOOTPRINT attribute.
+
+        Return the region of the lineage that the value of an object depends on
+        (ancestors, descendants, cycle, lineage, model).
+        """
+        return cls._FOOTPRINT
 
     @abstractmethod
     def compute(self, data: Data, lineage: Lineage, *args, **kwargs) -> Any:
@@ -297,7 +413,9 @@ class GlobalPropCalculator(PropertyCalculator):
         pass
 
     @abstractmethod
-    def enrich(self, data: Data, **kwargs) -> None:
+    def enrich(
+        self, data: Data, context: UpdateContext | None = None, **kwargs
+    ) -> None:
         """
         Enrich the data with the value of a global property for all objects in all lineages.
 
@@ -305,6 +423,8 @@ class GlobalPropCalculator(PropertyCalculator):
         ----------
         data : Data
             Data object containing the lineages to enrich.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
         """
         pass
 
@@ -334,19 +454,38 @@ class NodeGlobalPropCalculator(GlobalPropCalculator):
         """
         pass
 
-    def enrich(self, data: Data, **kwargs) -> None:
+    def enrich(
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]] | None = None,
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
         """
-        Enrich the data with the value of a global property for all nodes in all lineages.
+        Enrich the data with the value of a global property for a list of nodes.
 
         Parameters
         ----------
         data : Data
             Data object containing the lineages to enrich.
+        nodes_to_enrich : list of tuple[int, int], optional
+            List of tuples containing the node ID and the lineage ID of the nodes
+            to enrich with the property value. If None, all nodes in all lineages
+            are enriched.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
         """
         lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
-        for lin in lineages.values():
-            for nid in lin.nodes:
-                lin.nodes[nid][self.prop.identifier] = self.compute(data, lin, nid)
+        ctx_kwargs = self._get_context_kwargs(context)
+        if nodes_to_enrich is None:
+            nodes_to_enrich = [
+                (nid, lin_ID) for lin_ID, lin in lineages.items() for nid in lin.nodes
+            ]
+        for nid, lin_ID in nodes_to_enrich:
+            lin = lineages[lin_ID]
+            lin.nodes[nid][self.prop.identifier] = self.compute(
+                data, lin, nid, **ctx_kwargs
+            )
 
 
 class EdgeGlobalPropCalculator(GlobalPropCalculator):
@@ -374,19 +513,41 @@ class EdgeGlobalPropCalculator(GlobalPropCalculator):
         """
         pass
 
-    def enrich(self, data: Data, **kwargs) -> None:
+    def enrich(
+        self,
+        data: Data,
+        edges_to_enrich: list[tuple[int, int, int]] | None = None,
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
         """
-        Enrich the data with the value of a global property for all edges in all lineages.
+        Enrich the data with the value of a global property for a list of edges.
 
         Parameters
         ----------
         data : Data
             Data object containing the lineages to enrich.
+        edges_to_enrich : list of tuple[int, int, int], optional
+            List of tuples containing the source node ID, the target node ID and
+            the lineage ID of the edges to enrich with the property value.
+            If None, all edges in all lineages are enriched.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
         """
         lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
-        for lin in lineages.values():
-            for edge in lin.edges:
-                lin.edges[edge][self.prop.identifier] = self.compute(data, lin, edge)
+        ctx_kwargs = self._get_context_kwargs(context)
+        if edges_to_enrich is None:
+            edges_to_enrich = [
+                (source, target, lin_ID)
+                for lin_ID, lin in lineages.items()
+                for source, target in lin.edges
+            ]
+        for source, target, lin_ID in edges_to_enrich:
+            link = (source, target)
+            lin = lineages[lin_ID]
+            lin.edges[link][self.prop.identifier] = self.compute(
+                data, lin, link, **ctx_kwargs
+            )
 
 
 class LineageGlobalPropCalculator(GlobalPropCalculator):
@@ -412,16 +573,156 @@ class LineageGlobalPropCalculator(GlobalPropCalculator):
         """
         pass
 
-    def enrich(self, data: Data, **kwargs) -> None:
+    def enrich(
+        self,
+        data: Data,
+        lineages_to_enrich: list[int] | None = None,
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
         """
-        Enrich the data with the value of a global property for all lineages.
+        Enrich the data with the value of a global property for a list of lineages.
 
         Parameters
         ----------
-
         data : Data
             Data object containing the lineages to enrich.
+        lineages_to_enrich : list of int, optional
+            List of the IDs of the lineages to enrich with the property value.
+            If None, all lineages are enriched.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
         """
         lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
-        for lin in lineages.values():
-            lin.graph[self.prop.identifier] = self.compute(data, lin)
+        ctx_kwargs = self._get_context_kwargs(context)
+        if lineages_to_enrich is None:
+            lineages_to_enrich = list(lineages.keys())
+        for lin_ID in lineages_to_enrich:
+            lin = lineages[lin_ID]
+            lin.graph[self.prop.identifier] = self.compute(data, lin, **ctx_kwargs)
+
+
+def _profile_compute(
+    compute: Callable[..., Any], run: CalculatorRun, context: UpdateContext | None
+) -> Callable[..., Any]:
+    """
+    Wrap the `compute()` method of a calculator to record its statistics in a run.
+
+    Parameters
+    ----------
+    compute : Callable[..., Any]
+        The `compute()` method to wrap.
+    run : CalculatorRun
+        The run in which to accumulate the wall time and the cache statistics.
+    context : UpdateContext | None
+        Memoization context of the current update, if any.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The wrapped method.
+    """
+
+    def profiled_compute(*args: Any, **kwargs: Any) -> Any:
+        if context is not None:
+            hits, misses = context.hits, context.misses
+        start_time = time.perf_counter()
+        value = compute(*args, **kwargs)
+        run.wall_time += time.perf_counter() - start_time
+        if context is not None:
+            run.cache_hits += context.hits - hits
+            run.cache_misses += context.misses - misses
+        return value
+
+    return profiled_compute
+
+
+def enrich_fused(
+    calculators: list[LocalPropCalculator],
+    data: Data,
+    nodes_to_enrich: list[tuple[int, int]] | None = None,
+    edges_to_enrich: list[tuple[int, int, int]] | None = None,
+    lineages_to_enrich: list[int] | None = None,
+    context: UpdateContext | None = None,
+    runs: list[CalculatorRun] | None = None,
+) -> None:
+    """
+    Enrich the data with the values of several local properties in a single pass.
+
+    Each object is visited only once and all the properties are computed
+    one after the other, in the order of the calculators. Since local properties
+    only depend on data from the object itself, a property can use the value
+    of a property computed before it in the same pass.
+
+    Parameters
+    ----------
+    calculators : list[LocalPropCalculator]
+        Calculators of the properties to compute. They must all be for
+        the same property type and the same lineage type.
+    data : Data
+        Data object containing the lineages.
+    nodes_to_enrich : list of tuple[int, int], optional
+        List of tuples containing the node ID and the lineage ID of the nodes
+        to enrich, for node properties.
+    edges_to_enrich : list of tuple[int, int, int], optional
+        List of tuples containing the source node ID, the target node ID and
+        the lineage ID of the edges to enrich, for edge properties.
+    lineages_to_enrich : list of int, optional
+        List of the IDs of the lineages to enrich, for lineage properties.
+    context : UpdateContext, optional
+        Memoization context of the current update, if any.
+    runs : list[CalculatorRun], optional
+        Statistics of each calculator, in the same order as `calculators`.
+        If given, the time spent in the `compute()` method of each calculator
+        and its cache statistics are added to its run.
+
+    Raises
+    ------
+    ValueError
+        If the calculators are not all local calculators for the same property type
+        and the same lineage type.
+    """
+    if not calculators:
+        return
+    prop_type = calculators[0].get_property_type()
+    lin_type = calculators[0].prop.lin_type
+    for calc in calculators:
+        if (
+            not calc.is_for_local_property()
+            or calc.get_property_type() != prop_type
+            or calc.prop.lin_type != lin_type
+        ):
+            raise ValueError(
+                "Only local calculators for the same property type "
+                "and lineage type can be fused."
+            )
+
+    lineages = _get_lin_data_from_lin_type(data, lin_type)
+    computations = [
+        (calc.prop.identifier, calc.compute, calc._get_context_kwargs(context))
+        for calc in calculators
+    ]
+    if runs is not None:
+        computations = [
+            (prop_ID, _profile_compute(compute, run, context), ctx_kwargs)
+            for (prop_ID, compute, ctx_kwargs), run in zip(computations, runs)
+        ]
+    if prop_type == "node":
+        for nid, lin_ID in nodes_to_enrich or []:
+            lin = lineages[lin_ID]
+            attrs = lin.nodes[nid]
+            for prop_ID, compute, ctx_kwargs in computations:
+                attrs[prop_ID] = compute(lin, nid, **ctx_kwargs)
+    elif prop_type == "edge":
+        for source, target, lin_ID in edges_to_enrich or []:
+            link = (source, target)
+            lin = lineages[lin_ID]
+            attrs = lin.edges[link]
+            for prop_ID, compute, ctx_kwargs in computations:
+                attrs[prop_ID] = compute(lin, link, **ctx_kwargs)
+    else:
+        for lin_ID in lineages_to_enrich or []:
+            lin = lineages[lin_ID]
+            attrs = lin.graph
+            for prop_ID, compute, ctx_kwargs in computations:
+                attrs[prop_ID] = compute(lin, **ctx_kwargs)
@@ -0,0 +1,1505 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Columnar snapshot format of a model.
+
+A snapshot is a directory holding the lineages of a model as concatenated
+columnar arrays, one `.npy` file per array so they can be memory-mapped.
+The lineages are stored in one or more segments, under `segments/`, each holding:
+
+- for cell lineages, a table of lineages, a table of nodes and a table of edges,
+  and the same three tables for cycle lineages, if any,
+- `state.pkl`, with the remaining state of the model, e.g. the property
+  calculators and the neighbor graph.
+
+The manifest of the snapshot, `metadata.json`, holds the model metadata,
+the properties metadata, the schema of the tables of each segment,
+the segment of each lineage and the segment holding the current state.
+A full save writes all the lineages in a single segment, while an incremental
+save appends a segment with only the lineages modified since the previous save:
+the previous copies of these lineages are no longer referenced by the manifest.
+The snapshot is compacted into a single segment by the next full save,
+or automatically when there are too many segments or stale lineages.
+
+The rows of the node and edge tables are grouped by lineage, in the order of
+the lineage table, which stores the offsets of the nodes and edges of each lineage.
+Each node, edge or lineage attribute is stored as a column of its table,
+encoded depending on its values:
+
+- "scalar": a column of bool, int, float or str values is stored as one array,
+- "ragged": a column of lists, tuples or arrays of such values is stored
+  as the concatenation of the values and the offsets of each row,
+- "object": any other column is pickled.
+
+When an attribute is missing from some rows, the values of the other rows
+are stored along with a mask of the rows that have the attribute.
+Unlike a pickle of the whole model, the lineages do not depend on the internal
+structure of the networkx graphs. However, `state.pkl` still pickles the property
+calculators, so a snapshot of a model with custom calculators can still break
+when their classes change.
+"""
+
+import gc
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import uuid
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager
+from itertools import chain, pairwise
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Literal
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from pycellin.classes.data import Data
+from pycellin.classes.lineage import CellLineage, CycleLineage, Lineage
+from pycellin.classes.property import Property
+from pycellin.classes.props_metadata import PropsMetadata
+from pycellin.custom_types import property_type_to_strings
+
+_FORMAT = "pycellin-snapshot"
+_VERSION = 2
+_METADATA_FILE = "metadata.json"
+_STATE_FILE = "state.pkl"
+_SEGMENTS_DIR = "segments"
+# Number of segments from which an incremental save compacts the snapshot.
+_MAX_SEGMENTS = 16
+
+# Marker of the rows that do not have a given attribute.
+_MISSING = object()
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause the garbage collector while many objects are created.
+
+    The garbage collector is triggered by the number of allocated containers,
+    so rebuilding the attribute dicts of all the nodes and edges would trigger it
+    repeatedly, although none of these objects can be garbage.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _get_scalar_dtype(types: set[type]) -> type | None:
+    """
+    Return the numpy dtype that can store values of the given types without loss.
+
+    Parameters
+    ----------
+    types : set[type]
+        Types of the values.
+
+    Returns
+    -------
+    type | None
+        The numpy dtype, or None if the values cannot be stored as a numpy array.
+    """
+    if not types:
+        return None
+    if all(issubclass(t, (bool, np.bool_)) for t in types):
+        return np.bool_
+    if all(
+        issubclass(t, (int, np.signedinteger)) and not issubclass(t, bool)
+        for t in types
+    ):
+        return np.int64
+    if all(issubclass(t, (float, np.floating)) for t in types):
+        return np.float64
+    if all(issubclass(t, str) for t in types):
+        return np.str_
+    return None
+
+
+def _encode_ragged(
+    values: list[Any], container: type
+) -> tuple[dict[str, Any], dict[str, np.ndarray]] | None:
+    """
+    Encode a column of sequences as concatenated values and row offsets.
+
+    Parameters
+    ----------
+    values : list[Any]
+        Values of the column, all of type `container`.
+    container : type
+        Type of the values: list, tuple or np.ndarray.
+
+    Returns
+    -------
+    tuple[dict[str, Any], dict[str, np.ndarray]] | None
+        The description of the column and its arrays, or None if the sequences
+        cannot be concatenated without loss.
+    """
+    items_type = None
+    if container is np.ndarray:
+        if any(value.ndim == 0 or value.dtype.kind not in "biufU" for value in values):
+            return None
+        non_empty = [value for value in values if len(value)]
+        if (
+            len({value.dtype for value in non_empty}) > 1
+            or len({value.shape[1:] for value in non_empty}) > 1
+        ):
+            return None
+        if non_empty:
+            flat = np.concatenate(non_empty)
+        else:
+            flat = np.empty(0, dtype=values[0].dtype if values else np.float64)
+    else:
+        items = list(chain.from_iterable(values))
+        item_types = set(map(type, items))
+        if item_types == {list} or item_types == {tuple}:
+            # Sequences of sequences of the same length, e.g. lists of coordinates.
+            widths = set(map(len, items))
+            if widths == {0} or len(widths) > 1:
+                return None
+            items_type = item_types.pop().__name__
+            scalars = list(chain.from_iterable(items))
+            shape: tuple[int, ...] = (len(items), widths.pop())
+        else:
+            scalars = items
+            shape = (len(items),)
+        # The sequences are rebuilt from their items: check that the type
+        # of the items is restored as well, e.g. that ints are not turned to floats.
+        dtype = _get_scalar_dtype(set(map(type, scalars)))
+        if dtype is None and scalars:
+            return None
+        try:
+            flat = np.array(scalars, dtype=dtype or np.float64).reshape(shape)
+        except OverflowError:
+            return None
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(list(map(len, values)), out=offsets[1:])
+    desc = {"kind": "ragged", "container": container.__name__, "items": items_type}
+    return desc, {"values": flat, "offsets": offsets}
+
+
+def _encode_column(
+    values: list[Any],
+) -> tuple[dict[str, Any], dict[str, np.ndarray] | list[Any]]:
+    """
+    Encode the values of a column as numpy arrays when possible.
+
+    Parameters
+    ----------
+    values : list[Any]
+        Values of the column.
+
+    Returns
+    -------
+    tuple[dict[str, Any], dict[str, np.ndarray] | list[Any]]
+        The description of the column and its arrays, or the values themselves
+        when they cannot be stored as numpy arrays and need to be pickled.
+    """
+    types = set(map(type, values))
+    dtype = _get_scalar_dtype(types)
+    if dtype is not None:
+        try:
+            return {"kind": "scalar"}, {"values": np.array(values, dtype=dtype)}
+        except OverflowError:
+            pass
+    if len(types) == 1 and (container := types.pop()) in (list, tuple, np.ndarray):
+        encoded = _encode_ragged(values, container)
+        if encoded is not None:
+            return encoded
+    return {"kind": "object"}, values
+
+
+def _get_columns(
+    rows: list[dict[str, Any]],
+) -> dict[Any, tuple[list[Any], np.ndarray | None]]:
+    """
+    Transpose the attributes of the rows of a table into columns.
+
+    Parameters
+    ----------
+    rows : list[dict[str, Any]]
+        Attributes of each row.
+
+    Returns
+    -------
+    dict[Any, tuple[list[Any], np.ndarray | None]]
+        For each attribute, its values in the rows that have it, and the mask
+        of these rows, or None if all the rows have it.
+    """
+    keys = list(dict.fromkeys(chain.from_iterable(rows)))
+    if not keys:
+        return {}
+    try:
+        # Fast path when all the rows have all the attributes.
+        values = list(map(itemgetter(*keys), rows))
+    except KeyError:
+        pass
+    else:
+        if len(keys) == 1:
+            return {keys[0]: (values, None)}
+        return {key: (list(column), None) for key, column in zip(keys, zip(*values))}
+    columns = {}
+    for key in keys:
+        values = [row.get(key, _MISSING) for row in rows]
+        mask = np.array([value is not _MISSING for value in values], dtype=bool)
+        if mask.all():
+            columns[key] = (values, None)
+        else:
+            columns[key] = ([value for value in values if value is not _MISSING], mask)
+    return columns
+
+
+def _write_table(
+    table_dir: Path, index: dict[str, np.ndarray], rows: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Write a table of index arrays and attribute columns.
+
+    Parameters
+    ----------
+    table_dir : Path
+        Directory to write the table into.
+    index : dict[str, np.ndarray]
+        Arrays describing the rows, e.g. the IDs of the nodes.
+    rows : list[dict[str, Any]]
+        Attributes of each row.
+
+    Returns
+    -------
+    dict[str, Any]
+        The schema of the table.
+    """
+    column_dir = table_dir / "columns"
+    column_dir.mkdir(parents=True)
+    for name, array in index.items():
+        np.save(table_dir / f"{name}.npy", array)
+    columns = []
+    for i, (key, (values, mask)) in enumerate(_get_columns(rows).items()):
+        if mask is not None:
+            np.save(column_dir / f"{i}.mask.npy", mask)
+        desc, encoded = _encode_column(values)
+        if isinstance(encoded, dict):
+            for name, array in encoded.items():
+                np.save(column_dir / f"{i}.{name}.npy", array)
+        else:
+            with open(column_dir / f"{i}.pkl", "wb") as file:
+                pickle.dump(encoded, file, protocol=pickle.HIGHEST_PROTOCOL)
+        columns.append({"name": key, "masked": mask is not None, **desc})
+    return {"length": len(rows), "index": list(index), "columns": columns}
+
+
+class _Column:
+    """
+    Attribute column of a snapshot table.
+
+    All the files of the column are opened on creation, so the column stays
+    readable if they are removed afterwards, e.g. by the compaction
+    of the snapshot. When memory-mapped, the values are only read from disk
+    when accessed.
+
+    Parameters
+    ----------
+    column_dir : Path
+        Directory of the columns of the table.
+    index : int
+        Position of the column in the table.
+    desc : dict[str, Any]
+        Description of the column.
+    mmap : bool
+        True to memory-map the arrays of the column.
+    """
+
+    def __init__(self, column_dir: Path, index: int, desc: dict[str, Any], mmap: bool):
+        self.name = desc["name"]
+        self.desc = desc
+        path = column_dir / str(index)
+        mmap_mode = "r" if mmap else None
+        self.mask: np.ndarray | None = None
+        if desc["masked"]:
+            self.mask = np.load(f"{path}.mask.npy", mmap_mode=mmap_mode)
+        self.offsets: np.ndarray | None = None
+        if desc["kind"] == "object":
+            with open(f"{path}.pkl", "rb") as file:
+                self.values: np.ndarray | list[Any] = pickle.load(file)
+        else:
+            self.values = np.load(f"{path}.values.npy", mmap_mode=mmap_mode)
+            if desc["kind"] == "ragged":
+                self.offsets = np.load(f"{path}.offsets.npy", mmap_mode=mmap_mode)
+        # Position in the stored values of the first row of each range of rows.
+        self._ranks: np.ndarray | None = None
+
+    def _get_value_bounds(self, start: int, stop: int) -> tuple[int, int]:
+        """
+        Return the bounds in the stored values of a range of rows.
+
+        Parameters
+        ----------
+        start : int
+            First row of the range.
+        stop : int
+            Row following the last row of the range.
+
+        Returns
+        -------
+        tuple[int, int]
+            Position of the first stored value of the range and of the value
+            following the last one.
+        """
+        if self.mask is None:
+            return start, stop
+        if self._ranks is None:
+            self._ranks = np.zeros(len(self.mask) + 1, dtype=np.int64)
+            np.cumsum(self.mask, out=self._ranks[1:])
+        return int(self._ranks[start]), int(self._ranks[stop])
+
+    def get_values(self, start: int, stop: int) -> list[Any]:
+        """
+        Return the values of the rows of a range that have the attribute.
+
+        Parameters
+        ----------
+        start : int
+            First row of the range.
+        stop : int
+            Row following the last row of the range.
+
+        Returns
+        -------
+        list[Any]
+            The values, in the order of the rows.
+        """
+        first, last = self._get_value_bounds(start, stop)
+        kind = self.desc["kind"]
+        if kind == "object":
+            return self.values[first:last]
+        if kind == "scalar":
+            return self.values[first:last].tolist()
+        offsets = self.offsets[first : last + 1].tolist()
+        values = self.values[offsets[0] : offsets[-1]]
+        bounds = list(pairwise([offset - offsets[0] for offset in offsets]))
+        if self.desc["container"] == "ndarray":
+            return [values[start:stop] for start, stop in bounds]
+        if self.desc["items"] == "tuple":
+            flat = list(zip(*values.T.tolist()))
+        else:
+            flat = values.tolist()
+        if self.desc["container"] == "tuple":
+            return [tuple(flat[start:stop]) for start, stop in bounds]
+        return [flat[start:stop] for start, stop in bounds]
+
+
+class _Table:
+    """
+    Index arrays and attribute columns of a snapshot table.
+
+    Parameters
+    ----------
+    table_dir : Path
+        Directory of the table.
+    schema : dict[str, Any]
+        Schema of the table.
+    mmap : bool
+        True to memory-map the arrays of the table.
+    """
+
+    def __init__(self, table_dir: Path, schema: dict[str, Any], mmap: bool):
+        mmap_mode = "r" if mmap else None
+        self.length = schema["length"]
+        self.index = {
+            name: np.load(table_dir / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in schema["index"]
+        }
+        self.columns = [
+            _Column(table_dir / "columns", i, desc, mmap)
+            for i, desc in enumerate(schema["columns"])
+        ]
+
+    def get_rows(self, start: int, stop: int) -> list[dict[str, Any]]:
+        """
+        Return the attributes of each row of a range.
+
+        Parameters
+        ----------
+        start : int
+            First row of the range.
+        stop : int
+            Row following the last row of the range.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The attributes of each row.
+        """
+        keys = []
+        columns = []
+        missing = []
+        for column in self.columns:
+            values = column.get_values(start, stop)
+            if column.mask is not None:
+                mask = np.asarray(column.mask[start:stop])
+                if not mask.any():
+                    continue
+                if not mask.all():
+                    full = [_MISSING] * (stop - start)
+                    for row, value in zip(np.flatnonzero(mask).tolist(), values):
+                        full[row] = value
+                    values = full
+                    missing.append((column.name, np.flatnonzero(~mask).tolist()))
+            keys.append(column.name)
+            columns.append(values)
+        if columns:
+            rows = [dict(zip(keys, values)) for values in zip(*columns)]
+        else:
+            rows = [{} for _ in range(stop - start)]
+        for key, missing_rows in missing:
+            for row in missing_rows:
+                del rows[row][key]
+        return rows
+
+    def get_dataframe(self, ranges: list[tuple[int, int]]) -> pd.DataFrame:
+        """
+        Return the attributes of the rows of some ranges as a DataFrame.
+
+        Missing attributes are set to NaN, and attributes missing from all
+        the rows are left out, as when building a DataFrame from the attribute
+        dicts of the rows.
+
+        Parameters
+        ----------
+        ranges : list[tuple[int, int]]
+            First row and row following the last row of each range.
+
+        Returns
+        -------
+        pd.DataFrame
+            The attributes of the rows, one column per attribute.
+        """
+        size = sum(stop - start for start, stop in ranges)
+        frame: dict[Any, Any] = {}
+        for column in self.columns:
+            if column.desc["kind"] == "scalar" and column.mask is None:
+                parts = [column.values[start:stop] for start, stop in ranges]
+                frame[column.name] = np.concatenate(parts)
+                continue
+            values: list[Any] = [np.nan] * size
+            found = False
+            position = 0
+            for start, stop in ranges:
+                chunk = column.get_values(start, stop)
+                if column.mask is None:
+                    values[position : position + len(chunk)] = chunk
+                else:
+                    rows = np.flatnonzero(column.mask[start:stop]) + position
+                    for row, value in zip(rows.tolist(), chunk):
+                        values[row] = value
+                found = found or bool(chunk)
+                position += stop - start
+            if found:
+                frame[column.name] = values
+        return pd.DataFrame(frame, index=pd.RangeIndex(size))
+
+
+def _write_lineages(
+    path: Path, lin_type: str, lineages: dict[int, Lineage]
+) -> dict[str, dict[str, Any]]:
+    """
+    Write the tables of lineages, nodes and edges of a set of lineages.
+
+    Parameters
+    ----------
+    path : Path
+        Directory of the snapshot.
+    lin_type : str
+        Type of the lineages, "cell" or "cycle", used to name the tables.
+    lineages : dict[int, Lineage]
+        The lineages to write, keyed by lineage ID.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        The schema of each table.
+    """
+    node_ids: list[int] = []
+    node_rows: list[dict[str, Any]] = []
+    sources: list[int] = []
+    targets: list[int] = []
+    edge_rows: list[dict[str, Any]] = []
+    node_offsets = [0]
+    edge_offsets = [0]
+    for lineage in lineages.values():
+        for nid, attrs in lineage.nodes(data=True):
+            node_ids.append(nid)
+            node_rows.append(attrs)
+        for source, target, attrs in lineage.edges(data=True):
+            sources.append(source)
+            targets.append(target)
+            edge_rows.append(attrs)
+        node_offsets.append(len(node_ids))
+        edge_offsets.append(len(sources))
+    lineage_index = {
+        "ids": np.array(list(lineages), dtype=np.int64),
+        "node_offsets": np.array(node_offsets, dtype=np.int64),
+        "edge_offsets": np.array(edge_offsets, dtype=np.int64),
+        "frozen": np.array([nx.is_frozen(lin) for lin in lineages.values()], bool),
+    }
+    return {
+        f"{lin_type}_lineages": _write_table(
+            path / f"{lin_type}_lineages",
+            lineage_index,
+            [lineage.graph for lineage in lineages.values()],
+        ),
+        f"{lin_type}_nodes": _write_table(
+            path / f"{lin_type}_nodes",
+            {"ids": np.array(node_ids, dtype=np.int64)},
+            node_rows,
+        ),
+        f"{lin_type}_edges": _write_table(
+            path / f"{lin_type}_edges",
+            {
+                "sources": np.array(sources, dtype=np.int64),
+                "targets": np.array(targets, dtype=np.int64),
+            },
+            edge_rows,
+        ),
+    }
+
+
+def _build_lineage(
+    new_lineage: Callable[[], Lineage],
+    graph: dict[str, Any],
+    node_ids: list[int],
+    node_attrs: list[dict[str, Any]],
+    edges: Iterable[tuple[int, int, dict[str, Any]]],
+    frozen: bool,
+) -> Lineage:
+    """
+    Build a lineage from its nodes and edges.
+
+    The adjacency of the lineage is filled directly rather than through
+    `add_nodes_from()` and `add_edges_from()`, which check and copy the attributes
+    of each node and edge: the attribute dicts are used as is.
+
+    Parameters
+    ----------
+    new_lineage : Callable[[], Lineage]
+        Function creating an empty lineage.
+    graph : dict[str, Any]
+        Attributes of the lineage.
+    node_ids : list[int]
+        IDs of the nodes.
+    node_attrs : list[dict[str, Any]]
+        Attributes of each node.
+    edges : Iterable[tuple[int, int, dict[str, Any]]]
+        Source node, target node and attributes of each edge.
+    frozen : bool
+        True to freeze the structure of the lineage.
+
+    Returns
+    -------
+    Lineage
+        The lineage.
+    """
+    lineage = new_lineage()
+    lineage.graph.update(graph)
+    lineage._node.update(zip(node_ids, node_attrs))
+    succ = lineage._succ
+    pred = lineage._pred
+    succ.update({nid: {} for nid in node_ids})
+    pred.update({nid: {} for nid in node_ids})
+    for source, target, attrs in edges:
+        succ[source][target] = attrs
+        pred[target][source] = attrs
+    if frozen:
+        nx.freeze(lineage)
+    return lineage
+
+
+def _read_tables(
+    path: Path, lin_type: str, schemas: dict[str, dict[str, Any]], mmap: bool
+) -> dict[str, _Table]:
+    """
+    Open the tables of lineages, nodes and edges of a type of lineages.
+
+    Parameters
+    ----------
+    path : Path
+        Directory of the snapshot.
+    lin_type : str
+        Type of the lineages, "cell" or "cycle", used to name the tables.
+    schemas : dict[str, dict[str, Any]]
+        Schema of each table of the snapshot.
+    mmap : bool
+        True to memory-map the arrays of the tables.
+
+    Returns
+    -------
+    dict[str, _Table]
+        The "lineages", "nodes" and "edges" tables.
+    """
+    tables = {}
+    for table in ("lineages", "nodes", "edges"):
+        name = f"{lin_type}_{table}"
+        tables[table] = _Table(path / name, schemas[name], mmap)
+    return tables
+
+
+def _get_locations(
+    metadata: dict[str, Any], lin_type: str, segments: list[dict[str, _Table]]
+) -> dict[int, tuple[int, int]]:
+    """
+    Locate the lineages of a snapshot in its segments.
+
+    Parameters
+    ----------
+    metadata : dict[str, Any]
+        Metadata of the snapshot.
+    lin_type : str
+        Type of the lineages, "cell" or "cycle".
+    segments : list[dict[str, _Table]]
+        The "lineages", "nodes" and "edges" tables of each segment.
+
+    Returns
+    -------
+    dict[int, tuple[int, int]]
+        Segment and row in the lineage table of the segment of each lineage,
+        in the order of the lineages.
+    """
+    rows = []
+    for tables in segments:
+        lin_IDs = tables["lineages"].index["ids"].tolist()
+        rows.append({lin_ID: row for row, lin_ID in enumerate(lin_IDs)})
+    if "lineages" not in metadata:
+        # Single segment holding all the lineages, in order.
+        return {lin_ID: (0, row) for lin_ID, row in rows[0].items()}
+    order = metadata["lineages"][lin_type]
+    return {
+        lin_ID: (segment, rows[segment][lin_ID])
+        for lin_ID, segment in zip(order["ids"], order["segments"])
+    }
+
+
+def _read_lineages(
+    tables: dict[str, _Table], new_lineage: Callable[[], Lineage]
+) -> dict[int, Lineage]:
+    """
+    Build all the lineages of a snapshot from its tables.
+
+    Parameters
+    ----------
+    tables : dict[str, _Table]
+        The "lineages", "nodes" and "edges" tables.
+    new_lineage : Callable[[], Lineage]
+        Function creating an empty lineage.
+
+    Returns
+    -------
+    dict[int, Lineage]
+        The lineages, keyed by lineage ID.
+    """
+    lineage_table, node_table, edge_table = (
+        tables["lineages"],
+        tables["nodes"],
+        tables["edges"],
+    )
+    graph_attrs = lineage_table.get_rows(0, lineage_table.length)
+    node_attrs = node_table.get_rows(0, node_table.length)
+    edge_attrs = edge_table.get_rows(0, edge_table.length)
+    node_ids = node_table.index["ids"].tolist()
+    sources = edge_table.index["sources"].tolist()
+    targets = edge_table.index["targets"].tolist()
+    lineage_index = lineage_table.index
+    lineages = {}
+    for lin_ID, graph, frozen, (n_start, n_stop), (e_start, e_stop) in zip(
+        lineage_index["ids"].tolist(),
+        graph_attrs,
+        lineage_index["frozen"].tolist(),
+        pairwise(lineage_index["node_offsets"].tolist()),
+        pairwise(lineage_index["edge_offsets"].tolist()),
+    ):
+        lineages[lin_ID] = _build_lineage(
+            new_lineage,
+            graph,
+            node_ids[n_start:n_stop],
+            node_attrs[n_start:n_stop],
+            zip(
+                sources[e_start:e_stop],
+                targets[e_start:e_stop],
+                edge_attrs[e_start:e_stop],
+            ),
+            frozen,
+        )
+    return lineages
+
+
+class LazyLineages(MutableMapping):
+    """
+    Lineages of a snapshot, each built from the snapshot tables on first access.
+
+    When the tables are memory-mapped, the processes opening the same snapshot
+    share the OS page cache instead of each holding a copy of the model.
+    A lineage is only built when it is accessed as a graph, e.g. with
+    `lineages[lin_ID]` or by iterating over `lineages.values()`, and is then
+    kept in memory. Lineages can be added and removed as in a dict,
+    but the snapshot files are never modified.
+
+    Parameters
+    ----------
+    segments : list[dict[str, _Table]]
+        The "lineages", "nodes" and "edges" tables of each segment
+        of the snapshot.
+    locations : dict[int, tuple[int, int]]
+        Segment and row in the lineage table of the segment of each lineage,
+        in the order of the lineages.
+    new_lineage : Callable[[], Lineage]
+        Function creating an empty lineage.
+    """
+
+    def __init__(
+        self,
+        segments: list[dict[str, _Table]],
+        locations: dict[int, tuple[int, int]],
+        new_lineage: Callable[[], Lineage],
+    ):
+        self._segments = segments
+        self._new_lineage = new_lineage
+        # Lineages in the order of the snapshot, None for the lineages not built yet.
+        self._lineages: dict[int, Lineage | None] = dict.fromkeys(locations)
+        # Location in the snapshot of the lineages not built yet.
+        self._locations = dict(locations)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyLineages({len(self._lineages)} lineages, "
+            f"{len(self._lineages) - len(self._locations)} built)"
+        )
+
+    def __reduce__(self) -> tuple[type, tuple[dict[int, Lineage]]]:
+        # Pickled as a plain dict of lineages, independent of the snapshot files.
+        return dict, (dict(self.items()),)
+
+    def __len__(self) -> int:
+        return len(self._lineages)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._lineages)
+
+    def __contains__(self, lin_ID: object) -> bool:
+        return lin_ID in self._lineages
+
+    def __getitem__(self, lin_ID: int) -> Lineage:
+        lineage = self._lineages[lin_ID]
+        if lineage is None:
+            lineage = self._build(*self._locations.pop(lin_ID))
+            self._lineages[lin_ID] = lineage
+        return lineage
+
+    def __setitem__(self, lin_ID: int, lineage: Lineage) -> None:
+        self._lineages[lin_ID] = lineage
+        self._locations.pop(lin_ID, None)
+
+    def __delitem__(self, lin_ID: int) -> None:
+        del self._lineages[lin_ID]
+        self._locations.pop(lin_ID, None)
+
+    def _build(self, segment: int, row: int) -> Lineage:
+        """
+        Build the lineage of a row of the lineage table of a segment.
+
+        Parameters
+        ----------
+        segment : int
+            Index of the segment.
+        row : int
+            Row of the lineage in the lineage table of the segment.
+
+        Returns
+        -------
+        Lineage
+            The lineage.
+        """
+        tables = self._segments[segment]
+        lineage_table, node_table, edge_table = (
+            tables["lineages"],
+            tables["nodes"],
+            tables["edges"],
+        )
+        index = lineage_table.index
+        n_start, n_stop = index["node_offsets"][row : row + 2].tolist()
+        e_start, e_stop = index["edge_offsets"][row : row + 2].tolist()
+        return _build_lineage(
+            self._new_lineage,
+            lineage_table.get_rows(row, row + 1)[0],
+            node_table.index["ids"][n_start:n_stop].tolist(),
+            node_table.get_rows(n_start, n_stop),
+            zip(
+                edge_table.index["sources"][e_start:e_stop].tolist(),
+                edge_table.index["targets"][e_start:e_stop].tolist(),
+                edge_table.get_rows(e_start, e_stop),
+            ),
+            bool(index["frozen"][row]),
+        )
+
+    def is_built(self, lin_ID: int) -> bool:
+        """
+        Check if a lineage has already been built from the snapshot tables.
+
+        Parameters
+        ----------
+        lin_ID : int
+            ID of the lineage.
+
+        Returns
+        -------
+        bool
+            True if the lineage has been built or added since the snapshot
+            was opened, False otherwise.
+
+        Raises
+        ------
+        KeyError
+            If there is no lineage with this ID.
+        """
+        if lin_ID not in self._lineages:
+            raise KeyError(lin_ID)
+        return lin_ID not in self._locations
+
+    def get_dataframe(
+        self, table: Literal["lineages", "nodes", "edges"], lids: list[int] | None
+    ) -> pd.DataFrame | None:
+        """
+        Read the rows of some lineages from a table, without building the lineages.
+
+        Parameters
+        ----------
+        table : {"lineages", "nodes", "edges"}
+            Table to read.
+        lids : list[int] | None
+            IDs of the lineages to read. If None or empty, all the lineages
+            are read.
+
+        Returns
+        -------
+        pd.DataFrame | None
+            The attributes of the rows, with a "lineage_ID" column and, for edges,
+            "source_cell_ID" and "target_cell_ID" columns. None if no lineage
+            is selected or if some of the selected lineages have been built,
+            since they may have been modified since the snapshot was opened.
+        """
+        selected = [lin_ID for lin_ID in self._lineages if not lids or lin_ID in lids]
+        if not selected or any(lin_ID not in self._locations for lin_ID in selected):
+            return None
+        # Consecutive lineages stored in the same segment are read at once.
+        frames = []
+        for segment, lin_IDs in _group_by_segment(selected, self._locations):
+            rows = np.array([self._locations[lin_ID][1] for lin_ID in lin_IDs])
+            frames.append(self._get_segment_dataframe(segment, table, lin_IDs, rows))
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def _get_segment_dataframe(
+        self,
+        segment: int,
+        table: Literal["lineages", "nodes", "edges"],
+        lin_IDs: list[int],
+        rows: np.ndarray,
+    ) -> pd.DataFrame:
+        """
+        Read the rows of some lineages of a segment from a table.
+
+        Parameters
+        ----------
+        segment : int
+            Index of the segment.
+        table : {"lineages", "nodes", "edges"}
+            Table to read.
+        lin_IDs : list[int]
+            IDs of the lineages to read.
+        rows : np.ndarray
+            Rows of the lineages in the lineage table of the segment.
+
+        Returns
+        -------
+        pd.DataFrame
+            The attributes of the rows, see `get_dataframe()`.
+        """
+        tables = self._segments[segment]
+        if table == "lineages":
+            bounds = np.column_stack((rows, rows + 1))
+        else:
+            offsets = tables["lineages"].index[f"{table[:-1]}_offsets"]
+            bounds = np.column_stack((offsets[rows], offsets[rows + 1]))
+        # Consecutive rows are read at once.
+        ranges: list[list[int]] = []
+        for start, stop in bounds.tolist():
+            if ranges and ranges[-1][1] == start:
+                ranges[-1][1] = stop
+            else:
+                ranges.append([start, stop])
+        rows_table = tables[table]
+        df = rows_table.get_dataframe([(start, stop) for start, stop in ranges])
+        if table == "edges":
+            ends = {}
+            for name, key in (("source", "sources"), ("target", "targets")):
+                ids = rows_table.index[key]
+                ends[f"{name}_cell_ID"] = np.concatenate(
+                    [ids[start:stop] for start, stop in ranges]
+                )
+            df = pd.concat([pd.DataFrame(ends), df], axis=1)
+        if table != "lineages":
+            df["lineage_ID"] = np.repeat(lin_IDs, bounds[:, 1] - bounds[:, 0])
+        return df
+
+
+def _group_by_segment(
+    lin_IDs: list[int], locations: dict[int, tuple[int, int]]
+) -> list[tuple[int, list[int]]]:
+    """
+    Group consecutive lineages stored in the same segment.
+
+    Parameters
+    ----------
+    lin_IDs : list[int]
+        IDs of the lineages.
+    locations : dict[int, tuple[int, int]]
+        Segment and row of each lineage.
+
+    Returns
+    -------
+    list[tuple[int, list[int]]]
+        Segment and IDs of each group of consecutive lineages.
+    """
+    groups: list[tuple[int, list[int]]] = []
+    for lin_ID in lin_IDs:
+        segment = locations[lin_ID][0]
+        if groups and groups[-1][0] == segment:
+            groups[-1][1].append(lin_ID)
+        else:
+            groups.append((segment, [lin_ID]))
+    return groups
+
+
+def _props_metadata_to_dict(props_metadata: PropsMetadata) -> dict[str, Any]:
+    """
+    Convert the properties metadata to a JSON serializable dictionary.
+
+    Parameters
+    ----------
+    props_metadata : PropsMetadata
+        The properties metadata to convert.
+
+    Returns
+    -------
+    dict[str, Any]
+        The declared properties and the identifiers of the protected ones.
+    """
+    props = [
+        {
+            "identifier": prop.identifier,
+            "name": prop.name,
+            "description": prop.description,
+            "provenance": prop.provenance,
+            "prop_type": property_type_to_strings(prop.prop_type),
+            "lin_type": prop.lin_type,
+            "dtype": prop.dtype,
+            "unit": prop.unit,
+        }
+        for prop in props_metadata.props.values()
+    ]
+    return {"props": props, "protected_props": props_metadata._get_protected_props()}
+
+
+def _props_metadata_from_dict(props_dict: dict[str, Any]) -> PropsMetadata:
+    """
+    Create the properties metadata from its dictionary representation.
+
+    Parameters
+    ----------
+    props_dict : dict[str, Any]
+        The declared properties and the identifiers of the protected ones.
+
+    Returns
+    -------
+    PropsMetadata
+        The properties metadata.
+    """
+    props = [Property(**prop) for prop in props_dict["props"]]
+    return PropsMetadata(
+        props={prop.identifier: prop for prop in props},
+        protected_props=list(props_dict["protected_props"]),
+    )
+
+
+class _StatePickler(pickle.Pickler):
+    """
+    Pickler of the model state that refers to the data and properties by name.
+
+    The property calculators can hold references to the data of the model
+    or to its properties, which are stored in the tables and in the metadata
+    of the snapshot: they are not pickled again but restored on loading.
+    """
+
+    def __init__(self, file, data: Data, props_metadata: PropsMetadata):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._refs = {id(data): ("data", None)}
+        for prop_id, prop in props_metadata.props.items():
+            self._refs[id(prop)] = ("property", prop_id)
+
+    def persistent_id(self, obj: Any) -> tuple[str, str | None] | None:
+        return self._refs.get(id(obj))
+
+
+class _StateUnpickler(pickle.Unpickler):
+    """
+    Unpickler of the model state, counterpart of `_StatePickler`.
+    """
+
+    def __init__(self, file, data: Data, props_metadata: PropsMetadata):
+        super().__init__(file)
+        self._data = data
+        self._props = props_metadata.props
+
+    def persistent_load(self, pid: tuple[str, str | None]) -> Any:
+        kind, key = pid
+        if kind == "data":
+            return self._data
+        if kind == "property":
+            return self._props[key]
+        raise pickle.UnpicklingError(f"Unknown persistent ID: {pid}.")
+
+
+def _read_metadata(path: Path) -> dict[str, Any]:
+    """
+    Read and check the metadata of a snapshot.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the snapshot directory.
+
+    Returns
+    -------
+    dict[str, Any]
+        The metadata of the snapshot.
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no snapshot at `path`.
+    ValueError
+        If the snapshot was written by a more recent version of pycellin.
+    """
+    with open(path / _METADATA_FILE, encoding="utf-8") as file:
+        metadata = json.load(file)
+    if metadata.get("format") != _FORMAT:
+        raise ValueError(f"'{path}' is not a pycellin snapshot.")
+    if metadata["version"] > _VERSION:
+        raise ValueError(
+            f"Snapshot version {metadata['version']} is not supported, "
+            f"the latest supported version is {_VERSION}."
+        )
+    if metadata["version"] == 1:
+        # Single segment at the root of the snapshot, holding all the lineages.
+        metadata["segments"] = [{"dir": ".", "tables": metadata.pop("tables")}]
+        metadata["state"] = 0
+    return metadata
+
+
+def _write_segment(
+    path: Path,
+    name: str,
+    lineages: dict[str, Mapping[int, Lineage]],
+    data: Data,
+    props_metadata: PropsMetadata,
+    state: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Write a segment holding some lineages and the state of the model.
+
+    Parameters
+    ----------
+    path : Path
+        Directory of the snapshot.
+    name : str
+        Name of the segment.
+    lineages : dict[str, Mapping[int, Lineage]]
+        Lineages to write, keyed by lineage ID, for each type of lineages.
+    data : Data
+        Data of the model, referred to by the state.
+    props_metadata : PropsMetadata
+        Properties metadata of the model, referred to by the state.
+    state : dict[str, Any]
+        Remaining state of the model.
+
+    Returns
+    -------
+    dict[str, Any]
+        The directory of the segment, relative to `path`, and the schema
+        of its tables.
+    """
+    segment_dir = f"{_SEGMENTS_DIR}/{name}"
+    tables = {}
+    for lin_type, lins in lineages.items():
+        tables.update(_write_lineages(path / segment_dir, lin_type, lins))
+    with open(path / segment_dir / _STATE_FILE, "wb") as file:
+        _StatePickler(file, data, props_metadata).dump(state)
+    return {"dir": segment_dir, "tables": tables}
+
+
+def _write_metadata(path: Path, metadata: dict[str, Any]) -> None:
+    """
+    Write the metadata of a snapshot, replacing any previous one atomically.
+
+    Parameters
+    ----------
+    path : Path
+        Directory of the snapshot.
+    metadata : dict[str, Any]
+        The metadata to write.
+    """
+    tmp_file = path / f".{_METADATA_FILE}.{metadata['generation']}"
+    with open(tmp_file, "w", encoding="utf-8") as file:
+        json.dump(metadata, file)
+    os.replace(tmp_file, path / _METADATA_FILE)
+
+
+def _get_delta_base(
+    path: Path,
+    metadata: dict[str, Any],
+    lineages: dict[str, Mapping[int, Lineage]],
+    unsaved: tuple[str, set[int]] | None,
+) -> dict[str, Any] | None:
+    """
+    Return the metadata of the snapshot to append a segment to, if possible.
+
+    A segment holding only the modified lineages can be appended to the snapshot
+    at `path` when it is the one the modifications are relative to, when
+    the properties and the time settings of the model are unchanged, and when
+    the snapshot does not need to be compacted.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the snapshot directory.
+    metadata : dict[str, Any]
+        Metadata of the snapshot to write.
+    lineages : dict[str, Mapping[int, Lineage]]
+        Lineages of the model, keyed by lineage ID, for each type of lineages.
+    unsaved : tuple[str, set[int]] | None
+        Generation of the snapshot the modifications are relative to,
+        and IDs of the modified lineages.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The metadata of the snapshot at `path`, or None if the whole model
+        must be written.
+    """
+    if unsaved is None or not (path / _METADATA_FILE).is_file():
+        return None
+    generation, lin_IDs = unsaved
+    try:
+        previous = _read_metadata(path)
+    except ValueError:
+        return None
+    if previous["version"] != _VERSION or previous["generation"] != generation:
+        return None
+    # Round trip through JSON so that tuples compare equal to lists.
+    current = json.loads(
+        json.dumps([metadata["props_metadata"], metadata["has_cycle_data"]])
+    )
+    if current != [previous["props_metadata"], previous["has_cycle_data"]]:
+        return None
+    for key in ("reference_time_property", "time_step"):
+        if previous["model_metadata"].get(key) != metadata["model_metadata"].get(key):
+            return None
+    # Lineages neither modified nor in the snapshot were not tracked.
+    for lin_type, lins in lineages.items():
+        stored = set(previous["lineages"][lin_type]["ids"])
+        if any(lin_ID not in stored and lin_ID not in lin_IDs for lin_ID in lins):
+            return None
+    # Compaction, when there are too many segments or when the stale copies
+    # of the modified lineages outnumber the current lineages.
+    if len(previous["segments"]) >= _MAX_SEGMENTS:
+        return None
+    nb_rows = sum(
+        segment["tables"]["cell_lineages"]["length"]
+        for segment in previous["segments"]
+    )
+    if nb_rows + len(lin_IDs) > 2 * len(lineages["cell"]):
+        return None
+    return previous
+
+
+def _write_full(
+    path: Path,
+    metadata: dict[str, Any],
+    lineages: dict[str, Mapping[int, Lineage]],
+    data: Data,
+    props_metadata: PropsMetadata,
+    state: dict[str, Any],
+) -> None:
+    """
+    Write all the lineages of a model as a snapshot with a single segment.
+
+    The snapshot is first written in a temporary directory next to `path`,
+    which then replaces any previous snapshot at `path`.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the snapshot directory.
+    metadata : dict[str, Any]
+        Metadata of the snapshot, completed with the segments and lineages.
+    lineages : dict[str, Mapping[int, Lineage]]
+        Lineages of the model, keyed by lineage ID, for each type of lineages.
+    data : Data
+        Data of the model.
+    props_metadata : PropsMetadata
+        Properties metadata of the model.
+    state : dict[str, Any]
+        Remaining state of the model.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(prefix=f".{path.name}.", dir=path.parent))
+    try:
+        segment = _write_segment(
+            tmp_path, metadata["generation"], lineages, data, props_metadata, state
+        )
+        metadata["segments"] = [segment]
+        metadata["state"] = 0
+        metadata["lineages"] = {
+            lin_type: {"ids": list(lins), "segments": [0] * len(lins)}
+            for lin_type, lins in lineages.items()
+        }
+        _write_metadata(tmp_path, metadata)
+        if path.exists():
+            shutil.rmtree(path)
+        tmp_path.rename(path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+
+def _write_delta(
+    path: Path,
+    metadata: dict[str, Any],
+    previous: dict[str, Any],
+    lin_IDs: set[int],
+    lineages: dict[str, Mapping[int, Lineage]],
+    data: Data,
+    props_metadata: PropsMetadata,
+    state: dict[str, Any],
+) -> None:
+    """
+    Append a segment holding the modified lineages to a snapshot.
+
+    The previous copies of the modified lineages are left in their segment
+    but are no longer referenced by the metadata. Segments without any
+    referenced lineage are removed once the new metadata is written.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the snapshot directory.
+    metadata : dict[str, Any]
+        Metadata of the snapshot, completed with the segments and lineages.
+    previous : dict[str, Any]
+        Metadata of the snapshot at `path`.
+    lin_IDs : set[int]
+        IDs of the modified lineages.
+    lineages : dict[str, Mapping[int, Lineage]]
+        Lineages of the model, keyed by lineage ID, for each type of lineages.
+    data : Data
+        Data of the model.
+    props_metadata : PropsMetadata
+        Properties metadata of the model.
+    state : dict[str, Any]
+        Remaining state of the model.
+    """
+    modified = {
+        lin_type: {lin_ID: lins[lin_ID] for lin_ID in lins if lin_ID in lin_IDs}
+        for lin_type, lins in lineages.items()
+    }
+    # The segment is first written in a temporary directory so that
+    # an interrupted save leaves the snapshot untouched.
+    tmp_path = Path(tempfile.mkdtemp(prefix=".segment.", dir=path))
+    segment_path = path / _SEGMENTS_DIR / metadata["generation"]
+    try:
+        segment = _write_segment(
+            tmp_path, metadata["generation"], modified, data, props_metadata, state
+        )
+        (tmp_path / segment["dir"]).rename(segment_path)
+        segments = previous["segments"] + [segment]
+        new_segment = len(segments) - 1
+        locations = {}
+        for lin_type, lins in lineages.items():
+            stored = previous["lineages"][lin_type]
+            stored_segments = dict(zip(stored["ids"], stored["segments"]))
+            locations[lin_type] = [
+                new_segment if lin_ID in lin_IDs else stored_segments[lin_ID]
+                for lin_ID in lins
+            ]
+        used = {new_segment}.union(*locations.values())
+        renumbering = {old: new for new, old in enumerate(sorted(used))}
+        metadata["segments"] = [segments[i] for i in sorted(used)]
+        metadata["state"] = renumbering[new_segment]
+        metadata["lineages"] = {
+            lin_type: {
+                "ids": list(lins),
+                "segments": [renumbering[i] for i in locations[lin_type]],
+            }
+            for lin_type, lins in lineages.items()
+        }
+        _write_metadata(path, metadata)
+    except BaseException:
+        shutil.rmtree(segment_path, ignore_errors=True)
+        raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    for i, segment in enumerate(previous["segments"]):
+        if i not in used:
+            shutil.rmtree(path / segment["dir"], ignore_errors=True)
+
+
+def write_snapshot(
+    path: str | Path,
+    state: dict[str, Any],
+    unsaved: tuple[str, set[int]] | None = None,
+) -> str:
+    """
+    Write the state of a model as a snapshot directory.
+
+    When `unsaved` is given and refers to the snapshot at `path`, only the
+    modified lineages are written, in a new segment appended to the snapshot.
+    Otherwise, or when the snapshot needs to be compacted, all the lineages
+    are written in a new snapshot replacing any previous one at `path`.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path of the snapshot directory.
+    state : dict[str, Any]
+        State of the model, as returned by `Model.__getstate__()`.
+    unsaved : tuple[str, set[int]] | None, optional
+        Generation of the snapshot the model was last saved to or loaded from,
+        and IDs of the lineages modified since then. None by default,
+        to write all the lineages.
+
+    Returns
+    -------
+    str
+        The generation of the written snapshot, which identifies it.
+
+    Raises
+    ------
+    FileExistsError
+        If `path` exists and is not a snapshot directory.
+    TypeError
+        If the model metadata is not JSON serializable.
+    """
+    path = Path(path)
+    if path.exists() and not (path / _METADATA_FILE).is_file():
+        raise FileExistsError(f"'{path}' exists and is not a pycellin snapshot.")
+    state = dict(state)
+    data = state.pop("data")
+    props_metadata = state.pop("props_metadata")
+    metadata = {
+        "format": _FORMAT,
+        "version": _VERSION,
+        "generation": uuid.uuid4().hex,
+        "model_metadata": state.pop("model_metadata"),
+        "props_metadata": _props_metadata_to_dict(props_metadata),
+        "has_cycle_data": data.cycle_data is not None,
+    }
+    # Serialize the metadata first to fail before writing anything.
+    json.dumps(metadata)
+
+    lineages: dict[str, Mapping[int, Lineage]] = {"cell": data.cell_data}
+    if data.cycle_data is not None:
+        lineages["cycle"] = data.cycle_data
+    previous = _get_delta_base(path, metadata, lineages, unsaved)
+    if previous is None:
+        _write_full(path, metadata, lineages, data, props_metadata, state)
+    else:
+        assert unsaved is not None
+        _write_delta(
+            path, metadata, previous, unsaved[1], lineages, data, props_metadata, state
+        )
+    return metadata["generation"]
+
+
+def read_snapshot(
+    path: str | Path, mmap: bool = False, lazy: bool = False
+) -> tuple[dict[str, Any], str | None]:
+    """
+    Read the state of a model from a snapshot directory.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path of the snapshot directory.
+    mmap : bool, optional
+        True to memory-map the arrays of the snapshot instead of reading them
+        into memory. Array property values are then read-only views
+        of the snapshot files. False by default.
+    lazy : bool, optional
+        True to build each lineage from the snapshot tables only when it is
+        accessed, see `LazyLineages`. False by default.
+
+    Returns
+    -------
+    tuple[dict[str, Any], str | None]
+        State of the model, to be restored with `Model.__setstate__()`,
+        and generation of the snapshot, None for snapshots written
+        before incremental saves were supported.
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no snapshot at `path`.
+    ValueError
+        If the snapshot was written by a more recent version of pycellin.
+    """
+    path = Path(path)
+    metadata = _read_metadata(path)
+    model_metadata = metadata["model_metadata"]
+    new_lineages: dict[str, Callable[[], Lineage]] = {"cell": CellLineage}
+    if metadata["has_cycle_data"]:
+        new_lineages["cycle"] = lambda: CycleLineage(
+            model_metadata["reference_time_property"], model_metadata["time_step"]
+        )
+    with _gc_paused():
+        lineages: dict[str, MutableMapping[int, Lineage]] = {}
+        for lin_type, new_lineage in new_lineages.items():
+            segments = [
+                _read_tables(path / segment["dir"], lin_type, segment["tables"], mmap)
+                for segment in metadata["segments"]
+            ]
+            locations = _get_locations(metadata, lin_type, segments)
+            if lazy:
+                lineages[lin_type] = LazyLineages(segments, locations, new_lineage)
+            else:
+                built = [_read_lineages(tables, new_lineage) for tables in segments]
+                lineages[lin_type] = {
+                    lin_ID: built[segment][lin_ID]
+                    for lin_ID, (segment, _) in locations.items()
+                }
+        data = Data(lineages["cell"])
+        data.cycle_data = lineages.get("cycle")
+        props_metadata = _props_metadata_from_dict(metadata["props_metadata"])
+        state_dir = path / metadata["segments"][metadata["state"]]["dir"]
+        with open(state_dir / _STATE_FILE, "rb") as file:
+            state = _StateUnpickler(file, data, props_metadata).load()
+    state["data"] = data
+    state["props_metadata"] = props_metadata
+    state["model_metadata"] = model_metadata
+    return state, metadata.get("generation")
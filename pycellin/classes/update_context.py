@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+from pycellin.classes.data import Data
+from pycellin.classes.lineage import Lineage
+
+
+class UpdateContext:
+    """
+    Memoization context shared by all the calculators of a single model update.
+
+    Several calculators need the same intermediate results (cell cycles,
+    lineage roots, cell coordinates...). Instead of recomputing them for each
+    calculator, they are computed once per lineage and cached in the context.
+    The context is created at the beginning of `Model.update()` and discarded
+    at the end of it, so cached values can never be stale: the structure of
+    the lineages does not change while properties are being computed.
+
+    Calculators get access to the context by declaring a `context` keyword
+    parameter in their `compute()` method. It is then passed by `enrich()`
+    when the calculator is run by the updater. Outside of an update, `context`
+    is None and calculators must fall back to computing values directly.
+    """
+
+    def __init__(self) -> None:
+        # {(key, id(lineage)): (lineage, value)}
+        # A reference to the lineage is kept alongside the value so that
+        # its id() cannot be reused by another object during the update.
+        self._cache: dict[tuple[Hashable, int], tuple[Lineage | Data, Any]] = {}
+        # Number of values reused from the cache and computed, for profiling.
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """
+        Remove all the cached values.
+        """
+        self._cache.clear()
+
+    def memoize(
+        self, key: Hashable, lineage: Lineage | Data, func: Callable[[Any], Any]
+    ) -> Any:
+        """
+        Return the cached value of `key` for a lineage, computing it if needed.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifier of the intermediate result.
+        lineage : Lineage | Data
+            Lineage the intermediate result is computed on, or the whole data
+            for intermediate results spanning several lineages.
+        func : Callable[[Any], Any]
+            Function computing the intermediate result from the lineage or data.
+            Only called when the value is not already cached.
+
+        Returns
+        -------
+        Any
+            The cached or newly computed value.
+        """
+        cache_key = (key, id(lineage))
+        try:
+            value = self._cache[cache_key][1]
+        except KeyError:
+            self.misses += 1
+            value = func(lineage)
+            self._cache[cache_key] = (lineage, value)
+            return value
+        self.hits += 1
+        return value
+
+    def get_root(self, lineage: Lineage) -> int | list[int]:
+        """
+        Return the root of a lineage.
+
+        Parameters
+        ----------
+        lineage : Lineage
+            Lineage of interest.
+
+        Returns
+        -------
+        int or list[int]
+            The root node of the lineage, or a list of root nodes if the lineage
+            has more than one root.
+        """
+        return self.memoize("root", lineage, lambda lin: lin.get_root())
+
+    def get_cell_cycle(self, lineage: Lineage, cid: int) -> list[int]:
+        """
+        Return all the cells in the cell cycle of the given cell, in chronological order.
+
+        All the cell cycles of the lineage are computed at the first call,
+        in a single pass over the lineage.
+
+        Parameters
+        ----------
+        lineage : CellLineage
+            Lineage containing the cell of interest.
+        cid : int
+            ID of the cell for which to identify the cells in the cell cycle.
+
+        Returns
+        -------
+        list[int]
+            A chronologically ordered list of cells representing
+            the cell cycle for the given cell. This list is shared between all
+            the cells of the cycle and must not be modified.
+
+        Raises
+        ------
+        KeyError
+            If the cell is not in the lineage.
+        """
+        return self.memoize("cell_cycles", lineage, _map_cells_to_cycles)[cid]
+
+    def get_cell_coords(self, lineage: Lineage) -> tuple[dict[int, int], np.ndarray]:
+        """
+        Return the coordinates of all the cells of a lineage as an array.
+
+        Parameters
+        ----------
+        lineage : CellLineage
+            Lineage of interest.
+
+        Returns
+        -------
+        tuple[dict[int, int], np.ndarray]
+            A mapping from cell ID to row index in the array, and an array
+            of shape (number of cells, 3) holding the `cell_x`, `cell_y`
+            and `cell_z` coordinates of the cells.
+
+        Raises
+        ------
+        KeyError
+            If a cell is missing one of the coordinates.
+        """
+        return self.memoize("cell_coords", lineage, _get_cell_coords)
+
+    def get_edge_distances(self, lineage: Lineage) -> dict[tuple[int, int], float]:
+        """
+        Return the Euclidean distance between the two cells of each link of a lineage.
+
+        Parameters
+        ----------
+        lineage : CellLineage
+            Lineage of interest.
+
+        Returns
+        -------
+        dict[tuple[int, int], float]
+            Distance between the source and target cells, for each link.
+        """
+        return self.memoize("edge_distances", lineage, self._compute_edge_distances)
+
+    def _compute_edge_distances(self, lineage: Lineage) -> dict[tuple[int, int], float]:
+        edges = list(lineage.edges())
+        if not edges:
+            return {}
+        index, coords = self.get_cell_coords(lineage)
+        sources = np.array([index[s] for s, _ in edges], dtype=np.intp)
+        targets = np.array([index[t] for _, t in edges], dtype=np.intp)
+        dists = np.linalg.norm(coords[targets] - coords[sources], axis=1)
+        return dict(zip(edges, dists.tolist()))
+
+
+def _map_cells_to_cycles(lineage: Lineage) -> dict[int, list[int]]:
+    """
+    Map each cell of a lineage to the list of cells of its cell cycle.
+
+    Parameters
+    ----------
+    lineage : CellLineage
+        Lineage of interest.
+
+    Returns
+    -------
+    dict[int, list[int]]
+        Cell cycle of each cell of the lineage.
+    """
+    cell_to_cycle = {}
+    for cycle in lineage.get_cell_cycles():  # type: ignore[attr-defined]
+        for cid in cycle:
+            cell_to_cycle[cid] = cycle
+    return cell_to_cycle
+
+
+def _get_cell_coords(lineage: Lineage) -> tuple[dict[int, int], np.ndarray]:
+    """
+    Gather the coordinates of all the cells of a lineage in an array.
+
+    Parameters
+    ----------
+    lineage : CellLineage
+        Lineage of interest.
+
+    Returns
+    -------
+    tuple[dict[int, int], np.ndarray]
+        A mapping from cell ID to row index in the array, and the array of
+        coordinates of shape (number of cells, 3).
+    """
+    index = {}
+    coords = np.empty((len(lineage), 3), dtype=float)
+    for i, (nid, attrs) in enumerate(lineage.nodes(data=True)):
+        index[nid] = i
+        coords[i] = (attrs["cell_x"], attrs["cell_y"], attrs["cell_z"])
+    return index, coords
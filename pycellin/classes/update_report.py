@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+
+@dataclass
+class CalculatorRun:
+    """
+    Statistics of a single calculator run during an update.
+
+    Attributes
+    ----------
+    prop : str
+        Identifier of the computed property.
+    calculator : str
+        Class name of the calculator.
+    lin_type : str
+        Type of lineage the property applies to.
+    wall_time : float
+        Time spent computing the property, in seconds.
+    nb_objects : int | None
+        Number of objects (nodes, edges or lineages) the property was computed for,
+        or None if the property was computed for all the objects of the model.
+    cache_hits : int
+        Number of intermediate results reused from the update context.
+    cache_misses : int
+        Number of intermediate results computed and stored in the update context.
+    fused : bool
+        True if the calculator was fused with other local calculators, i.e. run
+        in a single pass over the objects. Its wall time is then the time spent
+        in its own computations, without the iteration over the objects.
+    """
+
+    prop: str
+    calculator: str
+    lin_type: str
+    wall_time: float
+    nb_objects: int | None
+    cache_hits: int
+    cache_misses: int
+    fused: bool = False
+
+
+@dataclass
+class UpdateReport:
+    """
+    Profiling report of a model update.
+
+    Attributes
+    ----------
+    phases : dict[str, float]
+        Time spent in each phase of the update, in seconds.
+    runs : list[CalculatorRun]
+        Statistics of each calculator run, in execution order.
+    total_time : float
+        Total time of the update, in seconds.
+
+    Examples
+    --------
+    >>> report = model.update(profile=True)
+    >>> print(report)
+    >>> df = report.to_dataframe()
+    """
+
+    phases: dict[str, float] = field(default_factory=dict)
+    runs: list[CalculatorRun] = field(default_factory=list)
+    total_time: float = 0.0
+
+    _start_time: float = field(default=0.0, repr=False)
+    _last_time: float = field(default=0.0, repr=False)
+
+    def _start(self) -> None:
+        """
+        Start measuring the time of the update.
+        """
+        self._start_time = time.perf_counter()
+        self._last_time = self._start_time
+
+    def _lap(self, phase: str) -> None:
+        """
+        Record the time spent in a phase, since the end of the previous phase.
+
+        If the phase is recorded several times, the times are summed.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the phase that just ended.
+        """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last_time
+        self._last_time = now
+        self.total_time = now - self._start_time
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Return the statistics of the calculator runs as a DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per calculator run, in execution order.
+        """
+        rows = [
+            {
+                "property": run.prop,
+                "calculator": run.calculator,
+                "lin_type": run.lin_type,
+                "wall_time": run.wall_time,
+                "nb_objects": run.nb_objects,
+                "cache_hits": run.cache_hits,
+                "cache_misses": run.cache_misses,
+                "fused": run.fused,
+            }
+            for run in self.runs
+        ]
+        columns = [
+            "property",
+            "calculator",
+            "lin_type",
+            "wall_time",
+            "nb_objects",
+            "cache_hits",
+            "cache_misses",
+            "fused",
+        ]
+        return pd.DataFrame(rows, columns=columns)
+
+    def __str__(self) -> str:
+        # The name column is as wide as the longest phase or property name.
+        names = [*self.phases, *(run.prop for run in self.runs)]
+        width = max(map(len, names), default=0)
+        lines = [f"Update done in {self.total_time:.3f} s"]
+        lines.append("Phases:")
+        for phase, wall_time in self.phases.items():
+            lines.append(f"  {phase:<{width}} {wall_time:10.3f} s")
+        lines.append("Properties (slowest first):")
+        for run in sorted(self.runs, key=lambda r: r.wall_time, reverse=True):
+            nb_objects = "all" if run.nb_objects is None else run.nb_objects
+            lines.append(
+                f"  {run.prop:<{width}} {run.wall_time:10.3f} s"
+                f"  objects: {nb_objects}"
+                f"  cache hits/misses: {run.cache_hits}/{run.cache_misses}"
+                + ("  (fused)" if run.fused else "")
+            )
+        return "\n".join(lines)
@@ -1,12 +1,299 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import time
+from pathlib import Path
+from typing import Any
+
 import networkx as nx
 
 from pycellin.classes import Data
-from pycellin.classes.property_calculator import PropertyCalculator
+from pycellin.classes.property_calculator import PropertyCalculator, enrich_fused
 from pycellin.classes.lineage import CellLineage
-from pycellin.custom_types import Cell, Link
+from pycellin.classes.update_context import UpdateContext
+from pycellin.classes.update_report import CalculatorRun, UpdateReport
+from pycellin.custom_types import Cell, Footprint, Link
+
+
+def _propagate(lineage: CellLineage, cells: set[int], downstream: bool) -> set[int]:
+    """
+    Get the given cells and all their descendants, or all their ancestors.
+
+    Parameters
+    ----------
+    lineage : CellLineage
+        Lineage containing the cells.
+    cells : set[int]
+        IDs of the cells to start from.
+    downstream : bool
+        True to get the descendants of the cells, False to get their ancestors.
+
+    Returns
+    -------
+    set[int]
+        IDs of the cells and of their descendants or ancestors.
+    """
+    get_next = lineage.successors if downstream else lineage.predecessors
+    reached = set(cells)
+    to_visit = list(cells)
+    while to_visit:
+        for next_cell in get_next(to_visit.pop()):
+            if next_cell not in reached:
+                reached.add(next_cell)
+                to_visit.append(next_cell)
+    return reached
+
+
+def _expand_to_footprint(
+    lineage: CellLineage, cells: set[int], footprint: Footprint
+) -> set[int]:
+    """
+    Get the cells whose value may be impacted by a modification of the given cells.
+
+    Parameters
+    ----------
+    lineage : CellLineage
+        Lineage containing the cells.
+    cells : set[int]
+        IDs of the modified cells.
+    footprint : Footprint
+        Region of the lineage that the value of a cell depends on.
+
+    Returns
+    -------
+    set[int]
+        IDs of the cells that need to be recomputed.
+    """
+    if footprint == "ancestors":
+        return _propagate(lineage, cells, downstream=True)
+    elif footprint == "descendants":
+        return _propagate(lineage, cells, downstream=False)
+    elif footprint == "cycle":
+        # A modification can merge or split the cell cycles of the neighbors
+        # of the modified cells, so these cycles are impacted too.
+        neighbors = set(cells)
+        for cid in cells:
+            neighbors.update(lineage.predecessors(cid))
+            neighbors.update(lineage.successors(cid))
+        impacted: set[int] = set()
+        for cid in neighbors:
+            if cid not in impacted:
+                impacted.update(lineage.get_cell_cycle(cid))
+        return impacted
+    else:
+        return set(lineage.nodes)
+
+
+def _merge_objects(
+    objects: tuple[list[Cell], list[Link], list[int]] | None,
+    other_objects: tuple[list[Cell], list[Link], list[int]] | None,
+) -> tuple[list[Cell], list[Link], list[int]] | None:
+    """
+    Merge two groups of cells, links and lineage IDs to recompute.
+
+    Parameters
+    ----------
+    objects : tuple[list[Cell], list[Link], list[int]] | None
+        The first group of objects, or None for all the objects of the model.
+    other_objects : tuple[list[Cell], list[Link], list[int]] | None
+        The second group of objects, or None for all the objects of the model.
+
+    Returns
+    -------
+    tuple[list[Cell], list[Link], list[int]] | None
+        The merged objects, without duplicates,
+        or None for all the objects of the model.
+    """
+    if objects is None or other_objects is None:
+        return None
+    cells, links, lins = objects
+    other_cells, other_links, other_lins = other_objects
+    return (
+        list(set(cells) | set(other_cells)),
+        list(set(links) | set(other_links)),
+        list(set(lins) | set(other_lins)),
+    )
+
+
+def _get_cycle_objects(
+    data: Data, lin_IDs: set[int] | None
+) -> tuple[list[Cell], list[Link], list[int]]:
+    """
+    Get all the cycles, links and lineage IDs of the given cycle lineages.
+
+    Parameters
+    ----------
+    data : Data
+        The data containing the cycle lineages.
+    lin_IDs : set[int] | None
+        IDs of the cycle lineages of interest, or None for all the cycle lineages.
+
+    Returns
+    -------
+    tuple[list[Cell], list[Link], list[int]]
+        The cycles, links and lineage IDs of the cycle lineages.
+    """
+    if lin_IDs is None:
+        lin_IDs = set(data.cycle_data.keys())
+    cycles = [
+        Cell(cycle_ID, lin_ID)
+        for lin_ID in lin_IDs
+        for cycle_ID in data.cycle_data[lin_ID].nodes()
+    ]
+    links = [
+        Link(source, target, lin_ID)
+        for lin_ID in lin_IDs
+        for source, target in data.cycle_data[lin_ID].edges()
+    ]
+    return cycles, links, list(lin_IDs)
+
+
+def _can_fuse(
+    fused_calc: PropertyCalculator,
+    fused_objects: tuple[list[Cell], list[Link], list[int]] | None,
+    calculator: PropertyCalculator,
+    objects: tuple[list[Cell], list[Link], list[int]] | None,
+) -> bool:
+    """
+    Check if a local calculator can be fused with already fused local calculators.
+
+    Parameters
+    ----------
+    fused_calc : PropertyCalculator
+        One of the already fused calculators.
+    fused_objects : tuple[list[Cell], list[Link], list[int]] | None
+        The objects to enrich with the fused calculators.
+    calculator : PropertyCalculator
+        The calculator to fuse.
+    objects : tuple[list[Cell], list[Link], list[int]] | None
+        The objects to enrich with the calculator to fuse.
+
+    Returns
+    -------
+    bool
+        True if the calculator can be fused, False otherwise.
+    """
+    prop_type = calculator.get_property_type()
+    if (
+        prop_type != fused_calc.get_property_type()
+        or calculator.prop.lin_type != fused_calc.prop.lin_type
+        or not calculator.is_fusable()  # type: ignore[attr-defined]
+        or not fused_calc.is_fusable()  # type: ignore[attr-defined]
+    ):
+        return False
+    if objects is fused_objects:
+        return True
+    if objects is None or fused_objects is None:
+        return False
+    index = {"node": 0, "edge": 1, "lineage": 2}[prop_type]
+    return set(objects[index]) == set(fused_objects[index])
+
+
+def _enrich_all(
+    calculators: list[PropertyCalculator],
+    data: Data,
+    objects: tuple[list[Cell], list[Link], list[int]] | None,
+    context: UpdateContext,
+    report: UpdateReport | None = None,
+) -> None:
+    """
+    Enrich the data with the values computed by one or several fused calculators.
+
+    Parameters
+    ----------
+    calculators : list[PropertyCalculator]
+        The calculators to run. Several calculators must be local calculators
+        for the same property type and lineage type.
+    data : Data
+        The data to enrich.
+    objects : tuple[list[Cell], list[Link], list[int]] | None
+        The objects to enrich, or None for all the objects of the model.
+    context : UpdateContext
+        Memoization context of the current update.
+    report : UpdateReport, optional
+        Report in which to record the statistics of each calculator, if any.
+    """
+    if not calculators:
+        return
+    if report is None:
+        _run_calculators(calculators, data, objects, context)
+        return
+
+    nb_objects = None
+    if objects is not None:
+        index = {"node": 0, "edge": 1, "lineage": 2}
+        nb_objects = len(objects[index[calculators[0].get_property_type()]])
+    runs = [
+        CalculatorRun(
+            prop=calc.prop.identifier,
+            calculator=type(calc).__name__,
+            lin_type=calc.prop.lin_type,
+            wall_time=0.0,
+            nb_objects=nb_objects,
+            cache_hits=0,
+            cache_misses=0,
+            fused=len(calculators) > 1,
+        )
+        for calc in calculators
+    ]
+    if len(calculators) > 1:
+        # Each calculator is timed inside the single pass over the objects.
+        _run_calculators(calculators, data, objects, context, runs)
+    else:
+        start_time = time.perf_counter()
+        hits, misses = context.hits, context.misses
+        _run_calculators(calculators, data, objects, context)
+        runs[0].wall_time = time.perf_counter() - start_time
+        runs[0].cache_hits = context.hits - hits
+        runs[0].cache_misses = context.misses - misses
+    report.runs.extend(runs)
+
+
+def _run_calculators(
+    calculators: list[PropertyCalculator],
+    data: Data,
+    objects: tuple[list[Cell], list[Link], list[int]] | None,
+    context: UpdateContext,
+    runs: list[CalculatorRun] | None = None,
+) -> None:
+    """
+    Run one calculator, or several fused local calculators.
+
+    Parameters
+    ----------
+    calculators : list[PropertyCalculator]
+        The calculators to run.
+    data : Data
+        The data to enrich.
+    objects : tuple[list[Cell], list[Link], list[int]] | None
+        The objects to enrich, or None for all the objects of the model.
+    context : UpdateContext
+        Memoization context of the current update.
+    runs : list[CalculatorRun], optional
+        Statistics of each fused calculator, in which to record the time spent
+        in each of them, if any.
+    """
+    nodes, edges, lins = objects or (None, None, None)
+    if len(calculators) > 1:
+        enrich_fused(
+            calculators,  # type: ignore[arg-type]
+            data,
+            nodes_to_enrich=nodes,
+            edges_to_enrich=edges,
+            lineages_to_enrich=lins,
+            context=context,
+            runs=runs,
+        )
+        return
+    # Depending on the class of the calculator, a different version of
+    # the enrich() method is called.
+    calculators[0].enrich(
+        data,
+        nodes_to_enrich=nodes,
+        edges_to_enrich=edges,
+        lineages_to_enrich=lins,
+        context=context,
+    )
 
 
 class ModelUpdater:
@@ -26,9 +313,17 @@ class ModelUpdater:
         self._added_lineages = set()  # set of lineage_ID
         self._removed_lineages = set()
         self._modified_lineages = set()
+        # Property values modified without any change in the structure.
+        self._modified_cell_props = dict()  # {Cell(): set of property identifiers}
+        self._modified_link_props = dict()  # {Link(): set of property identifiers}
 
         self._calculators = dict()  # {prop_name: PropertyCalculator}
 
+        # Snapshot the model was last saved to or loaded from, as (resolved path,
+        # generation), and IDs of the lineages modified since then.
+        self._snapshot: tuple[str, str | None] | None = None
+        self._unsaved_lineages: set[int] = set()
+
         # TODO: add something to store the order in which properties are computed?
         # Or maybe add an argument to update() to specify the order? We need to be able
         # to specify the order only for properties that have dependencies. So it might be
@@ -41,10 +336,17 @@ class ModelUpdater:
         # correctly. In that case, the solution is to add the cycle properties first,
         # then update, then add the cell properties and update again.
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        # Updaters pickled before incremental snapshots were supported.
+        self.__dict__.setdefault("_snapshot", None)
+        self.__dict__.setdefault("_unsaved_lineages", set())
+
     def _reinit(self) -> None:
         """
         Reset the state of the updater.
         """
+        self._unsaved_lineages.update(self._get_modified_lineages())
         self._update_required = False
         self._full_data_update = False
         self._added_cells.clear()
@@ -54,6 +356,68 @@ class ModelUpdater:
         self._added_lineages.clear()
         self._removed_lineages.clear()
         self._modified_lineages.clear()
+        self._modified_cell_props.clear()
+        self._modified_link_props.clear()
+
+    def _get_modified_lineages(self) -> set[int]:
+        """
+        Get the IDs of the lineages modified since the last update.
+
+        Returns
+        -------
+        set[int]
+            IDs of the added, removed and modified lineages, and of the lineages
+            of the added, removed or modified cells and links.
+        """
+        lin_IDs = (
+            self._added_lineages | self._removed_lineages | self._modified_lineages
+        )
+        for objects in (
+            self._added_cells,
+            self._removed_cells,
+            self._added_links,
+            self._removed_links,
+            self._modified_cell_props,
+            self._modified_link_props,
+        ):
+            lin_IDs.update(obj.lineage_ID for obj in objects)
+        return lin_IDs
+
+    def _get_unsaved_lineages(self, path: str | Path) -> tuple[str, set[int]] | None:
+        """
+        Get the lineages modified since the model was saved to or loaded from a path.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the snapshot directory.
+
+        Returns
+        -------
+        tuple[str, set[int]] | None
+            Generation of the snapshot and IDs of the lineages modified since
+            then, or None if the model was not last saved to or loaded from `path`.
+        """
+        if self._snapshot is None:
+            return None
+        snapshot_path, generation = self._snapshot
+        if generation is None or snapshot_path != str(Path(path).resolve()):
+            return None
+        return generation, self._unsaved_lineages | self._get_modified_lineages()
+
+    def _set_snapshot(self, path: str | Path, generation: str | None) -> None:
+        """
+        Record that the model has been saved to or loaded from a snapshot.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path of the snapshot directory.
+        generation : str | None
+            Generation of the snapshot.
+        """
+        self._snapshot = (str(Path(path).resolve()), generation)
+        self._unsaved_lineages = set()
 
     def _print_state(self) -> None:
         """
@@ -68,6 +432,8 @@ class ModelUpdater:
         print("Added lineages:", self._added_lineages)
         print("Removed lineages:", self._removed_lineages)
         print("Modified lineages:", self._modified_lineages)
+        print("Modified cell properties:", self._modified_cell_props)
+        print("Modified link properties:", self._modified_link_props)
 
     def register_calculator(
         self,
@@ -102,12 +468,227 @@ class ModelUpdater:
         else:
             raise KeyError(f"Property {prop_name} has no registered calculator.")
 
+    def _get_dirty_cells(self, data: Data, lineages: set[int]) -> dict[int, set[int]]:
+        """
+        Get the cells directly impacted by the modifications since the last update.
+
+        Added cells and the cells at both ends of added or removed links
+        are considered dirty. All the cells of new lineages, and of modified lineages
+        with no recorded cell or link modification, are also considered dirty.
+
+        Parameters
+        ----------
+        data : Data
+            The data to update.
+        lineages : set[int]
+            IDs of the lineages to process.
+
+        Returns
+        -------
+        dict[int, set[int]]
+            IDs of the dirty cells, grouped by lineage ID.
+        """
+        dirty_cells: dict[int, set[int]] = {lin_ID: set() for lin_ID in lineages}
+        for cell in self._added_cells:
+            if cell.lineage_ID in dirty_cells:
+                dirty_cells[cell.lineage_ID].add(cell.cell_ID)
+        for link in self._added_links | self._removed_links:
+            if link.lineage_ID in dirty_cells:
+                dirty_cells[link.lineage_ID].add(link.source_cell_ID)
+                dirty_cells[link.lineage_ID].add(link.target_cell_ID)
+
+        for lin_ID, cells in dirty_cells.items():
+            lineage = data.cell_data[lin_ID]
+            if lin_ID in self._added_lineages or not cells:
+                cells.update(lineage.nodes)
+            # Removed cells, or cells that moved to another lineage,
+            # cannot be recomputed in this lineage.
+            cells.intersection_update(lineage.nodes)
+        return dirty_cells
+
+    def _get_footprint_objects(
+        self,
+        data: Data,
+        dirty_cells: dict[int, set[int]],
+        footprint: Footprint,
+    ) -> tuple[list[Cell], list[Link], list[int]] | None:
+        """
+        Get the cells, links and lineages impacted by the dirty cells.
+
+        Parameters
+        ----------
+        data : Data
+            The data to update.
+        dirty_cells : dict[int, set[int]]
+            IDs of the dirty cells, grouped by lineage ID.
+        footprint : Footprint
+            Region of the lineage that the value of an object depends on.
+
+        Returns
+        -------
+        tuple[list[Cell], list[Link], list[int]] | None
+            The impacted cells, links and lineage IDs,
+            or None if all the objects of the model are impacted.
+        """
+        if footprint == "model":
+            return None
+        cells = []
+        links = set()
+        for lin_ID, dirty in dirty_cells.items():
+            lineage = data.cell_data[lin_ID]
+            impacted = _expand_to_footprint(lineage, dirty, footprint)
+            for cid in impacted:
+                cells.append(Cell(cid, lin_ID))
+                for source, target in lineage.in_edges(cid):
+                    links.add(Link(source, target, lin_ID))
+                for source, target in lineage.out_edges(cid):
+                    links.add(Link(source, target, lin_ID))
+        return cells, list(links), list(dirty_cells.keys())
+
+    def _get_changed_objects(
+        self, data: Data, calculator: PropertyCalculator
+    ) -> tuple[set[Cell], set[Link]]:
+        """
+        Get the existing cells and links with modified values for the calculator inputs.
+
+        Parameters
+        ----------
+        data : Data
+            The data to update.
+        calculator : PropertyCalculator
+            The calculator of interest.
+
+        Returns
+        -------
+        tuple[set[Cell], set[Link]]
+            The cells and links with at least one modified input value.
+        """
+        inputs = calculator.get_inputs()
+        cells = set()
+        for cell, props in self._modified_cell_props.items():
+            if inputs is None or not props.isdisjoint(inputs):
+                lineage = data.cell_data.get(cell.lineage_ID)
+                if lineage is not None and cell.cell_ID in lineage:
+                    cells.add(cell)
+        links = set()
+        for link, props in self._modified_link_props.items():
+            if inputs is None or not props.isdisjoint(inputs):
+                lineage = data.cell_data.get(link.lineage_ID)
+                if lineage is not None and lineage.has_edge(
+                    link.source_cell_ID, link.target_cell_ID
+                ):
+                    links.add(link)
+        return cells, links
+
+    def _get_impacted_objects(
+        self,
+        data: Data,
+        calculator: PropertyCalculator,
+        cells: set[Cell],
+        links: set[Link],
+    ) -> tuple[list[Cell], list[Link], list[int]] | None:
+        """
+        Get the objects whose value may be impacted by modified property values.
+
+        Parameters
+        ----------
+        data : Data
+            The data to update.
+        calculator : PropertyCalculator
+            The calculator of the property to recompute.
+        cells : set[Cell]
+            The cells with modified input values.
+        links : set[Link]
+            The links with modified input values.
+
+        Returns
+        -------
+        tuple[list[Cell], list[Link], list[int]] | None
+            The impacted cells, links and lineage IDs,
+            or None if all the objects of the model are impacted.
+        """
+        if calculator.is_for_local_property():
+            prop_type = calculator.get_property_type()
+            if prop_type == "node":
+                return list(cells), [], []
+            elif prop_type == "edge":
+                # A local edge property can depend on the values of both its cells.
+                impacted_links = set(links)
+                for cell in cells:
+                    lineage = data.cell_data[cell.lineage_ID]
+                    for source, target in lineage.in_edges(cell.cell_ID):
+                        impacted_links.add(Link(source, target, cell.lineage_ID))
+                    for source, target in lineage.out_edges(cell.cell_ID):
+                        impacted_links.add(Link(source, target, cell.lineage_ID))
+                return [], list(impacted_links), []
+            else:
+                lin_IDs = {cell.lineage_ID for cell in cells}
+                lin_IDs.update(link.lineage_ID for link in links)
+                return [], [], list(lin_IDs)
+
+        seeds: dict[int, set[int]] = {}
+        for cell in cells:
+            seeds.setdefault(cell.lineage_ID, set()).add(cell.cell_ID)
+        for link in links:
+            seeds.setdefault(link.lineage_ID, set()).update(
+                (link.source_cell_ID, link.target_cell_ID)
+            )
+        return self._get_footprint_objects(data, seeds, calculator.get_footprint())
+
+    def _record_computed_values(
+        self,
+        data: Data,
+        calculator: PropertyCalculator,
+        objects: tuple[list[Cell], list[Link], list[int]] | None,
+    ) -> None:
+        """
+        Record the values computed by a calculator as modified.
+
+        Properties computed later in the update that depend on the computed
+        property will then be recomputed on the same objects.
+
+        Parameters
+        ----------
+        data : Data
+            The data being updated.
+        calculator : PropertyCalculator
+            The calculator that computed the values.
+        objects : tuple[list[Cell], list[Link], list[int]] | None
+            The cells, links and lineage IDs for which values have been computed,
+            or None if they have been computed for all the objects of the model.
+        """
+        prop_ID = calculator.prop.identifier
+        prop_type = calculator.get_property_type()
+        if prop_type == "node":
+            if objects is None:
+                cells = [
+                    Cell(nid, lin_ID)
+                    for lin_ID, lin in data.cell_data.items()
+                    for nid in lin.nodes
+                ]
+            else:
+                cells = [Cell(*cell) for cell in objects[0]]
+            for cell in cells:
+                self._modified_cell_props.setdefault(cell, set()).add(prop_ID)
+        elif prop_type == "edge":
+            if objects is None:
+                links = [
+                    Link(source, target, lin_ID)
+                    for lin_ID, lin in data.cell_data.items()
+                    for source, target in lin.edges
+                ]
+            else:
+                links = [Link(*link) for link in objects[1]]
+            for link in links:
+                self._modified_link_props.setdefault(link, set()).add(prop_ID)
+
     def _update(
         self,
         data: Data,
         time_prop: str,
         time_step: int | float,
         props_to_update: list[str] | None = None,
+        report: UpdateReport | None = None,
     ) -> None:
         """
         Update the property values of the data.
@@ -122,6 +703,9 @@ class ModelUpdater:
             The time step to use for the update.
         props_to_update : list of str, optional
             List of properties to update. If None, all properties are updated.
+        report : UpdateReport, optional
+            Report in which to record profiling information about the update.
+            If None, the update is not profiled.
 
         Warnings
         --------
@@ -133,6 +717,8 @@ class ModelUpdater:
         first, then update, then add the cell properties and update again.
         """
         # TODO: refactor, this method is too long and does too many things.
+        if report is not None:
+            report._start()
 
         # Remove empty lineages.
         for lin_ID in (
@@ -146,6 +732,9 @@ class ModelUpdater:
             if lin_ID in data.cell_data:
                 del data.cell_data[lin_ID]
 
+        if report is not None:
+            report._lap("lineages_cleanup")
+
         # Split lineages with several unconnected components.
         lineages = list(data.cell_data.values())
         for lin in lineages:
@@ -241,6 +830,9 @@ class ModelUpdater:
                     data.cell_data[new_lin_ID] = split_lin
                     self._added_lineages.add(new_lin_ID)
 
+        if report is not None:
+            report._lap("split_components")
+
         # Update cell lineage properties.
         # TODO: Deal with property dependencies. See comments in __init__.
         if props_to_update is None:
@@ -290,16 +882,63 @@ class ModelUpdater:
         # Remove duplicates.
         edges_to_process = list(set(edges_to_process))
 
+        # Intermediate results shared between calculators are cached
+        # for the duration of the update only.
+        context = UpdateContext()
+
+        # Global properties are only recomputed on the region of the lineages
+        # impacted by the modifications, as declared by their footprint.
+        dirty_cells = self._get_dirty_cells(data, lins_to_process)
+        footprint_objects = {}  # {footprint: (cells, links, lineages) | None}
+        if report is not None:
+            report._lap("objects_selection")
+
         # Recompute the properties as needed.
+        # Consecutive local calculators working on the same objects are fused
+        # so that each object is visited only once.
+        fused_calcs: list[PropertyCalculator] = []
+        fused_objects: tuple[list[Cell], list[Link], list[int]] | None = None
         for calc in cell_calculators:
-            # Depending on the class of the calculator, a different version of
-            # the enrich() method is called.
-            calc.enrich(
-                data,
-                nodes_to_enrich=nodes_to_process,  # self._added_cells,
-                edges_to_enrich=edges_to_process,  # self._added_links,
-                lineages_to_enrich=lins_to_process,  # self._added_lineages | self._modified_lineages
-            )
+            if calc.is_for_local_property():
+                objects = (nodes_to_process, edges_to_process, lins_to_process)
+            else:
+                footprint = calc.get_footprint()
+                if footprint not in footprint_objects:
+                    footprint_objects[footprint] = self._get_footprint_objects(
+                        data, dirty_cells, footprint
+                    )
+                objects = footprint_objects[footprint]
+            # Objects impacted by modified values of the calculator inputs.
+            changed_cells, changed_links = self._get_changed_objects(data, calc)
+            if changed_cells or changed_links:
+                objects = _merge_objects(
+                    objects,
+                    self._get_impacted_objects(data, calc, changed_cells, changed_links),
+                )
+            # Recording can be done before the computation since the objects
+            # to compute are already known.
+            self._record_computed_values(data, calc, objects)
+            # Lineages with recomputed values must be saved again.
+            if objects is None:
+                self._unsaved_lineages.update(data.cell_data)
+            else:
+                self._unsaved_lineages.update(objects[2])
+
+            if calc.is_for_local_property():
+                if fused_calcs and _can_fuse(fused_calcs[0], fused_objects, calc, objects):
+                    fused_calcs.append(calc)
+                else:
+                    _enrich_all(fused_calcs, data, fused_objects, context, report)
+                    fused_calcs = [calc]
+                    fused_objects = objects
+                continue
+
+            _enrich_all(fused_calcs, data, fused_objects, context, report)
+            fused_calcs = []
+            _enrich_all([calc], data, objects, context, report)
+        _enrich_all(fused_calcs, data, fused_objects, context, report)
+        if report is not None:
+            report._lap("cell_properties")
 
         # In case of modifications in the structure of some cell lineages,
         # we need to recompute the cycle lineages and their properties.
@@ -319,6 +958,9 @@ class ModelUpdater:
         for lin_ID in self._removed_lineages:
             if data.cycle_data is not None and lin_ID in data.cycle_data:
                 del data.cycle_data[lin_ID]
+        if report is not None:
+            report._lap("cycle_rebuild")
+
         # Update cycle lineages with cycle properties.
         if data.cycle_data is not None:
             if props_to_update is None:
@@ -334,27 +976,36 @@ class ModelUpdater:
                     if self._calculators[prop].prop.lin_type
                     in ("CycleLineage", "Lineage")
                 ]
-            # Since cycle lineages are recreated at each update, every element
-            # of the lineages need to be updated with its properties.
-            cycle_nodes = [
-                Cell(cycle_ID, lin_ID)
-                for lin_ID in data.cycle_data
-                for cycle_ID in data.cycle_data[lin_ID].nodes()
-            ]
-            cycle_edges = [
-                Link(source, target, lin_ID)
-                for lin_ID in data.cycle_data
-                for source, target in data.cycle_data[lin_ID].edges()
-            ]
+            # Only the rebuilt cycle lineages and the ones with modified
+            # input values need to be updated.
+            rebuilt_lins = {
+                lin_ID for lin_ID in lins_to_process if lin_ID in data.cycle_data
+            }
+            cycle_props = {}  # {lin_ID: set of cycle properties computed}
             for calc in cycle_calculators:
-                # Depending on the class of the calculator, a different version of
-                # the enrich() method is called.
-                calc.enrich(
-                    data,
-                    nodes_to_enrich=cycle_nodes,
-                    edges_to_enrich=cycle_edges,
-                    lineages_to_enrich=data.cycle_data.keys(),
-                )
+                if calc.get_footprint() == "model":
+                    cycle_lins = None
+                else:
+                    changed_cells, changed_links = self._get_changed_objects(data, calc)
+                    cycle_lins = set(rebuilt_lins)
+                    cycle_lins.update(cell.lineage_ID for cell in changed_cells)
+                    cycle_lins.update(link.lineage_ID for link in changed_links)
+                    inputs = calc.get_inputs()
+                    cycle_lins.update(
+                        lin_ID
+                        for lin_ID, props in cycle_props.items()
+                        if inputs is None or not props.isdisjoint(inputs)
+                    )
+                    cycle_lins.intersection_update(data.cycle_data.keys())
+                nodes, edges, lins = _get_cycle_objects(data, cycle_lins)
+                _enrich_all([calc], data, (nodes, edges, lins), context, report)
+                self._unsaved_lineages.update(lins)
+                for lin_ID in lins:
+                    cycle_props.setdefault(lin_ID, set()).add(calc.prop.identifier)
+
+        if report is not None:
+            report._lap("cycle_properties")
 
         # Update is done, we can clean up.
+        context.clear()
         self._reinit()
@@ -7,6 +7,7 @@ from typing import Literal
 
 
 LineageType = Literal["CellLineage", "CycleLineage", "Lineage"]
+Footprint = Literal["ancestors", "descendants", "cycle", "lineage", "model"]
 
 
 class PropertyType(Flag):
@@ -1,5 +1,15 @@
+from .aggregation import SubtreeReduction, TreeScan
 from .core import *
-from .morphology import RodLength, RodWidth
+from .morphology import ROIPropCalculator, RodLength, RodWidth
+from .neighborhood import LocalDensity, NearestNonSisterDistance, NeighborCount
+from .shape import (
+    CellArea,
+    CellEccentricity,
+    CellPerimeter,
+    CellSolidity,
+    MinRectLength,
+    MinRectWidth,
+)
 from .tracking import (
     AbsoluteAge,
     CycleCompleteness,
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Generic calculators aggregating a property along the lineage tree.
+
+These calculators rely on the `Lineage.scan()` and `Lineage.reduce_subtree()`
+primitives, which compute the values of all the nodes of a lineage in a single
+pass instead of gathering the ancestors or descendants of each node.
+Since the aggregated property and the operation are chosen by the user,
+there is no predefined property associated with these calculators: the user
+provides the `Property` describing the result.
+"""
+
+from abc import abstractmethod
+from typing import Any, Callable, Literal
+
+from pycellin.classes.data import Data
+from pycellin.classes.lineage import Lineage
+from pycellin.classes.property import Property
+from pycellin.classes.property_calculator import (
+    NodeGlobalPropCalculator,
+    _get_lin_data_from_lin_type,
+)
+from pycellin.classes.update_context import UpdateContext
+
+
+class _TreeAggregation(NodeGlobalPropCalculator):
+    """
+    Base calculator for properties aggregated over a whole lineage at once.
+    """
+
+    def __init__(
+        self,
+        property: Property,
+        input_prop: str | None,
+        op: str | Callable[[Any, Any], Any] = "sum",
+    ):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        input_prop : str | None
+            Identifier of the property to aggregate, or None to aggregate
+            a value of 1 for each node.
+        op : str or Callable[[Any, Any], Any], optional
+            Binary operation: "sum", "prod", "max", "min", a binary numpy ufunc
+            or any function of two arguments. "sum" by default.
+        """
+        super().__init__(property)
+        self.input_prop = input_prop
+        self.op = op
+
+    def get_inputs(self) -> set[str]:
+        return set() if self.input_prop is None else {self.input_prop}
+
+    @abstractmethod
+    def aggregate(self, lineage: Lineage) -> dict[int, Any]:
+        """
+        Compute the aggregated values of all the nodes of a lineage.
+        Need to be implemented in subclasses.
+
+        Parameters
+        ----------
+        lineage : Lineage
+            Lineage of interest.
+
+        Returns
+        -------
+        dict[int, Any]
+            The aggregated value of each node.
+        """
+        pass
+
+    def compute(  # type: ignore[override]
+        self, data: Data, lineage: Lineage, nid: int
+    ) -> Any:
+        """
+        Compute the aggregated value of a single node.
+
+        The whole lineage is aggregated, so `enrich()` should be preferred
+        to compute several nodes.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineage.
+        lineage : Lineage
+            Lineage containing the node of interest.
+        nid : int
+            Node ID of the node of interest.
+
+        Returns
+        -------
+        Any
+            The aggregated value of the node.
+        """
+        return self.aggregate(lineage)[nid]
+
+    def enrich(
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]] | None = None,
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Enrich the data with the aggregated values for a list of nodes.
+
+        Each lineage is aggregated once, whatever the number of its nodes to enrich.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineages to enrich.
+        nodes_to_enrich : list of tuple[int, int], optional
+            List of tuples containing the node ID and the lineage ID of the nodes
+            to enrich with the property value. If None, all nodes in all lineages
+            are enriched.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any. Not used.
+        """
+        lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
+        if nodes_to_enrich is None:
+            nodes_to_enrich = [
+                (nid, lin_ID) for lin_ID, lin in lineages.items() for nid in lin.nodes
+            ]
+        nodes_by_lin: dict[int, list[int]] = {}
+        for nid, lin_ID in nodes_to_enrich:
+            nodes_by_lin.setdefault(lin_ID, []).append(nid)
+        for lin_ID, nids in nodes_by_lin.items():
+            lin = lineages[lin_ID]
+            values = self.aggregate(lin)
+            for nid in nids:
+                lin.nodes[nid][self.prop.identifier] = values[nid]
+
+
+class TreeScan(_TreeAggregation):
+    """
+    Calculator to accumulate a property along the paths from the root to the leaves.
+
+    The value of a node is `op(value of its parent, input value of the node)`,
+    e.g. with `op="sum"` and the `cell_displacement` edge property, each cell gets
+    its cumulative displacement since the root. See `Lineage.scan()`.
+    """
+
+    _FOOTPRINT = "ancestors"
+
+    def __init__(
+        self,
+        property: Property,
+        input_prop: str | None,
+        op: str | Callable[[Any, Any], Any] = "sum",
+        on: Literal["node", "edge"] = "node",
+        initial: Any = None,
+    ):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        input_prop : str | None
+            Identifier of the property to accumulate, or None to accumulate
+            a value of 1 for each node.
+        op : str or Callable[[Any, Any], Any], optional
+            Binary operation: "sum", "prod", "max", "min", a binary numpy ufunc
+            or any function of two arguments. "sum" by default.
+        on : {"node", "edge"}, optional
+            Type of the input property. For an edge property, the value of a node
+            is accumulated from the value of its incoming edge. "node" by default.
+        initial : Any, optional
+            Value accumulated before the root.
+        """
+        super().__init__(property, input_prop, op)
+        self.on = on
+        self.initial = initial
+
+    def aggregate(self, lineage: Lineage) -> dict[int, Any]:
+        return lineage.scan(self.input_prop, self.op, self.on, self.initial)
+
+
+class SubtreeReduction(_TreeAggregation):
+    """
+    Calculator to reduce a node property over the subtree rooted at each node.
+
+    The value of a node is the reduction of the input values of the node
+    and of all its descendants, e.g. with no input property and `op="sum"`,
+    each cell gets the number of cells in its progeny, itself included.
+    See `Lineage.reduce_subtree()`.
+    """
+
+    _FOOTPRINT = "descendants"
+
+    def aggregate(self, lineage: Lineage) -> dict[int, Any]:
+        return lineage.reduce_subtree(self.input_prop, self.op)
@@ -79,6 +79,9 @@ class Timepoint(NodeLocalPropCalculator):
 
         self.min_time = min_time
 
+    def get_inputs(self) -> set[str]:
+        return {self.ref_time_prop}
+
     def compute(self, lineage, nid: int) -> int:
         """
         Compute the timepoint of a given node.
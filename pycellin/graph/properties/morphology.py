@@ -6,20 +6,33 @@ A collection of diverse morphology properties that can be added to
 lineage graphs.
 """
 
-from itertools import combinations, product
+import hashlib
+import sys
+import warnings
+from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
 from operator import itemgetter
+from typing import Any, Callable, Hashable, Sequence
 
 import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
 from PIL import Image, ImageDraw
 from scipy import ndimage as ndi
-from shapely.geometry import LineString, Point
+from scipy import sparse
+from scipy.sparse import csgraph
+from shapely.geometry import LineString
 from skimage.morphology import skeletonize
 
+from pycellin.classes.data import Data
 from pycellin.classes.lineage import CellLineage
 from pycellin.classes.property import Property
-from pycellin.classes.property_calculator import NodeLocalPropCalculator
+from pycellin.classes.property_calculator import (
+    NodeLocalPropCalculator,
+    _get_lin_data_from_lin_type,
+)
+from pycellin.classes.update_context import UpdateContext
 
 # TODO:
 # - remove debug code
@@ -43,62 +56,127 @@ def from_roi_to_array(roi, width, height):
     return img
 
 
-def adjacent_pixels(img, pixel):
-    i, j = pixel
-    adj_px = []
-    for k, l in product(range(i - 1, i + 2), range(j - 1, j + 2)):
-        if k == i and l == j:
-            continue
-        # if k >= img.shape[1] or l >= img.shape[0]:
-
-        try:
-            if img[k, l] != 0:
-                adj_px.append((k, l))
-        except IndexError:
-            # If current pixel is on the border of the image, there can't be
-            # adjacency on the border side.
-            continue
-    return adj_px
-
-
-def prune_skel(adjacency_dict):
-    # We only want to keep the main skeleton which is the longest path
-    # of the graph. To find it, we are looking for the longest shortest
-    # path between 2 extremities of the graph. For this, we switch to
-    # a graph representation of the skeleton to ease the path research.
-    skel_graph = nx.from_dict_of_lists(adjacency_dict)
-    longest_path = []
-    tip_px = [px for px, list_px in adjacency_dict.items() if len(list_px) == 1]
-    for n1, n2 in combinations(tip_px, 2):
-        tmp_path = nx.shortest_path(skel_graph, n1, n2)
-        if len(tmp_path) > len(longest_path):
-            longest_path = tmp_path
-    # Returning the adjacency_dict: now it contains only main skeleton pix.
-    return nx.to_dict_of_lists(skel_graph, nodelist=longest_path)
-
-
-def from_skel_to_path(adjacency_dict, first_px):
-    # Ordering the skeleton pixels by following along the skeleton,
-    # from one tip to another.
-    path = [first_px]
-    current_px = adjacency_dict[first_px][0]
-    path.append(current_px)
-    # print(current_px)
-    while current_px in adjacency_dict:
-        candidates = adjacency_dict[current_px]
-        candidates.remove(path[-2])  # The pixel we're coming from.
-        # print(candidates)
-        if not candidates:  # There is no more pixel: we've reached a tip.
-            break
-        assert len(candidates) == 1
-        current_px = candidates[0]
-        path.append(current_px)
-    return path
-
-
-def from_path_to_line(path, tol):
+# Kernel counting the 8-connected neighbors of a pixel.
+_NEIGHBORS_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=np.uint8)
+# Offsets of the 8-connected neighbors of a pixel.
+_NEIGHBORS_OFFSETS = np.argwhere(_NEIGHBORS_KERNEL) - 1
+
+
+def count_skel_neighbors(skel: np.ndarray) -> np.ndarray:
+    """
+    Count the 8-connected skeleton neighbors of each skeleton pixel.
+
+    Parameters
+    ----------
+    skel : np.ndarray
+        Binary image of the skeleton.
+
+    Returns
+    -------
+    np.ndarray
+        Image of the same shape as `skel` holding the number of neighbors
+        of each skeleton pixel, and 0 outside of the skeleton.
+    """
+    skel = skel.astype(np.uint8)
+    return ndi.convolve(skel, _NEIGHBORS_KERNEL, mode="constant", cval=0) * skel
+
+
+def from_skel_to_graph(skel: np.ndarray) -> tuple[np.ndarray, sparse.csr_matrix]:
+    """
+    Build the 8-connectivity graph of the pixels of a skeleton.
+
+    Parameters
+    ----------
+    skel : np.ndarray
+        Binary image of the skeleton.
+
+    Returns
+    -------
+    tuple[np.ndarray, sparse.csr_matrix]
+        The (row, column) coordinates of the skeleton pixels, of shape
+        (number of pixels, 2), and the adjacency matrix of the pixels,
+        in the same order.
+    """
+    pixels = np.argwhere(skel)
+    nb_pixels = len(pixels)
+    # Index of each skeleton pixel in `pixels`, -1 outside of the skeleton.
+    # The padding spares us from checking the borders of the image.
+    index = np.full((skel.shape[0] + 2, skel.shape[1] + 2), -1, dtype=np.intp)
+    index[pixels[:, 0] + 1, pixels[:, 1] + 1] = np.arange(nb_pixels)
+    rows = []
+    cols = []
+    for di, dj in _NEIGHBORS_OFFSETS:
+        neighbors = index[pixels[:, 0] + 1 + di, pixels[:, 1] + 1 + dj]
+        is_skel = neighbors >= 0
+        rows.append(np.flatnonzero(is_skel))
+        cols.append(neighbors[is_skel])
+    rows_arr = np.concatenate(rows)
+    cols_arr = np.concatenate(cols)
+    graph = sparse.csr_matrix(
+        (np.ones(len(rows_arr), dtype=np.uint8), (rows_arr, cols_arr)),
+        shape=(nb_pixels, nb_pixels),
+    )
+    return pixels, graph
+
+
+def from_skel_to_path(skel: np.ndarray, nb_neighbors: np.ndarray) -> np.ndarray:
+    """
+    Order the pixels of the main skeleton, from one tip to the other.
+
+    The main skeleton is the longest shortest path between 2 tips
+    of the skeleton, so side branches are pruned.
+
+    Parameters
+    ----------
+    skel : np.ndarray
+        Binary image of the skeleton.
+    nb_neighbors : np.ndarray
+        Number of neighbors of each skeleton pixel, as returned by
+        `count_skel_neighbors()`.
+
+    Returns
+    -------
+    np.ndarray
+        The (row, column) coordinates of the ordered pixels of the main
+        skeleton, of shape (number of pixels, 2). Empty if the skeleton
+        has less than 2 tips.
+    """
+    pixels, graph = from_skel_to_graph(skel)
+    degrees = nb_neighbors[pixels[:, 0], pixels[:, 1]]
+    tips = np.flatnonzero(degrees == 1)
+    if len(tips) < 2:
+        return np.empty((0, 2), dtype=np.intp)
+    if len(tips) == 2 and degrees.max() <= 2:
+        # Simple path: a breadth-first traversal from one tip follows it.
+        order = csgraph.breadth_first_order(
+            graph, tips[0], directed=False, return_predecessors=False
+        )
+        return pixels[order]
+    # Side branches: we look for the longest shortest path between 2 tips.
+    # Ties are broken in favor of the first pair of tips in scan order.
+    dist = csgraph.shortest_path(graph, directed=False, unweighted=True, indices=tips)
+    tips_dist = dist[:, tips]
+    tips_dist[~np.isfinite(tips_dist)] = -1
+    start, end = np.unravel_index(np.argmax(tips_dist), tips_dist.shape)
+    # Several shortest paths of the same number of pixels can link the 2 tips,
+    # with different lengths once simplified. networkx picks one depending on
+    # the order of the neighbors of each pixel, so the neighbors are listed
+    # in scan order to keep the path, and the rod length, of previous versions.
+    graph.sort_indices()
+    skel_graph = nx.from_dict_of_lists(
+        {
+            i: graph.indices[graph.indptr[i] : graph.indptr[i + 1]].tolist()
+            for i in range(len(pixels))
+        }
+    )
+    path = nx.shortest_path(skel_graph, int(tips[start]), int(tips[end]))
+    return pixels[path]
+
+
+def from_path_to_line(path: np.ndarray, tol: float) -> LineString:
     # Creation of a geometrical line out of the skeleton path.
-    line = LineString([Point((x, y)) for (y, x) in path])
+    # Pixels coordinates are (row, column) i.e. (y, x).
+    line = LineString(path[:, ::-1])
     # To get a better approximation of the object lenght, we simplify
     # the skeleton line.
     simplified_line = line.simplify(tol, preserve_topology=True)
@@ -143,6 +221,66 @@ def get_width_and_length(
     debug_folder : Optional[str], optional
         Folder in which to save the debug graphs, by default None.
 
+    Returns
+    -------
+    tuple[float, float]
+        Width and length of the ROI.
+    """
+    debug_file = None
+    if debug:
+        lin_id = lineage.nodes[nid]["lineage_ID"]
+        debug_file = f"{debug_folder}/Lineage{lin_id}_Node{nid}_{skel_algo}"
+    return get_roi_width_and_length(
+        lineage.nodes[nid]["ROI_coords"],
+        pixel_size,
+        skel_algo,
+        tolerance,
+        method_width,
+        width_ignore_tips,
+        nid=nid,
+        debug=debug,
+        debug_file=debug_file,
+    )
+
+
+def get_roi_width_and_length(
+    roi: Sequence[tuple[float, float]] | np.ndarray,
+    pixel_size: float,
+    skel_algo: str = "zhang",
+    tolerance: float = 0.5,
+    method_width: str = "mean",
+    width_ignore_tips: bool = False,
+    nid: int | None = None,
+    debug: bool = False,
+    debug_file: str | None = None,
+) -> tuple[float, float]:
+    """
+    Compute the width and length of an ROI.
+
+    Parameters
+    ----------
+    roi : Sequence[tuple[float, float]] | np.ndarray
+        Coordinates of the ROI vertices.
+    pixel_size : float
+        Pixel size in micrometer.
+    skel_algo : str, optional
+        'zhang' or 'lee', by default 'zhang'.
+    tolerance : float, optional
+        Tolerance distance for shape simplification (0-1).
+        The higher the tolerance, the more simplified the line will be.
+        By default 0.5.
+    method_width : str, optional
+        Method to compute width along skeleton: min, max, mean or median.
+        By default mean.
+    width_ignore_tips : bool, optional
+        True to ignore the skeleton tips while computing width, by default False.
+    nid : int, optional
+        Node ID (cell_ID) of the cell the ROI belongs to, used in warnings.
+    debug : bool, optional
+        True to activate debug behavior, by default False.
+    debug_file : str, optional
+        File in which to save the debug graphs, by default None.
+
     Returns
     -------
     tuple[float, float]
@@ -158,7 +296,6 @@ def get_width_and_length(
     # First we need to reconstruct the image of the object we are working on.
     # This is done by drawing and filling a polygon defined by the points
     # in the ROI list.
-    roi = lineage.nodes[nid]["ROI_coords"]
     # The coordinates extracted from the graph are in microns, not in pixels.
     # roi = [(int(x * x_resolution), int(y * x_resolution)) for (x, y) in roi]
     roi = [(int(x * 1 / pixel_size), int(y * 1 / pixel_size)) for (x, y) in roi]
@@ -209,90 +346,39 @@ def get_width_and_length(
     # The next step is to create a simple path out of the skeleton, then to
     # simplify the associated curve to compute an approximation of the
     # width and length of the object.
-    # Building a pixel adjacency dictionary in which keys are the coordinates
-    # of non zero pixels, and values are the coordinates of pixels adjacent
-    # to the key pixel (using an 8-connectivity).
-    adjacency_dict = {}
-    pixels_i, pixels_j = np.nonzero(skel)
-    pruning = False
-    for i, j in zip(pixels_i, pixels_j):
-        adj_px = adjacent_pixels(skel, (i, j))
-        connectivity = len(adj_px)
-        if connectivity > 2:
-            # There is a side branching so we will need to prune it later
-            # so as to only keep the main skeleton.
-            pruning = True
-        adjacency_dict[(i, j)] = adj_px
-
-    if pruning:
-        # We only want to keep the main skeleton which is the longest path
-        # of the graph so we need to prune the side branches.
-        if debug:
-            print("PRUNING")
-            print(adjacency_dict)
-            # print(len(adjacency_dict))
-        adjacency_dict = prune_skel(adjacency_dict)
-        if debug:
-            print(adjacency_dict)
-            # print(len(adjacency_dict))
-
-    # Tips of the skeleton = pixels connected to only 1 pixel.
-    tip_px = [px for px, list_px in adjacency_dict.items() if len(list_px) == 1]
-    if len(adjacency_dict) == 1:
+    # Tips of the skeleton = pixels connected to only 1 pixel (8-connectivity).
+    # If there are side branches, we only keep the main skeleton which is
+    # the longest path between 2 tips.
+    nb_neighbors = count_skel_neighbors(skel)
+    nb_skel_px = np.count_nonzero(skel)
+    path = from_skel_to_path(skel, nb_neighbors) if nb_skel_px > 1 else None
+    if nb_skel_px == 1:
         # There is only one pixel in the skeleton. The object being processed
         # is probably roundish. The method for mesuring length is not
         # adapted to this kind of morphology.
-        try:
-            track_ID = lineage.nodes[nid]["TRACK_ID"]
-        except KeyError:
-            print(
-                f"WARNING: One pixel skeleton on node {nid}! "
-                f"The object is probably roundish and the radius "
-                f"is a better metric in that case. Setting the length and "
-                f"width to NaN."
-            )
-        else:
-            print(
-                f"WARNING: One pixel skeleton on node {nid} of track "
-                f"{track_ID}! The object is probably roundish and the radius"
-                f" is a better metric in that case. Setting the length and "
-                f"width to NaN."
-            )
+        warnings.warn(
+            f"One pixel skeleton on node {nid}! The object is probably roundish "
+            f"and the radius is a better metric in that case. "
+            f"Setting the length and width to NaN."
+        )
         length = np.nan
         width = np.nan
-    elif len(adjacency_dict) == 0 or len(tip_px) == 0:
+    elif path is None or len(path) == 0:
         # The skeleton is a loop!! The object being processed is
         # probably roundish. The method for mesuring length is not adapted to
         # this kind of morphology.
-        try:
-            track_ID = lineage.nodes[nid]["TRACK_ID"]
-        except KeyError:
-            print(
-                f"WARNING: One pixel skeleton on node {nid}! "
-                f"The object is probably roundish and the radius "
-                f"is a better metric in that case. Setting the length and "
-                f"width to NaN."
-            )
-        else:
-            print(
-                f"WARNING: Circular skeleton on node {nid} of track "
-                f"{track_ID}! The object is probably roundish and the radius "
-                f"is a better metric in that case. Setting the length and "
-                f"width to NaN."
-            )
+        warnings.warn(
+            f"Circular skeleton on node {nid}! The object is probably roundish "
+            f"and the radius is a better metric in that case. "
+            f"Setting the length and width to NaN."
+        )
         length = np.nan
         width = np.nan
     else:
-        # Ordering the skeleton pixels by following along the skeleton,
-        # from one tip to another.
-        # The skeleton has been pruned so there should be only 2 tips.
-        assert len(tip_px) == 2
-        path = from_skel_to_path(adjacency_dict, tip_px[0])
+        # Skeleton pixels ordered from one tip to another.
+        tip_px = [tuple(path[0]), tuple(path[-1])]
         if debug:
-            points = [Point((x, y)) for (y, x) in path]
-            xs = [point.x for point in points]
-            ys = [point.y for point in points]
-            ax[0, 2].scatter(xs, ys, color="red", s=20)
+            ax[0, 2].scatter(path[:, 1], path[:, 0], color="red", s=20)
             ax[0, 2].invert_yaxis()
             ax[0, 2].set_aspect("equal")
             ax[0, 2].axis("off")
@@ -312,28 +398,13 @@ def get_width_and_length(
         for px in tip_px:
             # We need to add the distance from each tip of the skeleton to the
             # object border, as given by the distance map.
-            # print(dist_on_skel[px])
             length += dist_on_skel[px]
 
         if debug:
             # Doing the same steps as above but for the other skeleton algo.
-            adjacency_dict2 = {}
-            pixels_i2, pixels_j2 = np.nonzero(skel2)
-            pruning2 = False
-            for i, j in zip(pixels_i2, pixels_j2):
-                adj_px2 = adjacent_pixels(skel2, (i, j))
-                connectivity2 = len(adj_px2)
-                if connectivity2 > 2:
-                    pruning2 = True
-                adjacency_dict2[(i, j)] = adj_px2
-            if pruning2:
-                adjacency_dict2 = prune_skel(adjacency_dict2)
-            tip_px2 = [px for px, list_px in adjacency_dict2.items() if len(list_px) == 1]
-            path2 = from_skel_to_path(adjacency_dict2, tip_px2[0])
-            points2 = [Point((x, y)) for (y, x) in path2]
-            xs = [point.x for point in points2]
-            ys = [point.y for point in points2]
-            ax[1, 2].scatter(xs, ys, color="red", s=20)
+            path2 = from_skel_to_path(skel2, count_skel_neighbors(skel2))
+            tip_px2 = [tuple(path2[0]), tuple(path2[-1])]
+            ax[1, 2].scatter(path2[:, 1], path2[:, 0], color="red", s=20)
             ax[1, 2].invert_yaxis()
             ax[1, 2].set_aspect("equal")
             ax[1, 2].axis("off")
@@ -379,8 +450,10 @@ def get_width_and_length(
             else:
                 width = np.min(dist_on_skel) * 2 - 1
         else:
-            print("Wrong width method. Should be one of: min, max, mean, median.")
-            # TODO: raise an error when method is not supported
+            raise ValueError(
+                f"Unknown width method: {method_width}. "
+                "Should be one of: min, max, mean, median."
+            )
 
         if debug:
             print(f"Width: {width:.2f} px i.e. {width * pixel_size:.2f} μm.")
@@ -401,7 +474,7 @@ def get_width_and_length(
                 verticalalignment="top",
             )
 
-            width2 = (np.sum(dist_on_skel2) / len(pixels_i2)) * 2 - 1
+            width2 = (np.sum(dist_on_skel2) / np.count_nonzero(skel2)) * 2 - 1
             txt2 = (
                 f"Length: {length2 * pixel_size:.2f} μm\n{' ' * 10}i.e. {length2:.2f} px"
                 f"\nWidth: {width2 * pixel_size:.2f} μm\n{' ' * 10}i.e. {width2:.2f} px"
@@ -419,9 +492,7 @@ def get_width_and_length(
 
             ax[1, 0].remove()
             plt.show()
-            lin_id = lineage.nodes[nid]["lineage_ID"]
-            file = f"{debug_folder}/Lineage{lin_id}_Node{nid}_{skel_algo}"
-            plt.savefig(file)
+            plt.savefig(debug_file)
             plt.close()
 
     length *= pixel_size
@@ -430,28 +501,440 @@ def get_width_and_length(
     return width, length
 
 
-def create_rod_width_property(
-    custom_identifier: str | None,
-    unit: str,
-    custom_name: str | None = None,
-    custom_description: str | None = None,
-) -> Property:
-    return Property(
-        identifier=custom_identifier or "rod_width",
-        name=custom_name or "Rod width",
-        description=custom_description or "Width of the cell, for rod-shaped cells only",
-        provenance="pycellin",
-        prop_type="node",
-        lin_type="CellLineage",
-        dtype="float",
-        unit=unit,
-    )
+def _compute_roi_chunk(
+    func: Callable[..., Any],
+    nids: list[int],
+    coords: np.ndarray,
+    offsets: np.ndarray,
+) -> list[Any]:
+    """
+    Compute the values of a ROI-based property for a chunk of ROIs.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        Function computing the value from a ROI, called as `func(roi, nid=nid)`.
+    nids : list[int]
+        Node IDs of the cells of the chunk.
+    coords : np.ndarray
+        Coordinates of the vertices of all the ROIs of the chunk,
+        of shape (number of vertices, 2).
+    offsets : np.ndarray
+        Index of the first vertex of each ROI in `coords`, followed by
+        the total number of vertices.
+
+    Returns
+    -------
+    list[Any]
+        The values computed for each ROI, in order.
+    """
+    return [
+        func(coords[start:end], nid=nid)
+        for nid, start, end in zip(nids, offsets[:-1], offsets[1:])
+    ]
+
+
+class ROIPropCalculator(NodeLocalPropCalculator):
+    """
+    Abstract calculator for node properties that only depend on the ROI of the cells.
+
+    Since each value only depends on the `ROI_coords` of a single cell, the
+    computation can be parallelized. When `workers` is greater than 1, the ROIs
+    of the cells to enrich are packed into compact arrays and sent by chunks
+    to a pool of processes (or threads).
+    """
+
+    def __init__(
+        self,
+        property: Property,
+        workers: int = 1,
+        chunk_size: int = 1000,
+        use_threads: bool = False,
+        progress: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        workers : int, optional
+            Number of workers computing the values in parallel, by default 1
+            (no parallelization).
+        chunk_size : int, optional
+            Number of cells sent at once to a worker, by default 1000.
+        use_threads : bool, optional
+            True to use a pool of threads instead of a pool of processes,
+            by default False. Threads avoid the cost of starting processes
+            and of sending the ROIs, but only run in parallel the code that
+            releases the GIL.
+        progress : bool, optional
+            True to display the progress of the computation, by default False.
+        """
+        super().__init__(property)
+        if workers < 1:
+            raise ValueError(f"`workers` must be at least 1, not {workers}.")
+        if chunk_size < 1:
+            raise ValueError(f"`chunk_size` must be at least 1, not {chunk_size}.")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.use_threads = use_threads
+        self.progress = progress
+
+    @abstractmethod
+    def get_roi_function(self) -> Callable[..., Any]:
+        """
+        Return the function computing the value of the property from a ROI.
+
+        The function is called as `func(roi, nid=nid)`, with `roi` an array
+        of shape (number of vertices, 2) and `nid` the ID of the cell.
+        It must be picklable to be sent to worker processes, e.g. a module-level
+        function or a `functools.partial` of one.
+
+        Returns
+        -------
+        Callable[..., Any]
+            The function computing the value of the property.
+        """
+        pass
+
+    def get_inputs(self) -> set[str]:
+        return {"ROI_coords"}
+
+    def is_fusable(self) -> bool:
+        return self.workers == 1 and not self.progress
+
+    def compute(  # type: ignore[override]
+        self, lineage: CellLineage, nid: int
+    ) -> Any:
+        roi = np.asarray(lineage.nodes[nid]["ROI_coords"], dtype=float)
+        return self.get_roi_function()(roi, nid=nid)
+
+    def compute_rois(
+        self,
+        nids: list[int],
+        rois: list[Sequence[tuple[float, float]] | np.ndarray],
+    ) -> list[Any]:
+        """
+        Compute the values of the property for several ROIs, in parallel if required.
+
+        Parameters
+        ----------
+        nids : list[int]
+            Node IDs of the cells.
+        rois : list[Sequence[tuple[float, float]] | np.ndarray]
+            ROIs of the cells, in the same order.
+
+        Returns
+        -------
+        list[Any]
+            The values of the property, in the same order as the cells.
+        """
+        func = self.get_roi_function()
+        chunks = []
+        for start in range(0, len(nids), self.chunk_size):
+            chunk_rois = [
+                np.asarray(roi, dtype=float).reshape(-1, 2)
+                for roi in rois[start : start + self.chunk_size]
+            ]
+            offsets = np.zeros(len(chunk_rois) + 1, dtype=np.intp)
+            np.cumsum([len(roi) for roi in chunk_rois], out=offsets[1:])
+            coords = np.concatenate(chunk_rois)
+            chunks.append((nids[start : start + self.chunk_size], coords, offsets))
+
+        results: list[list[Any]] = [[] for _ in chunks]
+        nb_done = 0
+        if self.workers == 1:
+            for i, chunk in enumerate(chunks):
+                results[i] = _compute_roi_chunk(func, *chunk)
+                nb_done += len(chunk[0])
+                self._show_progress(nb_done, len(nids))
+        else:
+            pool_type = ThreadPoolExecutor if self.use_threads else ProcessPoolExecutor
+            with pool_type(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(_compute_roi_chunk, func, *chunk): i
+                    for i, chunk in enumerate(chunks)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results[i] = future.result()
+                    nb_done += len(chunks[i][0])
+                    self._show_progress(nb_done, len(nids))
+        return [value for chunk_values in results for value in chunk_values]
+
+    def _show_progress(self, nb_done: int, nb_total: int) -> None:
+        """
+        Display the progress of the computation, if required.
+
+        Parameters
+        ----------
+        nb_done : int
+            Number of cells already processed.
+        nb_total : int
+            Total number of cells to process.
+        """
+        if not self.progress:
+            return
+        end = "\n" if nb_done == nb_total else ""
+        print(
+            f"\r{self.prop.identifier}: {nb_done}/{nb_total} cells",
+            end=end,
+            file=sys.stderr,
+            flush=True,
+        )
+
+    def enrich(
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]],
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Enrich the data with the value of the property for a list of nodes.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineages.
+        nodes_to_enrich : list of tuple[int, int]
+            List of tuples containing the node ID and the lineage ID of the nodes
+            to enrich with the property value.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any. Not used.
+        """
+        lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
+        nids = [nid for nid, _ in nodes_to_enrich]
+        rois = [
+            lineages[lin_ID].nodes[nid]["ROI_coords"] for nid, lin_ID in nodes_to_enrich
+        ]
+        values = self.compute_rois(nids, rois)
+        for (nid, lin_ID), value in zip(nodes_to_enrich, values):
+            lineages[lin_ID].nodes[nid][self.prop.identifier] = value
+
+
+class RodDimensionsCache:
+    """
+    Cache of the width and length of rod-shaped cells.
+
+    Width and length are computed together from the same skeleton. The cache
+    allows the `RodWidth` and `RodLength` calculators to share a single
+    skeletonization per cell. Since a digest of the ROI of a cell and the
+    computation parameters are part of the cache key, cells whose ROI did not
+    change are not recomputed from one update to the next.
+
+    The entry of a cell is dropped when its ROI changes or when the cell is
+    removed, and the least recently used entries are evicted once the cache
+    holds `max_size` cells.
+    """
 
+    def __init__(self, max_size: int | None = 1_000_000) -> None:
+        """
+        Parameters
+        ----------
+        max_size : int | None, optional
+            Maximum number of cached cells, by default 1,000,000.
+            If None, the size of the cache is not limited.
+
+        Raises
+        ------
+        ValueError
+            If `max_size` is not positive.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"`max_size` must be positive, got {max_size}.")
+        self.max_size = max_size
+        # {(lineage_ID, cell_ID): (ROI and parameters key, (width, length))}
+        # Ordered from the least to the most recently used.
+        self._dims: dict[tuple[Any, int], tuple[Hashable, tuple[float, float]]] = {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        # Caches pickled before the size limit was supported.
+        self.__dict__.setdefault("max_size", 1_000_000)
+
+    def __len__(self) -> int:
+        return len(self._dims)
+
+    def clear(self) -> None:
+        """
+        Remove all the cached dimensions.
+        """
+        self._dims.clear()
+
+    @staticmethod
+    def get_key(
+        roi: Sequence[tuple[float, float]] | np.ndarray, params: tuple
+    ) -> Hashable:
+        """
+        Return the cache key of a ROI computed with a set of parameters.
+
+        Parameters
+        ----------
+        roi : Sequence[tuple[float, float]] | np.ndarray
+            Coordinates of the ROI.
+        params : tuple
+            Parameters of the computation.
+
+        Returns
+        -------
+        Hashable
+            A BLAKE2b digest of the ROI coordinates, with the parameters.
+        """
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(roi, dtype=float).tobytes(), digest_size=16
+        ).digest()
+        return (digest, params)
+
+    def lookup(
+        self,
+        lineage: CellLineage,
+        nid: int,
+        params: tuple,
+        key: Hashable | None = None,
+    ) -> tuple[float, float] | None:
+        """
+        Return the cached width and length of a cell, if they are up to date.
+
+        The entry of the cell is dropped if it was cached for another ROI
+        or other parameters.
+
+        Parameters
+        ----------
+        lineage : CellLineage
+            Lineage graph containing the node of interest.
+        nid : int
+            Node ID (cell_ID) of the cell of interest.
+        params : tuple
+            Parameters of the computation.
+        key : Hashable, optional
+            Cache key of the ROI of the cell, as returned by `get_key()`.
+            If None, it is computed from the ROI.
+
+        Returns
+        -------
+        tuple[float, float] | None
+            Width and length of the ROI of the cell, or None if they are not
+            cached for the current ROI and parameters.
+        """
+        cell = (lineage.graph.get("lineage_ID"), nid)
+        cached = self._dims.pop(cell, None)
+        if cached is None:
+            return None
+        if key is None:
+            key = self.get_key(lineage.nodes[nid]["ROI_coords"], params)
+        if cached[0] != key:
+            return None
+        # Reinserted as the most recently used entry.
+        self._dims[cell] = cached
+        return cached[1]
+
+    def store(
+        self,
+        lineage: CellLineage,
+        nid: int,
+        params: tuple,
+        dims: tuple[float, float],
+        key: Hashable | None = None,
+    ) -> None:
+        """
+        Cache the width and length of a cell.
+
+        Parameters
+        ----------
+        lineage : CellLineage
+            Lineage graph containing the node of interest.
+        nid : int
+            Node ID (cell_ID) of the cell of interest.
+        params : tuple
+            Parameters of the computation.
+        dims : tuple[float, float]
+            Width and length of the ROI of the cell.
+        key : Hashable, optional
+            Cache key of the ROI of the cell, as returned by `get_key()`.
+            If None, it is computed from the ROI.
+        """
+        if key is None:
+            key = self.get_key(lineage.nodes[nid]["ROI_coords"], params)
+        cell = (lineage.graph.get("lineage_ID"), nid)
+        self._dims.pop(cell, None)
+        self._dims[cell] = (key, dims)
+        if self.max_size is not None:
+            while len(self._dims) > self.max_size:
+                del self._dims[next(iter(self._dims))]
+
+    def prune(self, lineages: dict[int, CellLineage]) -> None:
+        """
+        Drop the entries of the cells that are not in the lineages anymore.
+
+        Parameters
+        ----------
+        lineages : dict[int, CellLineage]
+            The current lineages, keyed by lineage ID.
+        """
+        removed = [
+            cell
+            for cell in self._dims
+            if cell[0] not in lineages or cell[1] not in lineages[cell[0]]
+        ]
+        for cell in removed:
+            del self._dims[cell]
+
+    def get_width_and_length(
+        self,
+        nid: int,
+        lineage: CellLineage,
+        pixel_size: float,
+        skel_algo: str = "zhang",
+        tolerance: float = 0.5,
+        method_width: str = "mean",
+        width_ignore_tips: bool = False,
+    ) -> tuple[float, float]:
+        """
+        Return the width and length of the ROI of a cell, computing them if needed.
+
+        Parameters
+        ----------
+        nid : int
+            Node ID (cell_ID) of the cell of interest.
+        lineage : CellLineage
+            Lineage graph containing the node of interest.
+        pixel_size : float
+            Pixel size in micrometer.
+        skel_algo : str, optional
+            'zhang' or 'lee', by default 'zhang'.
+        tolerance : float, optional
+            Tolerance distance for shape simplification (0-1), by default 0.5.
+        method_width : str, optional
+            Method to compute width along skeleton: min, max, mean or median.
+            By default mean.
+        width_ignore_tips : bool, optional
+            True to ignore the skeleton tips while computing width, by default False.
+
+        Returns
+        -------
+        tuple[float, float]
+            Width and length of the ROI.
+        """
+        params = (pixel_size, skel_algo, tolerance, method_width, width_ignore_tips)
+        key = self.get_key(lineage.nodes[nid]["ROI_coords"], params)
+        dims = self.lookup(lineage, nid, params, key)
+        if dims is None:
+            dims = get_width_and_length(nid, lineage, *params)
+            self.store(lineage, nid, params, dims, key)
+        return dims
+
+
+class _RodDimension(ROIPropCalculator):
+    """
+    Base calculator for the dimensions of rod-shaped cells.
+    """
+
+    _DIMENSION_INDEX = None  # type: int | None
 
-class RodWidth(NodeLocalPropCalculator):
     def __init__(
         self,
-        property,
+        property: Property,
         pixel_size: float,
         skel_algo: str = "zhang",
         tolerance: float = 0.5,
@@ -459,8 +942,48 @@ class RodWidth(NodeLocalPropCalculator):
         width_ignore_tips: bool = False,
         debug: bool = False,
         debug_folder: str | None = None,
+        cache: RodDimensionsCache | None = None,
+        workers: int = 1,
+        chunk_size: int = 1000,
+        use_threads: bool = False,
+        progress: bool = False,
     ):
-        super().__init__(property)
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        pixel_size : float
+            Pixel size in micrometer.
+        skel_algo : str, optional
+            'zhang' or 'lee', by default 'zhang'.
+        tolerance : float, optional
+            Tolerance distance for shape simplification (0-1), by default 0.5.
+        method_width : str, optional
+            Method to compute width along skeleton: min, max, mean or median.
+            By default mean.
+        width_ignore_tips : bool, optional
+            True to ignore the skeleton tips while computing width, by default False.
+        debug : bool, optional
+            True to activate debug behavior, by default False.
+            The cache and parallelization are not used in debug mode.
+        debug_folder : str, optional
+            Folder in which to save the debug graphs, by default None.
+        cache : RodDimensionsCache, optional
+            Cache of the cell dimensions. Give the same cache to a `RodWidth`
+            and a `RodLength` calculator so that each cell is only skeletonized
+            once. If None, a new cache is created.
+        workers : int, optional
+            Number of workers computing the dimensions in parallel, by default 1.
+        chunk_size : int, optional
+            Number of cells sent at once to a worker, by default 1000.
+        use_threads : bool, optional
+            True to use a pool of threads instead of a pool of processes,
+            by default False.
+        progress : bool, optional
+            True to display the progress of the computation, by default False.
+        """
+        super().__init__(property, workers, chunk_size, use_threads, progress)
         self.pixel_size = pixel_size
         self.skel_algo = skel_algo
         self.tolerance = tolerance
@@ -468,21 +991,127 @@ class RodWidth(NodeLocalPropCalculator):
         self.width_ignore_tips = width_ignore_tips
         self.debug = debug
         self.debug_folder = debug_folder
+        self.cache = cache if cache is not None else RodDimensionsCache()
 
-    def compute(  # type: ignore[override]
-        self, lineage: CellLineage, nid: int
-    ) -> float:
-        return get_width_and_length(
-            nid,
-            lineage,
+    def _get_params(self) -> tuple:
+        return (
             self.pixel_size,
             self.skel_algo,
             self.tolerance,
             self.method_width,
             self.width_ignore_tips,
-            self.debug,
-            self.debug_folder,
-        )[0]
+        )
+
+    def get_roi_function(self) -> Callable[..., tuple[float, float]]:
+        # Both dimensions are returned so that they can be cached together.
+        return partial(
+            get_roi_width_and_length,
+            pixel_size=self.pixel_size,
+            skel_algo=self.skel_algo,
+            tolerance=self.tolerance,
+            method_width=self.method_width,
+            width_ignore_tips=self.width_ignore_tips,
+        )
+
+    def is_fusable(self) -> bool:
+        return self.debug or super().is_fusable()
+
+    def compute(  # type: ignore[override]
+        self, lineage: CellLineage, nid: int
+    ) -> float:
+        if self.debug:
+            dims = get_width_and_length(
+                nid,
+                lineage,
+                *self._get_params(),
+                debug=self.debug,
+                debug_folder=self.debug_folder,
+            )
+        else:
+            dims = self.cache.get_width_and_length(nid, lineage, *self._get_params())
+        return dims[self._DIMENSION_INDEX]
+
+    def enrich(
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]],
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Enrich the data with the value of the property for a list of nodes.
+
+        Only the cells missing from the cache are computed, and the cache
+        entries of the cells that are not in the data anymore are dropped.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineages.
+        nodes_to_enrich : list of tuple[int, int]
+            List of tuples containing the node ID and the lineage ID of the nodes
+            to enrich with the property value.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any. Not used.
+        """
+        if self.debug:
+            NodeLocalPropCalculator.enrich(self, data, nodes_to_enrich, context)
+            return
+        lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
+        self.cache.prune(lineages)
+        params = self._get_params()
+        # The ROI of each cell is hashed once, for both the lookup and the store.
+        keys = []
+        all_dims = []
+        to_compute = []
+        for nid, lin_ID in nodes_to_enrich:
+            lin = lineages[lin_ID]
+            key = self.cache.get_key(lin.nodes[nid]["ROI_coords"], params)
+            dims = self.cache.lookup(lin, nid, params, key)
+            if dims is None:
+                to_compute.append(len(all_dims))
+            keys.append(key)
+            all_dims.append(dims)
+        computed = self.compute_rois(
+            [nodes_to_enrich[i][0] for i in to_compute],
+            [
+                lineages[lin_ID].nodes[nid]["ROI_coords"]
+                for nid, lin_ID in (nodes_to_enrich[i] for i in to_compute)
+            ],
+        )
+        for i, dims in zip(to_compute, computed):
+            nid, lin_ID = nodes_to_enrich[i]
+            self.cache.store(lineages[lin_ID], nid, params, dims, keys[i])
+            all_dims[i] = dims
+        for (nid, lin_ID), dims in zip(nodes_to_enrich, all_dims):
+            value = dims[self._DIMENSION_INDEX]
+            lineages[lin_ID].nodes[nid][self.prop.identifier] = value
+
+
+def create_rod_width_property(
+    custom_identifier: str | None,
+    unit: str,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "rod_width",
+        name=custom_name or "Rod width",
+        description=custom_description or "Width of the cell, for rod-shaped cells only",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+        unit=unit,
+    )
+
+
+class RodWidth(_RodDimension):
+    """
+    Calculator to compute the width of rod-shaped cells from their ROI.
+    """
+
+    _DIMENSION_INDEX = 0
 
 
 def create_rod_length_property(
@@ -503,41 +1132,12 @@ def create_rod_length_property(
     )
 
 
-class RodLength(NodeLocalPropCalculator):
-    def __init__(
-        self,
-        property,
-        pixel_size: float,
-        skel_algo: str = "zhang",
-        tolerance: float = 0.5,
-        method_width: str = "mean",
-        width_ignore_tips: bool = False,
-        debug: bool = False,
-        debug_folder: str | None = None,
-    ):
-        super().__init__(property)
-        self.pixel_size = pixel_size
-        self.skel_algo = skel_algo
-        self.tolerance = tolerance
-        self.method_width = method_width
-        self.width_ignore_tips = width_ignore_tips
-        self.debug = debug
-        self.debug_folder = debug_folder
+class RodLength(_RodDimension):
+    """
+    Calculator to compute the length of rod-shaped cells from their ROI.
+    """
 
-    def compute(  # type: ignore[override]
-        self, lineage: CellLineage, nid: int
-    ) -> float:
-        return get_width_and_length(
-            nid,
-            lineage,
-            self.pixel_size,
-            self.skel_algo,
-            self.tolerance,
-            self.method_width,
-            self.width_ignore_tips,
-            self.debug,
-            self.debug_folder,
-        )[1]
+    _DIMENSION_INDEX = 1
 
 
 # TODO: this is a property that should not be in pycellin, too many ways to define
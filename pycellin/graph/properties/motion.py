@@ -10,6 +10,7 @@ from itertools import pairwise
 from typing import Any, Literal
 
 import numpy as np
+from scipy.fft import next_fast_len
 
 from pycellin.classes.data import Data
 from pycellin.classes.exceptions import FusionError
@@ -17,8 +18,33 @@ from pycellin.classes.lineage import CellLineage, CycleLineage
 from pycellin.classes.property import Property
 from pycellin.classes.property_calculator import (
     EdgeLocalPropCalculator,
+    LineageGlobalPropCalculator,
     NodeGlobalPropCalculator,
 )
+from pycellin.classes.update_context import UpdateContext
+
+
+def _get_cell_location(lineage: CellLineage, nid: int) -> tuple[float, float, float]:
+    """
+    Get the location of a cell.
+
+    Parameters
+    ----------
+    lineage : CellLineage
+        Lineage graph containing the node of interest.
+    nid : int
+        Node ID (cell_ID) of the cell of interest.
+
+    Returns
+    -------
+    tuple[float, float, float]
+        The x, y and z coordinates of the cell.
+    """
+    return (
+        lineage.nodes[nid]["cell_x"],
+        lineage.nodes[nid]["cell_y"],
+        lineage.nodes[nid]["cell_z"],
+    )
 
 
 def _get_branch_edge_property_values(
@@ -105,6 +131,9 @@ class CellDisplacement(EdgeLocalPropCalculator):
     of the cell at the two consecutive detections.
     """
 
+    def get_inputs(self) -> set[str]:
+        return {"cell_x", "cell_y", "cell_z"}
+
     def compute(  # type: ignore[override]
         self, lineage: CellLineage, edge: tuple[int, int]
     ) -> float:
@@ -166,6 +195,8 @@ class BranchTotalDisplacement(NodeGlobalPropCalculator):
     the cell cycle.
     """
 
+    _FOOTPRINT = "lineage"
+
     def __init__(self, property: Property, include_incoming_edge: bool = False):
         """
         Parameters
@@ -179,6 +210,9 @@ class BranchTotalDisplacement(NodeGlobalPropCalculator):
         super().__init__(property)
         self.include_incoming_edge = include_incoming_edge
 
+    def get_inputs(self) -> set[str]:
+        return {"cell_displacement"}
+
     def compute(  # type: ignore[override]
         self, data: Data, lineage: CycleLineage, nid: int
     ) -> float:
@@ -232,6 +266,8 @@ class BranchMeanDisplacement(NodeGlobalPropCalculator):
     the cell cycle.
     """
 
+    _FOOTPRINT = "lineage"
+
     def __init__(self, property: Property, include_incoming_edge: bool = False):
         """
         Parameters
@@ -245,6 +281,9 @@ class BranchMeanDisplacement(NodeGlobalPropCalculator):
         super().__init__(property)
         self.include_incoming_edge = include_incoming_edge
 
+    def get_inputs(self) -> set[str]:
+        return {"cell_displacement"}
+
     def compute(  # type: ignore[override]
         self, data: Data, lineage: CycleLineage, nid: int
     ) -> float:
@@ -311,6 +350,15 @@ class CellSpeed(EdgeLocalPropCalculator):
         super().__init__(property)
         self.time_prop_name = time_prop_name
 
+    def get_inputs(self) -> set[str]:
+        return {
+            self.time_prop_name,
+            "cell_displacement",
+            "cell_x",
+            "cell_y",
+            "cell_z",
+        }
+
     def compute(  # type: ignore[override]
         self, lineage: CellLineage, edge: tuple[int, int]
     ) -> float:
@@ -368,6 +416,8 @@ class BranchMeanSpeed(NodeGlobalPropCalculator):
     during the cell cycle.
     """
 
+    _FOOTPRINT = "lineage"
+
     def __init__(self, property: Property, include_incoming_edge: bool = False):
         """
         Parameters
@@ -381,6 +431,9 @@ class BranchMeanSpeed(NodeGlobalPropCalculator):
         super().__init__(property)
         self.include_incoming_edge = include_incoming_edge
 
+    def get_inputs(self) -> set[str]:
+        return {"cell_speed"}
+
     def compute(  # type: ignore[override]
         self, data: Data, lineage: CycleLineage, nid: int
     ) -> float:
@@ -434,6 +487,8 @@ class Straightness(NodeGlobalPropCalculator):
     while a trajectory with many turns has a straightness close to 0.
     """
 
+    _FOOTPRINT = "lineage"
+
     def __init__(self, property: Property, include_incoming_edge: bool = False):
         """
         Parameters
@@ -447,8 +502,15 @@ class Straightness(NodeGlobalPropCalculator):
         super().__init__(property)
         self.include_incoming_edge = include_incoming_edge
 
+    def get_inputs(self) -> set[str]:
+        return {"cell_x", "cell_y", "cell_z"}
+
     def compute(  # type: ignore[override]
-        self, data: Data, cycle_lin: CycleLineage, nid: int
+        self,
+        data: Data,
+        cycle_lin: CycleLineage,
+        nid: int,
+        context: UpdateContext | None = None,
     ) -> float:
         """
         Compute the straightness of the cell displacement within a cell cycle.
@@ -461,6 +523,10 @@ class Straightness(NodeGlobalPropCalculator):
             Lineage graph containing the node of interest.
         node : int
             Node ID (cycle_ID) of the cell cycle of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any. When provided,
+            the distances between cells are computed once per lineage
+            and shared with other calculators.
 
         Returns
         -------
@@ -471,55 +537,32 @@ class Straightness(NodeGlobalPropCalculator):
         lin_ID = cycle_lin.graph["lineage_ID"]
         cell_lin = data.cell_data[lin_ID]
         cells = cycle_lin.nodes[nid]["cells"]
-        distances = [
-            math.dist(
-                (
-                    cell_lin.nodes[n1]["cell_x"],
-                    cell_lin.nodes[n1]["cell_y"],
-                    cell_lin.nodes[n1]["cell_z"],
-                ),
-                (
-                    cell_lin.nodes[n2]["cell_x"],
-                    cell_lin.nodes[n2]["cell_y"],
-                    cell_lin.nodes[n2]["cell_z"],
-                ),
-            )
-            for (n1, n2) in pairwise(cells)
-        ]
+        links = list(pairwise(cells))
 
         if self.include_incoming_edge:
             first_cell = cells[0]
             preds = list(cell_lin.predecessors(first_cell))
             if len(preds) == 1:
-                dist = math.dist(
-                    (
-                        cell_lin.nodes[preds[0]]["cell_x"],
-                        cell_lin.nodes[preds[0]]["cell_y"],
-                        cell_lin.nodes[preds[0]]["cell_z"],
-                    ),
-                    (
-                        cell_lin.nodes[first_cell]["cell_x"],
-                        cell_lin.nodes[first_cell]["cell_y"],
-                        cell_lin.nodes[first_cell]["cell_z"],
-                    ),
-                )
-                distances.append(dist)
+                links.append((preds[0], first_cell))
             elif len(preds) > 1:
                 raise FusionError(first_cell, lin_ID)
-        
+
+        if context is None:
+            distances = [
+                math.dist(
+                    _get_cell_location(cell_lin, n1), _get_cell_location(cell_lin, n2)
+                )
+                for (n1, n2) in links
+            ]
+        else:
+            edge_distances = context.get_edge_distances(cell_lin)
+            distances = [edge_distances[link] for link in links]
+
         if sum(distances) == 0:
             return math.nan
 
-        first_cell_loc = (
-            cell_lin.nodes[cells[0]]["cell_x"],
-            cell_lin.nodes[cells[0]]["cell_y"],
-            cell_lin.nodes[cells[0]]["cell_z"],
-        )
-        last_cell_loc = (
-            cell_lin.nodes[cells[-1]]["cell_x"],
-            cell_lin.nodes[cells[-1]]["cell_y"],
-            cell_lin.nodes[cells[-1]]["cell_z"],
-        )
+        first_cell_loc = _get_cell_location(cell_lin, cells[0])
+        last_cell_loc = _get_cell_location(cell_lin, cells[-1])
         return math.dist(first_cell_loc, last_cell_loc) / sum(distances)
 
 
@@ -552,6 +595,8 @@ class Angle(NodeGlobalPropCalculator):
         - the displacement vector from itself to its successor
     """
 
+    _FOOTPRINT = "cycle"
+
     def __init__(self, property: Property, unit: Literal["radian", "degree"] = "radian"):
         """
         Parameters
@@ -564,6 +609,9 @@ class Angle(NodeGlobalPropCalculator):
         super().__init__(property)
         self.unit = unit
 
+    def get_inputs(self) -> set[str]:
+        return {"cell_x", "cell_y", "cell_z"}
+
     def compute(  # type: ignore[override]
         self, data: Data, lineage: CellLineage, nid: int
     ) -> float:
@@ -627,3 +675,551 @@ class Angle(NodeGlobalPropCalculator):
             raise ValueError(
                 f"Unknown unit: {self.unit}. Valid units are 'radian' and 'degree'."
             )
+
+
+# Mean squared displacement and velocity autocorrelation ######################
+
+
+def _correlate(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Compute the correlation `sum_i a[i] . b[i + k]` of two signals for all lags k.
+
+    The correlation is computed with FFTs on zero-padded signals,
+    in O(n log n) instead of O(n^2) for the direct sum.
+
+    Parameters
+    ----------
+    a : np.ndarray
+        First signal, of shape (n,) or (n, d).
+    b : np.ndarray
+        Second signal, of the same shape as `a`.
+
+    Returns
+    -------
+    np.ndarray
+        Correlation for lags 0 to n - 1. For signals of shape (n, d),
+        the correlation is summed over the d components.
+    """
+    n = len(a)
+    if n == 0:
+        return np.zeros(0)
+    size = next_fast_len(2 * n)
+    fa = np.fft.rfft(a, size, axis=0)
+    fb = np.fft.rfft(b, size, axis=0)
+    corr = np.fft.irfft(fa.conj() * fb, size, axis=0)[:n]
+    if corr.ndim > 1:
+        corr = corr.sum(axis=1)
+    return corr
+
+
+def get_msd_sums(
+    positions: np.ndarray, mask: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the sums of squared displacements of a trajectory for all lags.
+
+    Positions are sampled on a regular time grid, and missing detections
+    (gaps) are excluded through the mask. The squared displacement
+    |r(i + k) - r(i)|^2 is expanded into |r(i + k)|^2 + |r(i)|^2 - 2 r(i).r(i + k),
+    so that each term is a correlation computed with FFTs.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        Positions of the cell on the time grid, of shape (n, d).
+    mask : np.ndarray
+        Boolean array of shape (n,), True where the cell is detected.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The sum of squared displacements and the number of displacements
+        for each lag from 0 to n - 1.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    weights = mask.astype(float)
+    # The MSD is translation invariant: centering the positions limits
+    # the loss of precision in the expanded sum.
+    centered = positions - positions[mask].mean(axis=0) if mask.any() else positions
+    centered = np.where(mask[:, np.newaxis], centered, 0.0)
+    squares = (centered**2).sum(axis=1)
+    sums = (
+        _correlate(weights, squares)
+        + _correlate(squares, weights)
+        - 2 * _correlate(centered, centered)
+    )
+    sums = np.maximum(sums, 0.0)
+    if len(sums):
+        sums[0] = 0.0
+    counts = np.rint(_correlate(weights, weights))
+    return sums, counts
+
+
+def get_vacf_sums(
+    positions: np.ndarray, mask: np.ndarray, time_step: float = 1.0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the sums of velocity products of a trajectory for all lags.
+
+    Velocities are computed between consecutive points of the time grid,
+    and only where the cell is detected at both points.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        Positions of the cell on the time grid, of shape (n, d).
+    mask : np.ndarray
+        Boolean array of shape (n,), True where the cell is detected.
+    time_step : float, optional
+        Time between two consecutive points of the time grid. 1 by default.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The sum of the products v(i).v(i + k) and the number of products
+        for each lag from 0 to n - 2.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    vel_mask = mask[1:] & mask[:-1]
+    velocities = np.diff(positions, axis=0) / time_step
+    velocities = np.where(vel_mask[:, np.newaxis], velocities, 0.0)
+    sums = _correlate(velocities, velocities)
+    weights = vel_mask.astype(float)
+    counts = np.rint(_correlate(weights, weights))
+    return sums, counts
+
+
+def _get_cycle_trajectory(
+    cell_lin: CellLineage,
+    cells: list[int],
+    time_prop_name: str,
+    time_step: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Place the positions of the cells of a cell cycle on a regular time grid.
+
+    Parameters
+    ----------
+    cell_lin : CellLineage
+        Lineage graph containing the cells.
+    cells : list[int]
+        IDs of the cells of the cell cycle, in chronological order.
+    time_prop_name : str
+        The name of the time property (e.g. "frame", "time", etc.).
+    time_step : float
+        Time between two consecutive points of the grid, in the unit
+        of the time property.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The positions on the time grid, of shape (n, 3), and the boolean mask
+        of the grid points where the cell is detected.
+    """
+    times = np.array([cell_lin.nodes[n][time_prop_name] for n in cells], dtype=float)
+    locations = np.array([_get_cell_location(cell_lin, n) for n in cells], dtype=float)
+    indices = np.rint((times - times[0]) / time_step).astype(np.intp)
+    positions = np.zeros((indices[-1] + 1, locations.shape[1]))
+    mask = np.zeros(indices[-1] + 1, dtype=bool)
+    positions[indices] = locations
+    mask[indices] = True
+    return positions, mask
+
+
+def get_cycles_correlation_sums(
+    kind: Literal["msd", "vacf"],
+    data: Data,
+    cycle_lin: CycleLineage,
+    ccids: list[int],
+    time_prop_name: str,
+    time_step: float,
+    max_lag: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Accumulate the MSD or VACF sums of several cell cycles of a lineage.
+
+    Parameters
+    ----------
+    kind : {"msd", "vacf"}
+        "msd" for the squared displacements, "vacf" for the velocity products.
+    data : Data
+        Data object containing the lineage.
+    cycle_lin : CycleLineage
+        Lineage graph containing the cell cycles.
+    ccids : list[int]
+        IDs of the cell cycles.
+    time_prop_name : str
+        The name of the time property (e.g. "frame", "time", etc.).
+    time_step : float
+        Time between two consecutive detections, in the unit of the time property.
+    max_lag : int, optional
+        Largest lag to compute, in number of time steps. If None, all lags are
+        computed.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The sum of the squared displacements or velocity products
+        and their number for each lag.
+    """
+    cell_lin = data.cell_data[cycle_lin.graph["lineage_ID"]]
+    sums = np.zeros(0)
+    counts = np.zeros(0)
+    for ccid in ccids:
+        positions, mask = _get_cycle_trajectory(
+            cell_lin, cycle_lin.nodes[ccid]["cells"], time_prop_name, time_step
+        )
+        if kind == "msd":
+            cycle_sums, cycle_counts = get_msd_sums(positions, mask)
+        else:
+            cycle_sums, cycle_counts = get_vacf_sums(positions, mask, time_step)
+        if max_lag is not None:
+            cycle_sums = cycle_sums[: max_lag + 1]
+            cycle_counts = cycle_counts[: max_lag + 1]
+        sums, counts = _add_sums(sums, counts, cycle_sums, cycle_counts)
+    return sums, counts
+
+
+def _add_sums(
+    sums: np.ndarray,
+    counts: np.ndarray,
+    new_sums: np.ndarray,
+    new_counts: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Add per-lag sums and counts, padding the shortest arrays with zeros.
+
+    Parameters
+    ----------
+    sums : np.ndarray
+        Accumulated sums for each lag.
+    counts : np.ndarray
+        Accumulated counts for each lag.
+    new_sums : np.ndarray
+        Sums to add for each lag.
+    new_counts : np.ndarray
+        Counts to add for each lag.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The updated sums and counts.
+    """
+    if len(new_sums) > len(sums):
+        sums = np.pad(sums, (0, len(new_sums) - len(sums)))
+        counts = np.pad(counts, (0, len(new_sums) - len(counts)))
+    sums[: len(new_sums)] += new_sums
+    counts[: len(new_counts)] += new_counts
+    return sums, counts
+
+
+def get_cycles_correlation(
+    kind: Literal["msd", "vacf"],
+    data: Data,
+    cycle_lin: CycleLineage,
+    ccids: list[int],
+    time_prop_name: str,
+    time_step: float,
+    max_lag: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the MSD or the VACF averaged over several cell cycles of a lineage.
+
+    The sums and counts of each cell cycle are accumulated for each lag
+    before averaging, so that each displacement or velocity product
+    has the same weight.
+
+    Parameters
+    ----------
+    kind : {"msd", "vacf"}
+        "msd" for the mean squared displacement, "vacf" for the velocity
+        autocorrelation function.
+    data : Data
+        Data object containing the lineage.
+    cycle_lin : CycleLineage
+        Lineage graph containing the cell cycles.
+    ccids : list[int]
+        IDs of the cell cycles.
+    time_prop_name : str
+        The name of the time property (e.g. "frame", "time", etc.).
+    time_step : float
+        Time between two consecutive detections, in the unit of the time property.
+    max_lag : int, optional
+        Largest lag to compute, in number of time steps. If None, all lags are
+        computed.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The averaged values for each lag, NaN where there is no data,
+        and the number of displacements or velocity products for each lag.
+    """
+    sums, counts = get_cycles_correlation_sums(
+        kind, data, cycle_lin, ccids, time_prop_name, time_step, max_lag
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = np.where(counts > 0, sums / counts, np.nan)
+    return values, counts
+
+
+class _CycleCorrelation(NodeGlobalPropCalculator):
+    """
+    Base calculator for time correlations of the trajectory of a cell cycle.
+    """
+
+    _FOOTPRINT = "lineage"
+    _KIND: Literal["msd", "vacf"]
+
+    def __init__(
+        self,
+        property: Property,
+        time_prop_name: str,
+        time_step: float,
+        max_lag: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        time_prop_name : str
+            The name of the time property (e.g. "frame", "time", etc.) to use
+            to place the detections in time.
+        time_step : float
+            Time between two consecutive detections, in the unit of the time property.
+        max_lag : int, optional
+            Largest lag to compute, in number of time steps. If None, all lags are
+            computed.
+        """
+        super().__init__(property)
+        self.time_prop_name = time_prop_name
+        self.time_step = time_step
+        self.max_lag = max_lag
+
+    def get_inputs(self) -> set[str]:
+        return {self.time_prop_name, "cell_x", "cell_y", "cell_z"}
+
+    def compute(  # type: ignore[override]
+        self, data: Data, lineage: CycleLineage, nid: int
+    ) -> list[float]:
+        """
+        Compute the time correlation of the trajectory of a cell cycle.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineage.
+        lineage : CycleLineage
+            Lineage graph containing the node of interest.
+        nid : int
+            Node ID (cycle_ID) of the cell cycle of interest.
+
+        Returns
+        -------
+        list[float]
+            Value for each lag, the lag k corresponding to a time of
+            k * time_step. NaN for lags without data.
+        """
+        values, _ = get_cycles_correlation(
+            self._KIND,
+            data,
+            lineage,
+            [nid],
+            self.time_prop_name,
+            self.time_step,
+            self.max_lag,
+        )
+        return values.tolist()
+
+
+class _LineageCorrelation(LineageGlobalPropCalculator):
+    """
+    Base calculator for time correlations averaged over the cell cycles of a lineage.
+    """
+
+    _FOOTPRINT = "lineage"
+    _KIND: Literal["msd", "vacf"]
+
+    def __init__(
+        self,
+        property: Property,
+        time_prop_name: str,
+        time_step: float,
+        max_lag: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        time_prop_name : str
+            The name of the time property (e.g. "frame", "time", etc.) to use
+            to place the detections in time.
+        time_step : float
+            Time between two consecutive detections, in the unit of the time property.
+        max_lag : int, optional
+            Largest lag to compute, in number of time steps. If None, all lags are
+            computed.
+        """
+        super().__init__(property)
+        self.time_prop_name = time_prop_name
+        self.time_step = time_step
+        self.max_lag = max_lag
+
+    def get_inputs(self) -> set[str]:
+        return {self.time_prop_name, "cell_x", "cell_y", "cell_z"}
+
+    def compute(  # type: ignore[override]
+        self, data: Data, lineage: CycleLineage
+    ) -> list[float]:
+        """
+        Compute the time correlation averaged over the cell cycles of a lineage.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineage.
+        lineage : CycleLineage
+            Lineage of interest.
+
+        Returns
+        -------
+        list[float]
+            Value for each lag, the lag k corresponding to a time of
+            k * time_step. NaN for lags without data.
+        """
+        values, _ = get_cycles_correlation(
+            self._KIND,
+            data,
+            lineage,
+            list(lineage.nodes),
+            self.time_prop_name,
+            self.time_step,
+            self.max_lag,
+        )
+        return values.tolist()
+
+
+def create_cycle_msd_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+    unit: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "cycle_msd",
+        name=custom_name or "Cycle MSD",
+        description=custom_description
+        or "Mean squared displacement of the cell during the cell cycle, for each lag",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CycleLineage",
+        dtype="list[float]",
+        unit=unit,
+    )
+
+
+class CycleMSD(_CycleCorrelation):
+    """
+    Calculator to compute the mean squared displacement (MSD) of a cell cycle.
+
+    The MSD at lag k is the mean of the squared displacements of the cell
+    between two detections separated by k time steps. It is computed with FFTs
+    in O(n log n), n being the number of time steps of the cell cycle.
+    Gaps in the detections are taken into account through the time property.
+    """
+
+    _KIND = "msd"
+
+
+def create_cycle_vacf_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+    unit: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "cycle_vacf",
+        name=custom_name or "Cycle VACF",
+        description=custom_description
+        or "Velocity autocorrelation of the cell during the cell cycle, for each lag",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CycleLineage",
+        dtype="list[float]",
+        unit=unit,
+    )
+
+
+class CycleVACF(_CycleCorrelation):
+    """
+    Calculator to compute the velocity autocorrelation function (VACF) of a cell cycle.
+
+    The VACF at lag k is the mean of the dot products of the velocities
+    of the cell separated by k time steps. Velocities are computed between
+    consecutive time steps and are undefined across gaps in the detections.
+    It is computed with FFTs in O(n log n), n being the number of time steps
+    of the cell cycle.
+    """
+
+    _KIND = "vacf"
+
+
+def create_lineage_msd_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+    unit: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "lineage_msd",
+        name=custom_name or "Lineage MSD",
+        description=custom_description
+        or "Mean squared displacement over all the cell cycles, for each lag",
+        provenance="pycellin",
+        prop_type="lineage",
+        lin_type="CycleLineage",
+        dtype="list[float]",
+        unit=unit,
+    )
+
+
+class LineageMSD(_LineageCorrelation):
+    """
+    Calculator to compute the mean squared displacement (MSD) of a lineage.
+
+    The squared displacements of all the cell cycles of the lineage are averaged
+    for each lag. See `CycleMSD`.
+    """
+
+    _KIND = "msd"
+
+
+def create_lineage_vacf_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+    unit: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "lineage_vacf",
+        name=custom_name or "Lineage VACF",
+        description=custom_description
+        or "Velocity autocorrelation over all the cell cycles, for each lag",
+        provenance="pycellin",
+        prop_type="lineage",
+        lin_type="CycleLineage",
+        dtype="list[float]",
+        unit=unit,
+    )
+
+
+class LineageVACF(_LineageCorrelation):
+    """
+    Calculator to compute the velocity autocorrelation function (VACF) of a lineage.
+
+    The velocity products of all the cell cycles of the lineage are averaged
+    for each lag. See `CycleVACF`.
+    """
+
+    _KIND = "vacf"
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+A collection of properties related to the spatial neighborhood of cells.
+
+Neighborhood properties depend on the cells of all the lineages present
+at the same timepoint. Instead of searching all the cells of the model
+for each cell, the cells of each timepoint are indexed once in a KD-tree,
+and all the cells of a timepoint are queried in a single vectorized call.
+The spatial index is cached in the update context so that it is shared
+by all the neighborhood calculators of an update.
+"""
+
+import math
+from abc import abstractmethod
+from typing import Any, Literal, NamedTuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from pycellin.classes.data import Data
+from pycellin.classes.lineage import CellLineage
+from pycellin.classes.property import Property
+from pycellin.classes.property_calculator import NodeGlobalPropCalculator
+from pycellin.classes.update_context import UpdateContext
+
+
+class Frame(NamedTuple):
+    """
+    Cells of a single timepoint, indexed in a KD-tree.
+
+    Attributes
+    ----------
+    cell_IDs : np.ndarray
+        IDs of the cells.
+    lineage_IDs : np.ndarray
+        IDs of the lineages of the cells.
+    coords : np.ndarray
+        Coordinates of the cells, of shape (number of cells, 3).
+    tree : cKDTree
+        KD-tree built on the coordinates of the cells.
+    """
+
+    cell_IDs: np.ndarray
+    lineage_IDs: np.ndarray
+    coords: np.ndarray
+    tree: cKDTree
+
+
+class FrameIndex:
+    """
+    Spatial index of the cells of a model, with one KD-tree per timepoint.
+    """
+
+    def __init__(self, data: Data, time_prop: str):
+        """
+        Parameters
+        ----------
+        data : Data
+            Data object containing the cell lineages to index.
+        time_prop : str
+            The name of the time property (e.g. "frame", "time", etc.) used
+            to group cells by timepoint.
+
+        Raises
+        ------
+        KeyError
+            If a cell is missing the time property or one of the coordinates.
+        """
+        self._data = data
+        cell_IDs = []
+        lineage_IDs = []
+        times = []
+        coords = []
+        for lin_ID, lineage in data.cell_data.items():
+            for nid, attrs in lineage.nodes(data=True):
+                cell_IDs.append(nid)
+                lineage_IDs.append(lin_ID)
+                times.append(attrs[time_prop])
+                coords.append((attrs["cell_x"], attrs["cell_y"], attrs["cell_z"]))
+
+        # {time: Frame}
+        self.frames: dict[Any, Frame] = {}
+        # {(cell_ID, lineage_ID): (time, row of the cell in the frame)}
+        self._rows: dict[tuple[int, int], tuple[Any, int]] = {}
+        self._sister_keys: dict[Any, np.ndarray] | None = None
+        if not cell_IDs:
+            return
+        times_arr = np.array(times)
+        order = np.argsort(times_arr, kind="stable")
+        sorted_times = times_arr[order]
+        bounds = np.flatnonzero(sorted_times[1:] != sorted_times[:-1]) + 1
+        cell_IDs_arr = np.array(cell_IDs)
+        lineage_IDs_arr = np.array(lineage_IDs)
+        coords_arr = np.array(coords, dtype=float)
+        for rows in np.split(order, bounds):
+            time = times[rows[0]]
+            frame_coords = coords_arr[rows]
+            self.frames[time] = Frame(
+                cell_IDs_arr[rows],
+                lineage_IDs_arr[rows],
+                frame_coords,
+                cKDTree(frame_coords),
+            )
+            for row, i in enumerate(rows.tolist()):
+                self._rows[(cell_IDs[i], lineage_IDs[i])] = (time, row)
+
+    def locate(self, nid: int, lin_ID: int) -> tuple[Any, int]:
+        """
+        Return the timepoint of a cell and its row in the frame of this timepoint.
+
+        Parameters
+        ----------
+        nid : int
+            ID of the cell.
+        lin_ID : int
+            ID of the lineage of the cell.
+
+        Returns
+        -------
+        tuple[Any, int]
+            The timepoint of the cell and its row in the frame.
+
+        Raises
+        ------
+        KeyError
+            If the cell is not indexed.
+        """
+        return self._rows[(nid, lin_ID)]
+
+    def get_sister_keys(self, time: Any) -> np.ndarray:
+        """
+        Return a key identifying the sisters of each cell of a timepoint.
+
+        Two cells of the same timepoint are sisters when they belong to
+        sister cell cycles, i.e. when they share the same key. Cells of a root
+        cell cycle have no sister and a key of -1. Keys of all the timepoints
+        are computed at the first call, in a single pass over the lineages.
+
+        Parameters
+        ----------
+        time : Any
+            Timepoint of interest.
+
+        Returns
+        -------
+        np.ndarray
+            Key of each cell of the frame.
+        """
+        if self._sister_keys is None:
+            self._sister_keys = self._compute_sister_keys()
+        return self._sister_keys[time]
+
+    def _compute_sister_keys(self) -> dict[Any, np.ndarray]:
+        # The key of a cell is its dividing mother cell, which is shared
+        # by all the cells of the sister cell cycles.
+        mothers: dict[tuple[int, int], int] = {}
+        div_keys: dict[tuple[int, int], int] = {}
+        for lin_ID, lineage in self._data.cell_data.items():
+            for cycle in lineage.get_cell_cycles():
+                preds = list(lineage.predecessors(cycle[0]))
+                if not preds:
+                    continue
+                key = div_keys.setdefault((preds[0], lin_ID), len(div_keys))
+                for nid in cycle:
+                    mothers[(nid, lin_ID)] = key
+        return {
+            time: np.array(
+                [
+                    mothers.get((nid, lin_ID), -1)
+                    for nid, lin_ID in zip(
+                        frame.cell_IDs.tolist(), frame.lineage_IDs.tolist()
+                    )
+                ],
+                dtype=np.int64,
+            )
+            for time, frame in self.frames.items()
+        }
+
+
+def get_frame_index(
+    data: Data, time_prop: str, context: UpdateContext | None = None
+) -> FrameIndex:
+    """
+    Return the spatial index of the cells of a model.
+
+    Parameters
+    ----------
+    data : Data
+        Data object containing the cell lineages to index.
+    time_prop : str
+        The name of the time property (e.g. "frame", "time", etc.) used
+        to group cells by timepoint.
+    context : UpdateContext, optional
+        Memoization context of the current update, if any. When provided,
+        the index is built once and shared by all the calculators of the update.
+
+    Returns
+    -------
+    FrameIndex
+        The spatial index of the cells.
+    """
+    if context is None:
+        return FrameIndex(data, time_prop)
+    return context.memoize(
+        ("frame_index", time_prop), data, lambda d: FrameIndex(d, time_prop)
+    )
+
+
+class _NeighborhoodCalculator(NodeGlobalPropCalculator):
+    """
+    Base calculator for properties computed from the cells of the same timepoint.
+    """
+
+    _FOOTPRINT = "model"
+
+    def __init__(self, property: Property, time_prop_name: str):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        time_prop_name : str
+            The name of the time property (e.g. "frame", "time", etc.) used
+            to group cells by timepoint.
+        """
+        super().__init__(property)
+        self.time_prop_name = time_prop_name
+
+    def get_inputs(self) -> set[str]:
+        return {self.time_prop_name, "cell_x", "cell_y", "cell_z"}
+
+    @abstractmethod
+    def query(self, index: FrameIndex, time: Any, rows: np.ndarray) -> np.ndarray:
+        """
+        Compute the property for several cells of the same timepoint.
+        Need to be implemented in subclasses.
+
+        Parameters
+        ----------
+        index : FrameIndex
+            Spatial index of the cells of the model.
+        time : Any
+            Timepoint of the cells.
+        rows : np.ndarray
+            Rows of the cells of interest in the frame of the timepoint.
+
+        Returns
+        -------
+        np.ndarray
+            The value of the property for each cell.
+        """
+        pass
+
+    def _compute_cells(
+        self,
+        data: Data,
+        cells: list[tuple[int, int]],
+        context: UpdateContext | None = None,
+    ) -> list[Any]:
+        """
+        Compute the property for a list of cells, one query per timepoint.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineages.
+        cells : list of tuple[int, int]
+            Cell ID and lineage ID of the cells of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
+
+        Returns
+        -------
+        list[Any]
+            The value of the property for each cell, in the same order.
+        """
+        index = get_frame_index(data, self.time_prop_name, context)
+        # {time: (positions in `cells`, rows in the frame)}
+        groups: dict[Any, tuple[list[int], list[int]]] = {}
+        for i, (nid, lin_ID) in enumerate(cells):
+            time, row = index.locate(nid, lin_ID)
+            positions, rows = groups.setdefault(time, ([], []))
+            positions.append(i)
+            rows.append(row)
+        values: list[Any] = [None] * len(cells)
+        for time, (positions, rows) in groups.items():
+            results = self.query(index, time, np.array(rows, dtype=np.intp))
+            for i, value in zip(positions, results.tolist()):
+                values[i] = value
+        return values
+
+    def compute(  # type: ignore[override]
+        self,
+        data: Data,
+        lineage: CellLineage,
+        nid: int,
+        context: UpdateContext | None = None,
+    ) -> Any:
+        """
+        Compute the property for a single cell.
+
+        Without an update context, the spatial index of the whole model is built,
+        so `enrich()` should be preferred to compute several cells.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineage.
+        lineage : CellLineage
+            Lineage graph containing the node of interest.
+        nid : int
+            Node ID (cell_ID) of the cell of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
+
+        Returns
+        -------
+        Any
+            The value of the property for the cell.
+        """
+        cells = [(nid, lineage.graph["lineage_ID"])]
+        return self._compute_cells(data, cells, context)[0]
+
+    def enrich(
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]] | None = None,
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Enrich the data with the value of the property for a list of cells.
+
+        The spatial index is built once, and the cells of each timepoint
+        are queried in a single vectorized call.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineages to enrich.
+        nodes_to_enrich : list of tuple[int, int], optional
+            List of tuples containing the node ID and the lineage ID of the nodes
+            to enrich with the property value. If None, all nodes in all lineages
+            are enriched.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
+        """
+        lineages = data.cell_data
+        if nodes_to_enrich is None:
+            nodes_to_enrich = [
+                (nid, lin_ID) for lin_ID, lin in lineages.items() for nid in lin.nodes
+            ]
+        values = self._compute_cells(data, nodes_to_enrich, context)
+        for (nid, lin_ID), value in zip(nodes_to_enrich, values):
+            lineages[lin_ID].nodes[nid][self.prop.identifier] = value
+
+
+def create_neighbor_count_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "neighbor_count",
+        name=custom_name or "Neighbor count",
+        description=custom_description
+        or "Number of other cells within a given distance at the same timepoint",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="int",
+    )
+
+
+class NeighborCount(_NeighborhoodCalculator):
+    """
+    Calculator to compute the number of neighbors of cells.
+
+    The neighbors of a cell are the other cells of the same timepoint,
+    from all the lineages, whose center is within a given distance
+    from the center of the cell.
+    """
+
+    def __init__(self, property: Property, radius: float, time_prop_name: str):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        radius : float
+            Maximum distance between the centers of neighboring cells.
+        time_prop_name : str
+            The name of the time property (e.g. "frame", "time", etc.) used
+            to group cells by timepoint.
+        """
+        super().__init__(property, time_prop_name)
+        self.radius = radius
+
+    def query(self, index: FrameIndex, time: Any, rows: np.ndarray) -> np.ndarray:
+        frame = index.frames[time]
+        counts = frame.tree.query_ball_point(
+            frame.coords[rows], self.radius, return_length=True
+        )
+        # The cell itself is always within the radius.
+        return np.asarray(counts) - 1
+
+
+def create_local_density_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+    unit: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "local_density",
+        name=custom_name or "Local density",
+        description=custom_description
+        or "Number of cells per unit area or volume around the cell",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+        unit=unit,
+    )
+
+
+class LocalDensity(_NeighborhoodCalculator):
+    """
+    Calculator to compute the local cell density around cells.
+
+    The local density is the number of cells of the same timepoint, the cell
+    itself included, whose center is within a given distance from the center
+    of the cell, divided by the area (2D) or the volume (3D) of the disk
+    or ball of this radius.
+    """
+
+    def __init__(
+        self,
+        property: Property,
+        radius: float,
+        time_prop_name: str,
+        ndim: Literal[2, 3] = 2,
+    ):
+        """
+        Parameters
+        ----------
+        property : Property
+            Property object to which the calculator is associated.
+        radius : float
+            Radius of the neighborhood.
+        time_prop_name : str
+            The name of the time property (e.g. "frame", "time", etc.) used
+            to group cells by timepoint.
+        ndim : {2, 3}, optional
+            Number of spatial dimensions of the data, to compute the density
+            per unit area (2) or volume (3). 2 by default.
+
+        Raises
+        ------
+        ValueError
+            If the number of dimensions is not 2 or 3.
+        """
+        if ndim not in (2, 3):
+            raise ValueError(f"Unsupported number of dimensions: {ndim}.")
+        super().__init__(property, time_prop_name)
+        self.radius = radius
+        self.ndim = ndim
+
+    def query(self, index: FrameIndex, time: Any, rows: np.ndarray) -> np.ndarray:
+        frame = index.frames[time]
+        counts = frame.tree.query_ball_point(
+            frame.coords[rows], self.radius, return_length=True
+        )
+        if self.ndim == 2:
+            size = math.pi * self.radius**2
+        else:
+            size = 4 / 3 * math.pi * self.radius**3
+        return np.asarray(counts) / size
+
+
+def create_nearest_non_sister_distance_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+    unit: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "nearest_non_sister_distance",
+        name=custom_name or "Nearest non-sister distance",
+        description=custom_description
+        or "Distance to the closest cell of the same timepoint that is not a sister",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+        unit=unit,
+    )
+
+
+class NearestNonSisterDistance(_NeighborhoodCalculator):
+    """
+    Calculator to compute the distance to the nearest non-sister cell.
+
+    The distance is computed between the centers of the cell and of the closest
+    other cell of the same timepoint, from all the lineages, that is not
+    a sister cell. NaN if there is no such cell.
+    """
+
+    # Number of nearest cells queried at first. It is doubled for the cells
+    # whose nearest cells are all sisters.
+    _INITIAL_K = 4
+
+    def query(self, index: FrameIndex, time: Any, rows: np.ndarray) -> np.ndarray:
+        frame = index.frames[time]
+        keys = index.get_sister_keys(time)
+        nb_cells = len(frame.cell_IDs)
+        distances = np.full(len(rows), np.nan)
+        pending = np.arange(len(rows))
+        k = min(self._INITIAL_K, nb_cells)
+        while len(pending) > 0:
+            dists, neighbors = frame.tree.query(frame.coords[rows[pending]], k=k)
+            dists = dists.reshape(len(pending), k)
+            neighbors = neighbors.reshape(len(pending), k)
+            own_rows = rows[pending][:, np.newaxis]
+            own_keys = keys[own_rows]
+            valid = (neighbors != own_rows) & (
+                (keys[neighbors] != own_keys) | (own_keys < 0)
+            )
+            found = valid.any(axis=1)
+            first = valid.argmax(axis=1)
+            distances[pending[found]] = dists[found, first[found]]
+            if k == nb_cells:
+                break
+            pending = pending[~found]
+            k = min(2 * k, nb_cells)
+        return distances
@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shape descriptors of the cells, computed from their ROI.
+
+The descriptors are computed with the vectorized functions of shapely 2:
+the ROIs of all the cells to enrich are converted into a single array of
+polygons and each descriptor is computed for the whole array at once.
+During a model update, the polygons of a lineage are built once and shared
+by all the shape calculators.
+"""
+
+from abc import abstractmethod
+from functools import partial
+from typing import Sequence
+
+import numpy as np
+import shapely
+
+from pycellin.classes.data import Data
+from pycellin.classes.lineage import CellLineage
+from pycellin.classes.property import Property
+from pycellin.classes.property_calculator import _get_lin_data_from_lin_type
+from pycellin.classes.update_context import UpdateContext
+from pycellin.graph.properties.morphology import ROIPropCalculator
+
+
+def from_rois_to_polygons(
+    rois: Sequence[Sequence[tuple[float, float]] | np.ndarray],
+) -> np.ndarray:
+    """
+    Build an array of polygons from a list of ROIs.
+
+    Parameters
+    ----------
+    rois : Sequence[Sequence[tuple[float, float]] | np.ndarray]
+        Coordinates of the vertices of each ROI.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shapely polygons, in the same order as the ROIs.
+    """
+    if len(rois) == 0:
+        return np.empty(0, dtype=object)
+    arrays = [np.asarray(roi, dtype=float).reshape(-1, 2) for roi in rois]
+    indices = np.repeat(np.arange(len(arrays)), [len(arr) for arr in arrays])
+    rings = shapely.linearrings(np.concatenate(arrays), indices=indices)
+    return shapely.polygons(rings)
+
+
+def _get_lineage_polygons(lineage: CellLineage) -> tuple[dict[int, int], np.ndarray]:
+    """
+    Build the polygons of the ROIs of all the cells of a lineage.
+
+    Parameters
+    ----------
+    lineage : CellLineage
+        Lineage of interest.
+
+    Returns
+    -------
+    tuple[dict[int, int], np.ndarray]
+        A mapping from cell ID to index in the array, and the array of polygons.
+    """
+    nids = list(lineage.nodes)
+    rois = [lineage.nodes[nid]["ROI_coords"] for nid in nids]
+    index = {nid: i for i, nid in enumerate(nids)}
+    return index, from_rois_to_polygons(rois)
+
+
+def get_area(polygons: np.ndarray) -> np.ndarray:
+    """
+    Compute the area of polygons.
+
+    Parameters
+    ----------
+    polygons : np.ndarray
+        Array of shapely polygons.
+
+    Returns
+    -------
+    np.ndarray
+        Area of each polygon.
+    """
+    return shapely.area(polygons)
+
+
+def get_perimeter(polygons: np.ndarray) -> np.ndarray:
+    """
+    Compute the perimeter of polygons.
+
+    Parameters
+    ----------
+    polygons : np.ndarray
+        Array of shapely polygons.
+
+    Returns
+    -------
+    np.ndarray
+        Perimeter of each polygon.
+    """
+    return shapely.length(polygons)
+
+
+def get_solidity(polygons: np.ndarray) -> np.ndarray:
+    """
+    Compute the solidity of polygons, i.e. the ratio of their area to the area
+    of their convex hull.
+
+    Parameters
+    ----------
+    polygons : np.ndarray
+        Array of shapely polygons.
+
+    Returns
+    -------
+    np.ndarray
+        Solidity of each polygon, NaN for polygons with a null convex hull area.
+    """
+    area = shapely.area(polygons)
+    hull_area = shapely.area(shapely.convex_hull(polygons))
+    solidity = np.full(len(area), np.nan)
+    np.divide(area, hull_area, out=solidity, where=hull_area > 0)
+    return solidity
+
+
+def get_eccentricity(polygons: np.ndarray) -> np.ndarray:
+    """
+    Compute the eccentricity of polygons.
+
+    The eccentricity is the one of the ellipse with the same second moments
+    as the polygon. It is 0 for a disk and tends to 1 for elongated shapes.
+
+    Parameters
+    ----------
+    polygons : np.ndarray
+        Array of shapely polygons.
+
+    Returns
+    -------
+    np.ndarray
+        Eccentricity of each polygon, NaN for degenerate polygons.
+    """
+    nb_polygons = len(polygons)
+    coords, index = shapely.get_coordinates(
+        shapely.get_exterior_ring(polygons), return_index=True
+    )
+    # Centering the vertices of each polygon to limit rounding errors.
+    counts = np.bincount(index, minlength=nb_polygons)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.stack(
+            [
+                np.bincount(index, coords[:, 0], nb_polygons) / counts,
+                np.bincount(index, coords[:, 1], nb_polygons) / counts,
+            ],
+            axis=1,
+        )
+    coords = coords - means[index]
+
+    # Moments of the polygons, computed on their edges with Green's theorem.
+    # Rings are closed, so edges link consecutive vertices of the same polygon.
+    is_edge = index[:-1] == index[1:]
+    edge_index = index[:-1][is_edge]
+    x0, y0 = coords[:-1][is_edge].T
+    x1, y1 = coords[1:][is_edge].T
+    cross = x0 * y1 - x1 * y0
+
+    def edge_sum(values: np.ndarray) -> np.ndarray:
+        return np.bincount(edge_index, values * cross, nb_polygons)
+
+    area = edge_sum(np.ones_like(cross)) / 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cx = edge_sum(x0 + x1) / (6 * area)
+        cy = edge_sum(y0 + y1) / (6 * area)
+        mu20 = edge_sum(x0**2 + x0 * x1 + x1**2) / (12 * area) - cx**2
+        mu02 = edge_sum(y0**2 + y0 * y1 + y1**2) / (12 * area) - cy**2
+        mu11 = (
+            edge_sum(x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) / (24 * area)
+            - cx * cy
+        )
+        # Eigenvalues of the covariance matrix.
+        half_trace = (mu20 + mu02) / 2
+        delta = np.sqrt(((mu20 - mu02) / 2) ** 2 + mu11**2)
+        major = half_trace + delta
+        # 1 - minor / major, where a relative gap at the level of the rounding
+        # errors of the moments is zeroed, since the square root amplifies it.
+        gap = 2 * delta / major
+        gap[gap < 1e-12] = 0.0
+        eccentricity = np.sqrt(np.clip(gap, 0, 1))
+    eccentricity[~(major > 0)] = np.nan
+    return eccentricity
+
+
+def get_min_rect_dimensions(polygons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the dimensions of the minimum rotated rectangles enclosing polygons.
+
+    Parameters
+    ----------
+    polygons : np.ndarray
+        Array of shapely polygons.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Length (longest side) and width (shortest side) of each rectangle.
+    """
+    rectangles = shapely.oriented_envelope(polygons)
+    coords, index = shapely.get_coordinates(rectangles, return_index=True)
+    starts = np.searchsorted(index, np.arange(len(polygons)))
+    ends = np.searchsorted(index, np.arange(len(polygons)), side="right") - 1
+    # Degenerate rectangles are lines or points, with less than 3 vertices.
+    p0 = coords[starts]
+    p1 = coords[np.minimum(starts + 1, ends)]
+    p2 = coords[np.minimum(starts + 2, ends)]
+    side1 = np.linalg.norm(p1 - p0, axis=1)
+    side2 = np.linalg.norm(p2 - p1, axis=1)
+    return np.maximum(side1, side2), np.minimum(side1, side2)
+
+
+def get_min_rect_length(polygons: np.ndarray) -> np.ndarray:
+    """
+    Compute the length of the minimum rotated rectangles enclosing polygons.
+
+    Parameters
+    ----------
+    polygons : np.ndarray
+        Array of shapely polygons.
+
+    Returns
+    -------
+    np.ndarray
+        Length of each rectangle.
+    """
+    return get_min_rect_dimensions(polygons)[0]
+
+
+def get_min_rect_width(polygons: np.ndarray) -> np.ndarray:
+    """
+    Compute the width of the minimum rotated rectangles enclosing polygons.
+
+    Parameters
+    ----------
+    polygons : np.ndarray
+        Array of shapely polygons.
+
+    Returns
+    -------
+    np.ndarray
+        Width of each rectangle.
+    """
+    return get_min_rect_dimensions(polygons)[1]
+
+
+def _describe_roi(describe, roi: np.ndarray, nid: int | None = None) -> float:
+    """
+    Compute a shape descriptor for a single ROI.
+
+    Parameters
+    ----------
+    describe : Callable[[np.ndarray], np.ndarray]
+        Vectorized function computing the descriptor from an array of polygons.
+    roi : np.ndarray
+        Coordinates of the ROI vertices.
+    nid : int, optional
+        Node ID (cell_ID) of the cell the ROI belongs to. Not used.
+
+    Returns
+    -------
+    float
+        The value of the descriptor.
+    """
+    return describe(from_rois_to_polygons([roi])).tolist()[0]
+
+
+class ShapeDescriptor(ROIPropCalculator):
+    """
+    Abstract calculator for shape descriptors computed on arrays of polygons.
+
+    Descriptors are computed for all the cells to enrich at once with vectorized
+    shapely functions, so the calculators are never fused nor run in parallel.
+    """
+
+    def __init__(self, property: Property):
+        super().__init__(property)
+
+    @staticmethod
+    @abstractmethod
+    def describe(polygons: np.ndarray) -> np.ndarray:
+        """
+        Compute the shape descriptor for an array of polygons.
+        Need to be implemented in subclasses.
+
+        Parameters
+        ----------
+        polygons : np.ndarray
+            Array of shapely polygons.
+
+        Returns
+        -------
+        np.ndarray
+            The value of the descriptor for each polygon.
+        """
+        pass
+
+    def get_roi_function(self):
+        return partial(_describe_roi, self.describe)
+
+    def is_fusable(self) -> bool:
+        return False
+
+    def enrich(
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]],
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Enrich the data with the value of the descriptor for a list of nodes.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineages.
+        nodes_to_enrich : list of tuple[int, int]
+            List of tuples containing the node ID and the lineage ID of the nodes
+            to enrich with the property value.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any. The polygons
+            of the lineages are cached in the context to be reused by the other
+            shape calculators.
+        """
+        lineages = _get_lin_data_from_lin_type(data, self.prop.lin_type)
+        if context is None:
+            rois = [
+                lineages[lin_ID].nodes[nid]["ROI_coords"]
+                for nid, lin_ID in nodes_to_enrich
+            ]
+            polygons = from_rois_to_polygons(rois)
+        else:
+            parts = []
+            for nid, lin_ID in nodes_to_enrich:
+                index, lin_polygons = context.memoize(
+                    "roi_polygons", lineages[lin_ID], _get_lineage_polygons
+                )
+                parts.append(lin_polygons[index[nid]])
+            polygons = np.array(parts, dtype=object)
+        values = self.describe(polygons).tolist()
+        for (nid, lin_ID), value in zip(nodes_to_enrich, values):
+            lineages[lin_ID].nodes[nid][self.prop.identifier] = value
+
+
+def create_cell_area_property(
+    custom_identifier: str | None,
+    unit: str,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "cell_area",
+        name=custom_name or "Cell area",
+        description=custom_description or "Area of the cell ROI",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+        unit=unit,
+    )
+
+
+class CellArea(ShapeDescriptor):
+    """
+    Calculator to compute the area of the cells from their ROI.
+    """
+
+    describe = staticmethod(get_area)
+
+
+def create_cell_perimeter_property(
+    custom_identifier: str | None,
+    unit: str,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "cell_perimeter",
+        name=custom_name or "Cell perimeter",
+        description=custom_description or "Perimeter of the cell ROI",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+        unit=unit,
+    )
+
+
+class CellPerimeter(ShapeDescriptor):
+    """
+    Calculator to compute the perimeter of the cells from their ROI.
+    """
+
+    describe = staticmethod(get_perimeter)
+
+
+def create_cell_solidity_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "cell_solidity",
+        name=custom_name or "Cell solidity",
+        description=custom_description
+        or "Ratio of the area of the cell ROI to the area of its convex hull",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+    )
+
+
+class CellSolidity(ShapeDescriptor):
+    """
+    Calculator to compute the solidity of the cells from their ROI.
+    """
+
+    describe = staticmethod(get_solidity)
+
+
+def create_cell_eccentricity_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "cell_eccentricity",
+        name=custom_name or "Cell eccentricity",
+        description=custom_description
+        or "Eccentricity of the ellipse with the same second moments as the cell ROI",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+    )
+
+
+class CellEccentricity(ShapeDescriptor):
+    """
+    Calculator to compute the eccentricity of the cells from their ROI.
+    """
+
+    describe = staticmethod(get_eccentricity)
+
+
+def create_min_rect_length_property(
+    custom_identifier: str | None,
+    unit: str,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "min_rect_length",
+        name=custom_name or "Minimum rectangle length",
+        description=custom_description
+        or "Length of the minimum rotated rectangle enclosing the cell ROI",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+        unit=unit,
+    )
+
+
+class MinRectLength(ShapeDescriptor):
+    """
+    Calculator to compute the length of the minimum rotated rectangle
+    enclosing the ROI of the cells.
+    """
+
+    describe = staticmethod(get_min_rect_length)
+
+
+def create_min_rect_width_property(
+    custom_identifier: str | None,
+    unit: str,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "min_rect_width",
+        name=custom_name or "Minimum rectangle width",
+        description=custom_description
+        or "Width of the minimum rotated rectangle enclosing the cell ROI",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+        unit=unit,
+    )
+
+
+class MinRectWidth(ShapeDescriptor):
+    """
+    Calculator to compute the width of the minimum rotated rectangle
+    enclosing the ROI of the cells.
+    """
+
+    describe = staticmethod(get_min_rect_width)
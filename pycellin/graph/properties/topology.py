@@ -3,8 +3,14 @@
 
 """Lineage topology property functions to create standard Property instances."""
 
+from pycellin.classes.data import Data
+from pycellin.classes.lineage import Lineage
 from pycellin.classes.property import Property
-from pycellin.classes.property_calculator import NodeLocalPropCalculator
+from pycellin.classes.property_calculator import (
+    NodeGlobalPropCalculator,
+    NodeLocalPropCalculator,
+)
+from pycellin.classes.update_context import UpdateContext
 
 
 def create_is_division_property(
@@ -27,6 +33,9 @@ def create_is_division_property(
 class IsDivision(NodeLocalPropCalculator):
     """Calculator for the is_division property."""
 
+    def get_inputs(self) -> set[str]:
+        return set()
+
     def compute(self, lineage, nid: int) -> bool:
         """
         Compute whether a given node is a division event.
@@ -67,6 +76,9 @@ def create_is_leaf_property(
 class IsLeaf(NodeLocalPropCalculator):
     """Calculator for the is_leaf property."""
 
+    def get_inputs(self) -> set[str]:
+        return set()
+
     def compute(self, lineage, nid: int) -> bool:
         """
         Compute whether a given node is a leaf cell.
@@ -107,6 +119,9 @@ def create_is_root_property(
 class IsRoot(NodeLocalPropCalculator):
     """Calculator for the is_root property."""
 
+    def get_inputs(self) -> set[str]:
+        return set()
+
     def compute(self, lineage, nid: int) -> bool:
         """
         Compute whether a given node is a root cell.
@@ -125,3 +140,120 @@ class IsRoot(NodeLocalPropCalculator):
             False otherwise.
         """
         return lineage.is_root(nid)  # type: ignore
+
+
+class _TreeLevel(NodeGlobalPropCalculator):
+    """
+    Base calculator for properties derived from the position of a cell in the tree.
+
+    The depth and generation of all the cells of a lineage are computed
+    in a single traversal, which is cached in the update context and shared
+    by all the cells of the lineage.
+    """
+
+    _FOOTPRINT = "ancestors"
+    # Index of the level in the tuples returned by `Lineage.get_tree_levels()`.
+    _LEVEL_INDEX: int
+
+    def get_inputs(self) -> set[str]:
+        return set()
+
+    def compute(  # type: ignore[override]
+        self,
+        data: Data,
+        lineage: Lineage,
+        nid: int,
+        context: UpdateContext | None = None,
+    ) -> int:
+        """
+        Compute the level of a given cell.
+
+        Parameters
+        ----------
+        data : Data
+            Data object containing the lineage.
+        lineage : Lineage
+            Lineage graph containing the node of interest.
+        nid : int
+            Node ID (cell_ID) of the cell of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
+
+        Returns
+        -------
+        int
+            Level of the cell.
+        """
+        if context is None:
+            levels = lineage.get_tree_levels()
+        else:
+            levels = context.memoize("tree_levels", lineage, Lineage.get_tree_levels)
+        return levels[nid][self._LEVEL_INDEX]
+
+    def enrich(
+        self,
+        data: Data,
+        nodes_to_enrich: list[tuple[int, int]] | None = None,
+        context: UpdateContext | None = None,
+        **kwargs,
+    ) -> None:
+        # Without an update context, a local one is used so that
+        # each lineage is traversed only once.
+        if context is None:
+            context = UpdateContext()
+        super().enrich(data, nodes_to_enrich, context=context, **kwargs)
+
+
+def create_depth_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "depth",
+        name=custom_name or "Depth",
+        description=custom_description
+        or "Number of cells upstream of the current one in the lineage",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="int",
+    )
+
+
+class Depth(_TreeLevel):
+    """
+    Calculator for the depth property.
+
+    The depth of a cell is its number of ancestors. Depth of the root is 0.
+    """
+
+    _LEVEL_INDEX = 0
+
+
+def create_generation_property(
+    custom_identifier: str | None = None,
+    custom_name: str | None = None,
+    custom_description: str | None = None,
+) -> Property:
+    return Property(
+        identifier=custom_identifier or "generation",
+        name=custom_name or "Generation",
+        description=custom_description
+        or "Number of divisions upstream of the current cell in the lineage",
+        provenance="pycellin",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="int",
+    )
+
+
+class Generation(_TreeLevel):
+    """
+    Calculator for the generation property.
+
+    The generation of a cell is the number of divisions among its ancestors,
+    i.e. the level of its cell cycle. Generation of the root is 0.
+    """
+
+    _LEVEL_INDEX = 1
@@ -36,6 +36,7 @@ from pycellin.classes.exceptions import FusionError
 from pycellin.classes.lineage import CellLineage, CycleLineage
 from pycellin.classes.property import Property
 from pycellin.classes.property_calculator import NodeGlobalPropCalculator
+from pycellin.classes.update_context import UpdateContext
 
 # TODO: should I add the word Calc or Calculator to the class names?
 # TODO: add calculator for mandatory cycle lineage properties (e.g. cycle length)
@@ -71,6 +72,8 @@ class AbsoluteAge(NodeGlobalPropCalculator):
     (e.g. "frame", "time", etc.).
     """
 
+    _FOOTPRINT = "ancestors"
+
     def __init__(self, property: Property, time_prop_name: str):
         """
         Parameters
@@ -84,8 +87,15 @@ class AbsoluteAge(NodeGlobalPropCalculator):
         super().__init__(property)
         self.time_prop_name = time_prop_name
 
+    def get_inputs(self) -> set[str]:
+        return {self.time_prop_name}
+
     def compute(  # type: ignore[override]
-        self, data: Data, lineage: CellLineage, nid: int
+        self,
+        data: Data,
+        lineage: CellLineage,
+        nid: int,
+        context: UpdateContext | None = None,
     ) -> int | float:
         """
         Compute the absolute age of a given cell.
@@ -98,6 +108,8 @@ class AbsoluteAge(NodeGlobalPropCalculator):
             Lineage graph containing the node of interest.
         nid : int
             Node ID (cell_ID) of the cell of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
 
         Returns
         -------
@@ -111,7 +123,10 @@ class AbsoluteAge(NodeGlobalPropCalculator):
         """
         if nid not in lineage.nodes:
             raise KeyError(f"Cell {nid} not in the lineage.")
-        root = lineage.get_root()
+        if context is None:
+            root = lineage.get_root()
+        else:
+            root = context.get_root(lineage)
         age = (
             lineage.nodes[nid][self.time_prop_name]
             - lineage.nodes[root][self.time_prop_name]
@@ -150,6 +165,8 @@ class RelativeAge(NodeGlobalPropCalculator):
     to the time unit of the model if specified.
     """
 
+    _FOOTPRINT = "cycle"
+
     def __init__(self, property: Property, time_prop_name: str):
         """
         Parameters
@@ -162,8 +179,15 @@ class RelativeAge(NodeGlobalPropCalculator):
         super().__init__(property)
         self.time_prop_name = time_prop_name
 
+    def get_inputs(self) -> set[str]:
+        return {self.time_prop_name}
+
     def compute(  # type: ignore[override]
-        self, data: Data, lineage: CellLineage, nid: int
+        self,
+        data: Data,
+        lineage: CellLineage,
+        nid: int,
+        context: UpdateContext | None = None,
     ) -> int | float:
         """
         Compute the relative age of a given cell.
@@ -176,6 +200,8 @@ class RelativeAge(NodeGlobalPropCalculator):
             Lineage graph containing the node of interest.
         nid : int
             Node ID (cell_ID) of the cell of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
 
         Returns
         -------
@@ -189,7 +215,7 @@ class RelativeAge(NodeGlobalPropCalculator):
         """
         if nid not in lineage.nodes:
             raise KeyError(f"Cell {nid} not in the lineage.")
-        first_cell = lineage.get_cell_cycle(nid)[0]
+        first_cell = _get_cell_cycle(lineage, nid, context)[0]
         age = (
             lineage.nodes[nid][self.time_prop_name]
             - lineage.nodes[first_cell][self.time_prop_name]
@@ -225,8 +251,17 @@ class CycleCompleteness(NodeGlobalPropCalculator):
     before the root or after the leaves.
     """
 
+    _FOOTPRINT = "cycle"
+
+    def get_inputs(self) -> set[str]:
+        return set()
+
     def compute(  # type: ignore[override]
-        self, data: Data, lineage: CellLineage | CycleLineage, nid: int
+        self,
+        data: Data,
+        lineage: CellLineage | CycleLineage,
+        nid: int,
+        context: UpdateContext | None = None,
     ) -> bool:
         """
         Compute the cell cycle completeness of a given cell or cell cycle.
@@ -239,6 +274,8 @@ class CycleCompleteness(NodeGlobalPropCalculator):
             Lineage graph containing the node (cell or cell cycle) of interest.
         nid : int
             Node ID of the node (cell or cell cycle) of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
 
         Returns
         -------
@@ -253,7 +290,7 @@ class CycleCompleteness(NodeGlobalPropCalculator):
         if isinstance(lineage, CellLineage):
             if nid not in lineage.nodes:
                 raise KeyError(f"Cell {nid} not in the lineage.")
-            cell_cycle = lineage.get_cell_cycle(nid)
+            cell_cycle = _get_cell_cycle(lineage, nid, context)
             if lineage.is_root(cell_cycle[0]) or lineage.is_leaf(cell_cycle[-1]):
                 return False
             else:
@@ -267,8 +304,36 @@ class CycleCompleteness(NodeGlobalPropCalculator):
                 return True
 
 
+def _get_cell_cycle(
+    lineage: CellLineage, nid: int, context: UpdateContext | None
+) -> list[int]:
+    """
+    Get the cell cycle of a cell, from the update context when available.
+
+    Parameters
+    ----------
+    lineage : CellLineage
+        Lineage graph containing the node of interest.
+    nid : int
+        Node ID (cell_ID) of the cell of interest.
+    context : UpdateContext | None
+        Memoization context of the current update, if any.
+
+    Returns
+    -------
+    list[int]
+        The cells of the cell cycle, in chronological order.
+    """
+    if context is None:
+        return lineage.get_cell_cycle(nid)
+    return context.get_cell_cycle(lineage, nid)
+
+
 def _get_cell_lin_timepoints(
-    lineage: CellLineage, nid: int, time_prop_name: str
+    lineage: CellLineage,
+    nid: int,
+    time_prop_name: str,
+    context: UpdateContext | None = None,
 ) -> tuple[int, int]:
     """
     Get the timepoints of the divisions defining the cell cycle.
@@ -284,6 +349,8 @@ def _get_cell_lin_timepoints(
     time_prop_name : str
         The name of the time property (e.g. "frame", "time", etc.) to use
         for calculation.
+    context : UpdateContext, optional
+        Memoization context of the current update, if any.
 
     Returns
     -------
@@ -299,7 +366,7 @@ def _get_cell_lin_timepoints(
     """
     if nid not in lineage.nodes:
         raise KeyError(f"Cell {nid} not in the lineage.")
-    cells = lineage.get_cell_cycle(nid)
+    cells = _get_cell_cycle(lineage, nid, context)
     frame_current_div = lineage.nodes[cells[-1]][time_prop_name]
     ancestors = list(lineage.predecessors(cells[0]))
     if len(ancestors) > 1:
@@ -385,6 +452,8 @@ class DivisionTime(NodeGlobalPropCalculator):
     (e.g. "frame", "time", etc.).
     """
 
+    _FOOTPRINT = "cycle"
+
     def __init__(self, property: Property, time_prop_name: str):
         """
         Parameters
@@ -398,8 +467,15 @@ class DivisionTime(NodeGlobalPropCalculator):
         super().__init__(property)
         self.time_prop_name = time_prop_name
 
+    def get_inputs(self) -> set[str]:
+        return {self.time_prop_name}
+
     def compute(  # type: ignore[override]
-        self, data: Data, lineage: CellLineage | CycleLineage, nid: int
+        self,
+        data: Data,
+        lineage: CellLineage | CycleLineage,
+        nid: int,
+        context: UpdateContext | None = None,
     ) -> int | float:
         """
         Compute the division time of a given cell or cell cycle.
@@ -412,6 +488,8 @@ class DivisionTime(NodeGlobalPropCalculator):
             Lineage graph containing the node (cell or cell cycle) of interest.
         nid : int
             Node ID of the node (cell or cell cycle) of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
 
         Returns
         -------
@@ -425,7 +503,7 @@ class DivisionTime(NodeGlobalPropCalculator):
         """
         if isinstance(lineage, CellLineage):
             timepoint_curr_div, timepoint_prev_div = _get_cell_lin_timepoints(
-                lineage, nid, self.time_prop_name
+                lineage, nid, self.time_prop_name, context
             )
         elif isinstance(lineage, CycleLineage):
             timepoint_curr_div, timepoint_prev_div = _get_cycle_lin_timepoints(
@@ -467,6 +545,8 @@ class DivisionRate(NodeGlobalPropCalculator):
     (e.g. "frame", "time", etc.).
     """
 
+    _FOOTPRINT = "cycle"
+
     def __init__(
         self, property: Property, time_prop_name: str, use_div_time: bool = False
     ):
@@ -492,8 +572,17 @@ class DivisionRate(NodeGlobalPropCalculator):
         self.time_prop_name = time_prop_name
         self.use_div_time = use_div_time
 
+    def get_inputs(self) -> set[str]:
+        if self.use_div_time:
+            return {"division_time"}
+        return {self.time_prop_name}
+
     def compute(  # type: ignore[override]
-        self, data: Data, lineage: CellLineage | CycleLineage, nid: int
+        self,
+        data: Data,
+        lineage: CellLineage | CycleLineage,
+        nid: int,
+        context: UpdateContext | None = None,
     ) -> int | float:
         """
         Compute the division rate of a given cell or cell cycle.
@@ -506,6 +595,8 @@ class DivisionRate(NodeGlobalPropCalculator):
             Lineage graph containing the node (cell or cell cycle) of interest.
         nid : int
             Node ID of the node (cell or cell cycle) of interest.
+        context : UpdateContext, optional
+            Memoization context of the current update, if any.
 
         Returns
         -------
@@ -542,7 +633,7 @@ class DivisionRate(NodeGlobalPropCalculator):
 
         if isinstance(lineage, CellLineage):
             timepoint_curr_div, timepoint_prev_div = _get_cell_lin_timepoints(
-                lineage, nid, self.time_prop_name
+                lineage, nid, self.time_prop_name, context
             )
         elif isinstance(lineage, CycleLineage):
             timepoint_curr_div, timepoint_prev_div = _get_cycle_lin_timepoints(
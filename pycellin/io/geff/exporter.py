@@ -12,18 +12,49 @@ References:
 """
 
 import copy
+import tempfile
+from itertools import chain
 from pathlib import Path
-from typing import Literal
+from typing import Any, Iterable, Literal
 
 import geff
 import geff_spec
 import networkx as nx
+import numcodecs
+import numpy as np
+import zarr
+from geff._typing import PropDictNpArray
+from geff.core_io import (
+    check_for_geff,
+    construct_var_len_props,
+    delete_geff,
+    write_arrays,
+)
+from geff.core_io._base_write import _compute_first_dim_chunk
+from geff.core_io._serialization import serialize_vlen_property_data
+from geff.validate.structure import validate_structure
+from geff_spec.utils import (
+    add_or_update_props_metadata,
+    compute_and_add_axis_min_max,
+    create_props_metadata,
+)
 
 from pycellin.classes import CellLineage, Model, Property
 from pycellin.custom_types import PropertyType
-from pycellin.io.utils import _remove_orphaned_metadata
+from pycellin.io.utils import _ExportView, _remove_orphaned_metadata
 
-# TODO: geffception for cycle and lineage props
+# Names of the GEFF files nested in the main GEFF file to store the lineage
+# properties and the cycle lineages.
+_LINEAGE_TABLES = ("cell_lineages", "cycle_lineages", "cell_cycles")
+
+# Node IDs, node properties, edge IDs, edge properties and metadata of a table.
+_GeffTable = tuple[
+    np.ndarray,
+    dict[str, PropDictNpArray],
+    np.ndarray,
+    dict[str, PropDictNpArray],
+    geff.GeffMetadata,
+]
 
 
 def _find_node_overlaps(lineages: list[CellLineage]) -> dict[int, list[int]]:
@@ -83,26 +114,52 @@ def _get_next_available_id(lineages: list[CellLineage]) -> int:
     return max_node_id + 1
 
 
-def _relabel_nodes(
+def _get_relabel_mappings(
     lineages: list[CellLineage],
     overlaps: dict[int, list[int]],
-) -> None:
+) -> dict[int, dict[int, int]]:
     """
-    Relabel nodes in each lineage to ensure unique IDs across all lineages.
+    Compute the new IDs of the overlapping nodes to make them unique across lineages.
+
+    The first lineage of each overlapping node keeps the original ID.
 
     Parameters
     ----------
     lineages : list[CellLineage]
-        List of lineage graphs to relabel in place.
+        List of lineage graphs.
     overlaps : dict[int, list[int]]
         Dictionary mapping overlapping node IDs to the list of lineage indices they belong to.
+
+    Returns
+    -------
+    dict[int, dict[int, int]]
+        A dictionary mapping lineage indices to their {old_ID: new_ID} mapping.
     """
+    mappings: dict[int, dict[int, int]] = {}
     next_available_id = _get_next_available_id(lineages)
     for nid, lids in sorted(overlaps.items()):
         for lid in lids[1:]:
-            mapping = {nid: next_available_id}
-            nx.relabel_nodes(lineages[lid], mapping, copy=False)
+            mappings.setdefault(lid, {})[nid] = next_available_id
             next_available_id += 1
+    return mappings
+
+
+def _relabel_nodes(
+    lineages: list[CellLineage],
+    overlaps: dict[int, list[int]],
+) -> None:
+    """
+    Relabel nodes in each lineage to ensure unique IDs across all lineages.
+
+    Parameters
+    ----------
+    lineages : list[CellLineage]
+        List of lineage graphs to relabel in place.
+    overlaps : dict[int, list[int]]
+        Dictionary mapping overlapping node IDs to the list of lineage indices they belong to.
+    """
+    for lid, mapping in _get_relabel_mappings(lineages, overlaps).items():
+        nx.relabel_nodes(lineages[lid], mapping, copy=False)
 
 
 def _solve_node_overlaps(lineages: list[CellLineage]) -> None:
@@ -119,6 +176,442 @@ def _solve_node_overlaps(lineages: list[CellLineage]) -> None:
         _relabel_nodes(lineages, overlaps)
 
 
+def _get_unique_node_ids(lin_ids: np.ndarray, node_ids: np.ndarray) -> np.ndarray:
+    """
+    Relabel the node IDs overlapping across lineages, in a single vectorized pass.
+
+    The first lineage of each overlapping node keeps the original ID, the other
+    ones get new IDs above the maximum node ID, by increasing original ID then
+    lineage order, as in `_get_relabel_mappings()`.
+
+    Parameters
+    ----------
+    lin_ids : np.ndarray
+        Index of the lineage of each node, in increasing order.
+    node_ids : np.ndarray
+        ID of each node.
+
+    Returns
+    -------
+    np.ndarray
+        The unique ID of each node.
+    """
+    order = np.lexsort((lin_ids, node_ids))
+    sorted_ids = node_ids[order]
+    is_dupe = np.zeros(len(node_ids), dtype=bool)
+    is_dupe[1:] = sorted_ids[1:] == sorted_ids[:-1]
+    if not is_dupe.any():
+        return node_ids
+    unique_ids = node_ids.copy()
+    first_new_id = node_ids.max() + 1
+    unique_ids[order[is_dupe]] = np.arange(
+        first_new_id, first_new_id + is_dupe.sum(), dtype=node_ids.dtype
+    )
+    return unique_ids
+
+
+def _get_default_value(value: Any) -> Any:
+    """
+    Return the value used in place of a missing value, based on a present one.
+
+    Parameters
+    ----------
+    value : Any
+        A value of the property.
+
+    Returns
+    -------
+    Any
+        Zero of the same type for numbers and booleans, an empty string
+        for strings, the value itself otherwise.
+    """
+    if isinstance(value, np.generic | bool | int | float):
+        return type(value)(0)
+    if isinstance(value, str):
+        return ""
+    return value
+
+
+def _build_prop_arrays(
+    attrs: Iterable[dict[str, Any]],
+    nb_elements: int,
+    var_length_props: list[str] | None = None,
+) -> dict[str, PropDictNpArray]:
+    """
+    Build the GEFF property arrays of nodes or edges, column by column.
+
+    Parameters
+    ----------
+    attrs : Iterable[dict[str, Any]]
+        Attributes of each node or edge.
+    nb_elements : int
+        Number of nodes or edges.
+    var_length_props : list[str] | None, optional
+        Identifiers of the properties whose values are arrays of variable length,
+        such as ROIs. Other properties with values of heterogeneous shapes
+        are also detected and stored as variable length properties.
+
+    Returns
+    -------
+    dict[str, PropDictNpArray]
+        The values and missing arrays of each property.
+    """
+    # {prop: (indices of the elements with the property, values)}
+    columns: dict[str, tuple[list[int], list[Any]]] = {}
+    for i, element_attrs in enumerate(attrs):
+        for key, value in element_attrs.items():
+            try:
+                indices, values = columns[key]
+            except KeyError:
+                indices, values = columns[key] = ([], [])
+            indices.append(i)
+            values.append(value)
+
+    var_length_props = var_length_props or []
+    props: dict[str, PropDictNpArray] = {}
+    for key, (indices, values) in columns.items():
+        missing = None
+        if len(values) < nb_elements:
+            default_value = _get_default_value(values[0])
+            filled_values = [default_value] * nb_elements
+            for i, value in zip(indices, values):
+                filled_values[i] = value
+            values = filled_values
+            missing = np.ones(nb_elements, dtype=bool)
+            missing[indices] = False
+        if key in var_length_props:
+            values_arr = construct_var_len_props(values)["values"]
+        else:
+            try:
+                values_arr = np.asarray(values)
+            except ValueError:
+                # Values of different shapes.
+                values_arr = construct_var_len_props(values)["values"]
+        props[key] = {"values": values_arr, "missing": missing}
+    return props
+
+
+def _build_geff_arrays(
+    data: dict[int, CellLineage],
+    var_length_props: list[str] | None = None,
+) -> tuple[
+    np.ndarray, dict[str, PropDictNpArray], np.ndarray, dict[str, PropDictNpArray]
+]:
+    """
+    Build the GEFF node and edge arrays directly from the lineages.
+
+    Node IDs overlapping across lineages are relabeled on the fly, so the lineages
+    are neither merged into a single graph nor modified.
+
+    Parameters
+    ----------
+    data : dict[int, CellLineage]
+        Cell lineages to export.
+    var_length_props : list[str] | None, optional
+        Identifiers of the properties whose values are arrays of variable length.
+
+    Returns
+    -------
+    tuple[np.ndarray, dict[str, PropDictNpArray], np.ndarray, dict[str, PropDictNpArray]]
+        The node IDs, the node property arrays, the edge IDs as (source, target)
+        pairs and the edge property arrays.
+
+    Raises
+    ------
+    ValueError
+        If a node ID is negative.
+    """
+    lineages = list(data.values())
+    nb_nodes = [len(lin) for lin in lineages]
+    nb_edges = [lin.number_of_edges() for lin in lineages]
+    node_ids = np.fromiter(
+        (nid for lin in lineages for nid in lin), dtype=np.int64, count=sum(nb_nodes)
+    )
+    if len(node_ids) and node_ids.min() < 0:
+        raise ValueError("Cannot write a geff with node ids that are negative")
+    lin_ids = np.repeat(np.arange(len(lineages)), nb_nodes)
+    unique_ids = _get_unique_node_ids(lin_ids, node_ids)
+
+    edge_ids = np.fromiter(
+        (nid for lin in lineages for edge in lin.edges for nid in edge),
+        dtype=np.int64,
+        count=2 * sum(nb_edges),
+    ).reshape(-1, 2)
+    if unique_ids is not node_ids:
+        # Edges of the lineages with relabeled nodes must follow the relabeling.
+        node_offsets = np.concatenate(([0], np.cumsum(nb_nodes)))
+        edge_offsets = np.concatenate(([0], np.cumsum(nb_edges)))
+        relabeled = np.flatnonzero(unique_ids != node_ids)
+        for i in np.unique(lin_ids[relabeled]):
+            old_ids = node_ids[node_offsets[i] : node_offsets[i + 1]]
+            new_ids = unique_ids[node_offsets[i] : node_offsets[i + 1]]
+            sorter = np.argsort(old_ids)
+            edges = edge_ids[edge_offsets[i] : edge_offsets[i + 1]]
+            edges[:] = new_ids[sorter[np.searchsorted(old_ids, edges, sorter=sorter)]]
+
+    node_props = _build_prop_arrays(
+        (attrs for lin in lineages for _, attrs in lin.nodes(data=True)),
+        len(node_ids),
+        var_length_props,
+    )
+    edge_props = _build_prop_arrays(
+        (attrs for lin in lineages for _, _, attrs in lin.edges(data=True)),
+        len(edge_ids),
+        var_length_props,
+    )
+    return (
+        unique_ids.astype(np.uint64),
+        node_props,
+        edge_ids.astype(np.uint64),
+        edge_props,
+    )
+
+
+def _to_geff_ids(
+    ids: np.ndarray, old_ids: np.ndarray, new_ids: np.ndarray
+) -> np.ndarray:
+    """
+    Convert node IDs of a lineage into the IDs of the nodes in the GEFF file.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        The node IDs to convert.
+    old_ids : np.ndarray
+        The IDs of the nodes of the lineage.
+    new_ids : np.ndarray
+        The GEFF IDs of the nodes of the lineage, in the same order as `old_ids`.
+
+    Returns
+    -------
+    np.ndarray
+        The GEFF IDs of the nodes.
+    """
+    sorter = np.argsort(old_ids)
+    return new_ids[sorter[np.searchsorted(old_ids, ids, sorter=sorter)]]
+
+
+def _build_table_props_metadata(
+    props: dict[str, PropDictNpArray],
+    properties: dict[str, Property],
+    prop_type: PropertyType,
+) -> dict[str, geff_spec.PropMetadata]:
+    """
+    Build the GEFF metadata of the properties of a lineage table.
+
+    The data type and the variable length flag are read from the property arrays,
+    the other fields from the pycellin properties.
+
+    Parameters
+    ----------
+    props : dict[str, PropDictNpArray]
+        The property arrays of the table.
+    properties : dict[str, Property]
+        Dictionary of property identifiers to Property objects.
+    prop_type : PropertyType
+        The type of the properties stored in the arrays.
+
+    Returns
+    -------
+    dict[str, geff_spec.PropMetadata]
+        The metadata of the properties of the arrays that are known to the model.
+    """
+    props_md: dict[str, geff_spec.PropMetadata] = {}
+    for prop_id, prop_arrays in props.items():
+        prop = properties.get(prop_id)
+        if prop is None or not prop.prop_type & prop_type:
+            continue
+        values = prop_arrays["values"]
+        varlength = values.dtype == object
+        dtype = values[0].dtype if varlength and len(values) else values.dtype
+        props_md[prop_id] = geff_spec.PropMetadata(
+            identifier=prop_id,
+            dtype=str(dtype),
+            varlength=varlength,
+            unit=prop.unit,
+            name=prop.name,
+            description=prop.description,
+        )
+    return props_md
+
+
+def _build_table(
+    node_ids: list[int] | np.ndarray,
+    node_attrs: list[dict[str, Any]],
+    edge_ids: np.ndarray,
+    edge_attrs: list[dict[str, Any]],
+    properties: dict[str, Property],
+    node_prop_type: PropertyType,
+    var_length_props: list[str] | None = None,
+) -> _GeffTable:
+    """
+    Build the arrays and the metadata of a lineage table.
+
+    Parameters
+    ----------
+    node_ids : list[int] | np.ndarray
+        The GEFF IDs of the nodes of the table.
+    node_attrs : list[dict[str, Any]]
+        Attributes of each node of the table.
+    edge_ids : np.ndarray
+        The edges of the table, as (source, target) pairs of GEFF IDs.
+    edge_attrs : list[dict[str, Any]]
+        Attributes of each edge of the table.
+    properties : dict[str, Property]
+        Dictionary of property identifiers to Property objects.
+    node_prop_type : PropertyType
+        The type of the properties stored on the nodes of the table.
+    var_length_props : list[str] | None, optional
+        Identifiers of the properties whose values are arrays of variable length.
+
+    Returns
+    -------
+    _GeffTable
+        The node IDs, the node property arrays, the edge IDs, the edge property
+        arrays and the GEFF metadata of the table.
+    """
+    node_props = _build_prop_arrays(node_attrs, len(node_attrs), var_length_props)
+    edge_props = _build_prop_arrays(edge_attrs, len(edge_attrs), var_length_props)
+    metadata = geff.GeffMetadata(
+        directed=True,
+        node_props_metadata=_build_table_props_metadata(
+            node_props, properties, node_prop_type
+        ),
+        edge_props_metadata=_build_table_props_metadata(
+            edge_props, properties, PropertyType.EDGE
+        ),
+    )
+    return (
+        np.asarray(node_ids, dtype=np.uint64),
+        node_props,
+        np.asarray(edge_ids, dtype=np.uint64).reshape(-1, 2),
+        edge_props,
+        metadata,
+    )
+
+
+def _build_lineage_tables(
+    model: Model,
+    var_length_props: list[str] | None = None,
+) -> dict[str, _GeffTable]:
+    """
+    Build the tables of the lineage properties and of the cycle lineages.
+
+    Each table is meant to be written as a GEFF file nested in the main one:
+    - "cell_lineages": one node per cell lineage, with the cell lineage properties,
+    - "cycle_lineages": one node per cycle lineage, with the cycle lineage properties,
+    - "cell_cycles": one node per cell cycle and one edge per link between
+      cell cycles, with the cell cycle properties.
+
+    Lineages are identified by the GEFF ID of their first cell and cell cycles
+    by the GEFF ID of their last cell, which is also the ID of the cell cycle.
+    The cells of each cell cycle are stored as GEFF IDs too, so the tables follow
+    the relabeling of the nodes overlapping across lineages. Empty lineages
+    are not exported.
+
+    Parameters
+    ----------
+    model : Model
+        The pycellin model to export.
+    var_length_props : list[str] | None, optional
+        Identifiers of the properties whose values are arrays of variable length.
+
+    Returns
+    -------
+    dict[str, _GeffTable]
+        The arrays and metadata of each table, by table name. The cycle tables
+        are only present when the model has cycle lineages.
+    """
+    lineages = list(model.data.cell_data.values())
+    nb_nodes = [len(lin) for lin in lineages]
+    node_ids = np.fromiter(
+        (nid for lin in lineages for nid in lin), dtype=np.int64, count=sum(nb_nodes)
+    )
+    lin_indices = np.repeat(np.arange(len(lineages)), nb_nodes)
+    # Same relabeling as the one of the nodes of the main GEFF file.
+    unique_ids = _get_unique_node_ids(lin_indices, node_ids)
+    offsets = np.concatenate(([0], np.cumsum(nb_nodes)))
+    cycle_data = model.data.cycle_data or {}
+
+    lin_ids: list[int] = []
+    lin_attrs: list[dict[str, Any]] = []
+    cycle_lin_ids: list[int] = []
+    cycle_lin_attrs: list[dict[str, Any]] = []
+    cycle_ids: list[np.ndarray] = []
+    cycle_attrs: list[dict[str, Any]] = []
+    cycle_edges: list[np.ndarray] = []
+    cycle_edge_attrs: list[dict[str, Any]] = []
+    for i, (lid, lin) in enumerate(model.data.cell_data.items()):
+        if nb_nodes[i] == 0:
+            continue
+        ref_id = int(unique_ids[offsets[i]])
+        lin_ids.append(ref_id)
+        lin_attrs.append(lin.graph)
+        cycle_lin = cycle_data.get(lid)
+        if cycle_lin is None:
+            continue
+        cycle_lin_ids.append(ref_id)
+        cycle_lin_attrs.append(cycle_lin.graph)
+
+        # Cycle IDs, cells and links are converted to GEFF IDs in a single pass.
+        nodes_attrs = [attrs for _, attrs in cycle_lin.nodes(data=True)]
+        cells = [attrs["cells"] for attrs in nodes_attrs]
+        ids = np.fromiter(
+            chain(
+                cycle_lin.nodes,
+                chain.from_iterable(cells),
+                chain.from_iterable(cycle_lin.edges),
+            ),
+            dtype=np.int64,
+        )
+        if unique_ids is not node_ids:
+            lin_nodes = slice(offsets[i], offsets[i + 1])
+            ids = _to_geff_ids(ids, node_ids[lin_nodes], unique_ids[lin_nodes])
+        bounds = np.cumsum([len(nodes_attrs), *(len(c) for c in cells)])
+        lin_cycle_ids, *cells_ids = np.split(ids[: bounds[-1]], bounds[:-1])
+        cycle_ids.append(lin_cycle_ids)
+        cycle_attrs.extend(
+            {**attrs, "cells": cycle_cells}
+            for attrs, cycle_cells in zip(nodes_attrs, cells_ids)
+        )
+        cycle_edges.append(ids[bounds[-1] :].reshape(-1, 2))
+        cycle_edge_attrs.extend(attrs for _, _, attrs in cycle_lin.edges(data=True))
+
+    no_edges = np.zeros((0, 2), dtype=np.uint64)
+    tables = {
+        "cell_lineages": _build_table(
+            lin_ids,
+            lin_attrs,
+            no_edges,
+            [],
+            model.get_cell_lineage_properties(),
+            PropertyType.LINEAGE,
+            var_length_props,
+        )
+    }
+    if cycle_data:
+        cycle_props = model.get_cycle_lineage_properties()
+        tables["cycle_lineages"] = _build_table(
+            cycle_lin_ids,
+            cycle_lin_attrs,
+            no_edges,
+            [],
+            cycle_props,
+            PropertyType.LINEAGE,
+            var_length_props,
+        )
+        tables["cell_cycles"] = _build_table(
+            np.concatenate(cycle_ids) if cycle_ids else [],
+            cycle_attrs,
+            np.concatenate(cycle_edges) if cycle_edges else no_edges,
+            cycle_edge_attrs,
+            cycle_props,
+            PropertyType.NODE,
+            [*(var_length_props or []), "cells"],
+        )
+    return tables
+
+
 def _build_axes(
     node_props: dict[str, Property],
     time_axes: list[str],
@@ -357,6 +850,309 @@ def _build_geff_metadata(
     )
 
 
+def _sort_by_time(
+    node_ids: np.ndarray,
+    node_props: dict[str, PropDictNpArray],
+    edge_ids: np.ndarray,
+    edge_props: dict[str, PropDictNpArray],
+    time_prop: str,
+) -> tuple[
+    np.ndarray, dict[str, PropDictNpArray], np.ndarray, dict[str, PropDictNpArray]
+]:
+    """
+    Sort the nodes by time, and the edges by time of their source node.
+
+    Parameters
+    ----------
+    node_ids : np.ndarray
+        The node IDs.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays.
+    edge_ids : np.ndarray
+        The edge IDs as (source, target) pairs.
+    edge_props : dict[str, PropDictNpArray]
+        The edge property arrays.
+    time_prop : str
+        Identifier of the node property used to sort the nodes.
+
+    Returns
+    -------
+    tuple[np.ndarray, dict[str, PropDictNpArray], np.ndarray, dict[str, PropDictNpArray]]
+        The sorted node IDs, node property arrays, edge IDs and edge property arrays.
+
+    Raises
+    ------
+    KeyError
+        If the time property is not a node property.
+    """
+
+    def reorder(props, order):
+        return {
+            key: {
+                "values": prop["values"][order],
+                "missing": None if prop["missing"] is None else prop["missing"][order],
+            }
+            for key, prop in props.items()
+        }
+
+    node_times = node_props[time_prop]["values"]
+    node_order = np.argsort(node_times, kind="stable")
+    sorter = np.argsort(node_ids)
+    source_rows = sorter[np.searchsorted(node_ids, edge_ids[:, 0], sorter=sorter)]
+    edge_order = np.argsort(node_times[source_rows], kind="stable")
+    return (
+        node_ids[node_order],
+        reorder(node_props, node_order),
+        edge_ids[edge_order],
+        reorder(edge_props, edge_order),
+    )
+
+
+def _get_compressors(
+    compressor: str | None,
+    compression_level: int | None,
+    zarr_format: Literal[2, 3],
+) -> Any:
+    """
+    Build the zarr compressor matching a compressor name and a compression level.
+
+    Parameters
+    ----------
+    compressor : str | None
+        Name of the compressor: "blosc-lz4", "blosc-zstd", "zstd", "gzip" or "none".
+        If None, the zarr default compressor used by geff is kept: Blosc with LZ4
+        for Zarr format 2, Zstd for Zarr format 3.
+    compression_level : int | None
+        Compression level of the compressor. If None, the codec default is used.
+    zarr_format : Literal[2, 3]
+        The Zarr format version of the GEFF file.
+
+    Returns
+    -------
+    Any
+        The zarr codec, "auto" for the zarr default codec, or None for
+        no compression.
+
+    Raises
+    ------
+    ValueError
+        If the compressor name is unknown, or if a compression level is given
+        without compression.
+    """
+    if compressor is None:
+        if compression_level is None:
+            return "auto"
+        compressor = "blosc-lz4" if zarr_format == 2 else "zstd"
+    if compressor == "none":
+        if compression_level is not None:
+            raise ValueError(
+                "`compression_level` cannot be set when `compressor` is 'none'."
+            )
+        return None
+    if compressor in ("blosc-lz4", "blosc-zstd"):
+        cname = compressor.removeprefix("blosc-")
+        clevel = 5 if compression_level is None else compression_level
+        if zarr_format == 3:
+            return zarr.codecs.BloscCodec(cname=cname, clevel=clevel, shuffle="shuffle")
+        return numcodecs.Blosc(
+            cname=cname, clevel=clevel, shuffle=numcodecs.Blosc.SHUFFLE
+        )
+    if compressor == "zstd":
+        level = 0 if compression_level is None else compression_level
+        if zarr_format == 3:
+            return zarr.codecs.ZstdCodec(level=level)
+        return numcodecs.Zstd(level=level)
+    if compressor == "gzip":
+        level = 5 if compression_level is None else compression_level
+        if zarr_format == 3:
+            return zarr.codecs.GzipCodec(level=level)
+        return numcodecs.GZip(level=level)
+    raise ValueError(
+        f"Unknown compressor '{compressor}', expected one of "
+        "'blosc-lz4', 'blosc-zstd', 'zstd', 'gzip' or 'none'."
+    )
+
+
+def _write_encoded_array(
+    group: zarr.Group,
+    path: str,
+    data: np.ndarray,
+    chunk_size: int | None,
+    shard_size: int | None,
+    compressors: Any,
+) -> None:
+    """
+    Write a numpy array in a zarr group, with the requested encoding.
+
+    Parameters
+    ----------
+    group : zarr.Group
+        The group to write into.
+    path : str
+        Path of the array within the group.
+    data : np.ndarray
+        The array to write.
+    chunk_size : int | None
+        Number of rows per chunk. If None, the geff default chunks of about
+        8 MiB are used.
+    shard_size : int | None
+        Number of rows per shard, for Zarr format 3 only. If None, the array
+        is not sharded.
+    compressors : Any
+        The zarr codec used to compress the array, or None for no compression.
+    """
+    rows = chunk_size or _compute_first_dim_chunk(data.shape, data.dtype.itemsize)
+    shards = None
+    if shard_size is not None:
+        # Shards must contain a whole number of chunks.
+        shards = (-(-shard_size // rows) * rows, *data.shape[1:])
+    group.create_array(
+        path,
+        data=data,
+        chunks=(rows, *data.shape[1:]),
+        shards=shards,
+        compressors=compressors,
+    )
+
+
+def _write_encoded_props(
+    root: zarr.Group,
+    group: Literal["nodes", "edges"],
+    props: dict[str, PropDictNpArray],
+    chunk_size: int | None,
+    shard_size: int | None,
+    compressors: Any,
+) -> list[geff_spec.PropMetadata]:
+    """
+    Write the property arrays of the nodes or edges, with the requested encoding.
+
+    Parameters
+    ----------
+    root : zarr.Group
+        The root group of the GEFF file.
+    group : Literal["nodes", "edges"]
+        The group of the properties.
+    props : dict[str, PropDictNpArray]
+        The property arrays.
+    chunk_size : int | None
+        Number of rows per chunk. If None, the geff default chunks are used.
+    shard_size : int | None
+        Number of rows per shard, for Zarr format 3 only.
+    compressors : Any
+        The zarr codec used to compress the arrays, or None for no compression.
+
+    Returns
+    -------
+    list[geff_spec.PropMetadata]
+        The metadata of the written properties.
+    """
+    props_group = root.require_group(f"{group}/props")
+    props_md = []
+    for name, prop in props.items():
+        prop_md = create_props_metadata(name, prop)
+        props_md.append(prop_md)
+        if prop_md.varlength:
+            values, missing, data = serialize_vlen_property_data(prop)
+        else:
+            values, missing, data = prop["values"], prop["missing"], None
+        prop_group = props_group.create_group(name)
+        for path, array in (("values", values), ("missing", missing), ("data", data)):
+            if array is not None:
+                _write_encoded_array(
+                    prop_group, path, array, chunk_size, shard_size, compressors
+                )
+    return props_md
+
+
+def _write_encoded_arrays(
+    store: str | Path,
+    node_ids: np.ndarray,
+    node_props: dict[str, PropDictNpArray],
+    edge_ids: np.ndarray,
+    edge_props: dict[str, PropDictNpArray],
+    metadata: geff.GeffMetadata,
+    zarr_format: Literal[2, 3],
+    chunk_size: int | None,
+    shard_size: int | None,
+    compressors: Any,
+) -> None:
+    """
+    Write a GEFF file from its arrays, with the requested encoding.
+
+    This is the counterpart of `geff.core_io.write_arrays()`, which hard-codes
+    the encoding of the arrays.
+
+    Parameters
+    ----------
+    store : str | Path
+        Path to the GEFF file. It must not contain a GEFF file already.
+    node_ids : np.ndarray
+        The node IDs.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays.
+    edge_ids : np.ndarray
+        The edge IDs as (source, target) pairs.
+    edge_props : dict[str, PropDictNpArray]
+        The edge property arrays.
+    metadata : geff.GeffMetadata
+        The metadata of the GEFF file, completed with the metadata
+        of the properties.
+    zarr_format : Literal[2, 3]
+        The Zarr format version of the GEFF file.
+    chunk_size : int | None
+        Number of rows per chunk. If None, the geff default chunks are used.
+    shard_size : int | None
+        Number of rows per shard, for Zarr format 3 only.
+    compressors : Any
+        The zarr codec used to compress the arrays, or None for no compression.
+
+    Raises
+    ------
+    ValueError
+        If the written GEFF file is invalid.
+    """
+    root = zarr.open_group(store, mode="a", zarr_format=zarr_format)
+    encoding = (chunk_size, shard_size, compressors)
+    _write_encoded_array(root, "nodes/ids", node_ids, *encoding)
+    _write_encoded_array(root, "edges/ids", edge_ids, *encoding)
+    if len(node_ids) == 0 and metadata.axes is not None:
+        # Axis properties must exist even in an empty graph.
+        for axis in metadata.axes:
+            node_props.setdefault(
+                axis.name, {"values": np.empty(0, dtype="float64"), "missing": None}
+            )
+    node_md = _write_encoded_props(root, "nodes", node_props, *encoding)
+    edge_md = _write_encoded_props(root, "edges", edge_props, *encoding)
+    metadata = add_or_update_props_metadata(metadata, node_md, "node")
+    metadata = add_or_update_props_metadata(metadata, edge_md, "edge")
+    metadata = compute_and_add_axis_min_max(metadata, node_props)
+    metadata.write(store)
+    validate_structure(store)
+
+
+def _delete_geff(store: str | Path, zarr_format: Literal[2, 3]) -> None:
+    """
+    Delete an existing GEFF file, including its lineage tables.
+
+    geff only deletes the groups it controls, so the nested lineage tables
+    are deleted first to not leave stale tables behind.
+
+    Parameters
+    ----------
+    store : str | Path
+        Path to the GEFF file to delete. Nothing is done if there is no GEFF file.
+    zarr_format : Literal[2, 3]
+        The Zarr format version of the GEFF file.
+    """
+    if not check_for_geff(store, zarr_format=zarr_format):
+        return
+    root = zarr.open_group(store, mode="a", zarr_format=zarr_format)
+    for name in _LINEAGE_TABLES:
+        if name in root:
+            del root[name]
+    delete_geff(store, zarr_format=zarr_format)
+
+
 def export_GEFF(
     model: Model,
     geff_out: str | Path,
@@ -365,7 +1161,15 @@ def export_GEFF(
     channel_axes: list[str] | None = None,
     variable_length_props: list[str] | None = None,
     zarr_format: Literal[2, 3] = 2,
-) -> Model:
+    return_exported_model: bool = False,
+    chunk_size: int | None = None,
+    shard_size: int | None = None,
+    compressor: (
+        Literal["blosc-lz4", "blosc-zstd", "zstd", "gzip", "none"] | None
+    ) = None,
+    compression_level: int | None = None,
+    sort_by_time: bool = False,
+) -> Model | None:
     """
     Export a pycellin model to GEFF format.
 
@@ -401,66 +1205,166 @@ def export_GEFF(
         are lists or arrays). If None, no properties are considered variable length.
     zarr_format : Literal[2, 3], optional
         The Zarr format version to use for the GEFF file. Default is 2.
+    return_exported_model : bool, optional
+        If True, the model is deep copied and the copy is modified for GEFF
+        compatibility before being written, then returned. Otherwise, the changes
+        are applied on the fly while building the exported graph, without copying
+        the model. Default is False.
+    chunk_size : int | None, optional
+        Number of nodes or edges per chunk of the Zarr arrays. If None, geff
+        chunks the arrays in blocks of about 8 MiB.
+    shard_size : int | None, optional
+        Number of nodes or edges per shard of the Zarr arrays, rounded up
+        to a multiple of `chunk_size`. Only available with Zarr format 3.
+        If None, the arrays are not sharded, as with geff.
+    compressor : {"blosc-lz4", "blosc-zstd", "zstd", "gzip", "none"}, optional
+        Compressor of the Zarr arrays, "none" to disable compression.
+        If None, the zarr default compressor used by geff is kept: Blosc with LZ4
+        for Zarr format 2, Zstd for Zarr format 3.
+    compression_level : int | None, optional
+        Compression level of the compressor. If None, the codec default is used.
+        Cannot be set when `compressor` is "none".
+    sort_by_time : bool, optional
+        If True, the nodes are sorted by the first time axis and the edges
+        by the time of their source node, so that each chunk covers a contiguous
+        range of timepoints. Default is False.
 
     Returns
     -------
-    Model
-        The model that was exported, which is a copy of the input model with
-        any necessary modifications for GEFF compatibility. The original input model
-        is not modified.
+    Model | None
+        If `return_exported_model` is True, the model that was exported, which is
+        a copy of the input model with any necessary modifications for GEFF
+        compatibility. The original input model is not modified. None otherwise.
 
     Raises
     ------
     ValueError
-        If the model contains no lineage data.
+        If the model contains no lineage data, or if the encoding options
+        are invalid.
     RuntimeError
         If the GEFF export process fails.
+
+    Notes
+    -----
+    All the arrays are chunked along their first dimension only, i.e. by groups
+    of nodes or edges. Small chunks speed up the partial reads of an object store,
+    e.g. of a few timepoints when combined with `sort_by_time`, at the cost of
+    more files or requests and of a lower compression ratio. On Zarr format 3,
+    sharding packs several chunks in a single file. The compressor changes
+    the file size much more than the write or read times. When any encoding
+    option is set, the arrays are written directly with this encoding,
+    since geff hard-codes the encoding of the arrays it writes.
+
+    Benchmark on the E. coli sample (526 nodes with ROIs), with the best write
+    time and full read time out of 6 runs, the file size and the number of files:
+
+    ================================  =======  ======  =======  =====
+    Encoding                          Write    Read    Size     Files
+    ================================  =======  ======  =======  =====
+    Zarr 2, defaults (Blosc LZ4)      0.86 s   0.58 s  585 KiB  431
+    Zarr 2, Zstd level 9              1.02 s   0.53 s  470 KiB  431
+    Zarr 2, Gzip                      0.89 s   0.56 s  481 KiB  431
+    Zarr 2, no compression            0.90 s   0.56 s  725 KiB  431
+    Zarr 2, chunk_size=64             1.73 s   0.93 s  648 KiB  1749
+    Zarr 3, defaults (Zstd)           0.71 s   0.45 s  508 KiB  254
+    Zarr 3, chunk 64, shard 200       1.61 s   1.05 s  680 KiB  584
+    ================================  =======  ======  =======  =====
+
+    The lineage properties are written in a GEFF file nested in the main one,
+    "cell_lineages", with one node per lineage. When the model has cycle lineages,
+    they are written in two other nested GEFF files: "cell_cycles" for the cell
+    cycles and their links, and "cycle_lineages" for the cycle lineage properties.
+    `load_GEFF()` restores them without recomputation.
     """
     if not model.data.cell_data:
         raise ValueError("Model contains no lineage data to export.")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"`chunk_size` must be positive, got {chunk_size}.")
+    if shard_size is not None:
+        if zarr_format != 3:
+            raise ValueError("Sharding is only available with Zarr format 3.")
+        if shard_size < 1:
+            raise ValueError(f"`shard_size` must be positive, got {shard_size}.")
+    custom_encoding = (
+        chunk_size is not None
+        or shard_size is not None
+        or compressor is not None
+        or compression_level is not None
+    )
+    compressors = _get_compressors(compressor, compression_level, zarr_format)
 
     try:
-        # We don't want to modify the original model.
-        model_copy = copy.deepcopy(model)
+        if return_exported_model:
+            # We don't want to modify the original model.
+            exported_model = copy.deepcopy(model)
+        else:
+            # Only the metadata is copied and modified.
+            exported_model = _ExportView(model).model
 
         # For GEFF compatibility, we need to ensure that there are no property metadata
         # entries that don't correspond to any actual property in the data.
-        _remove_orphaned_metadata(model_copy)
+        _remove_orphaned_metadata(exported_model)
         # All the lineages must also be in the same graph. However, some nodes can
         # have the same identifier across different lineages.
-        lineages = list(model_copy.data.cell_data.values())
-        _solve_node_overlaps(lineages)
-        geff_graph = nx.compose_all(lineages)
+        if return_exported_model:
+            _solve_node_overlaps(list(exported_model.data.cell_data.values()))
+        node_ids, node_props, edge_ids, edge_props = _build_geff_arrays(
+            exported_model.data.cell_data, variable_length_props
+        )
 
         metadata = _build_geff_metadata(
-            model=model_copy,
+            model=exported_model,
             time_axes=time_axes,
             space_axes=space_axes,
             channel_axes=channel_axes,
             var_length_props=variable_length_props,
         )
 
-        geff.write(
-            geff_graph,
-            geff_out,
-            metadata=metadata,
-            zarr_format=zarr_format,
-            structure_validation=True,
-            overwrite=True,
-        )
+        if sort_by_time:
+            node_ids, node_props, edge_ids, edge_props = _sort_by_time(
+                node_ids, node_props, edge_ids, edge_props, metadata.axes[0].name
+            )
+        # The tables are built from the input model, whose nodes are relabeled
+        # in the same way as the ones of the exported model.
+        tables = _build_lineage_tables(model, variable_length_props)
+
+        _delete_geff(geff_out, zarr_format)
+        graph = (node_ids, node_props, edge_ids, edge_props, metadata)
+        stores = [(str(geff_out), graph)]
+        stores += [
+            (f"{str(geff_out).rstrip('/')}/{name}", table)
+            for name, table in tables.items()
+        ]
+        for store, arrays in stores:
+            if custom_encoding:
+                # geff hard-codes the encoding of the arrays it writes.
+                _write_encoded_arrays(
+                    store,
+                    *arrays,
+                    zarr_format=zarr_format,
+                    chunk_size=chunk_size,
+                    shard_size=shard_size,
+                    compressors=compressors,
+                )
+            else:
+                write_arrays(
+                    store,
+                    *arrays,
+                    zarr_format=zarr_format,
+                    structure_validation=True,
+                    overwrite=True,
+                )
 
     except Exception as e:
         raise RuntimeError(f"Failed to export GEFF file to '{geff_out}': {e}.") from e
 
-    return model_copy
+    return exported_model if return_exported_model else None
 
 
 if __name__ == "__main__":
     """
     Quick demo with sample data.
     """
-    import tempfile
-
     from pycellin.io.trackmate.loader import load_TrackMate_XML
 
     xml_in = (
@@ -14,29 +14,36 @@ References:
 import importlib.metadata
 import logging
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import geff
 import geff_spec
 import networkx as nx
-
-from pycellin.classes import CellLineage, Data, Model, Property, PropsMetadata
+import numpy as np
+import zarr
+from geff._typing import InMemoryGeff, PropDictNpArray
+from geff.core_io import read_to_memory
+from scipy.sparse import csr_array
+from scipy.sparse.csgraph import connected_components
+
+from pycellin.classes import (
+    CellLineage,
+    CycleLineage,
+    Data,
+    Model,
+    Property,
+    PropsMetadata,
+)
+from pycellin.classes.lineage import Lineage
 from pycellin.custom_types import PropertyType, property_type_to_strings
 from pycellin.graph.properties.core import (
     create_cell_coord_property,
     create_cell_id_property,
     create_lineage_id_property,
 )
-from pycellin.io.utils import (
-    _graph_has_node_prop,
-    _split_graph_into_lineages,
-    _update_edge_prop_key,
-    _update_lineage_prop_key,
-    _update_lineages_IDs_key,
-    _update_node_prop_key,
-    check_fusions,
-)
+from pycellin.io.utils import check_fusions
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +81,7 @@ def _recursive_dict_search(
 def _identify_lin_id_prop(
     lin_id_key: str | None,
     geff_track_node_props: dict[Literal["lineage", "tracklet"], str] | None,
-    geff_graph: nx.DiGraph,
+    node_props: dict[str, PropDictNpArray],
 ) -> str | None:
     """
     Identify the lineage ID key from user input or GEFF metadata.
@@ -90,8 +97,8 @@ def _identify_lin_id_prop(
         Name of the property to identify lineages.
     geff_track_node_props : dict[Literal["lineage", "tracklet"], str] | None
         The track_node_props from GEFF metadata.
-    geff_graph : nx.DiGraph
-        The GEFF graph.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays of the GEFF graph.
 
     Returns
     -------
@@ -108,7 +115,7 @@ def _identify_lin_id_prop(
 
     valid_lin_id_key: str | None = None
     if lin_id_key is not None:
-        if _graph_has_node_prop(geff_graph, lin_id_key):
+        if _has_node_prop(node_props, lin_id_key):
             valid_lin_id_key = lin_id_key
         else:
             logger.info(
@@ -127,7 +134,7 @@ def _identify_lin_id_prop(
                 stacklevel=error_stack_level,
             )
         else:
-            if _graph_has_node_prop(geff_graph, "lineage_ID"):
+            if _has_node_prop(node_props, "lineage_ID"):
                 valid_lin_id_key = "lineage_ID"
                 logger.info(
                     "Lineage identifier inferred from existing graph property: "
@@ -148,7 +155,7 @@ def _identify_lin_id_prop(
 def _identify_time_prop(
     time_key: str | None,
     geff_md: geff.GeffMetadata | None,
-    geff_graph: nx.DiGraph,
+    node_props: dict[str, PropDictNpArray],
 ) -> str:
     """
     Identify the time property from argument or GEFF metadata.
@@ -166,8 +173,8 @@ def _identify_time_prop(
         The key provided to identify time points.
     geff_md : geff.GeffMetadata | None
         The GEFF metadata.
-    geff_graph : nx.DiGraph
-        The GEFF graph.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays of the GEFF graph.
 
     Returns
     -------
@@ -190,7 +197,7 @@ def _identify_time_prop(
         If a valid time property is inferred from axes.
     """
     if time_key is not None:
-        if not _graph_has_node_prop(geff_graph, time_key):
+        if not _has_node_prop(node_props, time_key):
             logger.info(
                 f"The provided property '{time_key}' is not present in the graph. "
                 "It will be inferred from GEFF metadata, if possible.",
@@ -203,7 +210,7 @@ def _identify_time_prop(
     if time_key is None and hints is not None:
         time_key = getattr(hints, "display_time", None)
         if time_key is not None:
-            if _graph_has_node_prop(geff_graph, time_key):
+            if _has_node_prop(node_props, time_key):
                 logger.info(
                     f"Valid time property inferred from display hints: '{time_key}'.",
                     stacklevel=3,
@@ -216,7 +223,7 @@ def _identify_time_prop(
     if time_key is None and axes is not None:
         time_axes = [axis for axis in axes if axis.type == "time"]
         for axis in time_axes:
-            if axis.name is not None and _graph_has_node_prop(geff_graph, axis.name):
+            if axis.name is not None and _has_node_prop(node_props, axis.name):
                 time_key = axis.name
                 logger.info(
                     f"Valid time property inferred from axes: '{time_key}'.",
@@ -238,7 +245,7 @@ def _identify_space_props(
     cell_y_key: str | None,
     cell_z_key: str | None,
     geff_md: geff.GeffMetadata | None,
-    geff_graph: nx.DiGraph,
+    node_props: dict[str, PropDictNpArray],
 ) -> tuple[str | None, str | None, str | None]:
     """
     Identify the space properties (x, y, z) from arguments or GEFF metadata.
@@ -257,8 +264,8 @@ def _identify_space_props(
         The key provided by the user to identify the z-coordinate.
     geff_md : geff.GeffMetadata | None
         The metadata from GEFF file.
-    geff_graph : nx.DiGraph
-        The geff graph.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays of the GEFF graph.
 
     Returns
     -------
@@ -273,7 +280,7 @@ def _identify_space_props(
     space_keys = [cell_x_key, cell_y_key, cell_z_key]
     for i, key in enumerate(space_keys):
         if key is not None:
-            if not _graph_has_node_prop(geff_graph, key):
+            if not _has_node_prop(node_props, key):
                 logger.info(
                     f"The provided property '{key}' is not present in the graph. "
                     "It will be inferred from GEFF metadata, if possible.",
@@ -288,7 +295,7 @@ def _identify_space_props(
         if key is None and hints is not None:
             space_key = getattr(hints, hint_field, None)
             if space_key is not None:
-                if _graph_has_node_prop(geff_graph, space_key):
+                if _has_node_prop(node_props, space_key):
                     logger.info(
                         f"Valid space property inferred from display hints: '{space_key}'.",
                         stacklevel=3,
@@ -304,8 +311,8 @@ def _identify_space_props(
         for i, key in enumerate(space_keys):
             if key is None:
                 for axis in space_axes:
-                    if axis.name is not None and _graph_has_node_prop(
-                        geff_graph, axis.name
+                    if axis.name is not None and _has_node_prop(
+                        node_props, axis.name
                     ):
                         space_keys[i] = axis.name
                         logger.info(
@@ -593,10 +600,10 @@ def _build_props_metadata(
             geff_md.edge_props_metadata, props_dict, PropertyType.EDGE, rename_map
         )
 
-    # TODO: for now lineage properties are not associated to a specific tag but stored
-    # somewhere in the "extra" field. We need to check recursively if there is a dict
-    # key called "lineage_props_metadata" in the "extra" field.
-    # For now I keep this, but it should be replaced by geffception at some point.
+    # pycellin stores lineage properties in a nested GEFF file, read in load_GEFF(),
+    # but other tools may declare them somewhere in the "extra" field. We need
+    # to check recursively if there is a dict key called "lineage_props_metadata"
+    # in the "extra" field.
     if geff_md.extra:
         # Recursive search for the "lineage_props_metadata" key through the "extra"
         # field dict of dicts of dicts...
@@ -834,14 +841,41 @@ def _build_generic_metadata(
     return metadata
 
 
-def _fallback_to_node_keys(geff_graph: nx.DiGraph, reason: str) -> None:
+def _has_node_prop(node_props: dict[str, PropDictNpArray], key: str) -> bool:
+    """
+    Check if a node property is present on all nodes of the GEFF graph.
+
+    Parameters
+    ----------
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays of the GEFF graph.
+    key : str
+        The name of the property to look for.
+
+    Returns
+    -------
+    bool
+        True if the property exists and is not missing on any node, False otherwise.
+    """
+    prop = node_props.get(key)
+    if prop is None:
+        return False
+    return prop["missing"] is None or not prop["missing"].any()
+
+
+def _fallback_to_node_keys(
+    node_ids: np.ndarray, node_props: dict[str, PropDictNpArray], reason: str
+) -> None:
     """
     Fallback to using graph node keys as cell IDs, with a warning.
 
     Parameters
     ----------
-    geff_graph : nx.DiGraph
-        The GEFF graph to update with fallback cell IDs.
+    node_ids : np.ndarray
+        The node IDs of the GEFF graph.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays of the GEFF graph, updated with a 'cell_ID'
+        property holding the node IDs.
     reason : str
         The reason for falling back to node keys, included in the warning message.
 
@@ -851,87 +885,263 @@ def _fallback_to_node_keys(geff_graph: nx.DiGraph, reason: str) -> None:
         Indicates that the fallback to node keys is occurring and the reason for it.
     """
     logger.warning(reason, stacklevel=3)
-    for node in geff_graph.nodes:
-        geff_graph.nodes[node]["cell_ID"] = node
+    node_props["cell_ID"] = {"values": node_ids, "missing": None}
 
 
-def _ensure_valid_cell_ID(geff_graph: nx.DiGraph, cell_id_key: str | None) -> str:
+def _ensure_valid_cell_ID(
+    node_ids: np.ndarray,
+    node_props: dict[str, PropDictNpArray],
+    cell_id_key: str | None,
+) -> tuple[str, np.ndarray]:
     """
-    Ensure that a valid cell ID property exists and is consistent with graph node IDs.
+    Ensure that a valid cell ID property exists and return the cell IDs.
 
     If ``cell_id_key`` is None, the function creates a ``cell_ID`` property from
-    the NetworkX node keys. If ``cell_id_key`` is provided, it verifies uniqueness of
+    the GEFF node IDs. If ``cell_id_key`` is provided, it verifies uniqueness of
     the property, that it exists on all nodes and is a positive integer. If not,
-    it falls back to creating a ``cell_ID`` property from node keys. If the provided
-    property is valid but its values differ from node keys, the graph node keys are
-    updated to match the provided IDs to avoid later inconsistencies.
+    it falls back to creating a ``cell_ID`` property from node IDs. If the provided
+    property is valid, its values are used as node keys of the lineages instead
+    of the GEFF node IDs, to avoid later inconsistencies.
 
     Parameters
     ----------
-    geff_graph : nx.DiGraph
-        The GEFF graph to validate or update.
+    node_ids : np.ndarray
+        The node IDs of the GEFF graph.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays of the GEFF graph.
     cell_id_key : str | None
         Name of the node property that identifies cells, or None to derive IDs
-        from the graph node keys.
+        from the GEFF node IDs.
 
     Returns
     -------
-    str
-        The name of the property used as cell identifier after validation or fallback.
+    tuple[str, np.ndarray]
+        The name of the property used as cell identifier after validation
+        or fallback, and the ID of each cell.
 
     Warns
     -----
     UserWarning
         If ``cell_id_key`` is provided but missing on some nodes, triggering a
-        fallback to generated ``cell_ID`` values from node keys.
+        fallback to generated ``cell_ID`` values from node IDs.
         If ``cell_id_key`` is provided but contains duplicate values across
-        nodes, triggering a fallback to generated ``cell_ID`` values from node keys.
+        nodes, triggering a fallback to generated ``cell_ID`` values from node IDs.
     """
     if cell_id_key is None:
         _fallback_to_node_keys(
-            geff_graph,
+            node_ids,
+            node_props,
             "No cell identifier property provided. "
             "A 'cell_ID' property will be created from node keys instead.",
         )
-        return "cell_ID"
+        return "cell_ID", node_ids
 
-    if not _graph_has_node_prop(geff_graph, cell_id_key):
+    if not _has_node_prop(node_props, cell_id_key):
         _fallback_to_node_keys(
-            geff_graph,
+            node_ids,
+            node_props,
             f"The provided property '{cell_id_key}' is not present on all nodes of "
             "the GEFF graph. A 'cell_ID' property will be created from node keys instead.",
         )
-        return "cell_ID"
+        return "cell_ID", node_ids
 
-    cell_ids = [geff_graph.nodes[node][cell_id_key] for node in geff_graph.nodes]
-    if not all(
-        isinstance(cell_id, int) and not isinstance(cell_id, bool) and cell_id >= 0
-        for cell_id in cell_ids
+    cell_ids = node_props[cell_id_key]["values"]
+    if (
+        cell_ids.ndim != 1
+        or not np.issubdtype(cell_ids.dtype, np.integer)
+        or (len(cell_ids) > 0 and cell_ids.min() < 0)
     ):
         _fallback_to_node_keys(
-            geff_graph,
+            node_ids,
+            node_props,
             f"Values in property '{cell_id_key}' are not all positive integers. "
             "This property cannot be used as cell identifier. "
             "A 'cell_ID' property will be created from node keys instead.",
         )
-        return "cell_ID"
+        return "cell_ID", node_ids
 
-    if len(set(cell_ids)) != len(cell_ids):
+    if len(np.unique(cell_ids)) != len(cell_ids):
         _fallback_to_node_keys(
-            geff_graph,
+            node_ids,
+            node_props,
             f"Duplicate values found in property '{cell_id_key}' across graph nodes. "
             "This property cannot be used as cell identifier. "
             "A 'cell_ID' property will be created from node keys instead.",
         )
-        return "cell_ID"
+        return "cell_ID", node_ids
+
+    return cell_id_key, cell_ids
+
+
+def _get_node_rows(node_ids: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """
+    Convert node IDs to rows in the node arrays.
+
+    Parameters
+    ----------
+    node_ids : np.ndarray
+        The node IDs of the GEFF graph.
+    ids : np.ndarray
+        The node IDs to convert, of any shape.
+
+    Returns
+    -------
+    np.ndarray
+        The rows of the nodes, with the same shape as `ids`.
+
+    Raises
+    ------
+    ValueError
+        If some IDs are not node IDs of the GEFF graph.
+    """
+    ids = np.asarray(ids)
+    if ids.size == 0:
+        return np.zeros(ids.shape, dtype=np.intp)
+    msg = "Some IDs do not match any node of the GEFF graph."
+    if len(node_ids) == 0:
+        raise ValueError(msg)
+    sorter = np.argsort(node_ids)
+    positions = np.searchsorted(node_ids, ids.reshape(-1), sorter=sorter)
+    rows = sorter[np.minimum(positions, len(node_ids) - 1)]
+    if np.any(node_ids[rows] != ids.reshape(-1)):
+        raise ValueError(msg)
+    return rows.reshape(ids.shape)
+
+
+def _get_edge_rows(node_ids: np.ndarray, edge_ids: np.ndarray) -> np.ndarray:
+    """
+    Convert the edges from pairs of node IDs to pairs of rows in the node arrays.
+
+    Parameters
+    ----------
+    node_ids : np.ndarray
+        The node IDs of the GEFF graph.
+    edge_ids : np.ndarray
+        The edges of the GEFF graph, as (source, target) pairs of node IDs.
+
+    Returns
+    -------
+    np.ndarray
+        The edges as (source, target) pairs of rows, of shape (number of edges, 2).
+    """
+    return _get_node_rows(node_ids, edge_ids).reshape(-1, 2)
+
+
+def _get_lineage_labels(nb_nodes: int, edge_rows: np.ndarray) -> np.ndarray:
+    """
+    Label each node with the index of its lineage, i.e. of its connected component.
+
+    Lineages are numbered by order of their first node in the node arrays.
 
-    mapping = {node: geff_graph.nodes[node][cell_id_key] for node in geff_graph.nodes}
-    nx.relabel_nodes(geff_graph, mapping, copy=False)
-    return cell_id_key
+    Parameters
+    ----------
+    nb_nodes : int
+        Number of nodes of the GEFF graph.
+    edge_rows : np.ndarray
+        The edges as (source, target) pairs of rows in the node arrays.
+
+    Returns
+    -------
+    np.ndarray
+        The lineage index of each node.
+    """
+    adjacency = csr_array(
+        (np.ones(len(edge_rows), dtype=bool), (edge_rows[:, 0], edge_rows[:, 1])),
+        shape=(nb_nodes, nb_nodes),
+    )
+    _, labels = connected_components(adjacency, directed=True, connection="weak")
+    return labels
+
+
+def _get_lineage_IDs(
+    labels: np.ndarray,
+    cell_ids: np.ndarray,
+    node_props: dict[str, PropDictNpArray],
+    lin_id_key: str | None,
+) -> np.ndarray:
+    """
+    Ensure consistent lineage ID assignment and return the ID of each lineage.
+
+    If ``lin_id_key`` is None, one-node lineages are identified by minus
+    the ID of their cell, and the other lineages are numbered from 0.
+    Otherwise, the lineage ID of the nodes of a lineage must be unique.
+    One-node lineages without lineage ID get minus the ID of their cell,
+    and the other lineages without lineage ID on any node get the next
+    available IDs.
+    In both cases, the lineage ID property is set on all nodes.
+
+    Parameters
+    ----------
+    labels : np.ndarray
+        The lineage index of each node.
+    cell_ids : np.ndarray
+        The ID of each cell.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays of the GEFF graph, updated with the lineage ID
+        of all nodes.
+    lin_id_key : str | None
+        Name of the node property that identifies lineages, or None to generate
+        new lineage IDs under the 'lineage_ID' key.
+
+    Returns
+    -------
+    np.ndarray
+        The ID of each lineage.
+
+    Raises
+    ------
+    ValueError
+        If the nodes of a same lineage have distinct lineage IDs.
+    """
+    nb_lineages = labels.max() + 1 if len(labels) > 0 else 0
+    if lin_id_key is None:
+        lin_id_key = "lineage_ID"
+        sizes = np.bincount(labels, minlength=nb_lineages)
+        lin_ids = np.empty(nb_lineages, dtype=np.int64)
+        # One-node lineages are identified by minus their node ID.
+        is_single = sizes == 1
+        lin_ids[~is_single] = np.arange(np.count_nonzero(~is_single))
+        single_rows = np.flatnonzero(is_single[labels])
+        lin_ids[labels[single_rows]] = -cell_ids[single_rows].astype(np.int64)
+    else:
+        prop = node_props[lin_id_key]
+        values = prop["values"]
+        present = np.ones(len(values), dtype=bool)
+        if prop["missing"] is not None:
+            present &= ~prop["missing"]
+        # Distinct (lineage, lineage ID) pairs.
+        unique_values, codes = np.unique(values[present], return_inverse=True)
+        pairs = np.unique(np.stack((labels[present], codes.reshape(-1))), axis=1)
+        if len(np.unique(pairs[0])) != pairs.shape[1]:
+            raise ValueError(
+                "Impossible state: inconsistent lineage ID values between "
+                "the nodes of a same lineage."
+            )
+        lin_ids = np.empty(nb_lineages, dtype=values.dtype)
+        lin_ids[pairs[0]] = unique_values[pairs[1]]
+        has_lin_id = np.zeros(nb_lineages, dtype=bool)
+        has_lin_id[pairs[0]] = True
+        if not has_lin_id.all():
+            next_id = 0
+            if np.issubdtype(values.dtype, np.number) and len(unique_values) > 0:
+                next_id = int(unique_values.max()) + 1
+            # One-node lineages without ID are identified by minus their node ID,
+            # the other lineages without ID get the next available IDs.
+            sizes = np.bincount(labels, minlength=nb_lineages)
+            is_single = ~has_lin_id & (sizes == 1)
+            is_new = ~has_lin_id & ~is_single
+            lin_ids[is_new] = np.arange(next_id, next_id + np.count_nonzero(is_new))
+            if is_single.any() and lin_ids.dtype.kind == "u":
+                lin_ids = lin_ids.astype(np.int64)
+            single_rows = np.flatnonzero(is_single[labels])
+            lin_ids[labels[single_rows]] = -cell_ids[single_rows].astype(np.int64)
+    node_props[lin_id_key] = {"values": lin_ids[labels], "missing": None}
+    return lin_ids
 
 
 def _standardize_properties_data(
-    lineages: list[CellLineage],
+    node_props: dict[str, PropDictNpArray],
+    edge_props: dict[str, PropDictNpArray],
     lin_id_key: str,
     cell_id_key: str,
     cell_x_key: str | None,
@@ -940,21 +1150,22 @@ def _standardize_properties_data(
     rename_map: dict[PropertyType, dict[str, str]],
 ) -> None:
     """
-    Standardize properties data in lineages to match pycellin conventions.
+    Standardize properties data to match pycellin conventions.
 
-    This function updates the property keys in lineage node data to use
-    standardized pycellin naming conventions (e.g., 'cell_ID', 'cell_x').
-    It also applies any key renames recorded in *rename_map* during metadata
-    extraction so that the graph data stays consistent with the metadata.
+    This function renames the node and edge property arrays to use standardized
+    pycellin naming conventions (e.g., 'cell_ID', 'cell_x'). It also applies
+    any key renames recorded in *rename_map* during metadata extraction so that
+    the data stays consistent with the metadata. Arrays are renamed in place,
+    so the order of the properties is preserved.
 
     Parameters
     ----------
-    lineages : list[CellLineage]
-        List of CellLineage objects to standardize.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays to standardize.
+    edge_props : dict[str, PropDictNpArray]
+        The edge property arrays to standardize.
     lin_id_key : str
-        The current lineage ID key name. If not "lineage_ID", this property will be
-        renamed in two places: (1) as a node attribute on all nodes within each
-        lineage, and (2) as a graph attribute for each lineage object.
+        The current lineage ID key name.
     cell_id_key : str
         The current cell ID key name.
     cell_x_key : str | None
@@ -966,32 +1177,376 @@ def _standardize_properties_data(
     rename_map : dict[PropertyType, dict[str, str]]
         Accumulator of ``{old_key: new_key}`` renames per property type
         (NODE, EDGE, LINEAGE) collected during metadata extraction.
-        Applied to each lineage's node attributes, edge attributes, and
-        graph-level attributes respectively.
+        Node and edge renames are applied to the node and edge property arrays.
     """
-    for lin in lineages:
-        # Collision renames as recorded during metadata extraction.
-        for old_key, new_key in rename_map[PropertyType.NODE].items():
-            _update_node_prop_key(lin, old_key=old_key, new_key=new_key)
-        for old_key, new_key in rename_map[PropertyType.EDGE].items():
-            _update_edge_prop_key(lin, old_key=old_key, new_key=new_key)
-        for old_key, new_key in rename_map[PropertyType.LINEAGE].items():
-            _update_lineage_prop_key(lin, old_key=old_key, new_key=new_key)
-
-        # Standard pycellin property renames.
-        if lin_id_key != "lineage_ID":
-            _update_node_prop_key(lin, old_key=lin_id_key, new_key="lineage_ID")
-        if cell_id_key != "cell_ID":
-            _update_node_prop_key(lin, old_key=cell_id_key, new_key="cell_ID")
-        if cell_x_key is not None and cell_x_key != "cell_x":
-            _update_node_prop_key(lin, old_key=cell_x_key, new_key="cell_x")
-        if cell_y_key is not None and cell_y_key != "cell_y":
-            _update_node_prop_key(lin, old_key=cell_y_key, new_key="cell_y")
-        if cell_z_key is not None and cell_z_key != "cell_z":
-            _update_node_prop_key(lin, old_key=cell_z_key, new_key="cell_z")
+    # Collision renames as recorded during metadata extraction.
+    node_renames = dict(rename_map[PropertyType.NODE])
+    edge_renames = dict(rename_map[PropertyType.EDGE])
+
+    # Standard pycellin property renames.
+    for old_key, new_key in [
+        (lin_id_key, "lineage_ID"),
+        (cell_id_key, "cell_ID"),
+        (cell_x_key, "cell_x"),
+        (cell_y_key, "cell_y"),
+        (cell_z_key, "cell_z"),
+    ]:
+        if old_key is not None and old_key != new_key:
+            node_renames[old_key] = new_key
+
+    for props, renames in [(node_props, node_renames), (edge_props, edge_renames)]:
+        if not any(key in props for key in renames):
+            continue
+        renamed: dict[str, PropDictNpArray] = {}
+        for key, prop in props.items():
+            # A renamed property replaces any existing property with the same key.
+            new_key = renames.get(key, key)
+            if key in renames or new_key not in renamed:
+                renamed[new_key] = prop
+        props.clear()
+        props.update(renamed)
+
+
+def _get_attrs(props: dict[str, PropDictNpArray], nb_elements: int) -> list[dict]:
+    """
+    Convert property arrays into the attributes dictionary of each node or edge.
 
-    if lin_id_key != "lineage_ID":
-        _update_lineages_IDs_key(lineages, lin_id_key)
+    Values are converted to Python objects, except for variable length
+    properties which are kept as numpy arrays. Missing values are omitted.
+
+    Parameters
+    ----------
+    props : dict[str, PropDictNpArray]
+        The node or edge property arrays.
+    nb_elements : int
+        Number of nodes or edges.
+
+    Returns
+    -------
+    list[dict]
+        The attributes of each node or edge.
+    """
+    attrs: list[dict] = [{} for _ in range(nb_elements)]
+    for key, prop in props.items():
+        values = prop["values"]
+        values = list(values) if values.dtype == object else values.tolist()
+        if prop["missing"] is None:
+            for element_attrs, value in zip(attrs, values):
+                element_attrs[key] = value
+        else:
+            missing = prop["missing"].tolist()
+            for element_attrs, value, is_missing in zip(attrs, values, missing):
+                if not is_missing:
+                    element_attrs[key] = value
+    return attrs
+
+
+def _build_lineages(
+    cell_ids: np.ndarray,
+    node_props: dict[str, PropDictNpArray],
+    edge_rows: np.ndarray,
+    edge_props: dict[str, PropDictNpArray],
+    labels: np.ndarray,
+    lin_ids: np.ndarray,
+    new_lineage: Callable[[], Lineage] = CellLineage,
+) -> list[Lineage]:
+    """
+    Build the lineages from the node and edge arrays, in a single pass.
+
+    Parameters
+    ----------
+    cell_ids : np.ndarray
+        The ID of each node, used as node key in the lineages.
+    node_props : dict[str, PropDictNpArray]
+        The node property arrays.
+    edge_rows : np.ndarray
+        The edges as (source, target) pairs of rows in the node arrays.
+    edge_props : dict[str, PropDictNpArray]
+        The edge property arrays.
+    labels : np.ndarray
+        The lineage index of each node.
+    lin_ids : np.ndarray
+        The ID of each lineage.
+    new_lineage : Callable[[], Lineage], optional
+        Function creating an empty lineage, CellLineage by default.
+
+    Returns
+    -------
+    list[Lineage]
+        The lineages, in the order of their first node.
+    """
+    if len(lin_ids) == 0:
+        return [CellLineage(lid=0)]
+
+    node_keys = cell_ids.tolist()
+    node_attrs = _get_attrs(node_props, len(cell_ids))
+    edge_attrs = _get_attrs(edge_props, len(edge_rows))
+    node_order = np.argsort(labels, kind="stable")
+    node_bounds = np.searchsorted(labels[node_order], np.arange(len(lin_ids) + 1))
+    edge_labels = labels[edge_rows[:, 0]]
+    edge_order = np.argsort(edge_labels, kind="stable")
+    edge_bounds = np.searchsorted(edge_labels[edge_order], np.arange(len(lin_ids) + 1))
+
+    edge_keys = cell_ids[edge_rows].tolist()
+
+    lineages = []
+    for i, lin_id in enumerate(lin_ids.tolist()):
+        lin = new_lineage()
+        lin.graph["lineage_ID"] = lin_id
+        rows = node_order[node_bounds[i] : node_bounds[i + 1]].tolist()
+        lin.add_nodes_from((node_keys[row], node_attrs[row]) for row in rows)
+        edges = edge_order[edge_bounds[i] : edge_bounds[i + 1]].tolist()
+        lin.add_edges_from((*edge_keys[edge], edge_attrs[edge]) for edge in edges)
+        lineages.append(lin)
+    return lineages
+
+
+def _read_lineage_tables(
+    geff_file: Path | str, structure_validation: bool
+) -> dict[str, InMemoryGeff]:
+    """
+    Read the lineage tables nested in a GEFF file, if any.
+
+    Lineage tables are written by pycellin: "cell_lineages" and "cycle_lineages"
+    store the properties of the cell and cycle lineages, "cell_cycles"
+    stores the cell cycles and their links.
+
+    Parameters
+    ----------
+    geff_file : Path | str
+        Path to the GEFF file.
+    structure_validation : bool
+        Whether to validate the structure of the tables.
+
+    Returns
+    -------
+    dict[str, InMemoryGeff]
+        The content of each table found in the GEFF file, by table name.
+    """
+    root = zarr.open_group(geff_file, mode="r")
+    return {
+        name: read_to_memory(
+            f"{str(geff_file).rstrip('/')}/{name}",
+            structure_validation=structure_validation,
+        )
+        for name in ("cell_lineages", "cycle_lineages", "cell_cycles")
+        if name in root
+    }
+
+
+def _extract_cycle_props_metadata(
+    md: dict[str, geff_spec.PropMetadata],
+    props_dict: dict[str, Property],
+    prop_type: PropertyType,
+) -> None:
+    """
+    Extract cycle lineage properties metadata and update the props_dict.
+
+    Properties already defined for cycle lineages are left unchanged.
+    Properties already defined for cell lineages with the same type,
+    like the lineage ID, become properties of both lineage types.
+
+    Parameters
+    ----------
+    md : dict[str, geff_spec.PropMetadata]
+        The dictionary containing properties metadata.
+    props_dict : dict[str, Property]
+        The dictionary to update with extracted properties metadata.
+    prop_type : PropertyType
+        The type of property being extracted.
+
+    Raises
+    ------
+    KeyError
+        If a property identifier already exists in props_dict
+        for another property type.
+    """
+    for key, prop in md.items():
+        existing_prop = props_dict.get(key)
+        if existing_prop is None:
+            props_dict[key] = Property(
+                identifier=key,
+                name=prop.name or key,
+                description=prop.description or prop.name or key,
+                provenance="geff",
+                prop_type=prop_type,
+                lin_type="CycleLineage",
+                dtype=prop.dtype,
+                unit=prop.unit or None,
+            )
+        elif prop_type in existing_prop.prop_type:
+            if existing_prop.lin_type == "CellLineage":
+                existing_prop.lin_type = "Lineage"
+        else:
+            raise KeyError(
+                f"Cannot register cycle lineage property '{key}' "
+                f"({property_type_to_strings(prop_type)}): an identical identifier "
+                "already exists in properties dictionary for another property type."
+            )
+
+
+def _set_lineage_props(
+    lineages: dict[int, Lineage],
+    lin_ids: np.ndarray,
+    props: dict[str, PropDictNpArray],
+) -> None:
+    """
+    Set the lineage properties read from a lineage table on the lineages.
+
+    Parameters
+    ----------
+    lineages : dict[int, Lineage]
+        The lineages, by lineage ID.
+    lin_ids : np.ndarray
+        The ID of the lineage of each row of the table.
+    props : dict[str, PropDictNpArray]
+        The lineage property arrays of the table.
+    """
+    for lin_id, attrs in zip(lin_ids.tolist(), _get_attrs(props, len(lin_ids))):
+        lineages[lin_id].graph.update(attrs)
+
+
+def _build_cycle_lineages(
+    node_ids: np.ndarray,
+    cell_ids: np.ndarray,
+    labels: np.ndarray,
+    lin_ids: np.ndarray,
+    cycle_table: InMemoryGeff,
+    time_prop: str,
+    time_step: float | None,
+) -> list[CycleLineage]:
+    """
+    Build the cycle lineages from the cell cycles table of a GEFF file.
+
+    Cell cycles and their cells are identified by GEFF node IDs in the table,
+    which are converted into the IDs of the cells in the cell lineages.
+    Cycle lineages are restored as is, without recomputation.
+
+    Parameters
+    ----------
+    node_ids : np.ndarray
+        The node IDs of the GEFF graph.
+    cell_ids : np.ndarray
+        The ID of each cell.
+    labels : np.ndarray
+        The lineage index of each cell.
+    lin_ids : np.ndarray
+        The ID of each lineage.
+    cycle_table : InMemoryGeff
+        The content of the cell cycles table.
+    time_prop : str
+        The name of the time property of the model.
+    time_step : float | None
+        The time step of the model.
+
+    Returns
+    -------
+    list[CycleLineage]
+        The cycle lineages, in the order of the cell lineages.
+    """
+    cycle_rows = _get_node_rows(node_ids, cycle_table["node_ids"])
+    if len(cycle_rows) == 0:
+        return []
+    cycle_ids = cell_ids[cycle_rows]
+
+    node_props = dict(cycle_table["node_props"])
+    cells = node_props["cells"]["values"]
+    cells_ids = cell_ids[_get_node_rows(node_ids, np.concatenate(cells))]
+    cells_lists = np.empty(len(cells), dtype=object)
+    bounds = np.cumsum([len(cycle_cells) for cycle_cells in cells])
+    for i, cycle_cells in enumerate(np.split(cells_ids, bounds[:-1])):
+        cells_lists[i] = cycle_cells.tolist()
+    node_props["cells"] = {"values": cells_lists, "missing": None}
+    node_props["cycle_ID"] = {"values": cycle_ids, "missing": None}
+
+    # Lineages without any cell cycle have no cycle lineage.
+    cycle_lin_indices, cycle_labels = np.unique(
+        labels[cycle_rows], return_inverse=True
+    )
+    cycle_lineages = _build_lineages(
+        cycle_ids,
+        node_props,
+        _get_edge_rows(cycle_table["node_ids"], cycle_table["edge_ids"]),
+        dict(cycle_table["edge_props"]),
+        cycle_labels,
+        lin_ids[cycle_lin_indices],
+        new_lineage=partial(CycleLineage, time_prop, time_step),
+    )
+    # As when computed, the structure is mapped on the cell lineages one.
+    for cycle_lin in cycle_lineages:
+        nx.freeze(cycle_lin)
+    return cycle_lineages  # type: ignore[return-value]
+
+
+def _add_cycle_data(
+    model: Model,
+    tables: dict[str, InMemoryGeff],
+    node_ids: np.ndarray,
+    cell_ids: np.ndarray,
+    labels: np.ndarray,
+    lin_ids: np.ndarray,
+) -> None:
+    """
+    Add the cycle lineages and their properties read from the lineage tables.
+
+    Parameters
+    ----------
+    model : Model
+        The model to add the cycle lineages to.
+    tables : dict[str, InMemoryGeff]
+        The lineage tables of the GEFF file, with a "cell_cycles" table.
+    node_ids : np.ndarray
+        The node IDs of the GEFF graph.
+    cell_ids : np.ndarray
+        The ID of each cell.
+    labels : np.ndarray
+        The lineage index of each cell.
+    lin_ids : np.ndarray
+        The ID of each lineage.
+    """
+    model_md = model.model_metadata
+    props = model.props_metadata.props
+    model.props_metadata._add_cycle_lineage_props(model_md.time_unit)
+    cycle_table = tables["cell_cycles"]
+    _extract_cycle_props_metadata(
+        cycle_table["metadata"].node_props_metadata, props, PropertyType.NODE
+    )
+    _extract_cycle_props_metadata(
+        cycle_table["metadata"].edge_props_metadata, props, PropertyType.EDGE
+    )
+    cycle_lineages = _build_cycle_lineages(
+        node_ids,
+        cell_ids,
+        labels,
+        lin_ids,
+        cycle_table,
+        model_md.reference_time_property,
+        model_md.time_step,
+    )
+    model.data.cycle_data = {lin.graph["lineage_ID"]: lin for lin in cycle_lineages}
+
+    if "cycle_lineages" in tables:
+        lin_table = tables["cycle_lineages"]
+        lin_props = {
+            key: prop
+            for key, prop in lin_table["node_props"].items()
+            if key != "lineage_ID"
+        }
+        _extract_cycle_props_metadata(
+            {
+                key: md
+                for key, md in lin_table["metadata"].node_props_metadata.items()
+                if key in lin_props
+            },
+            props,
+            PropertyType.LINEAGE,
+        )
+        rows = _get_node_rows(node_ids, lin_table["node_ids"])
+        _set_lineage_props(
+            model.data.cycle_data,  # type: ignore[arg-type]
+            lin_ids[labels[rows]],
+            lin_props,
+        )
 
 
 def _standardize_props_metadata(
@@ -1113,26 +1668,32 @@ def load_GEFF(
     -------
     Model
         A pycellin model containing the data and metadata from the GEFF file.
+        The lineage properties and the cycle lineages saved by `export_GEFF()`
+        are restored as they were, without recomputation.
 
     Raises
     ------
     ValueError
         If the GEFF graph is undirected, as pycellin does not support undirected graphs.
     """
-    # Read the GEFF file.
-    geff_graph, geff_md = geff.read(geff_file, structure_validation=structure_validation)
+    # Read the node and edge arrays of the GEFF file.
+    geff_data = read_to_memory(geff_file, structure_validation=structure_validation)
+    geff_md = geff_data["metadata"]
     if not geff_md.directed:
         raise ValueError(
             "The GEFF graph is undirected: pycellin does not support undirected graphs."
         )
+    node_ids = geff_data["node_ids"]
+    node_props = dict(geff_data["node_props"])
+    edge_props = dict(geff_data["edge_props"])
 
     # Identify specific properties.
     lineage_id_prop = _identify_lin_id_prop(
-        lineage_id_prop, geff_md.track_node_props, geff_graph
+        lineage_id_prop, geff_md.track_node_props, node_props
     )
-    time_prop = _identify_time_prop(time_prop, geff_md, geff_graph)
+    time_prop = _identify_time_prop(time_prop, geff_md, node_props)
     cell_x_prop, cell_y_prop, cell_z_prop = _identify_space_props(
-        cell_x_prop, cell_y_prop, cell_z_prop, geff_md, geff_graph
+        cell_x_prop, cell_y_prop, cell_z_prop, geff_md, node_props
     )
 
     # Extract and dispatch metadata.
@@ -1146,15 +1707,39 @@ def load_GEFF(
     }
     props_md = _build_props_metadata(geff_md, rename_map)
 
-    # Split the graph into lineages.
-    cell_id_prop = _ensure_valid_cell_ID(geff_graph, cell_id_prop)
-    lineages = _split_graph_into_lineages(geff_graph, lineage_ID_key=lineage_id_prop)
+    # Lineage properties and cycle lineages are stored in nested GEFF files.
+    tables = _read_lineage_tables(geff_file, structure_validation)
+    lin_table_props: dict[str, PropDictNpArray] = {}
+    if "cell_lineages" in tables:
+        # Lineage IDs are identified from the nodes of the main GEFF file.
+        lin_table_props = {
+            key: prop
+            for key, prop in tables["cell_lineages"]["node_props"].items()
+            if key != "lineage_ID"
+        }
+        lin_table_md = tables["cell_lineages"]["metadata"].node_props_metadata
+        _extract_lin_props_metadata(
+            {
+                key: md.model_dump()
+                for key, md in lin_table_md.items()
+                if key in lin_table_props
+            },
+            props_md,
+            rename_map,
+        )
+
+    # Identify the lineages, i.e. the weakly connected components of the graph.
+    cell_id_prop, cell_ids = _ensure_valid_cell_ID(node_ids, node_props, cell_id_prop)
+    edge_rows = _get_edge_rows(node_ids, geff_data["edge_ids"])
+    labels = _get_lineage_labels(len(node_ids), edge_rows)
+    lin_ids = _get_lineage_IDs(labels, cell_ids, node_props, lineage_id_prop)
     if lineage_id_prop is None:
         lineage_id_prop = "lineage_ID"
 
     # Rename properties to match pycellin conventions.
     _standardize_properties_data(
-        lineages=lineages,
+        node_props=node_props,
+        edge_props=edge_props,
         lin_id_key=lineage_id_prop,
         cell_id_key=cell_id_prop,
         cell_x_key=cell_x_prop,
@@ -1173,7 +1758,10 @@ def load_GEFF(
         rename_map=rename_map,
     )
 
-    # Create the model.
+    # Create the model, building each lineage once from the arrays.
+    lineages = _build_lineages(
+        cell_ids, node_props, edge_rows, edge_props, labels, lin_ids
+    )
     model = Model(
         model_metadata=generic_md,
         props_metadata=PropsMetadata(props=props_md),
@@ -1181,6 +1769,18 @@ def load_GEFF(
     )
     check_fusions(model)  # pycellin DOES NOT support fusion events
 
+    # Restore the lineage properties and the cycle lineages without recomputation.
+    if "cell_lineages" in tables:
+        renames = rename_map[PropertyType.LINEAGE]
+        rows = _get_node_rows(node_ids, tables["cell_lineages"]["node_ids"])
+        _set_lineage_props(
+            model.data.cell_data,  # type: ignore[arg-type]
+            lin_ids[labels[rows]],
+            {renames.get(key, key): prop for key, prop in lin_table_props.items()},
+        )
+    if "cell_cycles" in tables:
+        _add_cycle_data(model, tables, node_ids, cell_ids, labels, lin_ids)
+
     return model
 
 
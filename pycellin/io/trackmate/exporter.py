@@ -7,31 +7,39 @@ directly from TrackMate.
 I've tested quickly and it doesn't seem to be a problem for TrackMate.
 """
 
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
 import copy
+from itertools import chain
 import logging
 import math
 import numbers
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
 import networkx as nx
 from lxml import etree as ET
 
-from pycellin.classes.exceptions import ProtectedPropertyError
-from pycellin.classes.lineage import CellLineage
+from pycellin.classes.lineage import CycleLineage
 from pycellin.classes.model import Model
 from pycellin.classes.property import Property
 from pycellin.classes.props_metadata import PropsMetadata
 from pycellin.custom_types import PropertyType
-from pycellin.io.utils import (
-    _identify_frame_prop,
-    _update_node_prop_key,
-)
+from pycellin.io.utils import _ExportView, _identify_frame_prop
 
 logger = logging.getLogger(__name__)
 
+# Node attributes that are not written as Spot attributes.
+_SPOT_EXCLUDED_KEYS = frozenset(["TRACK_ID", "ROI_coords"])
+# Size of the buffer of the output XML file, in bytes.
+_WRITE_BUFFER_SIZE = 1 << 20
+# Approximate number of XML tags serialized by a single task.
+_ITEMS_PER_TASK = 2000
+# Maximum number of serialization tasks waiting to be written.
+_MAX_PENDING_TASKS = 64
+
 
 def _unit_to_dimension(
     prop: Property,
@@ -144,11 +152,22 @@ def _unit_to_dimension(
     pycellin_props = {
         # Cell features.
         "angle": "ANGLE",
+        "cell_area": "AREA",
         "cell_displacement": "LENGTH",
+        "cell_eccentricity": "NONE",
+        "cell_perimeter": "LENGTH",
+        "cell_solidity": "NONE",
         "cell_speed": "VELOCITY",
+        "depth": "NONE",
+        "generation": "NONE",
         "is_division": "NONE",
         "is_leaf": "NONE",
         "is_root": "NONE",
+        "local_density": "NONE",
+        "min_rect_length": "LENGTH",
+        "min_rect_width": "LENGTH",
+        "nearest_non_sister_distance": "LENGTH",
+        "neighbor_count": "NONE",
         "pycellin_cell_ID": "NONE",
         "rod_length": "LENGTH",
         "rod_width": "LENGTH",
@@ -162,6 +181,8 @@ def _unit_to_dimension(
         "cycle_duration": "TIME",
         "cycle_ID": "NONE",
         "cycle_length": "NONE",
+        "cycle_msd": "NONE",  # list, won't be exported to TM
+        "cycle_vacf": "NONE",  # list, won't be exported to TM
         "division_time": "TIME",
         "division_rate": "TIME",  # TODO: check if this is correct
         "level": "NONE",
@@ -392,7 +413,14 @@ def _value_to_str(
     str
         The string equivalent of `value`.
     """
-    if isinstance(value, bool):
+    # Fast path for the most common types, checked by exact type
+    # since bool is a subclass of int.
+    value_type = type(value)
+    if value_type is float and math.isfinite(value):
+        return repr(value)
+    elif value_type is int or value_type is str:
+        return str(value)
+    elif isinstance(value, bool):
         return "1" if value else "0"
     elif isinstance(value, numbers.Number):
         if math.isnan(value):
@@ -411,47 +439,229 @@ def _value_to_str(
 
 
 def _create_Spot(
-    lineage: CellLineage,
-    node: int,
+    node_attrs: dict[str, Any],
 ) -> ET._Element:
     """
     Create an XML Spot Element representing a node of a Lineage.
 
     Parameters
     ----------
-    lineage : CellLineage
-        Lineage containing the node to create.
-    node : int
-        ID of the node in the lineage.
+    node_attrs : dict[str, Any]
+        Attributes of the node to create.
 
     Returns
     -------
     ET._Element
         The newly created Spot Element.
     """
-    exluded_keys = ["TRACK_ID", "ROI_coords"]
     n_attr = {
         k: _value_to_str(v)
-        for k, v in lineage.nodes[node].items()
-        if k not in exluded_keys
+        for k, v in node_attrs.items()
+        if k not in _SPOT_EXCLUDED_KEYS
     }
-    if "ROI_coords" in lineage.nodes[node]:
-        n_attr["ROI_N_POINTS"] = str(len(lineage.nodes[node]["ROI_coords"]))
-        # The text of a Spot is the coordinates of its ROI points, in a flattened list.
-        coords = [item for pt in lineage.nodes[node]["ROI_coords"] for item in pt]
-    else:
+    roi = node_attrs.get("ROI_coords")
+    if roi is None:
         # No segmentation mask, so we set the ROI_N_POINTS to 0.
         n_attr["ROI_N_POINTS"] = "0"
+        return ET.Element("Spot", n_attr)
 
+    n_attr["ROI_N_POINTS"] = str(len(roi))
     el_node = ET.Element("Spot", n_attr)
-    if "ROI_coords" in lineage.nodes[node]:
-        el_node.text = " ".join(map(str, coords))
+    # The text of a Spot is the coordinates of its ROI points, in a flattened list.
+    el_node.text = " ".join(map(str, chain.from_iterable(roi)))
     return el_node
 
 
+def _group_spots_by_frame(
+    view: _ExportView,
+) -> dict[int, list[tuple[int, int, dict[str, Any]]]]:
+    """
+    Group the nodes of all the lineages by frame, in a single pass.
+
+    Parameters
+    ----------
+    view : _ExportView
+        Export view of the cell lineages containing the nodes to group.
+
+    Returns
+    -------
+    dict[int, list[tuple[int, int, dict[str, Any]]]]
+        The lineage ID, node ID and original attributes of the nodes of each frame,
+        in lineage order.
+    """
+    frame_key = view.node.get_source_key("FRAME")
+    spots_by_frame: dict[int, list[tuple[int, int, dict[str, Any]]]] = {}
+    for lin_ID, lin in view.model.data.cell_data.items():
+        for nid, node_attrs in lin.nodes(data=True):
+            frame = node_attrs[frame_key]
+            try:
+                spots_by_frame[frame].append((lin_ID, nid, node_attrs))
+            except KeyError:
+                spots_by_frame[frame] = [(lin_ID, nid, node_attrs)]
+    return spots_by_frame
+
+
+def _batch_tasks(
+    tasks: Iterable[tuple[Any, list[Any]]],
+    max_items: int = _ITEMS_PER_TASK,
+) -> Iterator[list[tuple[Any, list[Any]]]]:
+    """
+    Group consecutive serialization tasks into batches of similar size.
+
+    Parameters
+    ----------
+    tasks : Iterable[tuple[Any, list[Any]]]
+        Tasks to group, each one being a tag and the list of its children.
+    max_items : int, optional
+        Number of children above which a batch is complete.
+
+    Yields
+    ------
+    list[tuple[Any, list[Any]]]
+        The batches of tasks, in order.
+    """
+    batch: list[tuple[Any, list[Any]]] = []
+    nb_items = 0
+    for task in tasks:
+        batch.append(task)
+        nb_items += len(task[1]) + 1
+        if nb_items >= max_items:
+            yield batch
+            batch = []
+            nb_items = 0
+    if batch:
+        yield batch
+
+
+def _map_in_order(
+    func: Callable[[Any], bytes],
+    tasks: Iterable[Any],
+    pool: ProcessPoolExecutor | None,
+    max_pending: int = _MAX_PENDING_TASKS,
+) -> Iterator[bytes]:
+    """
+    Apply a serialization function to tasks, in a pool of processes if provided.
+
+    The results are yielded in the order of the tasks. To keep memory usage
+    bounded, only a limited number of tasks are submitted ahead of the one
+    being written.
+
+    Parameters
+    ----------
+    func : Callable[[Any], bytes]
+        Picklable function serializing a task.
+    tasks : Iterable[Any]
+        Tasks to serialize.
+    pool : ProcessPoolExecutor | None
+        Pool of processes to use, or None to serialize in the current process.
+    max_pending : int, optional
+        Maximum number of tasks submitted to the pool and not yet written.
+
+    Yields
+    ------
+    bytes
+        The serialized tasks, in order.
+    """
+    if pool is None:
+        yield from map(func, tasks)
+        return
+    pending: deque[Future[bytes]] = deque()
+    for task in tasks:
+        pending.append(pool.submit(func, task))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _write_bytes(xf: ET.xmlfile, out: BinaryIO, block: bytes) -> None:
+    """
+    Write already serialized XML into an XML file.
+
+    Parameters
+    ----------
+    xf : ET.xmlfile
+        Context manager for the XML file to write.
+    out : BinaryIO
+        File object the XML file is written to.
+    block : bytes
+        Serialized XML to write, UTF-8 encoded.
+    """
+    # Flush what xf has buffered so the block is written at the right place.
+    xf.flush()
+    out.write(block)
+
+
+def _render_SpotsInFrame(frames: list[tuple[int, list[dict[str, Any]]]]) -> bytes:
+    """
+    Serialize SpotsInFrame XML tags, with their Spot tags.
+
+    Parameters
+    ----------
+    frames : list[tuple[int, list[dict[str, Any]]]]
+        Frames to serialize, with the exported attributes of their nodes.
+
+    Returns
+    -------
+    bytes
+        The indented SpotsInFrame tags, UTF-8 encoded.
+    """
+    blocks = []
+    for frame, spots in frames:
+        el_frame = ET.Element("SpotsInFrame", {"frame": str(frame)})
+        el_frame.text = f"\n{' ' * 8}"
+        el_spot = None
+        for node_attrs in spots:
+            el_spot = _create_Spot(node_attrs)
+            el_spot.tail = f"\n{' ' * 8}"
+            el_frame.append(el_spot)
+        if el_spot is not None:
+            el_spot.tail = f"\n{' ' * 6}"
+        blocks.append(f"\n{' ' * 6}".encode())
+        blocks.append(ET.tostring(el_frame, encoding="utf-8"))
+    return b"".join(blocks)
+
+
+def _render_Tracks(tracks: list[tuple[dict[str, Any], list[dict[str, Any]]]]) -> bytes:
+    """
+    Serialize Track XML tags, with their Edge tags.
+
+    Parameters
+    ----------
+    tracks : list[tuple[dict[str, Any], list[dict[str, Any]]]]
+        Tracks to serialize: the exported attributes of each lineage
+        and of its edges.
+
+    Returns
+    -------
+    bytes
+        The indented Track tags, UTF-8 encoded.
+    """
+    blocks = []
+    exluded_keys = ["Model", "FilteredTrack"]
+    for lin_attrs, edges in tracks:
+        t_attr = {
+            k: _value_to_str(v) for k, v in lin_attrs.items() if k not in exluded_keys
+        }
+        el_track = ET.Element("Track", t_attr)
+        el_track.text = f"\n{' ' * 8}" if edges else f"\n{' ' * 6}"
+        el_edge = None
+        for edge_attrs in edges:
+            e_attr = {k: _value_to_str(v) for k, v in edge_attrs.items()}
+            el_edge = ET.SubElement(el_track, "Edge", e_attr)
+            el_edge.tail = f"\n{' ' * 8}"
+        if el_edge is not None:
+            el_edge.tail = f"\n{' ' * 6}"
+        blocks.append(f"\n{' ' * 6}".encode())
+        blocks.append(ET.tostring(el_track, encoding="utf-8"))
+    return b"".join(blocks)
+
+
 def _write_AllSpots(
     xf: ET.xmlfile,
-    data: dict[int, CellLineage],
+    out: BinaryIO,
+    view: _ExportView,
+    pool: ProcessPoolExecutor | None = None,
 ) -> None:
     """
     Write the nodes/spots data into an XML file.
@@ -460,35 +670,67 @@ def _write_AllSpots(
     ----------
     xf : ET.xmlfile
         Context manager for the XML file to write.
-    data : dict[int, CellLineage]
-        Cell lineages containing the data to write.
+    out : BinaryIO
+        File object the XML file is written to.
+    view : _ExportView
+        Export view of the cell lineages containing the data to write.
+    pool : ProcessPoolExecutor | None, optional
+        Pool of processes serializing the frames in parallel. If None,
+        the frames are serialized in the current process.
     """
     xf.write(f"\n{' ' * 4}")
-    lineages = data.values()
-    nb_nodes = sum([len(lin) for lin in lineages])
+    data = view.model.data.cell_data
+    nb_nodes = sum([len(lin) for lin in data.values()])
     with xf.element("AllSpots", {"nspots": str(nb_nodes)}):
         # For each frame, nodes can be spread over several lineages
-        # so we first need to identify all of the existing frames.
-        frames = set()  # type: set[int]
-        for lin in lineages:
-            frames.update(nx.get_node_attributes(lin, "FRAME").values())
-
-        # Then at each frame, we can find the nodes and write its data.
-        for frame in frames:
-            xf.write(f"\n{' ' * 6}")
-            with xf.element("SpotsInFrame", {"frame": str(frame)}):
-                for lin in lineages:
-                    nodes = [n for n in lin.nodes() if lin.nodes[n]["FRAME"] == frame]
-                    for node in nodes:
-                        xf.write(f"\n{' ' * 8}")
-                        xf.write(_create_Spot(lin, node))
-                xf.write(f"\n{' ' * 6}")
+        # so we first group the nodes of all lineages by frame.
+        spots_by_frame = _group_spots_by_frame(view)
+        frames = (
+            (
+                frame,
+                [
+                    view.node.apply(node_attrs, lin_ID, nid)
+                    for lin_ID, nid, node_attrs in spots_by_frame[frame]
+                ],
+            )
+            for frame in sorted(spots_by_frame)
+        )
+        for block in _map_in_order(_render_SpotsInFrame, _batch_tasks(frames), pool):
+            _write_bytes(xf, out, block)
         xf.write(f"\n{' ' * 4}")
 
 
+def _iter_tracks(
+    view: _ExportView,
+) -> Iterator[tuple[dict[str, Any], list[dict[str, Any]]]]:
+    """
+    Iterate over the tracks to write, with their edges.
+
+    Parameters
+    ----------
+    view : _ExportView
+        Export view of the cell lineages containing the data to write.
+
+    Yields
+    ------
+    tuple[dict[str, Any], list[dict[str, Any]]]
+        The exported attributes of a lineage and of its edges.
+    """
+    for lin_ID in view.model.data.cell_data:
+        lin_attrs = view.get_lineage_attrs(lin_ID)
+        # We have track tags to add only for tracks with several spots,
+        # so one-node tracks are to be ignored. In pycellin, a one-node
+        # lineage is identified by a negative ID.
+        if lin_attrs["TRACK_ID"] < 0:
+            continue
+        yield lin_attrs, [edge_attrs for _, _, edge_attrs in view.iter_edges(lin_ID)]
+
+
 def _write_AllTracks(
     xf: ET.xmlfile,
-    data: dict[int, CellLineage],
+    out: BinaryIO,
+    view: _ExportView,
+    pool: ProcessPoolExecutor | None = None,
 ) -> None:
     """
     Write the tracks data into an XML file.
@@ -497,37 +739,23 @@ def _write_AllTracks(
     ----------
     xf : ET.xmlfile
         Context manager for the XML file to write.
-    data : dict[int, CellLineage]
-        Cell lineages containing the data to write.
+    out : BinaryIO
+        File object the XML file is written to.
+    view : _ExportView
+        Export view of the cell lineages containing the data to write.
+    pool : ProcessPoolExecutor | None, optional
+        Pool of processes serializing the tracks in parallel. If None,
+        the tracks are serialized in the current process.
     """
     xf.write(f"\n{' ' * 4}")
     with xf.element("AllTracks"):
-        for lineage in data.values():
-            # We have track tags to add only for tracks with several spots,
-            # so one-node tracks are to be ignored. In pycellin, a one-node
-            # lineage is identified by a negative ID.
-            if lineage.graph["TRACK_ID"] < 0:
-                continue
-
-            # Track tags.
-            xf.write(f"\n{' ' * 6}")
-            exluded_keys = ["Model", "FilteredTrack"]
-            t_attr = {
-                k: _value_to_str(v)
-                for k, v in lineage.graph.items()
-                if k not in exluded_keys
-            }
-            with xf.element("Track", t_attr):
-                # Edge tags.
-                for edge in lineage.edges.data():
-                    xf.write(f"\n{' ' * 8}")
-                    e_attr = {k: _value_to_str(v) for k, v in edge[2].items()}
-                    xf.write(ET.Element("Edge", e_attr))
-                xf.write(f"\n{' ' * 6}")
+        tracks = _iter_tracks(view)
+        for block in _map_in_order(_render_Tracks, _batch_tasks(tracks), pool):
+            _write_bytes(xf, out, block)
         xf.write(f"\n{' ' * 4}")
 
 
-def _write_track_id(xf: ET.xmlfile, lineage: CellLineage) -> None:
+def _write_track_id(xf: ET.xmlfile, lin_attrs: dict[str, Any]) -> None:
     """
     Helper function to write a track ID to the XML file.
 
@@ -535,8 +763,8 @@ def _write_track_id(xf: ET.xmlfile, lineage: CellLineage) -> None:
     ----------
     xf : ET.xmlfile
         Context manager for the XML file to write.
-    lineage : CellLineage
-        Cell lineage containing the data to write.
+    lin_attrs : dict[str, Any]
+        Exported attributes of the cell lineage containing the data to write.
 
     Raises
     ------
@@ -544,19 +772,19 @@ def _write_track_id(xf: ET.xmlfile, lineage: CellLineage) -> None:
         If the lineage does not have a TRACK_ID attribute.
     """
     try:
-        if lineage.graph["TRACK_ID"] < 0:
+        if lin_attrs["TRACK_ID"] < 0:
             # We don't want to write the track ID for one-node lineages.
             return
     except KeyError as err:
         raise KeyError("The lineage does not have a TRACK_ID attribute.") from err
     xf.write(f"\n{' ' * 6}")
-    t_attr = {"TRACK_ID": str(lineage.graph["TRACK_ID"])}
+    t_attr = {"TRACK_ID": str(lin_attrs["TRACK_ID"])}
     xf.write(ET.Element("TrackID", t_attr))
 
 
 def _write_FilteredTracks(
     xf: ET.xmlfile,
-    data: dict[int, CellLineage],
+    view: _ExportView,
     has_FilteredTracks: bool,
 ) -> None:
     """
@@ -566,155 +794,32 @@ def _write_FilteredTracks(
     ----------
     xf : ET.xmlfile
         Context manager for the XML file to write.
-    data : dict[int, CellLineage]
-        Cell lineages containing the data to write.
+    view : _ExportView
+        Export view of the cell lineages containing the data to write.
     has_FilteredTracks : bool
         Flag indicating if the model contains filtered tracks.
     """
     xf.write(f"\n{' ' * 4}")
     with xf.element("FilteredTracks"):
-        if has_FilteredTracks:
-            for lineage in data.values():
-                if lineage.graph["FilteredTrack"]:
-                    _write_track_id(xf, lineage)
-        else:
+        for lin_ID in view.model.data.cell_data:
+            lin_attrs = view.get_lineage_attrs(lin_ID)
             # If there are no filtered tracks, we need to add all the tracks
             # because TrackMate only displays tracks that are in this tag.
-            for lineage in data.values():
-                _write_track_id(xf, lineage)
+            if not has_FilteredTracks or lin_attrs["FilteredTrack"]:
+                _write_track_id(xf, lin_attrs)
         xf.write(f"\n{' ' * 4}")
     xf.write(f"\n{' ' * 2}")
 
 
-def _update_nodes(lin: CellLineage, frame_prop: str) -> set[int]:
+def _warn_missing_positions(missing_positions: dict[int, set[int]]) -> None:
     """
-    Update the node properties in the lineage to match TrackMate requirements.
+    Warn about the cells missing x and/or y coordinates, if any.
 
     Parameters
     ----------
-    lin : CellLineage
-        Lineage whose nodes to update.
-    frame_prop : str
-        Name of the property corresponding to the frame/timepoint.
-
-    Returns
-    -------
-    set[int]
-        Set of node IDs that are missing POSITION_X or POSITION_Y.
+    missing_positions : dict[int, set[int]]
+        IDs of the cells with missing coordinates, for each lineage ID.
     """
-    nodes_with_missing_pos = set()
-
-    for node, data in lin.nodes(data=True):
-        data["ID"] = data.pop("cell_ID")
-        data["FRAME"] = data.pop(frame_prop)
-        data["VISIBILITY"] = 1
-        try:
-            data.pop("lineage_ID")  # TM needs it only on the tracks, not on the spots
-        except KeyError:
-            pass  # lineage_ID should be present, but better be safe than sorry
-        try:
-            data.pop("timepoint")  # internal pycellin property
-        except KeyError:
-            # If frame_prop is timepoint, it has already been popped
-            # and we can ignore the KeyError.
-            pass
-        try:
-            data["name"] = data.pop("cell_name")
-        except KeyError:
-            pass  # not a mandatory property
-        # Position properties.
-        has_missing_pos = False
-        for axis in ["X", "Y", "Z"]:
-            try:
-                data[f"POSITION_{axis}"] = data.pop(f"cell_{axis.lower()}")
-            except KeyError:
-                # This POSITION_ is mandatory in TrackMate for x, y and z dimensions.
-                if axis in ["X", "Y"]:
-                    has_missing_pos = True
-                    # We set a default value, otherwise TrackMate will crash.
-                    data[f"POSITION_{axis}"] = 0.0
-                else:
-                    # We add the missing z dimension.
-                    data[f"POSITION_{axis}"] = 0.0
-
-        if has_missing_pos:
-            nodes_with_missing_pos.add(node)
-
-    return nodes_with_missing_pos
-
-
-def _update_edges(lin: CellLineage) -> None:
-    """
-    Update the edge properties in the lineage to match TrackMate requirements.
-
-    Parameters
-    ----------
-    lineage : CellLineage
-        Lineage whose edges to update.
-    """
-    for source_node, target_node, data in lin.edges(data=True):
-        # Mandatory TrackMate properties.
-        # Create if they don't exist. Update if they exist, for consistency.
-        data["SPOT_SOURCE_ID"] = source_node
-        data["SPOT_TARGET_ID"] = target_node
-        # Position properties.
-        for axis in ["X", "Y", "Z"]:
-            try:
-                data[f"EDGE_{axis}_LOCATION"] = data.pop(f"link_{axis.lower()}")
-            except KeyError:
-                pass  # not mandatory
-
-
-def _update_lineages(lin: CellLineage) -> None:
-    """
-    Update the lineage properties to match TrackMate requirements.
-
-    Parameters
-    ----------
-    lineage : CellLineage
-        Lineage whose graph to update.
-    """
-    # Mandatory TrackMate property.
-    lin.graph["TRACK_ID"] = lin.graph.pop("lineage_ID")
-
-    try:
-        lin.graph["name"] = lin.graph.pop("lineage_name")
-    except KeyError:
-        pass  # not mandatory
-    # Position properties.
-    for axis in ["X", "Y", "Z"]:
-        try:
-            lin.graph[f"TRACK_{axis}_LOCATION"] = lin.graph.pop(f"lineage_{axis.lower()}")
-        except KeyError:
-            pass  # not mandatory
-
-
-def _update_model_data(model: Model, frame_prop: str) -> None:
-    """
-    Update the data in the model to match TrackMate requirements.
-
-    Parameters
-    ----------
-    model : Model
-        Model whose data to update.
-    frame_prop : str
-        Name of the property corresponding to the frame/timepoint.
-
-    Warns
-    -----
-    If some cells are missing x and/or y coordinates, in which case they are set
-    to 0.0 by default.
-    """
-    # Track cells with missing position properties: {lineage_ID: set of node IDs}.
-    missing_positions = {}
-
-    for lin in model.data.cell_data.values():
-        nodes_with_missing_pos = _update_nodes(lin, frame_prop)
-        if nodes_with_missing_pos:
-            missing_positions[lin.graph["lineage_ID"]] = nodes_with_missing_pos
-        _update_edges(lin)
-        _update_lineages(lin)
-
     # Show a single summary warning at the end if any positions are missing.
     if missing_positions:
         msg_parts = []
@@ -784,26 +889,19 @@ def _is_numeric_dtype(dtype: str | None) -> bool:
     return bool(re.search(numeric_pattern, dtype_lower))
 
 
-def _remove_non_numeric_props(model: Model) -> None:
+def _get_non_numeric_props(model: Model) -> list[str]:
     """
-    Completely remove non-numeric properties from the model.
+    Return the properties of the model that TrackMate cannot handle.
 
     Parameters
     ----------
     model : Model
-        Model to modify.
-
-    Warns
-    -----
-    If some properties are not numeric and will not be exported to TrackMate.
-    This is the case for properties with string, list, or other non-numeric
-    values that TrackMate cannot handle.
+        Model to check.
 
-    Notes
-    -----
-    This is necessary because TrackMate does not support non-numeric features.
-    Boolean features are considered numeric and are converted to integers
-    (1 for True, 0 for False).
+    Returns
+    -------
+    list[str]
+        Identifiers of the non-numeric properties.
     """
     to_remove = [
         name
@@ -812,14 +910,19 @@ def _remove_non_numeric_props(model: Model) -> None:
     ]
     # The only exception is 'name' which is a string property that TrackMate can handle
     # as the display name of a spot or a track.
-    to_remove = [name for name in to_remove if name != "name"]
+    return [name for name in to_remove if name != "name"]
+
+
+def _warn_ignored_props(to_remove: list[str]) -> None:
+    """
+    Warn about the properties that are not exported to TrackMate.
+
+    Parameters
+    ----------
+    to_remove : list[str]
+        Identifiers of the ignored properties.
+    """
     if to_remove:
-        for name in to_remove:
-            try:
-                model.remove_property(name)
-            except ProtectedPropertyError:
-                model.props_metadata._unprotect_prop(name)
-                model.remove_property(name)
         plural = True if len(to_remove) > 1 else False
         msg = (
             f"Ignoring propert{'ies' if plural else 'y'}: "
@@ -1004,19 +1107,22 @@ def _update_props_metadata(model: Model, frame_prop: str) -> None:
     _update_location_props(model.props_metadata)
 
 
-def _add_radius_prop(model: Model) -> None:
+def _add_radius_prop_metadata(model: Model) -> str | None:
     """
-    Add a radius property to the model if it does not exist.
+    Declare the RADIUS property in the properties metadata of the model.
 
-    This is necessary because TrackMate requires a radius feature for the spots
-    in order to be able to draw them as circles.
-    If the radius property is not present, we add it with a default value of 1.0
-    for all nodes.
+    If a radius property is already declared, it is renamed to RADIUS.
 
     Parameters
     ----------
     model : Model
-        Model to modify.
+        Model whose metadata to update.
+
+    Returns
+    -------
+    str | None
+        Identifier of the radius property before renaming, or None if the model
+        had no radius property.
     """
     # Check if there is already a radius property in the registered properties.
     props = model.get_properties()
@@ -1026,18 +1132,10 @@ def _add_radius_prop(model: Model) -> None:
             radius_prop_name = prop_name
             break
 
-    # If yes, rename it to RADIUS if necessary, in both metadata and data.
+    # If yes, rename it to RADIUS if necessary.
     if radius_prop_name is not None:
         if radius_prop_name != "RADIUS":
             model.props_metadata._change_prop_identifier(radius_prop_name, "RADIUS")
-            for lin in model.data.cell_data.values():
-                _update_node_prop_key(
-                    lin,
-                    old_key=radius_prop_name,
-                    new_key="RADIUS",
-                    set_default_if_missing=True,
-                    default_value=1.0,
-                )
     else:
         # If not, create the RADIUS property in the metadata.
         radius_prop = Property(
@@ -1051,20 +1149,12 @@ def _add_radius_prop(model: Model) -> None:
             unit=model.get_space_unit(),
         )
         model.props_metadata._add_prop(radius_prop)
-
-    # Ensure all nodes have the RADIUS property set to 1.0 if missing.
-    for lin in model.data.cell_data.values():
-        for node in lin.nodes():
-            if "RADIUS" not in lin.nodes[node]:
-                lin.nodes[node]["RADIUS"] = 1.0
+    return radius_prop_name
 
 
-def _relabel_nodes(model) -> dict[int, dict[int, int]]:
+def _get_relabel_mapping(model: Model) -> dict[int, dict[int, int]]:
     """
-    Relabel the nodes and return a mapping of old node IDs to new node IDs for each lineage.
-
-    This is necessary because TrackMate requires unique spot IDs across all lineages.
-    If the model has non-unique node IDs, we relabel them in place to ensure uniqueness.
+    Return the new IDs of the nodes so that they are unique across all lineages.
 
     Parameters
     ----------
@@ -1074,9 +1164,8 @@ def _relabel_nodes(model) -> dict[int, dict[int, int]]:
     Returns
     -------
     dict[int, dict[int, int]]
-        A mapping of old node IDs to new node IDs for each lineage.
-        The outer dictionary keys are the lineage IDs, and the inner dictionaries
-        map old node IDs to new node IDs.
+        A mapping of old node IDs to new node IDs for each lineage, or an empty
+        dictionary if the node IDs are already unique.
 
     Warns
     -----
@@ -1090,10 +1179,8 @@ def _relabel_nodes(model) -> dict[int, dict[int, int]]:
     dupes = [item for item, count in count_ids.items() if count > 1]
 
     if not dupes:
-        # All node IDs are unique, no need to relabel.
         return {}
 
-    # Relabel the nodes.
     full_mapping: dict[int, dict[int, int]] = {}  # {lin_id: {old_node_id: new_node_id}}
     new_id = 0
     logger.debug(f"Duplicate node IDs found: {dupes}")
@@ -1107,30 +1194,19 @@ def _relabel_nodes(model) -> dict[int, dict[int, int]]:
         for node in lin.nodes():
             mapping[node] = new_id
             new_id += 1
-        nx.relabel_nodes(lin, mapping, copy=False)
+    return full_mapping
 
-        # The relabeling must be propagated to the cell_ID property.
-        for node in lin.nodes():
-            lin.nodes[node]["pycellin_cell_ID"] = lin.nodes[node]["cell_ID"]
-            lin.nodes[node]["cell_ID"] = node
-
-        # SPOT_SOURCE_ID and SPOT_TARGET_ID are updated / created later
-        # in _update_edges().
-
-    # Manual update of the specific node property cell_name
-    # when it has a TrackMate syntax: "ID{cell_name}"".
-    if model.has_property("cell_name"):
-        for lin_id, lin in model.data.cell_data.items():
-            for node in lin.nodes():
-                if "cell_name" in lin.nodes[node]:
-                    old_id = lin.nodes[node]["pycellin_cell_ID"]
-                    new_id = lin.nodes[node]["cell_ID"]
-                    if lin.nodes[node]["cell_name"] == f"ID{old_id}":
-                        lin.nodes[node]["cell_name"] = f"ID{new_id}"
-
-    # Update of the model in case some other properties refer
-    # to the node IDs (for example cycle_IDs).
-    prop = Property(
+
+def _create_pycellin_cell_id_property() -> Property:
+    """
+    Create the property storing the cell IDs before relabeling.
+
+    Returns
+    -------
+    Property
+        The pycellin_cell_ID property.
+    """
+    return Property(
         identifier="pycellin_cell_ID",
         name="Pycellin cell ID",
         description="Original cell ID before relabeling for TrackMate export",
@@ -1139,44 +1215,247 @@ def _relabel_nodes(model) -> dict[int, dict[int, int]]:
         lin_type="CellLineage",
         dtype="int",
     )
-    model.props_metadata._add_prop(prop)
-    model.prepare_full_data_update()
-    model.update()
 
-    return full_mapping
 
+def _add_relabel_overlay(view: _ExportView) -> None:
+    """
+    Relabel the nodes of an export view so that their IDs are unique.
 
-def _prepare_model_for_export(
-    model: Model,
-    propagate: bool,
+    The data is not modified: the new IDs are applied on the fly while the nodes
+    are exported. The original IDs are exported as `pycellin_cell_ID`.
+
+    Parameters
+    ----------
+    view : _ExportView
+        Export view to update.
+    """
+    view.relabel = _get_relabel_mapping(view.model)
+    if not view.relabel:
+        return
+
+    fix_cell_name = view.model.has_property("cell_name")
+
+    def overlay(lin_ID: int, nid: int, attrs: dict[str, Any]) -> dict[str, Any]:
+        new_id = view.relabel[lin_ID][nid]
+        new_attrs = {"pycellin_cell_ID": attrs["cell_ID"], "cell_ID": new_id}
+        # Cell names with a TrackMate syntax "ID{cell_ID}" follow the relabeling.
+        if fix_cell_name and attrs.get("cell_name") == f"ID{attrs['cell_ID']}":
+            new_attrs["cell_name"] = f"ID{new_id}"
+        return new_attrs
+
+    view.node.overlays.append(overlay)
+    view.model.props_metadata._add_prop(_create_pycellin_cell_id_property())
+
+
+def _update_cycle_lineages(
+    model: Model, relabel: dict[int, dict[int, int]], excluded: set[str]
 ) -> None:
     """
-    Prepare a pycellin model for export to TrackMate format.
+    Update the cycle lineages of an exported model to match its cell lineages.
+
+    Cycle IDs are the IDs of the last cell of each cycle, so they follow
+    the relabeling of the cells, as do the cells of each cycle. The properties
+    that are not exported are removed.
+
+    Parameters
+    ----------
+    model : Model
+        Exported model whose cycle lineages to update.
+    relabel : dict[int, dict[int, int]]
+        New IDs of the relabeled cells: {lineage_ID: {old_ID: new_ID}}.
+    excluded : set[str]
+        Identifiers of the properties that are not exported.
+    """
+    time_prop = model.model_metadata.reference_time_property
+    time_step = model.model_metadata.time_step
+    for lin_ID, clin in model.data.cycle_data.items():
+        mapping = relabel.get(lin_ID, {})
+        # The structure of a cycle lineage is frozen, so it is rebuilt.
+        new_clin = CycleLineage(time_prop, time_step)
+        new_clin.graph.update(
+            (key, value) for key, value in clin.graph.items() if key not in excluded
+        )
+        for cycle, attrs in clin.nodes(data=True):
+            new_attrs = {key: val for key, val in attrs.items() if key not in excluded}
+            if "cycle_ID" in new_attrs:
+                new_attrs["cycle_ID"] = mapping.get(cycle, cycle)
+            if "cells" in new_attrs:
+                new_attrs["cells"] = [mapping.get(cid, cid) for cid in attrs["cells"]]
+            new_clin.add_node(mapping.get(cycle, cycle), **new_attrs)
+        for source, target, attrs in clin.edges(data=True):
+            new_clin.add_edge(
+                mapping.get(source, source),
+                mapping.get(target, target),
+                **{key: val for key, val in attrs.items() if key not in excluded},
+            )
+        nx.freeze(new_clin)
+        model.data.cycle_data[lin_ID] = new_clin
+
+
+def _add_cycle_props_overlays(view: _ExportView) -> None:
+    """
+    Propagate the cycle properties to the cell lineages of an export view.
+
+    This is the view counterpart of `Model.propagate_cycle_properties()`:
+    the properties of the cycle lineages are read on the fly while the cell
+    lineages are exported, instead of being copied into the cell lineages.
+
+    Parameters
+    ----------
+    view : _ExportView
+        Export view to update.
+
+    Raises
+    ------
+    ValueError
+        If the cycle lineages have not been computed yet.
+    """
+    model = view.model
+    if not model.data.cycle_data:
+        raise ValueError(
+            "Cycle lineages have not been computed yet. "
+            "Please compute the cycle lineages first with `model.add_cycle_data()`."
+        )
+    if model._updater._update_required:
+        # Data is shared with the exported model, which is thus updated too.
+        model.update()
+    node_props, edge_props, lin_props = model._categorize_props(None)
+    cycle_data = model.data.cycle_data
+
+    # {lineage_ID: {cell_ID: cycle_ID}}
+    cycle_of = {
+        lin_ID: {
+            cell: cycle for cycle, cells in clin.nodes(data="cells") for cell in cells
+        }
+        for lin_ID, clin in cycle_data.items()
+    }
+
+    def node_overlay(lin_ID: int, nid: int, attrs: dict[str, Any]) -> dict[str, Any]:
+        cycle_attrs = cycle_data[lin_ID].nodes[cycle_of[lin_ID][nid]]
+        props = {prop: cycle_attrs[prop] for prop in node_props if prop in cycle_attrs}
+        if "cycle_ID" in props:
+            # Cycle IDs are cell IDs, so they follow the relabeling of the cells.
+            props["cycle_ID"] = view.get_node_ID(lin_ID, props["cycle_ID"])
+        return props
+
+    def edge_overlay(
+        lin_ID: int, source: int, target: int, attrs: dict[str, Any]
+    ) -> dict[str, Any]:
+        # Both intracycle edges and the incoming edge of a cycle
+        # get the properties of the incoming edge of the cycle.
+        clin = cycle_data[lin_ID]
+        cycle = cycle_of[lin_ID][target]
+        for pred in clin.pred[cycle]:
+            cycle_attrs = clin.edges[pred, cycle]
+            return {
+                prop: cycle_attrs[prop] for prop in edge_props if prop in cycle_attrs
+            }
+        return {}
+
+    def lineage_overlay(lin_ID: int, attrs: dict[str, Any]) -> dict[str, Any]:
+        cycle_attrs = cycle_data[lin_ID].graph
+        return {prop: cycle_attrs[prop] for prop in lin_props if prop in cycle_attrs}
+
+    propagated_props = set()
+    for clin in cycle_data.values():
+        for _, cycle_attrs in clin.nodes(data=True):
+            propagated_props.update(cycle_attrs.keys() & node_props)
+        for _, _, cycle_attrs in clin.edges(data=True):
+            propagated_props.update(cycle_attrs.keys() & edge_props)
+        propagated_props.update(clin.graph.keys() & lin_props)
+    if node_props:
+        view.node.overlays.append(node_overlay)
+    if edge_props:
+        view.edge.overlays.append(edge_overlay)
+    if lin_props:
+        view.lineage.overlays.append(lineage_overlay)
+    for prop in propagated_props:
+        model.props_metadata.props[prop].lin_type = "Lineage"
+
+
+def _get_TrackMate_view(model: Model, propagate: bool) -> _ExportView:
+    """
+Create an export view of a pycellin model matching TrackMate requirements.
 
-    This function updates the model to match TrackMate requirements
-    and removes non-numeric properties that TrackMate cannot handle.
+    The data of the model is neither copied nor modified: relabeling, propagation
+    of cycle properties, renaming and removal of properties are applied on the fly
+    while the data is written.
 
     Parameters
     ----------
     model : Model
-        Model to prepare for export.
+        Model to export.
     propagate : bool
-        Whether to propagate the cycle properties before preparing the model.
+        Whether to propagate the cycle properties to the exported cell lineages.
+
+    Returns
+    -------
+    _ExportView
+        The export view of the model.
 
     Raises
     ------
     KeyError
         If neither a frame-like property nor 'timepoint' is present on all nodes.
     """
-    _relabel_nodes(model)  # TrackMate needs unique spot IDs across all lineages
+    view = _ExportView(model)
+    _add_relabel_overlay(view)  # TrackMate needs unique spot IDs across all lineages
     if propagate:
-        model.propagate_cycle_properties()
+        _add_cycle_props_overlays(view)
+
+    frame_prop = _identify_frame_prop(view.model)
+    radius_prop_name = _add_radius_prop_metadata(view.model)
+    _update_props_metadata(view.model, frame_prop)
+
+    # Nodes.
+    view.node.renames.update(
+        {"cell_ID": "ID", frame_prop: "FRAME", "cell_name": "name"}
+    )
+    if radius_prop_name is not None:
+        view.node.renames[radius_prop_name] = "RADIUS"
+    view.node.constants["VISIBILITY"] = 1
+    # TM needs lineage_ID only on the tracks, not on the spots.
+    view.node.excluded.update(["lineage_ID", "timepoint"])
+    for axis in ["X", "Y", "Z"]:
+        view.node.renames[f"cell_{axis.lower()}"] = f"POSITION_{axis}"
+        # POSITION_ is mandatory in TrackMate for x, y and z dimensions.
+        view.node.defaults[f"POSITION_{axis}"] = 0.0
+    view.node.defaults["RADIUS"] = 1.0
+    missing_positions = {}
+    for lin_ID, lin in model.data.cell_data.items():
+        nodes_with_missing_pos = {
+            view.get_node_ID(lin_ID, node)
+            for node, data in lin.nodes(data=True)
+            if "cell_x" not in data or "cell_y" not in data
+        }
+        if nodes_with_missing_pos:
+            missing_positions[lin_ID] = nodes_with_missing_pos
+    _warn_missing_positions(missing_positions)
+
+    # Edges.
+    view.edge.overlays.append(
+        lambda lin_ID, source, target, attrs: {
+            "SPOT_SOURCE_ID": view.get_node_ID(lin_ID, source),
+            "SPOT_TARGET_ID": view.get_node_ID(lin_ID, target),
+        }
+    )
+    # Lineages.
+    view.lineage.renames.update({"lineage_ID": "TRACK_ID", "lineage_name": "name"})
+    for axis in ["X", "Y", "Z"]:
+        view.edge.renames[f"link_{axis.lower()}"] = f"EDGE_{axis}_LOCATION"
+        view.lineage.renames[f"lineage_{axis.lower()}"] = f"TRACK_{axis}_LOCATION"
+
+    # Non-numeric properties are only removed from the exported metadata
+    # and ignored while writing the data.
+    to_remove = _get_non_numeric_props(view.model)
+    for name in to_remove:
+        view.model.props_metadata._unprotect_prop(name)
+        view.model.props_metadata._remove_prop(name)
+    for transform in [view.node, view.edge, view.lineage]:
+        transform.excluded.update(to_remove)
+    _warn_ignored_props(to_remove)
 
-    frame_prop = _identify_frame_prop(model)
-    _add_radius_prop(model)
-    _update_props_metadata(model, frame_prop)
-    _update_model_data(model, frame_prop)
-    _remove_non_numeric_props(model)
+    return view
 
 
 def _write_Settings(
@@ -1339,7 +1618,9 @@ def export_TrackMate_XML(
     img_shape: tuple[int, int, int, int, int] | None = None,
     img_shape_field: str | None = None,
     propagate_cycle_props: bool = False,
-) -> Model:
+    return_exported_model: bool = False,
+    workers: int = 1,
+) -> Model | None:
     """
     Write an XML file readable by TrackMate from a pycellin model.
 
@@ -1373,13 +1654,29 @@ def export_TrackMate_XML(
         If True, cycle properties will be propagated to cell lineages before export.
         Useful if you want to export the cycle properties to TrackMate
         and have them accessible in the tracks. Default is False.
+    return_exported_model : bool, optional
+        If True, the model is deep copied, and the changes applied on the fly
+        while writing are then applied to the copy, which is returned.
+        Otherwise, the data of the model is not copied. Default is False.
+    workers : int, optional
+        Number of processes serializing the spots and tracks in parallel.
+        The spots of each frame and the tracks of each lineage are rendered
+        independently, then written in order, so the XML file is the same
+        whatever the number of workers. Default is 1 (no parallelization).
 
     Returns
     -------
-    model_copy : Model
-        The model as it was exported, including all the modifications done by the
-        exporter (removal of incompatible properties, propagation of cycle properties...).
-        This is a copy of the original model, so the original model is not modified.
+    model_copy : Model | None
+        If `return_exported_model` is True, the model as it was exported, including
+        all the modifications done by the exporter (removal of incompatible
+        properties, propagation of cycle properties...). This is a copy of
+        the original model, so the original model is not modified.
+        None otherwise.
+
+    Raises
+    ------
+    ValueError
+        If `workers` is lower than 1.
 
     Warnings
     --------
@@ -1391,43 +1688,62 @@ def export_TrackMate_XML(
     node of the cell cycle in cell lineages, whereas they are stored only once
     per cell cycle on the cycle node in cycle lineages.
     """
-    # We don't want to modify the original model.
-    model_copy = copy.deepcopy(model)
-
+    if workers < 1:
+        raise ValueError(f"`workers` must be at least 1, not {workers}.")
     if not units:
-        units = _ask_units(model_copy.props_metadata)
+        units = _ask_units(model.props_metadata)
     tm_units = {"spatialunits": units["space"], "timeunits": units["time"]}
-    if hasattr(model_copy.model_metadata, "TrackMate_version"):
-        tm_version = model_copy.model_metadata.TrackMate_version
+    if hasattr(model.model_metadata, "TrackMate_version"):
+        tm_version = model.model_metadata.TrackMate_version
     else:
         tm_version = "unknown"
-    has_FilteredTrack = model_copy.has_property("FilteredTrack")
-    _prepare_model_for_export(model_copy, propagate_cycle_props)
+    has_FilteredTrack = model.has_property("FilteredTrack")
 
-    with ET.xmlfile(xml_path, encoding="utf-8", close=True) as xf:
+    if return_exported_model:
+        # The changes of the view are applied to a copy of the model
+        # once it has been written, so the original model is not modified.
+        model = copy.deepcopy(model)
+    view = _get_TrackMate_view(model, propagate_cycle_props)
+    exported_model = view.model
+
+    pool_context = (
+        ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+    )
+    with (
+        pool_context as pool,
+        open(xml_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f,
+        ET.xmlfile(f, encoding="utf-8", buffered=True) as xf,
+    ):
         xf.write_declaration()
         with xf.element("TrackMate", {"version": tm_version}):
             xf.write("\n  ")
-            _write_metadata_tag(xf, model_copy.model_metadata.to_dict(), "Log")
+            _write_metadata_tag(xf, exported_model.model_metadata.to_dict(), "Log")
             xf.write("\n  ")
             with xf.element("Model", tm_units):
-                _write_FeatureDeclarations(xf, model_copy)
-                _write_AllSpots(xf, model_copy.data.cell_data)
-                _write_AllTracks(xf, model_copy.data.cell_data)
-                _write_FilteredTracks(xf, model_copy.data.cell_data, has_FilteredTrack)
+                _write_FeatureDeclarations(xf, exported_model)
+                _write_AllSpots(xf, f, view, pool)
+                _write_AllTracks(xf, f, view, pool)
+                _write_FilteredTracks(xf, view, has_FilteredTrack)
             xf.write("\n  ")
             _write_Settings(
-                xf, model_copy, img_path, img_path_field, img_shape, img_shape_field
+                xf, exported_model, img_path, img_path_field, img_shape, img_shape_field
             )
 
             xf.write("\n  ")
             for tag in ["GUIState", "DisplaySettings"]:
-                _write_metadata_tag(xf, model_copy.model_metadata.to_dict(), tag)
+                _write_metadata_tag(xf, exported_model.model_metadata.to_dict(), tag)
                 if tag == "DisplaySettings":
                     xf.write("\n")
                 else:
                     xf.write("\n  ")
-    return model_copy
+
+    if not return_exported_model:
+        return None
+    exported_model = view.materialize()
+    if exported_model.data.cycle_data:
+        excluded = set(_get_non_numeric_props(model))
+        _update_cycle_lineages(exported_model, view.relabel, excluded)
+    return exported_model
 
 
 if __name__ == "__main__":
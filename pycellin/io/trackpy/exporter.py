@@ -16,74 +16,76 @@ References:
 - trackpy GitHub: https://github.com/soft-matter/trackpy
 """
 
-import copy
-
+import networkx as nx
 import pandas as pd
 
 from pycellin.classes.model import Model
+from pycellin.custom_types import Cell
 from pycellin.io.utils import _identify_frame_prop
 
 
-def safekeep_original_lineage_IDs(model: Model) -> None:
+def _get_tracks(model: Model) -> tuple[dict[Cell, int], set[Cell], set[Cell]]:
     """
-    Add original lineage IDs to the nodes of the model.
+    Split the lineages of a model into division-free trackpy tracks.
 
-    We want to safekeep them since we are going to renumber
-    the lineages later on.
+    This mimics, without modifying the model, the removal of the division links
+    followed by the update of the model and the renumbering of negative lineage
+    IDs: in each lineage, the largest track keeps the lineage ID, the other
+    tracks with several cells get the next available lineage IDs, and then
+    the one-node lineages and the other one-cell tracks get the next ones.
 
     Parameters
     ----------
     model : Model
-        The pycellin model to modify.
-    """
-    for lin_ID, lin in model.data.cell_data.items():
-        for node in lin.nodes():
-            lin.nodes[node]["lineage_ID_Pycellin"] = lin_ID
-
-
-def remove_division_events(model: Model) -> None:
-    """
-    Remove division events by deleting edges involved in divisions.
-
-    Parameters
-    ----------
-    model : Model
-        The pycellin model to modify.
-    """
-    for lin in model.get_cell_lineages():
-        divs = lin.get_divisions()
-        div_edges = [edge for div in divs for edge in lin.out_edges(div)]
-        for edge in div_edges:
-            model.remove_link(*edge, lin.graph["lineage_ID"])
-    model.update()
-
-
-def renumber_negative_lineage_IDs(model: Model) -> None:
-    """
-    Ensure lineage IDs are positive.
-
-    Trackpy might not support negative lineage IDs so it is safer to
-    renumber them to positive ones.
+        The pycellin model to export.
 
-    Parameters
-    ----------
-    model : Model
-        The pycellin model to modify.
-    """
-    one_node_lin_IDs = [
-        lin.graph["lineage_ID"]
-        for lin in model.get_cell_lineages()
-        if lin.graph["lineage_ID"] < 0
-    ]
-    for lin_ID in one_node_lin_IDs:
-        lin = model.get_cell_lineage_from_ID(lin_ID)
-        assert lin is not None
-        new_lin_ID = model.get_next_available_lineage_ID()
-        # Update the lineage ID in the graph.
-        lin.graph["lineage_ID"] = new_lin_ID
-        # Update the lineage ID in the cell data.
-        model.data.cell_data.pop(lin_ID)
-        model.data.cell_data[new_lin_ID] = lin
+    Returns
+    -------
+    tuple[dict[Cell, int], set[Cell], set[Cell]]
+        The particle ID of each cell, and the cells that are the first
+        and the last cell of their track.
+    """
+    particle_IDs: dict[Cell, int] = {}
+    first_cells: set[Cell] = set()
+    last_cells: set[Cell] = set()
+    next_ID = model.get_next_available_lineage_ID()
+    one_node_lins: list[tuple[int, set[int]]] = []
+    one_cell_tracks: list[tuple[int, set[int]]] = []
+    for lin_ID, lin in model.data.cell_data.items():
+        div_links = [link for div in lin.get_divisions() for link in lin.out_edges(div)]
+        tracks_graph = nx.restricted_view(lin, [], div_links)
+        # Same track order as the update of the model splitting the lineage.
+        tracks = list(nx.weakly_connected_components(tracks_graph))
+        largest_track: set[int] = set()
+        for track in tracks:
+            if len(track) > len(largest_track):
+                largest_track = track
+        for track in tracks:
+            if track is largest_track:
+                if lin_ID < 0:
+                    one_node_lins.append((lin_ID, track))
+                    continue
+                track_ID = lin_ID
+            elif len(track) == 1:
+                one_cell_tracks.append((lin_ID, track))
+                continue
+            else:
+                track_ID = next_ID
+                next_ID += 1
+            particle_IDs.update((Cell(cid, lin_ID), track_ID) for cid in track)
+        for cid in lin.nodes():
+            if tracks_graph.in_degree(cid) == 0:
+                first_cells.add(Cell(cid, lin_ID))
+            if tracks_graph.out_degree(cid) == 0:
+                last_cells.add(Cell(cid, lin_ID))
+
+    # Trackpy might not support negative IDs, so tracks that would be one-node
+    # lineages are renumbered with positive IDs.
+    for lin_ID, track in one_node_lins + one_cell_tracks:
+        particle_IDs.update((Cell(cid, lin_ID), next_ID) for cid in track)
+        next_ID += 1
+
+    return particle_IDs, first_cells, last_cells
 
 
 def rename_columns_if_exist(df, columns_map):
@@ -172,7 +174,12 @@ def export_trackpy_dataframe(model: Model) -> pd.DataFrame:
 
     Trackpy does not support division events. They will be removed for
     the export so each cell cycle will be represented by a single
-    trackpy track in the dataframe.
+    trackpy track in the dataframe. The model itself is not modified.
+
+    The `is_division`, `is_root` and `is_leaf` properties, when present,
+    describe the exported tracks. The values of the other properties are
+    the ones of the model, computed on the whole lineages, e.g. the absolute
+    age of a cell is counted from the root of its lineage.
 
     Parameters
     ----------
@@ -184,15 +191,23 @@ def export_trackpy_dataframe(model: Model) -> pd.DataFrame:
     pd.DataFrame
         A DataFrame containing trackpy formatted data.
     """
-    # Prepare the model for export.
-    model_copy = copy.deepcopy(model)  # Don't want to modify the original model.
-    safekeep_original_lineage_IDs(model_copy)
-    remove_division_events(model_copy)  # Trackpy does not support division events.
-    renumber_negative_lineage_IDs(model_copy)
+    # Trackpy does not support division events: each cell cycle is exported
+    # as a track, without modifying the original model.
+    df = model.to_cell_dataframe()
+    df["lineage_ID_Pycellin"] = df["lineage_ID"]
+    particle_IDs, first_cells, last_cells = _get_tracks(model)
+    cells = list(map(Cell, df["cell_ID"].tolist(), df["lineage_ID"].tolist()))
+    df["lineage_ID"] = [particle_IDs[cell] for cell in cells]
+    # The topology properties describe the tracks instead of the lineages.
+    if "is_division" in df.columns:
+        df["is_division"] = False
+    if "is_root" in df.columns:
+        df["is_root"] = [cell in first_cells for cell in cells]
+    if "is_leaf" in df.columns:
+        df["is_leaf"] = [cell in last_cells for cell in cells]
 
     # Creation of the trackpy DataFrame.
-    df = model_copy.to_cell_dataframe()
-    frame_prop = _identify_frame_prop(model_copy)
+    frame_prop = _identify_frame_prop(model)
     df = format_dataframe(df, frame_prop)
 
     return df
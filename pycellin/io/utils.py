@@ -1,5 +1,7 @@
+import copy
 import logging
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
 
 import networkx as nx
 
@@ -644,3 +646,239 @@ def _update_lineages_IDs_key(
             else:
                 lin.graph["lineage_ID"] = next_id
                 next_id += 1
+
+
+@dataclass
+class _AttrsTransform:
+    """
+    Changes applied on the fly to the attributes of graph elements during an export.
+
+    Attributes
+    ----------
+    renames : dict[str, str]
+        New keys of the renamed attributes: {old_key: new_key}.
+    excluded : set[str]
+        Keys of the attributes that are not exported, after renaming.
+    constants : dict[str, Any]
+        Values set on all the elements, whatever their current value.
+    defaults : dict[str, Any]
+        Values set on the elements missing the attribute, after renaming.
+    overlays : list[Callable[..., dict[str, Any]]]
+        Functions returning additional or updated attributes for an element.
+        They are called with the key of the element followed by its attributes,
+        and applied before renaming.
+    """
+
+    renames: dict[str, str] = field(default_factory=dict)
+    excluded: set[str] = field(default_factory=set)
+    constants: dict[str, Any] = field(default_factory=dict)
+    defaults: dict[str, Any] = field(default_factory=dict)
+    overlays: list[Callable[..., dict[str, Any]]] = field(default_factory=list)
+
+    def is_identity(self) -> bool:
+        """
+        Return True if the transform does not change the attributes.
+        """
+        return not (
+            self.renames
+            or self.excluded
+            or self.constants
+            or self.defaults
+            or self.overlays
+        )
+
+    def get_source_key(self, key: str) -> str:
+        """
+        Return the key of an exported attribute in the original data.
+
+        Parameters
+        ----------
+        key : str
+            Key of the attribute once exported.
+
+        Returns
+        -------
+        str
+            Key of the attribute in the original data.
+        """
+        for old_key, new_key in self.renames.items():
+            if new_key == key:
+                return old_key
+        return key
+
+    def apply(self, attrs: dict[str, Any], *element_key: Any) -> dict[str, Any]:
+        """
+        Return the attributes of an element as exported.
+
+        The original attributes are not modified.
+
+        Parameters
+        ----------
+        attrs : dict[str, Any]
+            Original attributes of the element.
+        *element_key : Any
+            Key of the element passed to the overlays, e.g. lineage ID and node ID.
+
+        Returns
+        -------
+        dict[str, Any]
+            The exported attributes. If the transform does not change anything,
+            this is the original dictionary itself.
+        """
+        if self.is_identity():
+            return attrs
+        if self.overlays:
+            attrs = dict(attrs)
+            for overlay in self.overlays:
+                attrs.update(overlay(*element_key, attrs))
+        exported = {}
+        for key, value in attrs.items():
+            key = self.renames.get(key, key)
+            if key not in self.excluded:
+                exported[key] = value
+        exported.update(self.constants)
+        for key, value in self.defaults.items():
+            if key not in exported:
+                exported[key] = value
+        return exported
+
+
+class _ExportView:
+    """
+    Read-only view of the cell lineages of a model, as seen by an exporter.
+
+    Export formats have their own requirements on identifiers and properties:
+    nodes must be relabeled, properties renamed, filtered out or set to
+    default values... Instead of applying these changes to a deep copy
+    of the model, they are recorded in the view and applied on the fly
+    while the data is read, so the data of the model is neither copied
+    nor modified. Only the properties metadata is copied, so that it can
+    be modified to describe the exported properties.
+
+    Attributes
+    ----------
+    model : Model
+        Shallow copy of the model, sharing its data but with its own
+        properties metadata. Its data must not be modified.
+    relabel : dict[int, dict[int, int]]
+        New IDs of the relabeled nodes: {lineage_ID: {old_ID: new_ID}}.
+    node, edge, lineage : _AttrsTransform
+        Changes applied to the attributes of the nodes, edges and lineages.
+    """
+
+    def __init__(self, model: Model):
+        """
+        Parameters
+        ----------
+        model : Model
+            Model to export.
+        """
+        self.model = copy.copy(model)
+        self.model.props_metadata = model.props_metadata.copy()
+        self.relabel: dict[int, dict[int, int]] = {}
+        self.node = _AttrsTransform()
+        self.edge = _AttrsTransform()
+        self.lineage = _AttrsTransform()
+
+    def get_node_ID(self, lin_ID: int, nid: int) -> int:
+        """
+        Return the exported ID of a node.
+
+        Parameters
+        ----------
+        lin_ID : int
+            ID of the lineage of the node.
+        nid : int
+            Original ID of the node.
+
+        Returns
+        -------
+        int
+            The ID of the node once exported.
+        """
+        mapping = self.relabel.get(lin_ID)
+        return nid if mapping is None else mapping.get(nid, nid)
+
+    def iter_nodes(self, lin_ID: int) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Iterate over the exported nodes of a lineage.
+
+        Parameters
+        ----------
+        lin_ID : int
+            ID of the lineage.
+
+        Yields
+        ------
+        tuple[int, dict[str, Any]]
+            The exported ID and attributes of each node.
+        """
+        lineage = self.model.data.cell_data[lin_ID]
+        for nid, attrs in lineage.nodes(data=True):
+            yield (
+                self.get_node_ID(lin_ID, nid),
+                self.node.apply(attrs, lin_ID, nid),
+            )
+
+    def iter_edges(self, lin_ID: int) -> Iterator[tuple[int, int, dict[str, Any]]]:
+        """
+        Iterate over the exported edges of a lineage.
+
+        Parameters
+        ----------
+        lin_ID : int
+            ID of the lineage.
+
+        Yields
+        ------
+        tuple[int, int, dict[str, Any]]
+            The exported IDs of the source and target nodes, and the exported
+            attributes of each edge.
+        """
+        lineage = self.model.data.cell_data[lin_ID]
+        for source, target, attrs in lineage.edges(data=True):
+            yield (
+                self.get_node_ID(lin_ID, source),
+                self.get_node_ID(lin_ID, target),
+                self.edge.apply(attrs, lin_ID, source, target),
+            )
+
+    def get_lineage_attrs(self, lin_ID: int) -> dict[str, Any]:
+        """
+        Return the exported attributes of a lineage.
+
+        Parameters
+        ----------
+        lin_ID : int
+            ID of the lineage.
+
+        Returns
+        -------
+        dict[str, Any]
+            The exported attributes of the lineage.
+        """
+        lineage = self.model.data.cell_data[lin_ID]
+        return self.lineage.apply(lineage.graph, lin_ID)
+
+    def materialize(self) -> Model:
+        """
+        Apply the changes of the view to the cell lineages of its model.
+
+        Unlike the other methods, this modifies the data of the model, which is
+        shared with the model the view was created from. It is meant to get
+        the exported model from the view of a copy of a model.
+
+        Returns
+        -------
+        Model
+            The model of the view, with its cell lineages as exported.
+        """
+        for lin_ID, lin in self.model.data.cell_data.items():
+            nodes = list(self.iter_nodes(lin_ID))
+            edges = list(self.iter_edges(lin_ID))
+            lin_attrs = dict(self.get_lineage_attrs(lin_ID))
+            lin.clear()
+            lin.add_nodes_from(nodes)
+            lin.add_edges_from(edges)
+            lin.graph.update(lin_attrs)
+        return self.model
@@ -776,6 +776,223 @@ class TestLineageGetFusions:
 # CellLineage-specific basic operations
 
 
+class TestLineageScan:
+    """Test cases for Lineage.scan method."""
+
+    def test_sum_node_prop(self, cell_lin):
+        """Test scan with a sum over a node property."""
+        result = cell_lin.scan("timepoint")
+        for nid in cell_lin.nodes:
+            ancestors = nx.ancestors(cell_lin, nid) | {nid}
+            expected = sum(cell_lin.nodes[n]["timepoint"] for n in ancestors)
+            assert result[nid] == expected
+
+    def test_no_prop(self, cell_lin):
+        """Test scan without property, i.e. depth plus one."""
+        result = cell_lin.scan()
+        assert result == {n: cell_lin.nodes[n]["timepoint"] + 1 for n in cell_lin.nodes}
+
+    def test_edge_prop(self, cell_lin):
+        """Test scan over an edge property."""
+        for source, target in cell_lin.edges:
+            cell_lin.edges[source, target]["step"] = 0.5
+        result = cell_lin.scan("step", on="edge")
+        assert result[1] == 0
+        assert result[10] == pytest.approx(cell_lin.nodes[10]["timepoint"] * 0.5)
+        assert cell_lin.scan("step", on="edge", initial=10)[1] == 10
+
+    def test_edge_prop_no_identity(self, cell_lin):
+        """Test scan over an edge property with an operation without identity."""
+        for source, target in cell_lin.edges:
+            cell_lin.edges[source, target]["step"] = target
+        with pytest.raises(ValueError):
+            cell_lin.scan("step", op="max", on="edge")
+        result = cell_lin.scan("step", op="max", on="edge", initial=0)
+        assert result[16] == 16
+        assert result[6] == 6
+
+    def test_named_ops(self, cell_lin):
+        """Test scan with the named operations."""
+        assert cell_lin.scan("cell_ID", op="max")[9] == 9
+        assert cell_lin.scan("cell_ID", op="max")[12] == 12
+        assert cell_lin.scan("cell_ID", op="min")[16] == 1
+        assert cell_lin.scan("cell_ID", op="prod")[3] == 6
+        with pytest.raises(ValueError):
+            cell_lin.scan("cell_ID", op="mean")
+        with pytest.raises(ValueError):
+            cell_lin.scan("cell_ID", on="lineage")
+
+    def test_callable_op(self, cell_lin):
+        """Test scan with a Python function."""
+        result = cell_lin.scan("cell_ID", op=lambda acc, x: f"{acc}/{x}")
+        assert result[6] == "1/2/3/4/5/6"
+        assert result[1] == 1
+
+    def test_initial_node_prop(self, cell_lin):
+        """Test scan of a node property with an initial value."""
+        assert cell_lin.scan(initial=10)[1] == 11
+        assert cell_lin.scan(initial=10)[3] == 13
+
+    def test_empty_lineage(self, empty_cell_lin):
+        """Test scan on empty lineage."""
+        assert empty_cell_lin.scan() == {}
+
+    def test_unconnected_component(self, cell_lin_unconnected_component):
+        """Test scan on lineage with several roots."""
+        result = cell_lin_unconnected_component.scan()
+        assert result[17] == 1
+        assert result[18] == 2
+        assert result[16] == 7
+
+    def test_fusion(self, cell_lin):
+        """Test scan on lineage with a fusion."""
+        cell_lin.add_edge(3, 12)
+        with pytest.raises(FusionError):
+            cell_lin.scan()
+
+
+class TestLineageReduceSubtree:
+    """Test cases for Lineage.reduce_subtree method."""
+
+    def test_count(self, cell_lin):
+        """Test reduce_subtree without property, i.e. subtree size."""
+        result = cell_lin.reduce_subtree()
+        for nid in cell_lin.nodes:
+            assert result[nid] == len(nx.descendants(cell_lin, nid)) + 1
+
+    def test_max_node_prop(self, cell_lin):
+        """Test reduce_subtree with the maximum of a node property."""
+        result = cell_lin.reduce_subtree("timepoint", op="max")
+        for nid in cell_lin.nodes:
+            subtree = nx.descendants(cell_lin, nid) | {nid}
+            assert result[nid] == max(cell_lin.nodes[n]["timepoint"] for n in subtree)
+
+    def test_bool_prop(self, cell_lin):
+        """Test reduce_subtree sums booleans as integers."""
+        for nid in cell_lin.nodes:
+            cell_lin.nodes[nid]["is_leaf"] = cell_lin.out_degree(nid) == 0
+        result = cell_lin.reduce_subtree("is_leaf")
+        assert result[1] == 5
+        assert result[4] == 3
+        assert result[6] == 1
+
+    def test_callable_op(self, cell_lin):
+        """Test reduce_subtree with a Python function."""
+        result = cell_lin.reduce_subtree("cell_ID", op=lambda a, b: a + b)
+        assert result[8] == 8 + 9 + 10
+        assert result[1] == sum(range(1, 17))
+
+    def test_empty_lineage(self, empty_cell_lin):
+        """Test reduce_subtree on empty lineage."""
+        assert empty_cell_lin.reduce_subtree() == {}
+
+    def test_unconnected_component(self, cell_lin_unconnected_component):
+        """Test reduce_subtree on lineage with several roots."""
+        result = cell_lin_unconnected_component.reduce_subtree()
+        assert result[17] == 2
+        assert result[1] == 16
+
+
+class TestLineageGetTreeLevels:
+    """Test cases for Lineage.get_tree_levels method."""
+
+    def test_cell_lineage(self, cell_lin):
+        """Test depth and generation of the cells of a lineage."""
+        levels = cell_lin.get_tree_levels()
+        assert len(levels) == len(cell_lin)
+        assert levels[1] == (0, 0)
+        assert levels[2] == (1, 0)
+        assert levels[3] == (2, 1)
+        assert levels[9] == (6, 3)
+        assert levels[16] == (6, 2)
+
+    def test_empty_lineage(self, empty_cell_lin):
+        """Test get_tree_levels on empty lineage."""
+        assert empty_cell_lin.get_tree_levels() == {}
+
+    def test_unconnected_component(self, cell_lin_unconnected_component):
+        """Test get_tree_levels on lineage with several roots."""
+        levels = cell_lin_unconnected_component.get_tree_levels()
+        assert levels[17] == (0, 0)
+        assert levels[18] == (1, 0)
+
+    def test_fusion(self, cell_lin):
+        """Test get_tree_levels raises FusionError on a fusion."""
+        cell_lin.add_edge(9, 15)
+        with pytest.raises(FusionError):
+            cell_lin.get_tree_levels()
+
+
+class TestLineageGetRelatedPairs:
+    """Test cases for Lineage.get_related_pairs method."""
+
+    def test_mother_daughter(self, cell_lin):
+        """Test mother-daughter pairs link the dividing cell to the daughters."""
+        mothers, daughters = cell_lin.get_related_pairs("mother-daughter")
+        assert sorted(zip(mothers, daughters)) == [
+            (2, 3),
+            (2, 11),
+            (4, 5),
+            (4, 7),
+            (8, 9),
+            (8, 10),
+            (14, 15),
+            (14, 16),
+        ]
+
+    def test_sisters(self, cell_lin):
+        """Test each pair of sisters is returned once."""
+        pairs = cell_lin.get_related_pairs("sisters")
+        assert sorted(tuple(sorted(p)) for p in zip(*pairs)) == [
+            (3, 11),
+            (5, 7),
+            (9, 10),
+            (15, 16),
+        ]
+
+    def test_cousins(self, cell_lin):
+        """Test cousins are the daughters of sister cell cycles."""
+        pairs = cell_lin.get_related_pairs("cousins")
+        assert sorted(tuple(sorted(p)) for p in zip(*pairs)) == [
+            (5, 15),
+            (5, 16),
+            (7, 15),
+            (7, 16),
+        ]
+
+    def test_no_division(self, empty_cell_lin):
+        """Test get_related_pairs on a lineage without division."""
+        empty_cell_lin.add_edge(1, 2)
+        assert empty_cell_lin.get_related_pairs("sisters") == ([], [])
+
+    def test_unknown_relation(self, cell_lin):
+        """Test get_related_pairs raises ValueError for an unknown relation."""
+        with pytest.raises(ValueError):
+            cell_lin.get_related_pairs("aunt-niece")
+
+    def test_cycle_lineage(self, cell_lin):
+        """Test get_related_pairs on a cycle lineage."""
+        cycle_lin = CycleLineage("timepoint", 1.0, cell_lin)
+        mothers, daughters = cycle_lin.get_related_pairs("mother-daughter")
+        assert sorted(zip(mothers, daughters)) == [
+            (2, 4),
+            (2, 14),
+            (4, 6),
+            (4, 8),
+            (8, 9),
+            (8, 10),
+            (14, 15),
+            (14, 16),
+        ]
+        pairs = cycle_lin.get_related_pairs("cousins")
+        assert sorted(tuple(sorted(p)) for p in zip(*pairs)) == [
+            (6, 15),
+            (6, 16),
+            (8, 15),
+            (8, 16),
+        ]
+
+
 class TestCellLineageGetNextAvailableNodeID:
     """Test cases for CellLineage._get_next_available_node_ID method."""
 
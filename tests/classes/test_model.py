@@ -5,9 +5,10 @@
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from pycellin.classes import Model, Property
+from pycellin.classes import CellLineage, Data, Model, Property
 from pycellin.custom_types import PropertyType
 from pycellin.graph.properties.tracking import (
     create_absolute_age_property,
@@ -144,3 +145,62 @@ class TestCategorizePropsMockModel:
         assert "mixed_prop" in node_props
         assert "mixed_prop" in edge_props
         assert "mixed_prop" not in lin_props
+
+
+@pytest.fixture()
+def division_model():
+    """
+    Create a model with a lineage of 3 divisions:
+    1 -> 2 -> 3 and 2 -> 4, then 3 -> 5, 3 -> 6 and 4 -> 7 -> 8, 7 -> 9.
+    """
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 1
+    lineage.add_edges_from(
+        [(1, 2), (2, 3), (2, 4), (3, 5), (3, 6), (4, 7), (7, 8), (7, 9)]
+    )
+    frames = {1: 0, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3, 7: 3, 8: 4, 9: 4}
+    for nid, frame in frames.items():
+        lineage.nodes[nid]["frame"] = frame
+        lineage.nodes[nid]["size"] = float(nid)
+    return Model(data=Data({1: lineage}), reference_time_property="frame")
+
+
+class TestPairedValues:
+    """Test cases for Model.paired_values() method."""
+
+    def test_mother_daughter_cell(self, division_model):
+        mothers, daughters = division_model.paired_values(
+            "size", "mother-daughter", level="cell"
+        )
+        assert isinstance(mothers, np.ndarray)
+        pairs = sorted(zip(mothers.tolist(), daughters.tolist()))
+        assert pairs == [
+            (2.0, 3.0),
+            (2.0, 4.0),
+            (3.0, 5.0),
+            (3.0, 6.0),
+            (7.0, 8.0),
+            (7.0, 9.0),
+        ]
+
+    def test_sisters_and_cousins_cycle(self, division_model):
+        division_model.add_cycle_data()
+        first, second = division_model.paired_values("cycle_length", "sisters")
+        pairs = sorted(tuple(sorted(p)) for p in zip(first.tolist(), second.tolist()))
+        # Cycles [3], [4, 7], [5], [6], [8] and [9].
+        assert pairs == [(1, 1), (1, 1), (1, 2)]
+        first, second = division_model.paired_values("cycle_ID", "cousins")
+        pairs = sorted(tuple(sorted(p)) for p in zip(first.tolist(), second.tolist()))
+        assert pairs == [(5, 8), (5, 9), (6, 8), (6, 9)]
+
+    def test_no_cycle_data(self, division_model):
+        with pytest.raises(ValueError):
+            division_model.paired_values("cycle_length")
+
+    def test_unknown_level(self, division_model):
+        with pytest.raises(ValueError):
+            division_model.paired_values("size", level="lineage")
+
+    def test_unknown_lineage(self, division_model):
+        with pytest.raises(KeyError):
+            division_model.paired_values("size", level="cell", lids=[42])
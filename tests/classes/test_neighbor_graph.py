@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for NeighborGraph class from neighbor_graph.py module."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model, PropsMetadata
+from pycellin.classes.neighbor_graph import NeighborGraph, _pairs_to_csr
+from pycellin.custom_types import Cell
+from pycellin.graph.properties.core import create_frame_property
+
+
+def _square(x, y, size=1.0):
+    return [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+
+
+@pytest.fixture
+def data():
+    # Frame 0: cells 1 (lineage 1), 10 and 20 (lineages 2 and 3), on a row
+    # with touching ROIs for 1 and 10. Frame 1: cells 2 and 3 (daughters of 1)
+    # and 11, at the corners of a triangle.
+    lin1 = CellLineage()
+    lin1.graph["lineage_ID"] = 1
+    lin1.add_edges_from([(1, 2), (1, 3)])
+    lin2 = CellLineage()
+    lin2.graph["lineage_ID"] = 2
+    lin2.add_edge(10, 11)
+    lin3 = CellLineage()
+    lin3.graph["lineage_ID"] = 3
+    lin3.add_node(20)
+    cells = {
+        (1, 1): (0, 0.0, 0.0),
+        (10, 2): (0, 1.0, 0.0),
+        (20, 3): (0, 5.0, 0.0),
+        (2, 1): (1, 0.0, 0.0),
+        (3, 1): (1, 4.0, 0.0),
+        (11, 2): (1, 0.0, 3.0),
+    }
+    lineages = {1: lin1, 2: lin2, 3: lin3}
+    for (nid, lin_ID), (frame, x, y) in cells.items():
+        lineages[lin_ID].nodes[nid].update(
+            frame=frame,
+            cell_x=x,
+            cell_y=y,
+            cell_z=0.0,
+            ROI_coords=_square(x, y),
+        )
+    return Data(lineages)
+
+
+def test_pairs_to_csr():
+    indptr, indices = _pairs_to_csr(np.array([2, 0, 0, 2]), np.array([0, 2, 1, 1]), 4)
+    assert indptr.tolist() == [0, 2, 2, 4, 4]
+    assert indices.tolist() == [1, 2, 0, 1]
+
+
+def test_from_delaunay(data):
+    graph = NeighborGraph.from_delaunay(data, "frame")
+    # Aligned cells of frame 0: only consecutive cells are neighbors.
+    assert graph.neighbors(1, 1) == [Cell(10, 2)]
+    assert sorted(graph.neighbors(10, 2)) == [(1, 1), (20, 3)]
+    assert sorted(graph.neighbors(2, 1)) == [(3, 1), (11, 2)]
+    assert graph.number_of_edges() == 5
+
+
+def test_from_delaunay_max_distance(data):
+    graph = NeighborGraph.from_delaunay(data, "frame", max_distance=4.0)
+    assert graph.neighbors(20, 3) == [Cell(10, 2)]
+    assert graph.neighbors(3, 1) == [Cell(2, 1)]
+    assert graph.number_of_edges() == 4
+
+
+def test_from_delaunay_few_cells():
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 1
+    lineage.add_nodes_from([1, 2])
+    for nid in [1, 2]:
+        lineage.nodes[nid].update(frame=0, cell_x=nid, cell_y=0.0, cell_z=0.0)
+    graph = NeighborGraph.from_delaunay(Data({1: lineage}), "frame", ndim=3)
+    assert graph.neighbors(1, 1) == [Cell(2, 1)]
+    with pytest.raises(ValueError):
+        NeighborGraph.from_delaunay(Data({1: lineage}), "frame", ndim=1)
+
+
+def test_from_roi_contacts(data):
+    graph = NeighborGraph.from_roi_contacts(data, "frame")
+    assert graph.neighbors(1, 1) == [Cell(10, 2)]
+    assert graph.neighbors(20, 3) == []
+    assert graph.neighbors(2, 1) == []
+    graph = NeighborGraph.from_roi_contacts(data, "frame", tolerance=3.5)
+    assert sorted(graph.neighbors(10, 2)) == [(1, 1), (20, 3)]
+    assert sorted(graph.neighbors(2, 1)) == [(3, 1), (11, 2)]
+
+
+def test_get_adjacency(data):
+    graph = NeighborGraph.from_delaunay(data, "frame")
+    adjacency = graph.get_adjacency(0)
+    assert adjacency.shape == (3, 3)
+    assert (adjacency != adjacency.T).nnz == 0
+    frame = graph.frames[0]
+    row = frame.cell_IDs.tolist().index(10)
+    assert adjacency[[row]].sum() == 2
+
+
+def test_neighbors_unknown_cell(data):
+    graph = NeighborGraph.from_delaunay(data, "frame")
+    with pytest.raises(KeyError):
+        graph.neighbors(1, 2)
+
+
+def test_model_neighbors(data):
+    props_metadata = PropsMetadata()
+    props_metadata._add_prop(create_frame_property())
+    model = Model(
+        data=data, props_metadata=props_metadata, reference_time_property="frame"
+    )
+    with pytest.raises(ValueError):
+        model.neighbors(1, 1)
+    with pytest.raises(ValueError):
+        model.build_neighbor_graph(method="voronoi")
+    graph = model.build_neighbor_graph(method="contact")
+    assert model.neighbor_graph is graph
+    assert model.neighbors(10, 2) == [Cell(1, 1)]
+    # The neighbor graph is not stored in the lineages.
+    assert model.data.cell_data[1].number_of_edges() == 2
+    restored = pickle.loads(pickle.dumps(model))
+    assert restored.neighbors(10, 2) == [Cell(1, 1)]
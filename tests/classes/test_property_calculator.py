@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for property calculators from property_calculator.py module."""
+
+import pytest
+
+from pycellin.classes import CellLineage, Data
+from pycellin.classes.property_calculator import enrich_fused
+from pycellin.graph.properties.motion import (
+    CellDisplacement,
+    CellSpeed,
+    create_cell_displacement_property,
+    create_cell_speed_property,
+)
+from pycellin.graph.properties.topology import (
+    IsDivision,
+    IsLeaf,
+    create_is_division_property,
+    create_is_leaf_property,
+)
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def data():
+    lineage = CellLineage()
+    lineage.add_edges_from([(1, 2), (2, 3), (2, 4)])
+    for n in lineage.nodes:
+        lineage.nodes[n].update(
+            {"frame": min(n, 3), "cell_x": float(n), "cell_y": 0.0, "cell_z": 0.0}
+        )
+    lineage.graph["lineage_ID"] = 0
+    return Data({0: lineage})
+
+
+# enrich_fused ################################################################
+
+
+def test_enrich_fused_nodes(data):
+    calcs = [
+        IsDivision(create_is_division_property()),
+        IsLeaf(create_is_leaf_property()),
+    ]
+    nodes = [(nid, 0) for nid in data.cell_data[0].nodes]
+    enrich_fused(calcs, data, nodes_to_enrich=nodes)
+    lineage = data.cell_data[0]
+    assert [lineage.nodes[n]["is_division"] for n in [1, 2, 3, 4]] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert [lineage.nodes[n]["is_leaf"] for n in [1, 2, 3, 4]] == [
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_enrich_fused_dependent_edges(data):
+    # Speed uses the displacement computed just before, in the same pass.
+    calcs = [
+        CellDisplacement(create_cell_displacement_property()),
+        CellSpeed(create_cell_speed_property(), "frame"),
+    ]
+    edges = [(source, target, 0) for source, target in data.cell_data[0].edges]
+    enrich_fused(calcs, data, edges_to_enrich=edges)
+    lineage = data.cell_data[0]
+    assert lineage.edges[1, 2]["cell_displacement"] == 1.0
+    assert lineage.edges[2, 4]["cell_displacement"] == 2.0
+    assert lineage.edges[2, 4]["cell_speed"] == 2.0
+
+
+def test_enrich_fused_incompatible_calculators(data):
+    calcs = [
+        IsDivision(create_is_division_property()),
+        CellDisplacement(create_cell_displacement_property()),
+    ]
+    with pytest.raises(ValueError):
+        enrich_fused(calcs, data, nodes_to_enrich=[(1, 0)])
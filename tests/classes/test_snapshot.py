@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for the snapshot format from snapshot.py module."""
+
+import json
+import pickle
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model, PropsMetadata
+from pycellin.classes import snapshot
+from pycellin.classes.snapshot import (
+    _MISSING,
+    LazyLineages,
+    _Column,
+    _encode_column,
+    _get_columns,
+    _props_metadata_from_dict,
+    _props_metadata_to_dict,
+)
+from pycellin.custom_types import Cell
+from pycellin.graph.properties.core import (
+    create_cell_coord_property,
+    create_frame_property,
+)
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def model():
+    # 1 -> 2 -> 3 (division) -> 4 and 3 -> 5, plus a second lineage 10 -> 11.
+    lin1 = CellLineage()
+    lin1.graph.update(lineage_ID=1, lineage_name="first")
+    lin1.add_edges_from([(1, 2), (2, 3), (3, 4), (3, 5)])
+    lin2 = CellLineage()
+    lin2.graph.update(lineage_ID=2, lineage_name="second")
+    lin2.add_edge(10, 11)
+    frames = {1: 0, 2: 1, 3: 2, 4: 3, 5: 3, 10: 0, 11: 1}
+    for lin in (lin1, lin2):
+        for nid in lin.nodes:
+            x = float(nid)
+            lin.nodes[nid].update(
+                frame=frames[nid],
+                cell_x=x,
+                cell_y=0.0,
+                cell_z=0.0,
+                cell_name=f"cell_{nid}",
+                ROI_coords=[(x, 0.0), (x + 1, 0.0), (x + 1, 1.0), (x, 1.0)],
+                histogram=np.arange(nid, dtype=np.int32),
+            )
+        for source, target in lin.edges:
+            lin.edges[source, target]["displacement"] = 1.0
+    # Attributes missing from some nodes, and attributes that cannot be
+    # stored as arrays.
+    lin1.nodes[3]["is_curated"] = True
+    lin1.nodes[4]["is_curated"] = False
+    lin1.nodes[1]["notes"] = {"author": "me"}
+    props_metadata = PropsMetadata()
+    props_metadata._add_prop(create_frame_property())
+    props_metadata._add_prop(create_cell_coord_property(axis="x", unit="um"))
+    model = Model(
+        data=Data({1: lin1, 2: lin2}),
+        props_metadata=props_metadata,
+        reference_time_property="frame",
+    )
+    model.add_cycle_data()
+    model.add_pycellin_properties(["division_time", "depth"])
+    model.update()
+    return model
+
+
+def _assert_same_lineages(lineages, other_lineages):
+    assert list(lineages) == list(other_lineages)
+    for lin_ID, lin in lineages.items():
+        other = other_lineages[lin_ID]
+        assert type(other) is type(lin)
+        assert nx.is_frozen(other) == nx.is_frozen(lin)
+        assert other.graph == lin.graph
+        assert list(other.nodes) == list(lin.nodes)
+        assert list(other.edges) == list(lin.edges)
+        for nid, attrs in lin.nodes(data=True):
+            other_attrs = other.nodes[nid]
+            assert other_attrs.keys() == attrs.keys()
+            for key, value in attrs.items():
+                if isinstance(value, np.ndarray):
+                    assert other_attrs[key].dtype == value.dtype
+                    assert np.array_equal(other_attrs[key], value)
+                else:
+                    assert type(other_attrs[key]) is type(value)
+                    assert other_attrs[key] == value
+        for source, target, attrs in lin.edges(data=True):
+            assert other.edges[source, target] == attrs
+
+
+# Columns #####################################################################
+
+
+@pytest.mark.parametrize(
+    "values, kind",
+    [
+        ([1, 2, -3], "scalar"),
+        ([1.5, float("nan")], "scalar"),
+        ([True, False], "scalar"),
+        (["a", "bc", ""], "scalar"),
+        ([[1, 2], [], [3]], "ragged"),
+        ([(1.0, 2.0), (3.0,)], "ragged"),
+        ([[(0.0, 1.0), (2.0, 3.0)], [(4.0, 5.0)]], "ragged"),
+        ([[[0, 1]], [[2, 3], [4, 5]]], "ragged"),
+        ([np.zeros((2, 3)), np.ones((1, 3))], "ragged"),
+        ([1, 2.5], "object"),
+        ([1, None], "object"),
+        ([[1, 2.5]], "object"),
+        ([[(0.0, 1.0)], [(2.0,)]], "object"),
+        ([{"a": 1}], "object"),
+        ([2**70], "object"),
+    ],
+)
+def test_encode_decode_column(tmp_path, values, kind):
+    desc, encoded = _encode_column(values)
+    assert desc["kind"] == kind
+    if isinstance(encoded, dict):
+        for name, array in encoded.items():
+            np.save(tmp_path / f"0.{name}.npy", array)
+    else:
+        with open(tmp_path / "0.pkl", "wb") as file:
+            pickle.dump(encoded, file)
+    column = _Column(tmp_path, 0, {"name": "prop", "masked": False, **desc}, False)
+    decoded = column.get_values(0, len(values))
+    assert len(decoded) == len(values)
+    for value, decoded_value in zip(values, decoded):
+        if isinstance(value, np.ndarray):
+            assert np.array_equal(decoded_value, value)
+        elif value != value:
+            assert decoded_value != decoded_value
+        else:
+            assert type(decoded_value) is type(value)
+            assert decoded_value == value
+
+
+def test_column_get_values_masked(tmp_path):
+    values = [[1, 2], [3], [], [4, 5, 6]]
+    desc, encoded = _encode_column(values)
+    for name, array in encoded.items():
+        np.save(tmp_path / f"0.{name}.npy", array)
+    np.save(tmp_path / "0.mask.npy", np.array([True, False, True, True, False, True]))
+    column = _Column(tmp_path, 0, {"name": "prop", "masked": True, **desc}, True)
+    assert column.get_values(0, 6) == values
+    assert column.get_values(1, 4) == [[3], []]
+    assert column.get_values(4, 5) == []
+    assert column.get_values(4, 6) == [[4, 5, 6]]
+
+
+def test_get_columns():
+    columns = _get_columns([{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+    assert columns == {"a": ([1, 3], None), "b": ([2, 4], None)}
+    columns = _get_columns([{"a": 1}, {"b": 2}, {"a": 3}])
+    assert columns["a"][0] == [1, 3]
+    assert columns["a"][1].tolist() == [True, False, True]
+    assert columns["b"][0] == [2]
+    assert _MISSING not in columns["b"][0]
+    assert _get_columns([{}, {}]) == {}
+
+
+def test_props_metadata_round_trip(model):
+    props_dict = _props_metadata_to_dict(model.props_metadata)
+    json.dumps(props_dict)
+    props_metadata = _props_metadata_from_dict(props_dict)
+    assert props_metadata == model.props_metadata
+    assert props_metadata._get_protected_props() == (
+        model.props_metadata._get_protected_props()
+    )
+
+
+# Save and load ###############################################################
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_load(tmp_path, model, mmap, lazy):
+    path = tmp_path / "model.pycellin"
+    model.save(path)
+    loaded = Model.load(path, mmap=mmap, lazy=lazy)
+    assert isinstance(loaded.data.cell_data, LazyLineages) is lazy
+    assert loaded.model_metadata == model.model_metadata
+    assert loaded.props_metadata == model.props_metadata
+    assert loaded.reference_time_property == model.reference_time_property
+    _assert_same_lineages(model.data.cell_data, loaded.data.cell_data)
+    _assert_same_lineages(model.data.cycle_data, loaded.data.cycle_data)
+    assert loaded.data.cycle_data[1].graph["lineage_ID"] == 1
+    # Calculators are restored and bound to the loaded data and properties.
+    assert loaded._updater._calculators.keys() == model._updater._calculators.keys()
+    calc = loaded._updater._calculators["depth"]
+    assert calc.prop is loaded.props_metadata.props["depth"]
+    if mmap:
+        histogram = loaded.data.cell_data[1].nodes[3]["histogram"]
+        assert not histogram.flags.writeable
+
+
+def test_save_load_then_update(tmp_path, model):
+    model.save(tmp_path / "model")
+    loaded = Model.load(tmp_path / "model")
+    loaded.remove_cell(5, 1)
+    assert loaded.is_update_required()
+    loaded.update()
+    assert 5 not in loaded.data.cell_data[1]
+    assert loaded.data.cell_data[1].nodes[4]["depth"] == 3
+    # The original model is not impacted.
+    assert 5 in model.data.cell_data[1]
+
+
+def test_save_load_pending_update(tmp_path, model):
+    model.remove_cell(5, 1)
+    model.save(tmp_path / "model")
+    loaded = Model.load(tmp_path / "model")
+    assert loaded.is_update_required()
+    loaded.update()
+    assert not loaded.is_update_required()
+
+
+def test_save_load_without_cycle_data(tmp_path):
+    lin = CellLineage(lid=1)
+    lin.add_edge(1, 2)
+    lin.nodes[1]["frame"] = 0
+    lin.nodes[2]["frame"] = 1
+    model = Model(data=Data({1: lin}), reference_time_property="frame")
+    model.save(tmp_path / "model")
+    loaded = Model.load(tmp_path / "model")
+    assert loaded.data.cycle_data is None
+    _assert_same_lineages(model.data.cell_data, loaded.data.cell_data)
+
+
+def test_save_load_empty_model(tmp_path):
+    with pytest.warns(UserWarning):
+        model = Model(reference_time_property="frame")
+    model.save(tmp_path / "model")
+    loaded = Model.load(tmp_path / "model")
+    assert loaded.data.cell_data == {}
+    assert loaded.model_metadata == model.model_metadata
+
+
+def test_save_load_neighbor_graph(tmp_path, model):
+    model.build_neighbor_graph(method="delaunay")
+    model.save(tmp_path / "model")
+    loaded = Model.load(tmp_path / "model")
+    assert loaded.neighbors(10, 2) == model.neighbors(10, 2)
+    assert loaded.neighbors(11, 2) == [Cell(2, 1)]
+
+
+def test_save_overwrites_snapshot(tmp_path, model):
+    path = tmp_path / "model"
+    model.save(path)
+    model.remove_lineage(2)
+    model.save(path)
+    loaded = Model.load(path)
+    assert list(loaded.data.cell_data) == [1]
+    # No temporary directory is left behind.
+    assert [p.name for p in tmp_path.iterdir()] == ["model"]
+
+
+def test_save_does_not_overwrite_other_files(tmp_path, model):
+    path = tmp_path / "results"
+    path.mkdir()
+    (path / "data.csv").write_text("a,b")
+    with pytest.raises(FileExistsError):
+        model.save(path)
+    assert (path / "data.csv").exists()
+
+
+def test_save_non_serializable_metadata(tmp_path, model):
+    model.model_metadata.callback = print
+    with pytest.raises(TypeError):
+        model.save(tmp_path / "model")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_invalid_snapshot(tmp_path, model):
+    with pytest.raises(FileNotFoundError):
+        Model.load(tmp_path / "missing")
+    path = tmp_path / "model"
+    model.save(path)
+    metadata = json.loads((path / "metadata.json").read_text())
+    metadata["version"] += 1
+    (path / "metadata.json").write_text(json.dumps(metadata))
+    with pytest.raises(ValueError):
+        Model.load(path)
+
+
+# Open ########################################################################
+
+
+def test_open_builds_lineages_lazily(tmp_path, model):
+    model.save(tmp_path / "model")
+    opened = Model.open(tmp_path / "model")
+    cell_data = opened.data.cell_data
+    assert isinstance(cell_data, LazyLineages)
+    assert list(cell_data) == [1, 2]
+    assert 2 in cell_data and 3 not in cell_data
+    assert not cell_data.is_built(1) and not cell_data.is_built(2)
+    assert "2 lineages, 0 built" in repr(cell_data)
+    lin = cell_data[2]
+    assert cell_data.is_built(2) and not cell_data.is_built(1)
+    assert cell_data[2] is lin
+    _assert_same_lineages(model.data.cell_data, cell_data)
+    _assert_same_lineages(model.data.cycle_data, opened.data.cycle_data)
+    assert not cell_data[1].nodes[3]["histogram"].flags.writeable
+    with pytest.raises(KeyError):
+        cell_data.is_built(3)
+
+
+@pytest.mark.parametrize("lids", [None, [2], [1, 2]])
+def test_open_to_dataframe(tmp_path, model, lids):
+    for lin in model.data.cell_data.values():
+        for nid in lin.nodes:
+            lin.nodes[nid]["cell_ID"] = nid
+    model.save(tmp_path / "model")
+    opened = Model.open(tmp_path / "model")
+    for method in (
+        "to_cell_dataframe",
+        "to_link_dataframe",
+        "to_lineage_dataframe",
+        "to_cycle_dataframe",
+    ):
+        df = getattr(opened, method)(lids)
+        expected = getattr(model, method)(lids)
+        pd.testing.assert_frame_equal(df, expected, check_like=True)
+    # The dataframes are read from the snapshot arrays.
+    assert not any(opened.data.cell_data.is_built(lin_ID) for lin_ID in [1, 2])
+    # Built lineages may have been modified, so they are read from the graphs.
+    opened.data.cell_data[2].nodes[10]["cell_x"] = -1.0
+    df = opened.to_cell_dataframe(lids)
+    if lids != [1]:
+        assert -1.0 in df["cell_x"].tolist()
+
+
+def test_open_then_modify(tmp_path, model):
+    path = tmp_path / "model"
+    model.save(path)
+    opened = Model.open(path)
+    opened.remove_lineage(2)
+    opened.remove_cell(5, 1)
+    opened.update()
+    assert list(opened.data.cell_data) == [1]
+    # The snapshot is not modified.
+    _assert_same_lineages(model.data.cell_data, Model.load(path).data.cell_data)
+    opened.save(tmp_path / "modified")
+    loaded = Model.load(tmp_path / "modified")
+    _assert_same_lineages(opened.data.cell_data, loaded.data.cell_data)
+    assert 5 not in loaded.data.cell_data[1]
+
+
+def test_open_pickle(tmp_path, model):
+    model.save(tmp_path / "model")
+    opened = Model.open(tmp_path / "model")
+    unpickled = pickle.loads(pickle.dumps(opened))
+    assert type(unpickled.data.cell_data) is dict
+    _assert_same_lineages(model.data.cell_data, unpickled.data.cell_data)
+
+
+def test_open_invalid_mode(tmp_path, model):
+    model.save(tmp_path / "model")
+    with pytest.raises(ValueError):
+        Model.open(tmp_path / "model", mode="r+")
+
+
+# Incremental save ############################################################
+
+
+def _read_manifest(path):
+    return json.loads((path / "metadata.json").read_text())
+
+
+def _assert_same_model(model, path):
+    loaded = Model.load(path)
+    assert loaded.props_metadata == model.props_metadata
+    _assert_same_lineages(model.data.cell_data, loaded.data.cell_data)
+    _assert_same_lineages(model.data.cycle_data, loaded.data.cycle_data)
+    opened = Model.open(path)
+    _assert_same_lineages(model.data.cell_data, opened.data.cell_data)
+    # Only the segments of the manifest are left in the snapshot.
+    segments = {segment["dir"] for segment in _read_manifest(path)["segments"]}
+    assert {f"segments/{p.name}" for p in (path / "segments").iterdir()} == segments
+    assert sorted(p.name for p in path.iterdir()) == ["metadata.json", "segments"]
+
+
+def test_save_incremental(tmp_path, model):
+    path = tmp_path / "model"
+    model.save(path)
+    model.set_cell_props(10, 2, {"cell_x": -1.0})
+    model.update()
+    model.save(path, incremental=True)
+    manifest = _read_manifest(path)
+    assert len(manifest["segments"]) == 2
+    assert manifest["lineages"]["cell"] == {"ids": [1, 2], "segments": [0, 1]}
+    assert manifest["state"] == 1
+    assert manifest["segments"][1]["tables"]["cell_lineages"]["length"] == 1
+    _assert_same_model(model, path)
+
+
+def test_save_incremental_added_and_removed_lineages(tmp_path, model):
+    path = tmp_path / "model"
+    model.save(path)
+    model.remove_lineage(2)
+    model.add_lineage(lid=3)
+    model.add_cell(3, 20, time_value=0, prop_values={"cell_x": 0.0})
+    # The pending update is saved, then the update of the model.
+    model.save(path, incremental=True)
+    assert _read_manifest(path)["lineages"]["cell"]["segments"] == [0, 1]
+    _assert_same_model(model, path)
+    model.update()
+    model.save(path, incremental=True)
+    _assert_same_model(model, path)
+    loaded = Model.load(path)
+    assert loaded.is_update_required() == model.is_update_required()
+
+
+def test_save_incremental_after_load(tmp_path, model):
+    path = tmp_path / "model"
+    model.save(path)
+    for loaded in (Model.load(path), Model.open(path)):
+        loaded.remove_cell(5, 1)
+        loaded.update()
+        loaded.save(path, incremental=True)
+        _assert_same_model(loaded, path)
+        model = loaded
+    # Lineage 2 was never modified, so it is still in the first segment.
+    assert _read_manifest(path)["lineages"]["cell"]["segments"][1] == 0
+
+
+def test_save_incremental_full_write(tmp_path, model):
+    path = tmp_path / "model"
+    # Never saved to this path.
+    model.save(path, incremental=True)
+    assert len(_read_manifest(path)["segments"]) == 1
+    # The properties have changed.
+    model.add_pycellin_property("generation")
+    model.update()
+    model.save(path, incremental=True)
+    assert len(_read_manifest(path)["segments"]) == 1
+    _assert_same_model(model, path)
+    # The snapshot has been overwritten by another model.
+    other = Model.load(path)
+    other.remove_cell(5, 1)
+    other.update()
+    other.save(path)
+    model.set_cell_props(10, 2, {"cell_x": -1.0})
+    model.save(path, incremental=True)
+    assert len(_read_manifest(path)["segments"]) == 1
+    _assert_same_model(model, path)
+
+
+def test_save_incremental_compaction(tmp_path, model, monkeypatch):
+    path = tmp_path / "model"
+    model.save(path)
+    nb_segments = []
+    for x in range(3):
+        model.set_cell_props(10, 2, {"cell_x": float(x)})
+        model.update()
+        model.save(path, incremental=True)
+        nb_segments.append(len(_read_manifest(path)["segments"]))
+        _assert_same_model(model, path)
+    # Segments without current lineages are removed.
+    assert nb_segments == [2, 2, 2]
+    monkeypatch.setattr(snapshot, "_MAX_SEGMENTS", 2)
+    model.set_cell_props(10, 2, {"cell_x": -1.0})
+    model.save(path, incremental=True)
+    assert len(_read_manifest(path)["segments"]) == 1
+    _assert_same_model(model, path)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for UpdateContext class from update_context.py"""
+
+import math
+
+import pytest
+
+from pycellin.classes import CellLineage, Data
+from pycellin.classes.update_context import UpdateContext
+from pycellin.graph.properties.tracking import AbsoluteAge, RelativeAge
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def cell_lin():
+    lineage = CellLineage()
+    lineage.add_edges_from([(1, 2), (2, 3), (3, 4), (3, 5), (5, 6)])
+    for n in lineage.nodes:
+        lineage.nodes[n]["cell_ID"] = n
+        lineage.nodes[n]["cell_x"] = float(n)
+        lineage.nodes[n]["cell_y"] = 2.0 * n
+        lineage.nodes[n]["cell_z"] = 0.0
+    for n, frame in zip([1, 2, 3, 4, 5, 6], [0, 1, 2, 3, 3, 4]):
+        lineage.nodes[n]["frame"] = frame
+    lineage.graph["lineage_ID"] = 0
+    return lineage
+
+
+# UpdateContext ###############################################################
+
+
+def test_memoize(cell_lin):
+    context = UpdateContext()
+    calls = []
+
+    def func(lin):
+        calls.append(lin)
+        return len(lin)
+
+    assert context.memoize("size", cell_lin, func) == 6
+    assert context.memoize("size", cell_lin, func) == 6
+    assert len(calls) == 1
+    assert len(context) == 1
+
+
+def test_memoize_different_lineages(cell_lin):
+    context = UpdateContext()
+    other_lin = CellLineage()
+    other_lin.add_node(10)
+    assert context.memoize("size", cell_lin, len) == 6
+    assert context.memoize("size", other_lin, len) == 1
+    assert len(context) == 2
+
+
+def test_clear(cell_lin):
+    context = UpdateContext()
+    context.get_root(cell_lin)
+    context.clear()
+    assert len(context) == 0
+
+
+def test_get_root(cell_lin):
+    context = UpdateContext()
+    assert context.get_root(cell_lin) == cell_lin.get_root()
+
+
+def test_get_cell_cycle(cell_lin):
+    context = UpdateContext()
+    for cid in cell_lin.nodes:
+        assert context.get_cell_cycle(cell_lin, cid) == cell_lin.get_cell_cycle(cid)
+
+
+def test_get_cell_cycle_missing_cell(cell_lin):
+    context = UpdateContext()
+    with pytest.raises(KeyError):
+        context.get_cell_cycle(cell_lin, 42)
+
+
+def test_get_cell_coords(cell_lin):
+    context = UpdateContext()
+    index, coords = context.get_cell_coords(cell_lin)
+    assert coords.shape == (6, 3)
+    for cid in cell_lin.nodes:
+        assert tuple(coords[index[cid]]) == (float(cid), 2.0 * cid, 0.0)
+
+
+def test_get_edge_distances(cell_lin):
+    context = UpdateContext()
+    distances = context.get_edge_distances(cell_lin)
+    assert set(distances) == set(cell_lin.edges())
+    assert distances[(1, 2)] == pytest.approx(math.sqrt(5))
+    assert distances[(3, 5)] == pytest.approx(2 * math.sqrt(5))
+
+
+def test_get_edge_distances_no_edges():
+    context = UpdateContext()
+    lineage = CellLineage()
+    lineage.add_node(1, cell_x=0.0, cell_y=0.0, cell_z=0.0)
+    assert context.get_edge_distances(lineage) == {}
+
+
+# Calculators with context ####################################################
+
+
+def test_calculators_same_results_with_context(cell_lin):
+    data = Data({0: cell_lin})
+    context = UpdateContext()
+    for calc in [AbsoluteAge(None, "frame"), RelativeAge(None, "frame")]:
+        for nid in cell_lin.nodes:
+            expected = calc.compute(data, cell_lin, nid)
+            assert calc.compute(data, cell_lin, nid, context=context) == expected
+    assert len(context) > 0
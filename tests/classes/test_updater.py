@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for ModelUpdater class from updater.py module."""
+
+import math
+
+import networkx as nx
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model, PropsMetadata
+from pycellin.classes.exceptions import ProtectedPropertyError, TimeFlowError
+from pycellin.classes import updater
+from pycellin.classes.update_report import CalculatorRun, UpdateReport
+from pycellin.classes.updater import _expand_to_footprint
+from pycellin.custom_types import Link
+from pycellin.graph.properties.core import (
+    create_cell_coord_property,
+    create_link_coord_property,
+    create_timepoint_property,
+)
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def cell_lin():
+    # 1 -> 2 -> 3 -> 4
+    #           |
+    #           -> 5 -> 6
+    lineage = CellLineage()
+    lineage.add_edges_from([(1, 2), (2, 3), (3, 4), (3, 5), (5, 6)])
+    lineage.graph["lineage_ID"] = 1
+    return lineage
+
+
+def _build_model():
+    cell_data = {}
+    for lin_ID, offset in [(1, 0), (2, 100)]:
+        lineage = CellLineage()
+        lineage.add_edges_from(
+            [
+                (offset + 1, offset + 2),
+                (offset + 2, offset + 3),
+                (offset + 3, offset + 4),
+                (offset + 3, offset + 5),
+                (offset + 5, offset + 6),
+            ]
+        )
+        for n in lineage.nodes:
+            lineage.nodes[n]["cell_ID"] = n
+            lineage.nodes[n]["timepoint"] = nx.shortest_path_length(
+                lineage, offset + 1, n
+            )
+            lineage.nodes[n]["cell_x"] = float(n)
+            lineage.nodes[n]["cell_y"] = float(n % 3)
+            lineage.nodes[n]["cell_z"] = 0.0
+        lineage.graph["lineage_ID"] = lin_ID
+        cell_data[lin_ID] = lineage
+
+    props_metadata = PropsMetadata()
+    props_metadata._add_prop(create_timepoint_property())
+    for axis in "xyz":
+        props_metadata._add_prop(create_cell_coord_property(axis=axis, unit="um"))
+    model = Model(
+        data=Data(cell_data),
+        props_metadata=props_metadata,
+        reference_time_property="timepoint",
+    )
+    model.add_cycle_data()
+    model.add_absolute_age()
+    model.add_relative_age()
+    model.add_division_time()
+    model.add_angle()
+    model.add_straightness()
+    model.update()
+    return model
+
+
+def _add_cell_with_link(model, source, cid, time_value):
+    coords = {"cell_x": 0.0, "cell_y": 1.0, "cell_z": 0.0}
+    model.add_cell(1, cid=cid, time_value=time_value, prop_values=coords)
+    model.add_link(source, 1, cid, 1)
+
+
+def _assert_same_values(values, expected):
+    assert values.keys() == expected.keys()
+    for key, value in values.items():
+        if isinstance(value, float) and math.isnan(value):
+            assert math.isnan(expected[key])
+        else:
+            assert value == expected[key]
+
+
+# _expand_to_footprint ########################################################
+
+
+def test_expand_to_footprint_ancestors(cell_lin):
+    assert _expand_to_footprint(cell_lin, {3}, "ancestors") == {3, 4, 5, 6}
+
+
+def test_expand_to_footprint_descendants(cell_lin):
+    assert _expand_to_footprint(cell_lin, {5}, "descendants") == {1, 2, 3, 5}
+
+
+def test_expand_to_footprint_cycle(cell_lin):
+    # Cycles of 4 and of its parent 3.
+    assert _expand_to_footprint(cell_lin, {4}, "cycle") == {1, 2, 3, 4}
+    assert _expand_to_footprint(cell_lin, {6}, "cycle") == {5, 6}
+
+
+def test_expand_to_footprint_lineage(cell_lin):
+    assert _expand_to_footprint(cell_lin, {6}, "lineage") == set(cell_lin.nodes)
+
+
+# Region-scoped update ########################################################
+
+
+def test_update_unmodified_lineage_not_recomputed():
+    model = _build_model()
+    model.data.cell_data[2].nodes[106]["absolute_age"] = -1
+    model.data.cycle_data[2].nodes[106]["straightness"] = -1
+    _add_cell_with_link(model, source=6, cid=7, time_value=5)
+    model.update()
+    assert model.data.cell_data[2].nodes[106]["absolute_age"] == -1
+    assert model.data.cycle_data[2].nodes[106]["straightness"] == -1
+
+
+def test_update_out_of_footprint_not_recomputed():
+    model = _build_model()
+    # Relative age of 4 only depends on its own cell cycle.
+    model.data.cell_data[1].nodes[4]["relative_age"] = -1
+    _add_cell_with_link(model, source=6, cid=7, time_value=5)
+    model.update()
+    assert model.data.cell_data[1].nodes[4]["relative_age"] == -1
+    assert model.data.cell_data[1].nodes[7]["relative_age"] == 2
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda model: model.remove_cell(5, 1),
+        lambda model: model.remove_link(3, 4, 1),
+        lambda model: model.remove_link(2, 3, 1),
+        lambda model: _add_cell_with_link(model, source=2, cid=7, time_value=2),
+    ],
+)
+def test_update_same_values_as_full_update(edit):
+    model = _build_model()
+    edit(model)
+    model.update()
+    expected_model = _build_model()
+    edit(expected_model)
+    expected_model.prepare_full_data_update()
+    expected_model.update()
+
+    for lin_ID, lineage in model.data.cell_data.items():
+        expected_lin = expected_model.data.cell_data[lin_ID]
+        for nid in lineage.nodes:
+            _assert_same_values(lineage.nodes[nid], expected_lin.nodes[nid])
+    for lin_ID, lineage in model.data.cycle_data.items():
+        expected_lin = expected_model.data.cycle_data[lin_ID]
+        for nid in lineage.nodes:
+            _assert_same_values(lineage.nodes[nid], expected_lin.nodes[nid])
+
+
+def test_remove_cell_records_removed_links():
+    model = _build_model()
+    model.remove_cell(3, 1)
+    assert model._updater._removed_links == {
+        Link(2, 3, 1),
+        Link(3, 4, 1),
+        Link(3, 5, 1),
+    }
+
+
+# Property-level change tracking ##############################################
+
+
+def test_set_cell_props_recomputes_dependent_props():
+    model = _build_model()
+    lineage = model.data.cell_data[1]
+    # Sentinels on values that don't depend on cell coordinates.
+    lineage.nodes[6]["absolute_age"] = -1
+    model.data.cell_data[2].nodes[102]["angle"] = -1
+    model.set_cell_props(2, 1, {"cell_y": 5.0})
+    assert model.is_update_required()
+    model.update()
+
+    expected_model = _build_model()
+    expected_model.data.cell_data[1].nodes[2]["cell_y"] = 5.0
+    expected_model.prepare_full_data_update()
+    expected_model.update()
+    expected_lin = expected_model.data.cell_data[1]
+    for nid in [1, 2, 3]:
+        _assert_same_values(lineage.nodes[nid], expected_lin.nodes[nid])
+    assert lineage.nodes[6]["absolute_age"] == -1
+    assert model.data.cell_data[2].nodes[102]["angle"] == -1
+    expected_cycle_lin = expected_model.data.cycle_data[1]
+    for nid in model.data.cycle_data[1].nodes:
+        _assert_same_values(
+            model.data.cycle_data[1].nodes[nid], expected_cycle_lin.nodes[nid]
+        )
+
+
+def test_set_cell_props_time_prop():
+    model = _build_model()
+    model.set_cell_props(6, 1, {"timepoint": 6})
+    model.update()
+    assert model.data.cell_data[1].nodes[6]["absolute_age"] == 6
+    assert model.data.cell_data[1].nodes[6]["relative_age"] == 3
+    assert model.data.cycle_data[1].nodes[6]["division_time"] == 4
+
+
+def test_set_cell_props_time_flow_error():
+    model = _build_model()
+    with pytest.raises(TimeFlowError):
+        model.set_cell_props(3, 1, {"timepoint": 5})
+    assert model.data.cell_data[1].nodes[3]["timepoint"] == 2
+
+
+def test_set_cell_props_errors():
+    model = _build_model()
+    with pytest.raises(KeyError):
+        model.set_cell_props(42, 1, {"cell_x": 0.0})
+    with pytest.raises(KeyError):
+        model.set_cell_props(2, 42, {"cell_x": 0.0})
+    with pytest.raises(KeyError):
+        model.set_cell_props(2, 1, {"not_declared": 0.0})
+    model.props_metadata._protected_props.append("cell_x")
+    with pytest.raises(ProtectedPropertyError):
+        model.set_cell_props(2, 1, {"cell_x": 0.0})
+    assert not model.is_update_required()
+
+
+def test_set_link_props():
+    model = _build_model()
+    model.props_metadata._add_prop(create_link_coord_property(axis="x", unit="um"))
+    model.set_link_props(2, 3, 1, {"link_x": 1.5})
+    assert model.data.cell_data[1].edges[2, 3]["link_x"] == 1.5
+    assert model._updater._modified_link_props == {Link(2, 3, 1): {"link_x"}}
+    with pytest.raises(KeyError):
+        model.set_link_props(2, 4, 1, {"link_x": 1.5})
+
+
+# Fused local calculators #####################################################
+
+
+def test_update_fuses_consecutive_local_calculators(monkeypatch):
+    model = _build_model()
+    model.add_pycellin_properties(["is_division", "is_leaf", "is_root"])
+    fused_calls = []
+    original_enrich_fused = updater.enrich_fused
+
+    def spy(calculators, *args, **kwargs):
+        fused_calls.append([calc.prop.identifier for calc in calculators])
+        original_enrich_fused(calculators, *args, **kwargs)
+
+    monkeypatch.setattr(updater, "enrich_fused", spy)
+    model.update()
+    assert fused_calls == [["is_division", "is_leaf", "is_root"]]
+    lineage = model.data.cell_data[1]
+    assert lineage.nodes[3]["is_division"] is True
+    assert lineage.nodes[6]["is_leaf"] is True
+    assert lineage.nodes[1]["is_root"] is True
+
+
+def test_update_does_not_fuse_unfusable_calculators(monkeypatch):
+    model = _build_model()
+    model.add_pycellin_properties(["is_division", "is_leaf", "is_root"])
+    calcs = model._updater._calculators
+    monkeypatch.setattr(calcs["is_leaf"], "is_fusable", lambda: False)
+    fused_calls = []
+    original_enrich_fused = updater.enrich_fused
+
+    def spy(calculators, *args, **kwargs):
+        fused_calls.append([calc.prop.identifier for calc in calculators])
+        original_enrich_fused(calculators, *args, **kwargs)
+
+    monkeypatch.setattr(updater, "enrich_fused", spy)
+    model.update()
+    assert fused_calls == []
+    assert model.data.cell_data[1].nodes[6]["is_leaf"] is True
+
+
+# Profiling ###################################################################
+
+
+def test_update_profile():
+    model = _build_model()
+    model.add_pycellin_properties(["is_division", "is_leaf"])
+    report = model.update(profile=True)
+    assert set(report.phases) == {
+        "lineages_cleanup",
+        "split_components",
+        "objects_selection",
+        "cell_properties",
+        "cycle_rebuild",
+        "cycle_properties",
+    }
+    assert report.total_time == pytest.approx(sum(report.phases.values()))
+
+    df = report.to_dataframe()
+    assert list(df["property"]) == [
+        "absolute_age",
+        "relative_age",
+        "angle",
+        "is_division",
+        "is_leaf",
+        "division_time",
+        "straightness",
+    ]
+    df = df.set_index("property")
+    # Fused calculators are timed separately.
+    for prop in ["is_division", "is_leaf"]:
+        assert df.loc[prop, "fused"]
+        assert df.loc[prop, "nb_objects"] == 12
+        assert df.loc[prop, "wall_time"] > 0
+    assert not df.loc["angle", "fused"]
+    # Cell cycles are computed once and then reused.
+    assert df.loc["relative_age", "cache_misses"] == 2
+    assert df.loc["relative_age", "cache_hits"] == 10
+    assert "is_division" in str(report)
+
+
+def test_update_report_str():
+    runs = [
+        CalculatorRun("a_very_long_property_name", "A", "CellLineage", 1.0, 3, 0, 0),
+        CalculatorRun("short", "B", "CellLineage", 2.0, None, 1, 2, fused=True),
+    ]
+    report = UpdateReport(phases={"cell_properties": 3.0}, runs=runs, total_time=3.0)
+    lines = str(report).splitlines()
+    assert lines[4].startswith("  short ")
+    assert lines[4].endswith("(fused)")
+    # Times are aligned whatever the length of the names.
+    assert len({line.index(".") for line in [lines[2], lines[4], lines[5]]}) == 1
+
+
+def test_update_no_profile():
+    model = _build_model()
+    model.prepare_full_data_update()
+    assert model.update() is None
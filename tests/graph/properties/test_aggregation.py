@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for aggregation property classes from graph.properties."""
+
+import pytest
+
+from pycellin.classes import CellLineage, Data, Property
+from pycellin.graph.properties.aggregation import SubtreeReduction, TreeScan
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def data():
+    # 1 -> 2 -> 3 -> 4 and 2 -> 5 -> 6, plus a second lineage 10 -> 11.
+    lin1 = CellLineage()
+    lin1.graph["lineage_ID"] = 1
+    lin1.add_edges_from([(1, 2), (2, 3), (3, 4), (2, 5), (5, 6)])
+    for nid in lin1.nodes:
+        lin1.nodes[nid]["area"] = float(nid)
+    for source, target in lin1.edges:
+        lin1.edges[source, target]["displacement"] = 2.0
+    lin2 = CellLineage()
+    lin2.graph["lineage_ID"] = 2
+    lin2.add_edge(10, 11)
+    lin2.nodes[10]["area"] = 1.0
+    lin2.nodes[11]["area"] = 3.0
+    lin2.edges[10, 11]["displacement"] = 5.0
+    return Data({1: lin1, 2: lin2})
+
+
+def _create_prop(identifier):
+    return Property(
+        identifier=identifier,
+        name=identifier,
+        description=identifier,
+        provenance="test",
+        prop_type="node",
+        lin_type="CellLineage",
+        dtype="float",
+    )
+
+
+# TreeScan ####################################################################
+
+
+def test_tree_scan_enrich(data):
+    calc = TreeScan(_create_prop("total_displacement"), "displacement", on="edge")
+    calc.enrich(data)
+    lin1 = data.cell_data[1]
+    assert lin1.nodes[1]["total_displacement"] == 0
+    assert lin1.nodes[4]["total_displacement"] == 6.0
+    assert lin1.nodes[5]["total_displacement"] == 4.0
+    assert data.cell_data[2].nodes[11]["total_displacement"] == 5.0
+
+
+def test_tree_scan_enrich_subset(data, monkeypatch):
+    calls = []
+    original_scan = CellLineage.scan
+
+    def spy(self, *args, **kwargs):
+        calls.append(self.graph["lineage_ID"])
+        return original_scan(self, *args, **kwargs)
+
+    monkeypatch.setattr(CellLineage, "scan", spy)
+    calc = TreeScan(_create_prop("max_area"), "area", op="max")
+    calc.enrich(data, [(4, 1), (6, 1)])
+    # The lineage is scanned once for all its nodes.
+    assert calls == [1]
+    assert data.cell_data[1].nodes[4]["max_area"] == 4.0
+    assert "max_area" not in data.cell_data[1].nodes[3]
+
+
+def test_tree_scan_compute(data):
+    calc = TreeScan(_create_prop("generation_size"), None)
+    assert calc.compute(data, data.cell_data[1], 6) == 4
+    assert calc.get_inputs() == set()
+    assert calc.get_footprint() == "ancestors"
+
+
+# SubtreeReduction ############################################################
+
+
+def test_subtree_reduction_enrich(data):
+    calc = SubtreeReduction(_create_prop("progeny_area"), "area")
+    calc.enrich(data)
+    lin1 = data.cell_data[1]
+    assert lin1.nodes[1]["progeny_area"] == 21.0
+    assert lin1.nodes[5]["progeny_area"] == 11.0
+    assert data.cell_data[2].nodes[10]["progeny_area"] == 4.0
+
+
+def test_subtree_reduction_compute(data):
+    calc = SubtreeReduction(_create_prop("progeny_size"), None)
+    assert calc.compute(data, data.cell_data[1], 2) == 5
+    assert calc.get_inputs() == set()
+    assert calc.get_footprint() == "descendants"
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for morphology property classes from graph.properties."""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model
+import pycellin.graph.properties.morphology as morpho
+from pycellin.io.trackmate.loader import load_TrackMate_XML
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def rod_lin():
+    # A single rod-shaped cell: a 40x10 rectangle.
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 0
+    lineage.add_node(
+        1, ROI_coords=[(10.0, 10.0), (50.0, 10.0), (50.0, 20.0), (10.0, 20.0)]
+    )
+    return lineage
+
+
+@pytest.fixture
+def width_prop():
+    return morpho.create_rod_width_property(None, unit="pixel")
+
+
+@pytest.fixture
+def length_prop():
+    return morpho.create_rod_length_property(None, unit="pixel")
+
+
+@pytest.fixture
+def count_computations(monkeypatch):
+    calls = []
+    original = morpho.get_width_and_length
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(morpho, "get_width_and_length", counting)
+    return calls
+
+
+@pytest.fixture
+def branched_skel():
+    # A horizontal line of 9 pixels with a 2 pixels side branch
+    # and a 4 pixels side branch.
+    skel = np.zeros((10, 13), dtype=bool)
+    skel[5, 2:11] = True
+    skel[3:5, 4] = True
+    skel[6:10, 8] = True
+    return skel
+
+
+# Skeleton graph ##############################################################
+
+
+def test_count_skel_neighbors(branched_skel):
+    nb_neighbors = morpho.count_skel_neighbors(branched_skel)
+    assert np.all(nb_neighbors[~branched_skel] == 0)
+    assert nb_neighbors[5, 2] == 1
+    assert nb_neighbors[5, 3] == 3
+    assert nb_neighbors[5, 6] == 2
+    assert nb_neighbors[3, 4] == 1
+    assert np.count_nonzero(nb_neighbors == 1) == 4
+
+
+def test_from_skel_to_graph(branched_skel):
+    pixels, graph = morpho.from_skel_to_graph(branched_skel)
+    assert len(pixels) == np.count_nonzero(branched_skel)
+    assert graph.shape == (len(pixels), len(pixels))
+    assert (graph != graph.T).nnz == 0
+    degrees = np.asarray(graph.sum(axis=1)).ravel()
+    nb_neighbors = morpho.count_skel_neighbors(branched_skel)
+    assert np.array_equal(degrees, nb_neighbors[pixels[:, 0], pixels[:, 1]])
+
+
+def test_from_skel_to_path_simple():
+    skel = np.zeros((8, 8), dtype=bool)
+    skel[1, 1:4] = True
+    skel[2:5, 4] = True
+    path = morpho.from_skel_to_path(skel, morpho.count_skel_neighbors(skel))
+    assert len(path) == 6
+    assert {tuple(path[0]), tuple(path[-1])} == {(1, 1), (4, 4)}
+    steps = np.abs(np.diff(path, axis=0)).max(axis=1)
+    assert np.all(steps == 1)
+
+
+def test_from_skel_to_path_pruning(branched_skel):
+    nb_neighbors = morpho.count_skel_neighbors(branched_skel)
+    path = morpho.from_skel_to_path(branched_skel, nb_neighbors)
+    # The longest path goes from the left tip to the tip of the long branch.
+    assert {tuple(path[0]), tuple(path[-1])} == {(5, 2), (9, 8)}
+    assert (3, 4) not in {tuple(px) for px in path}
+    steps = np.abs(np.diff(path, axis=0)).max(axis=1)
+    assert np.all(steps == 1)
+
+
+# (lineage_ID, cell_ID): (rod width, rod length) of the cells of the E. coli
+# sample data with a branched skeleton, for which several shortest paths
+# link the tips of the main skeleton.
+_BRANCHED_SKEL_DIMENSIONS = {
+    (0, 9080): (0.4972420218286229, 4.131429278658118),
+    (0, 9104): (0.494869205991858, 2.8251228303250784),
+    (0, 9274): (0.5557555343308906, 5.952322273978106),
+    (0, 9326): (0.530259139994922, 6.577661233628781),
+    (0, 9441): (0.5847986094324765, 8.49516296414055),
+    (1, 9202): (0.5199105443283162, 4.651143279650888),
+    (2, 9026): (0.5436824188648499, 4.712550832123401),
+    (2, 9115): (0.5061630811404005, 5.259936924260776),
+    (2, 9173): (0.4923382461844728, 3.4706369186061536),
+    (2, 9174): (0.49238580379207, 4.301176715909432),
+    (2, 9175): (0.5054203988227791, 4.489709040764558),
+    (2, 9184): (0.5634440741396306, 8.443213092249184),
+    (2, 9200): (0.574802865740967, 4.070407924996979),
+    (2, 9213): (0.4990925150265937, 5.267851147125238),
+    (2, 9365): (0.5622017971364751, 7.583031183084368),
+    (2, 9366): (0.5346213196400532, 7.0066394981380276),
+    (2, 9394): (0.4728964649415418, 5.202026161300512),
+    (2, 9414): (0.5090540246629233, 5.516371855416202),
+    (2, 9431): (0.5065824773536894, 5.115401528128013),
+}
+
+
+def test_get_width_and_length_branched_skel_sample_data():
+    xml_path = (
+        Path(__file__).resolve().parents[3]
+        / "sample_data"
+        / "Ecoli_growth_on_agar_pad.xml"
+    )
+    model = load_TrackMate_XML(xml_path)
+    pixel_size = model.get_pixel_size()["width"]
+    for (lin_ID, nid), expected in _BRANCHED_SKEL_DIMENSIONS.items():
+        lineage = model.data.cell_data[lin_ID]
+        dims = morpho.get_width_and_length(nid, lineage, pixel_size)
+        assert dims == pytest.approx(expected, rel=1e-12)
+
+
+def test_from_skel_to_path_loop():
+    skel = np.zeros((6, 6), dtype=bool)
+    skel[1, 1:5] = True
+    skel[4, 1:5] = True
+    skel[1:5, 1] = True
+    skel[1:5, 4] = True
+    path = morpho.from_skel_to_path(skel, morpho.count_skel_neighbors(skel))
+    assert path.shape == (0, 2)
+
+
+def test_get_width_and_length_one_pixel_skel(rod_lin, monkeypatch):
+    def one_pixel_skel(img, method):
+        skel = np.zeros_like(img, dtype=bool)
+        skel[3, 3] = True
+        return skel
+
+    monkeypatch.setattr(morpho, "skeletonize", one_pixel_skel)
+    with pytest.warns(UserWarning, match="One pixel skeleton"):
+        width, length = morpho.get_width_and_length(1, rod_lin, 1.0)
+    assert math.isnan(width) and math.isnan(length)
+
+
+def test_get_width_and_length_wrong_method(rod_lin):
+    with pytest.raises(ValueError):
+        morpho.get_width_and_length(1, rod_lin, 1.0, method_width="mode")
+
+
+# RodWidth and RodLength ######################################################
+
+
+def test_rod_dimensions(rod_lin, width_prop, length_prop):
+    width = morpho.RodWidth(width_prop, 1.0).compute(rod_lin, 1)
+    length = morpho.RodLength(length_prop, 1.0).compute(rod_lin, 1)
+    assert width == pytest.approx(10, abs=2)
+    assert length == pytest.approx(40, abs=3)
+
+
+def test_rod_dimensions_shared_cache(
+    rod_lin, width_prop, length_prop, count_computations
+):
+    cache = morpho.RodDimensionsCache()
+    width_calc = morpho.RodWidth(width_prop, 1.0, cache=cache)
+    length_calc = morpho.RodLength(length_prop, 1.0, cache=cache)
+    width = width_calc.compute(rod_lin, 1)
+    length = length_calc.compute(rod_lin, 1)
+    assert count_computations == [1]
+    assert len(cache) == 1
+    assert (width, length) == morpho.get_width_and_length(1, rod_lin, 1.0)
+
+
+def test_rod_dimensions_cache_unchanged_roi(rod_lin, width_prop, count_computations):
+    calc = morpho.RodWidth(width_prop, 1.0)
+    calc.compute(rod_lin, 1)
+    calc.compute(rod_lin, 1)
+    assert count_computations == [1]
+
+
+def test_rod_dimensions_cache_changed_roi(rod_lin, length_prop, count_computations):
+    calc = morpho.RodLength(length_prop, 1.0)
+    length = calc.compute(rod_lin, 1)
+    rod_lin.nodes[1]["ROI_coords"] = [
+        (10.0, 10.0),
+        (70.0, 10.0),
+        (70.0, 20.0),
+        (10.0, 20.0),
+    ]
+    new_length = calc.compute(rod_lin, 1)
+    assert count_computations == [1, 1]
+    assert new_length > length
+
+
+def test_rod_dimensions_cache_changed_parameters(
+    rod_lin, width_prop, count_computations
+):
+    cache = morpho.RodDimensionsCache()
+    morpho.RodWidth(width_prop, 1.0, cache=cache).compute(rod_lin, 1)
+    morpho.RodWidth(width_prop, 1.0, method_width="max", cache=cache).compute(
+        rod_lin, 1
+    )
+    assert count_computations == [1, 1]
+
+
+def test_rod_dimensions_cache_clear(rod_lin, width_prop, count_computations):
+    calc = morpho.RodWidth(width_prop, 1.0)
+    calc.compute(rod_lin, 1)
+    calc.cache.clear()
+    assert len(calc.cache) == 0
+    calc.compute(rod_lin, 1)
+    assert count_computations == [1, 1]
+
+
+def test_rod_dimensions_cache_key_digest(rod_lin):
+    roi = rod_lin.nodes[1]["ROI_coords"]
+    key = morpho.RodDimensionsCache.get_key(roi, (1.0,))
+    assert key == morpho.RodDimensionsCache.get_key(np.array(roi), (1.0,))
+    assert isinstance(key[0], bytes) and len(key[0]) == 16
+    assert key != morpho.RodDimensionsCache.get_key(roi[::-1], (1.0,))
+
+
+def test_rod_dimensions_cache_drops_changed_roi(rod_lin):
+    cache = morpho.RodDimensionsCache()
+    cache.store(rod_lin, 1, (1.0,), (10.0, 40.0))
+    rod_lin.nodes[1]["ROI_coords"] = [(0.0, 0.0), (5.0, 0.0), (5.0, 5.0)]
+    assert cache.lookup(rod_lin, 1, (1.0,)) is None
+    assert len(cache) == 0
+
+
+def test_rod_dimensions_cache_max_size(rods_data):
+    lin = rods_data.cell_data[0]
+    cache = morpho.RodDimensionsCache(max_size=3)
+    for nid in range(3):
+        cache.store(lin, nid, (1.0,), (nid, nid))
+    # Node 0 becomes the most recently used entry, so node 1 is evicted.
+    assert cache.lookup(lin, 0, (1.0,)) == (0, 0)
+    cache.store(lin, 3, (1.0,), (3, 3))
+    assert len(cache) == 3
+    assert cache.lookup(lin, 1, (1.0,)) is None
+    assert cache.lookup(lin, 0, (1.0,)) == (0, 0)
+
+
+def test_rod_dimensions_cache_invalid_max_size():
+    with pytest.raises(ValueError, match="max_size"):
+        morpho.RodDimensionsCache(max_size=0)
+
+
+def test_rod_dimensions_cache_prune(rods_data, rod_nodes, width_prop):
+    calc = morpho.RodWidth(width_prop, 1.0)
+    calc.enrich(rods_data, rod_nodes)
+    assert len(calc.cache) == 10
+    rods_data.cell_data[0].remove_node(4)
+    del rods_data.cell_data[1]
+    calc.enrich(rods_data, [(0, 0)])
+    assert len(calc.cache) == 4
+
+
+def test_rod_dimensions_enrich_hashes_once(
+    rods_data, rod_nodes, width_prop, monkeypatch
+):
+    calls = []
+    original = morpho.RodDimensionsCache.get_key
+
+    def counting(roi, params):
+        calls.append(roi)
+        return original(roi, params)
+
+    monkeypatch.setattr(morpho.RodDimensionsCache, "get_key", staticmethod(counting))
+    calc = morpho.RodWidth(width_prop, 1.0)
+    calc.enrich(rods_data, rod_nodes)
+    assert len(calls) == len(rod_nodes)
+    calc.enrich(rods_data, rod_nodes)
+    assert len(calls) == 2 * len(rod_nodes)
+
+
+def test_rod_dimensions_separate_caches(rod_lin, width_prop, length_prop):
+    width_calc = morpho.RodWidth(width_prop, 1.0)
+    length_calc = morpho.RodLength(length_prop, 1.0)
+    assert width_calc.cache is not length_calc.cache
+    assert not math.isnan(width_calc.compute(rod_lin, 1))
+
+
+def test_model_rod_calculators_share_cache():
+    model = Model(data=Data({}), reference_time_property="frame")
+    model.add_rod_width()
+    model.add_rod_length()
+    calcs = model._updater._calculators
+    assert calcs["rod_width"].cache is calcs["rod_length"].cache
+
+
+# Parallel computation ########################################################
+
+
+@pytest.fixture
+def rods_data():
+    # 2 lineages of growing rod-shaped cells.
+    lineages = {}
+    for lin_ID in range(2):
+        lineage = CellLineage()
+        lineage.graph["lineage_ID"] = lin_ID
+        for nid in range(5):
+            length = 20.0 + 5 * nid + lin_ID
+            lineage.add_node(
+                nid, ROI_coords=[(0.0, 0.0), (length, 0.0), (length, 8.0), (0.0, 8.0)]
+            )
+        lineage.add_edges_from([(i, i + 1) for i in range(4)])
+        lineages[lin_ID] = lineage
+    return Data(lineages)
+
+
+@pytest.fixture
+def rod_nodes(rods_data):
+    return [(nid, lin_ID) for lin_ID, lin in rods_data.cell_data.items() for nid in lin]
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_rod_dimensions_parallel(rods_data, rod_nodes, length_prop, use_threads):
+    expected = {
+        (nid, lin_ID): morpho.get_width_and_length(
+            nid, rods_data.cell_data[lin_ID], 1.0
+        )[1]
+        for nid, lin_ID in rod_nodes
+    }
+    calc = morpho.RodLength(
+        length_prop, 1.0, workers=2, chunk_size=3, use_threads=use_threads
+    )
+    calc.enrich(rods_data, rod_nodes)
+    for nid, lin_ID in rod_nodes:
+        assert rods_data.cell_data[lin_ID].nodes[nid]["rod_length"] == expected[
+            (nid, lin_ID)
+        ]
+    assert len(calc.cache) == len(rod_nodes)
+
+
+def test_rod_dimensions_enrich_uses_cache(
+    rods_data, rod_nodes, width_prop, length_prop, count_computations, monkeypatch
+):
+    cache = morpho.RodDimensionsCache()
+    width_calc = morpho.RodWidth(width_prop, 1.0, cache=cache, chunk_size=4)
+    length_calc = morpho.RodLength(length_prop, 1.0, cache=cache, chunk_size=4)
+    computed = []
+    original = morpho._compute_roi_chunk
+
+    def counting(func, nids, coords, offsets):
+        computed.extend(nids)
+        return original(func, nids, coords, offsets)
+
+    monkeypatch.setattr(morpho, "_compute_roi_chunk", counting)
+    width_calc.enrich(rods_data, rod_nodes)
+    length_calc.enrich(rods_data, rod_nodes)
+    assert len(computed) == len(rod_nodes)
+    for nid, lin_ID in rod_nodes:
+        attrs = rods_data.cell_data[lin_ID].nodes[nid]
+        assert (attrs["rod_width"], attrs["rod_length"]) == cache.lookup(
+            rods_data.cell_data[lin_ID], nid, width_calc._get_params()
+        )
+
+
+def test_roi_calculator_progress(rods_data, rod_nodes, width_prop, capsys):
+    calc = morpho.RodWidth(width_prop, 1.0, chunk_size=4, progress=True)
+    calc.enrich(rods_data, rod_nodes)
+    err = capsys.readouterr().err
+    assert "rod_width: 4/10 cells" in err
+    assert err.endswith("rod_width: 10/10 cells\n")
+
+
+def test_roi_calculator_is_fusable(width_prop):
+    assert morpho.RodWidth(width_prop, 1.0).is_fusable()
+    assert not morpho.RodWidth(width_prop, 1.0, workers=2).is_fusable()
+    assert not morpho.RodWidth(width_prop, 1.0, progress=True).is_fusable()
+
+
+def test_roi_calculator_invalid_workers(width_prop):
+    with pytest.raises(ValueError):
+        morpho.RodWidth(width_prop, 1.0, workers=0)
+    with pytest.raises(ValueError):
+        morpho.RodWidth(width_prop, 1.0, chunk_size=0)
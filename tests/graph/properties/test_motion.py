@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for motion property classes from graph.properties."""
+
+import math
+
+import numpy as np
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model, PropsMetadata
+from pycellin.graph.properties.core import (
+    create_cell_coord_property,
+    create_frame_property,
+)
+import pycellin.graph.properties.motion as motion
+
+
+# Fixtures ####################################################################
+
+
+def _naive_msd(positions, mask):
+    msd = []
+    for lag in range(len(positions)):
+        values = [
+            np.sum((positions[i + lag] - positions[i]) ** 2)
+            for i in range(len(positions) - lag)
+            if mask[i] and mask[i + lag]
+        ]
+        msd.append(np.mean(values) if values else math.nan)
+    return np.array(msd)
+
+
+@pytest.fixture
+def trajectory():
+    rng = np.random.default_rng(0)
+    positions = np.cumsum(rng.normal(size=(50, 3)), axis=0) + 500.0
+    mask = rng.random(50) > 0.3
+    mask[0] = mask[-1] = True
+    return positions, mask
+
+
+@pytest.fixture
+def moving_data():
+    # 1 -> 2 -> 3 -> 4 (division) -> 5 -> 6 and 4 -> 7 -> 9, with a gap at frame 5.
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 1
+    lineage.add_edges_from([(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (4, 7), (7, 9)])
+    frames = {1: 0, 2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 4, 9: 6}
+    # Constant velocity of 2 along x before the division and for cell 5-6,
+    # constant velocity of 1 along y for cells 7-9.
+    locations = {
+        1: (0.0, 0.0),
+        2: (2.0, 0.0),
+        3: (4.0, 0.0),
+        4: (6.0, 0.0),
+        5: (8.0, 0.0),
+        6: (10.0, 0.0),
+        7: (6.0, 1.0),
+        9: (6.0, 3.0),
+    }
+    for nid, frame in frames.items():
+        x, y = locations[nid]
+        lineage.nodes[nid].update(frame=frame, cell_x=x, cell_y=y, cell_z=0.0)
+    return Data({1: lineage})
+
+
+# FFT correlations ############################################################
+
+
+def test_get_msd_sums(trajectory):
+    positions, mask = trajectory
+    sums, counts = motion.get_msd_sums(positions, mask)
+    with np.errstate(invalid="ignore"):
+        msd = sums / counts
+    assert np.allclose(msd, _naive_msd(positions, mask), equal_nan=True)
+    assert counts[0] == mask.sum()
+
+
+def test_get_vacf_sums(trajectory):
+    positions, mask = trajectory
+    sums, counts = motion.get_vacf_sums(positions, mask, time_step=2.0)
+    velocities = np.diff(positions, axis=0) / 2.0
+    vel_mask = mask[1:] & mask[:-1]
+    for lag in [0, 1, 7]:
+        products = [
+            velocities[i] @ velocities[i + lag]
+            for i in range(len(velocities) - lag)
+            if vel_mask[i] and vel_mask[i + lag]
+        ]
+        assert counts[lag] == len(products)
+        assert sums[lag] == pytest.approx(np.sum(products))
+
+
+def test_get_msd_sums_single_point():
+    sums, counts = motion.get_msd_sums(np.ones((1, 3)), np.array([True]))
+    assert sums.tolist() == [0.0]
+    assert counts.tolist() == [1.0]
+
+
+# Calculators #################################################################
+
+
+def test_cycle_msd_with_gap(moving_data):
+    cycle_lin = moving_data._compute_cycle_lineage("frame", 1, 1)
+    calc = motion.CycleMSD(
+        motion.create_cycle_msd_property(unit="um^2"), "frame", time_step=1
+    )
+    # Cells 7 and 9 are 2 frames apart: no displacement for a lag of 1.
+    msd = calc.compute(moving_data, cycle_lin, 9)
+    assert msd[0] == 0.0
+    assert math.isnan(msd[1])
+    assert msd[2] == pytest.approx(4.0)
+    # Constant velocity: MSD grows as the square of the lag.
+    msd = calc.compute(moving_data, cycle_lin, 4)
+    assert msd == pytest.approx([0.0, 4.0, 16.0, 36.0])
+
+
+def test_cycle_vacf(moving_data):
+    cycle_lin = moving_data._compute_cycle_lineage("frame", 1, 1)
+    calc = motion.CycleVACF(
+        motion.create_cycle_vacf_property(), "frame", time_step=1, max_lag=1
+    )
+    assert calc.compute(moving_data, cycle_lin, 4) == pytest.approx([4.0, 4.0])
+    assert calc.get_inputs() == {"frame", "cell_x", "cell_y", "cell_z"}
+
+
+def test_lineage_msd(moving_data):
+    cycle_lin = moving_data._compute_cycle_lineage("frame", 1, 1)
+    calc = motion.LineageMSD(motion.create_lineage_msd_property(), "frame", 1)
+    msd = calc.compute(moving_data, cycle_lin)
+    # Lag 1: 3 displacements of 2 for cycle 4, 1 of 2 for cycle 6.
+    assert msd[1] == pytest.approx(4.0)
+    # Lag 2: 2 of 4 for cycle 4, 1 of 2 for cycle 9.
+    assert msd[2] == pytest.approx((2 * 16.0 + 4.0) / 3)
+
+
+def test_cycles_correlation_sums(moving_data):
+    cycle_lin = moving_data._compute_cycle_lineage("frame", 1, 1)
+    sums, counts = motion.get_cycles_correlation_sums(
+        "msd", moving_data, cycle_lin, [4, 9], "frame", 1, max_lag=2
+    )
+    # Lag 1: 3 displacements of 2 for cycle 4, none for cycle 9.
+    # Lag 2: 2 of 4 for cycle 4, 1 of 2 for cycle 9.
+    assert sums.tolist() == pytest.approx([0.0, 12.0, 36.0])
+    assert counts.tolist() == [6.0, 3.0, 3.0]
+
+
+def test_model_msd_properties(moving_data):
+    props_metadata = PropsMetadata()
+    props_metadata._add_prop(create_frame_property())
+    for axis in "xyz":
+        props_metadata._add_prop(create_cell_coord_property(axis=axis, unit="um"))
+    model = Model(
+        data=moving_data,
+        props_metadata=props_metadata,
+        reference_time_property="frame",
+    )
+    model.model_metadata.space_unit = "um"
+    model.add_cycle_data()
+    model.add_pycellin_properties(["cycle_msd", "lineage_vacf"])
+    assert model.props_metadata.props["cycle_msd"].unit == "um^2"
+    model.update()
+    cycle_lin = model.data.cycle_data[1]
+    assert cycle_lin.nodes[4]["cycle_msd"] == pytest.approx([0.0, 4.0, 16.0, 36.0])
+    assert cycle_lin.graph["lineage_vacf"][0] == pytest.approx(4.0)
+
+
+def test_model_ensemble_msd(moving_data):
+    model = Model(data=moving_data, reference_time_property="frame")
+    with pytest.raises(ValueError):
+        model.ensemble_msd()
+    model.add_cycle_data()
+    lags, msd = model.ensemble_msd(max_lag=2)
+    assert lags.tolist() == [0, 1, 2]
+    assert msd[2] == pytest.approx((2 * 16.0 + 4.0) / 3)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for neighborhood property classes from graph.properties."""
+
+import math
+
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model, PropsMetadata
+from pycellin.classes.update_context import UpdateContext
+from pycellin.graph.properties.core import (
+    create_cell_coord_property,
+    create_frame_property,
+)
+import pycellin.graph.properties.neighborhood as nbh
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def data():
+    # Lineage 1: 1 -> 2, dividing into 3 and 4 at frame 1.
+    # Lineage 2: 10 -> 11, a single track.
+    lin1 = CellLineage()
+    lin1.graph["lineage_ID"] = 1
+    lin1.add_edges_from([(1, 2), (2, 3), (2, 4)])
+    lin2 = CellLineage()
+    lin2.graph["lineage_ID"] = 2
+    lin2.add_edges_from([(10, 11), (11, 12)])
+    cells = {
+        (1, 1): (0, 0.0, 0.0),
+        (2, 1): (1, 0.0, 0.0),
+        (3, 1): (2, -1.0, 0.0),
+        (4, 1): (2, 1.0, 0.0),
+        (10, 2): (0, 3.0, 0.0),
+        (11, 2): (1, 3.0, 4.0),
+        (12, 2): (2, 4.0, 0.0),
+    }
+    lineages = {1: lin1, 2: lin2}
+    for (nid, lin_ID), (frame, x, y) in cells.items():
+        lineage = lineages[lin_ID]
+        lineage.nodes[nid].update(frame=frame, cell_x=x, cell_y=y, cell_z=0.0)
+    return Data(lineages)
+
+
+# FrameIndex ##################################################################
+
+
+def test_frame_index(data):
+    index = nbh.FrameIndex(data, "frame")
+    assert sorted(index.frames) == [0, 1, 2]
+    time, row = index.locate(4, 1)
+    assert time == 2
+    assert index.frames[2].cell_IDs[row] == 4
+    assert index.frames[2].coords[row].tolist() == [1.0, 0.0, 0.0]
+
+
+def test_frame_index_sister_keys(data):
+    index = nbh.FrameIndex(data, "frame")
+    keys = dict(zip(index.frames[2].cell_IDs.tolist(), index.get_sister_keys(2)))
+    assert keys[3] == keys[4] >= 0
+    assert keys[12] == -1
+
+
+def test_frame_index_empty():
+    assert nbh.FrameIndex(Data({}), "frame").frames == {}
+
+
+def test_get_frame_index_shared(data):
+    context = UpdateContext()
+    index = nbh.get_frame_index(data, "frame", context)
+    assert nbh.get_frame_index(data, "frame", context) is index
+    assert nbh.get_frame_index(data, "frame") is not index
+
+
+# Calculators #################################################################
+
+
+def test_neighbor_count(data):
+    calc = nbh.NeighborCount(nbh.create_neighbor_count_property(), 2.5, "frame")
+    calc.enrich(data)
+    assert data.cell_data[1].nodes[3]["neighbor_count"] == 1
+    assert data.cell_data[1].nodes[4]["neighbor_count"] == 1
+    assert data.cell_data[1].nodes[2]["neighbor_count"] == 0
+    assert data.cell_data[2].nodes[12]["neighbor_count"] == 0
+    assert calc.get_footprint() == "model"
+
+
+def test_local_density(data):
+    calc = nbh.LocalDensity(nbh.create_local_density_property(), 3.0, "frame")
+    assert calc.compute(data, data.cell_data[1], 4) == pytest.approx(
+        3 / (math.pi * 9)
+    )
+    calc = nbh.LocalDensity(
+        nbh.create_local_density_property(), 3.0, "frame", ndim=3
+    )
+    assert calc.compute(data, data.cell_data[2], 12) == pytest.approx(
+        2 / (4 / 3 * math.pi * 27)
+    )
+    with pytest.raises(ValueError):
+        nbh.LocalDensity(nbh.create_local_density_property(), 3.0, "frame", ndim=1)
+
+
+def test_nearest_non_sister_distance(data):
+    calc = nbh.NearestNonSisterDistance(
+        nbh.create_nearest_non_sister_distance_property(), "frame"
+    )
+    calc.enrich(data)
+    # Cell 4 is closer to its sister 3 than to cell 12, but sisters are ignored.
+    assert data.cell_data[1].nodes[4]["nearest_non_sister_distance"] == 3.0
+    assert data.cell_data[2].nodes[12]["nearest_non_sister_distance"] == 3.0
+    assert data.cell_data[1].nodes[1]["nearest_non_sister_distance"] == 3.0
+
+
+def test_nearest_non_sister_distance_no_candidate():
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 1
+    lineage.add_edges_from([(1, 2), (1, 3)])
+    for nid, x in [(1, 0.0), (2, -1.0), (3, 1.0)]:
+        frame = int(nid > 1)
+        lineage.nodes[nid].update(frame=frame, cell_x=x, cell_y=0.0, cell_z=0.0)
+    data = Data({1: lineage})
+    calc = nbh.NearestNonSisterDistance(
+        nbh.create_nearest_non_sister_distance_property(), "frame"
+    )
+    assert math.isnan(calc.compute(data, lineage, 2))
+    assert math.isnan(calc.compute(data, lineage, 1))
+
+
+def test_nearest_non_sister_distance_many_sisters():
+    # All the nearest cells are sisters: the query must be widened.
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 1
+    daughters = list(range(2, 12))
+    lineage.add_edges_from((1, d) for d in daughters)
+    lineage.nodes[1].update(frame=0, cell_x=0.0, cell_y=0.0, cell_z=0.0)
+    for d in daughters:
+        lineage.nodes[d].update(frame=1, cell_x=0.1 * d, cell_y=0.0, cell_z=0.0)
+    other = CellLineage()
+    other.graph["lineage_ID"] = 2
+    other.add_node(20, frame=1, cell_x=50.0, cell_y=0.0, cell_z=0.0)
+    data = Data({1: lineage, 2: other})
+    calc = nbh.NearestNonSisterDistance(
+        nbh.create_nearest_non_sister_distance_property(), "frame"
+    )
+    assert calc.compute(data, lineage, 2) == pytest.approx(49.8)
+
+
+def test_model_neighborhood_properties(data):
+    props_metadata = PropsMetadata()
+    props_metadata._add_prop(create_frame_property())
+    for axis in "xyz":
+        props_metadata._add_prop(create_cell_coord_property(axis=axis, unit="um"))
+    model = Model(
+        data=data, props_metadata=props_metadata, reference_time_property="frame"
+    )
+    model.model_metadata.space_unit = "um"
+    model.add_neighbor_count(radius=2.5)
+    model.add_local_density(radius=2.5)
+    model.add_nearest_non_sister_distance()
+    assert model.props_metadata.props["local_density"].unit == "1/um^2"
+    model.update()
+    attrs = model.data.cell_data[1].nodes[3]
+    assert attrs["neighbor_count"] == 1
+    assert attrs["nearest_non_sister_distance"] == 5.0
+    assert attrs["local_density"] == pytest.approx(2 / (math.pi * 2.5**2))
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for shape property classes from graph.properties."""
+
+import math
+
+import numpy as np
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model
+from pycellin.classes.update_context import UpdateContext
+import pycellin.graph.properties.shape as shape
+
+
+# Fixtures ####################################################################
+
+
+RECTANGLE = [(0.0, 0.0), (4.0, 0.0), (4.0, 2.0), (0.0, 2.0)]
+# Square rotated by 45 degrees, with a side of sqrt(2).
+DIAMOND = [(1.0, 0.0), (2.0, 1.0), (1.0, 2.0), (0.0, 1.0)]
+# Non convex polygon: a 3x3 square missing its top right 1x1 corner.
+L_SHAPE = [(0.0, 0.0), (3.0, 0.0), (3.0, 2.0), (2.0, 2.0), (2.0, 3.0), (0.0, 3.0)]
+
+
+@pytest.fixture
+def polygons():
+    return shape.from_rois_to_polygons([RECTANGLE, DIAMOND, L_SHAPE])
+
+
+@pytest.fixture
+def shapes_data():
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 1
+    lineage.add_node(1, frame=0, ROI_coords=RECTANGLE)
+    lineage.add_node(2, frame=1, ROI_coords=DIAMOND)
+    lineage.add_node(3, frame=2, ROI_coords=L_SHAPE)
+    lineage.add_edges_from([(1, 2), (2, 3)])
+    return Data({1: lineage})
+
+
+# Vectorized descriptors ######################################################
+
+
+def test_from_rois_to_polygons(polygons):
+    assert len(polygons) == 3
+    assert polygons[0].is_valid and polygons[0].exterior.is_closed
+    assert len(shape.from_rois_to_polygons([])) == 0
+
+
+def test_get_area(polygons):
+    assert shape.get_area(polygons).tolist() == pytest.approx([8.0, 2.0, 8.0])
+
+
+def test_get_perimeter(polygons):
+    expected = [12.0, 4 * math.sqrt(2), 12.0]
+    assert shape.get_perimeter(polygons).tolist() == pytest.approx(expected)
+
+
+def test_get_solidity(polygons):
+    assert shape.get_solidity(polygons).tolist() == pytest.approx([1.0, 1.0, 8 / 8.5])
+
+
+def test_get_eccentricity(polygons):
+    ecc = shape.get_eccentricity(polygons)
+    # Rectangle: second moments are proportional to the squared sides.
+    assert ecc[0] == pytest.approx(math.sqrt(1 - 2**2 / 4**2))
+    # Square: no preferred direction.
+    assert ecc[1] == 0.0
+
+
+def test_get_eccentricity_ellipse():
+    a, b = 10.0, 4.0
+    t = np.linspace(0, 2 * np.pi, 400, endpoint=False)
+    ellipse = np.stack([5 + a * np.cos(t), 3 + b * np.sin(t)], axis=1)
+    ecc = shape.get_eccentricity(shape.from_rois_to_polygons([ellipse]))
+    assert ecc[0] == pytest.approx(math.sqrt(1 - b**2 / a**2), rel=1e-3)
+
+
+@pytest.mark.parametrize("nb_sides", [4, 5, 6, 7, 12])
+def test_get_eccentricity_regular_polygon(nb_sides):
+    # Off-centered and rotated regular polygons have no preferred direction.
+    t = 0.3 + 2 * np.pi * np.arange(nb_sides) / nb_sides
+    polygon = np.stack([123.4 + 7 * np.cos(t), 56.7 + 7 * np.sin(t)], axis=1)
+    square = [(10.0, 10.0), (13.0, 10.0), (13.0, 13.0), (10.0, 13.0)]
+    ecc = shape.get_eccentricity(shape.from_rois_to_polygons([polygon, square]))
+    assert ecc.tolist() == [0.0, 0.0]
+
+
+def test_get_eccentricity_clockwise():
+    ecc = shape.get_eccentricity(shape.from_rois_to_polygons([RECTANGLE[::-1]]))
+    assert ecc[0] == pytest.approx(math.sqrt(1 - 2**2 / 4**2))
+
+
+def test_get_min_rect_dimensions(polygons):
+    length, width = shape.get_min_rect_dimensions(polygons)
+    assert length.tolist() == pytest.approx([4.0, math.sqrt(2), 3.0])
+    assert width.tolist() == pytest.approx([2.0, math.sqrt(2), 3.0])
+
+
+def test_get_min_rect_dimensions_degenerate():
+    flat = shape.from_rois_to_polygons([[(0.0, 0.0), (2.0, 0.0), (4.0, 0.0)]])
+    length, width = shape.get_min_rect_dimensions(flat)
+    assert length.tolist() == pytest.approx([4.0])
+    assert width.tolist() == pytest.approx([0.0])
+
+
+# Calculators #################################################################
+
+
+def test_shape_descriptor_compute(shapes_data):
+    prop = shape.create_cell_area_property(None, unit="um^2")
+    calc = shape.CellArea(prop)
+    assert calc.compute(shapes_data.cell_data[1], 2) == pytest.approx(2.0)
+    assert not calc.is_fusable()
+    assert calc.get_inputs() == {"ROI_coords"}
+
+
+@pytest.mark.parametrize("with_context", [False, True])
+def test_shape_descriptor_enrich(shapes_data, with_context):
+    context = UpdateContext() if with_context else None
+    calcs = [
+        shape.CellArea(shape.create_cell_area_property(None, unit="um^2")),
+        shape.CellSolidity(shape.create_cell_solidity_property()),
+        shape.MinRectLength(shape.create_min_rect_length_property(None, unit="um")),
+    ]
+    nodes = [(1, 1), (3, 1)]
+    for calc in calcs:
+        calc.enrich(shapes_data, nodes, context=context)
+    lineage = shapes_data.cell_data[1]
+    assert lineage.nodes[1]["cell_area"] == pytest.approx(8.0)
+    assert lineage.nodes[3]["cell_solidity"] == pytest.approx(8 / 8.5)
+    assert lineage.nodes[3]["min_rect_length"] == pytest.approx(3.0)
+    assert "cell_area" not in lineage.nodes[2]
+    if with_context:
+        # Polygons of the lineage are built once for all the calculators.
+        assert context.misses == 1
+        assert context.hits == 2 * len(calcs) - 1
+
+
+def test_shape_descriptor_enrich_no_nodes(shapes_data):
+    calc = shape.CellEccentricity(shape.create_cell_eccentricity_property())
+    calc.enrich(shapes_data, [])
+    assert "cell_eccentricity" not in shapes_data.cell_data[1].nodes[1]
+
+
+def test_model_shape_properties(shapes_data):
+    model = Model(data=shapes_data, reference_time_property="frame")
+    model.model_metadata.space_unit = "um"
+    model.add_pycellin_properties(
+        [
+            "cell_area",
+            "cell_perimeter",
+            "cell_solidity",
+            "cell_eccentricity",
+            "min_rect_length",
+            "min_rect_width",
+        ]
+    )
+    assert model.props_metadata.props["cell_area"].unit == "um^2"
+    assert model.props_metadata.props["min_rect_width"].unit == "um"
+    model.update()
+    attrs = model.data.cell_data[1].nodes[1]
+    assert attrs["cell_perimeter"] == pytest.approx(12.0)
+    assert attrs["min_rect_width"] == pytest.approx(2.0)
+    assert attrs["cell_eccentricity"] == pytest.approx(math.sqrt(0.75))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for topology property classes from graph.properties."""
+
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model
+from pycellin.classes.lineage import Lineage
+from pycellin.classes.update_context import UpdateContext
+import pycellin.graph.properties.topology as topo
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def data():
+    # 1 -> 2 -> 3 -> 4 -> 5 and 3 -> 6 -> 7, 6 -> 8.
+    lineage = CellLineage()
+    lineage.graph["lineage_ID"] = 1
+    lineage.add_edges_from([(1, 2), (2, 3), (3, 4), (4, 5), (3, 6), (6, 7), (6, 8)])
+    frames = {1: 0, 2: 1, 3: 2, 4: 3, 5: 4, 6: 3, 7: 4, 8: 4}
+    for nid, frame in frames.items():
+        lineage.nodes[nid]["frame"] = frame
+    return Data({1: lineage})
+
+
+# Depth and Generation ########################################################
+
+
+def test_depth_compute(data):
+    calc = topo.Depth(topo.create_depth_property())
+    lineage = data.cell_data[1]
+    assert calc.compute(data, lineage, 1) == 0
+    assert calc.compute(data, lineage, 5) == 4
+    assert calc.compute(data, lineage, 8) == 4
+    assert calc.get_inputs() == set()
+    assert calc.get_footprint() == "ancestors"
+
+
+def test_generation_compute(data):
+    calc = topo.Generation(topo.create_generation_property())
+    lineage = data.cell_data[1]
+    assert calc.compute(data, lineage, 3) == 0
+    assert calc.compute(data, lineage, 5) == 1
+    assert calc.compute(data, lineage, 7) == 2
+
+
+@pytest.mark.parametrize("with_context", [False, True])
+def test_tree_level_enrich(data, with_context, monkeypatch):
+    calls = []
+    original = Lineage.get_tree_levels
+
+    def spy(self):
+        calls.append(self.graph["lineage_ID"])
+        return original(self)
+
+    monkeypatch.setattr(Lineage, "get_tree_levels", spy)
+    context = UpdateContext() if with_context else None
+    topo.Depth(topo.create_depth_property()).enrich(data, context=context)
+    topo.Generation(topo.create_generation_property()).enrich(data, context=context)
+    # The lineage is traversed once per calculator, or once overall
+    # when the calculators share the update context.
+    assert calls == ([1] if with_context else [1, 1])
+    lineage = data.cell_data[1]
+    depths = [lineage.nodes[nid]["depth"] for nid in range(1, 9)]
+    generations = [lineage.nodes[nid]["generation"] for nid in range(1, 9)]
+    assert depths == [0, 1, 2, 3, 4, 3, 4, 4]
+    assert generations == [0, 0, 0, 1, 1, 1, 2, 2]
+
+
+def test_model_tree_level_properties(data):
+    model = Model(data=data, reference_time_property="frame")
+    model.add_pycellin_properties(["depth", "generation"])
+    model.update()
+    model.add_cycle_data()
+    lineage = model.data.cell_data[1]
+    cycle_lineage = model.data.cycle_data[1]
+    # The generation of a cell is the level of its cell cycle.
+    for ccid in cycle_lineage.nodes:
+        for nid in cycle_lineage.nodes[ccid]["cells"]:
+            assert lineage.nodes[nid]["generation"] == cycle_lineage.nodes[ccid]["level"]
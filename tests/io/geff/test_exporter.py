@@ -2,7 +2,10 @@
 
 import geff
 import geff_spec
+import numpy as np
 import pytest
+import zarr
+from geff.core_io import read_to_memory
 
 from pycellin.classes import CellLineage, Data, Model, Property, PropsMetadata
 from pycellin.graph.properties.core import (
@@ -19,10 +22,15 @@ from pycellin.graph.properties.tracking import (
 from pycellin.io.geff.exporter import (
     _build_axes,
     _build_display_hints,
+    _build_geff_arrays,
     _build_geff_metadata,
+    _build_lineage_tables,
+    _build_prop_arrays,
     _build_props_metadata,
     _find_node_overlaps,
     _get_next_available_id,
+    _get_relabel_mappings,
+    _get_unique_node_ids,
     _relabel_nodes,
     _solve_node_overlaps,
     export_GEFF,
@@ -197,6 +205,35 @@ def model_with_xyz(simple_model):
     return simple_model
 
 
+@pytest.fixture
+def model_with_cycles(simple_model):
+    """Create a model with cycle lineages, lineage properties and node IDs
+    overlapping across lineages."""
+    lin = CellLineage()
+    lin.add_node(1, timepoint=0, cell_x=30.0, lineage_ID=2)
+    lin.add_node(4, timepoint=1, cell_x=32.0, lineage_ID=2)
+    lin.add_node(6, timepoint=1, cell_x=28.0, lineage_ID=2)
+    lin.add_edges_from([(1, 4), (1, 6)], link_x=2.0)
+    lin.graph["lineage_ID"] = 2
+    simple_model.data.cell_data[2] = lin
+    simple_model.props_metadata._add_prop(
+        Property(
+            identifier="lineage_name",
+            name="Lineage name",
+            description="Name of the lineage",
+            provenance="Test",
+            prop_type="lineage",
+            lin_type="CellLineage",
+            dtype="string",
+        )
+    )
+    for lid, lineage in simple_model.data.cell_data.items():
+        lineage.graph["lineage_name"] = f"lin{lid}"
+    simple_model.model_metadata.time_step = 1
+    simple_model.add_cycle_data()
+    return simple_model
+
+
 # Test Classes ################################################################
 
 
@@ -295,6 +332,122 @@ class TestRelabelNodes:
         assert set(lineage3.nodes()) == {20, 21, 22, 24, 26}
 
 
+class TestGetRelabelMappings:
+    """Test cases for _get_relabel_mappings function."""
+
+    def test_multiple_overlaps(self, lineage1, lineage2, lineage3):
+        lineage2.add_node(1)
+        lineage3.add_nodes_from([1, 2])
+        lineages = [lineage1, lineage2, lineage3]
+        overlaps = _find_node_overlaps(lineages)
+        mappings = _get_relabel_mappings(lineages, overlaps)
+        assert mappings == {1: {1: 23}, 2: {1: 24, 2: 25}}
+        assert sorted(lineage3.nodes) == [1, 2, 20, 21, 22]
+
+
+class TestGetUniqueNodeIds:
+    """Test cases for _get_unique_node_ids function."""
+
+    def test_no_overlaps(self):
+        node_ids = np.array([1, 2, 10, 11])
+        lin_ids = np.array([0, 0, 1, 1])
+        assert _get_unique_node_ids(lin_ids, node_ids) is node_ids
+
+    def test_same_ids_as_relabel_mappings(self, lineage1, lineage2, lineage3):
+        lineage2.add_node(1)
+        lineage3.add_nodes_from([1, 2])
+        lineages = [lineage1, lineage2, lineage3]
+        node_ids = np.array([nid for lin in lineages for nid in lin])
+        lin_ids = np.repeat(np.arange(3), [len(lin) for lin in lineages])
+        unique_ids = _get_unique_node_ids(lin_ids, node_ids)
+        mappings = _get_relabel_mappings(lineages, _find_node_overlaps(lineages))
+        expected = [
+            mappings.get(i, {}).get(nid, nid) for i, nid in zip(lin_ids, node_ids)
+        ]
+        assert unique_ids.tolist() == expected
+
+
+class TestBuildPropArrays:
+    """Test cases for _build_prop_arrays function."""
+
+    def test_missing_values(self):
+        attrs = [{"area": 1.5, "label": "a"}, {"area": 2.5}, {"label": "c"}]
+        props = _build_prop_arrays(attrs, 3)
+        assert props["area"]["values"].tolist() == [1.5, 2.5, 0.0]
+        assert props["area"]["missing"].tolist() == [False, False, True]
+        assert props["label"]["values"].tolist() == ["a", "", "c"]
+        assert props["label"]["missing"].tolist() == [False, True, False]
+
+    def test_no_missing_values(self):
+        props = _build_prop_arrays([{"frame": 0}, {"frame": 1}], 2)
+        assert props["frame"]["values"].tolist() == [0, 1]
+        assert props["frame"]["missing"] is None
+
+    def test_variable_length_values(self):
+        rois = [[[0, 0], [1, 0], [1, 1]], [[0, 0], [2, 0], [2, 2], [0, 2]]]
+        props = _build_prop_arrays([{"ROI": roi} for roi in rois], 2)
+        assert props["ROI"]["values"].dtype == object
+        assert props["ROI"]["values"][1].tolist() == rois[1]
+
+
+class TestBuildGeffArrays:
+    """Test cases for _build_geff_arrays function."""
+
+    def test_overlapping_ids(self, lineage1, lineage2):
+        lineage2.add_edge(13, 1)
+        node_ids, _, edge_ids, _ = _build_geff_arrays({0: lineage1, 1: lineage2})
+        assert sorted(node_ids.tolist()) == [1, 2, 3, 4, 5, 10, 11, 12, 13, 14]
+        assert [13, 14] in edge_ids.tolist()
+        assert [1, 2] in edge_ids.tolist()
+
+    def test_negative_node_ids(self):
+        lin = CellLineage()
+        lin.add_node(-1)
+        with pytest.raises(ValueError, match="negative"):
+            _build_geff_arrays({0: lin})
+
+
+class TestBuildLineageTables:
+    """Test cases for _build_lineage_tables function."""
+
+    def test_without_cycle_data(self, simple_model):
+        tables = _build_lineage_tables(simple_model)
+        assert list(tables) == ["cell_lineages"]
+        node_ids, node_props, edge_ids, _, metadata = tables["cell_lineages"]
+        assert node_ids.tolist() == [1, 3]
+        assert node_props["lineage_ID"]["values"].tolist() == [0, 1]
+        assert edge_ids.shape == (0, 2)
+        assert "lineage_ID" in metadata.node_props_metadata
+
+    def test_cycle_tables_follow_relabeling(self, model_with_cycles):
+        tables = _build_lineage_tables(model_with_cycles)
+        assert list(tables) == ["cell_lineages", "cycle_lineages", "cell_cycles"]
+        # Node 1 of lineage 2 is relabeled 7 and node 4 is relabeled 8.
+        node_ids, node_props, _, _, metadata = tables["cell_lineages"]
+        assert node_ids.tolist() == [1, 3, 7]
+        assert node_props["lineage_name"]["values"].tolist() == ["lin0", "lin1", "lin2"]
+        assert metadata.node_props_metadata["lineage_name"].name == "Lineage name"
+
+        node_ids, node_props, _, _, _ = tables["cycle_lineages"]
+        assert node_ids.tolist() == [1, 3, 7]
+        assert node_props["lineage_ID"]["values"].tolist() == [0, 1, 2]
+
+        node_ids, node_props, edge_ids, _, metadata = tables["cell_cycles"]
+        assert node_ids.tolist() == [2, 4, 7, 8, 6]
+        cells = [cycle_cells.tolist() for cycle_cells in node_props["cells"]["values"]]
+        assert cells == [[1, 2], [3, 4], [7], [8], [6]]
+        assert node_props["cycle_length"]["values"].tolist() == [2, 2, 1, 1, 1]
+        assert edge_ids.tolist() == [[7, 8], [7, 6]]
+        assert metadata.node_props_metadata["cells"].varlength
+        assert metadata.node_props_metadata["level"].dtype == "int64"
+
+    def test_original_model_not_modified(self, model_with_cycles):
+        _build_lineage_tables(model_with_cycles)
+        cycle_lin = model_with_cycles.data.cycle_data[2]
+        assert sorted(cycle_lin.nodes) == [1, 4, 6]
+        assert cycle_lin.nodes[1]["cells"] == [1]
+
+
 class TestSolveNodeOverlaps:
     """Test cases for _solve_node_overlaps function."""
 
@@ -622,7 +775,9 @@ class TestExportGEFF:
     def test_basic_export(self, simple_model, tmp_path):
         """Test basic GEFF export functionality."""
         geff_out = str(tmp_path / "test.geff")
-        exported_model = export_GEFF(simple_model, geff_out)
+        exported_model = export_GEFF(
+            simple_model, geff_out, return_exported_model=True
+        )
 
         # Check that the GEFF file was created.
         assert (tmp_path / "test.geff").exists()
@@ -641,7 +796,9 @@ class TestExportGEFF:
         and edges.
         """
         geff_out = str(tmp_path / "test.geff")
-        exported_model = export_GEFF(simple_model, geff_out)
+        exported_model = export_GEFF(
+            simple_model, geff_out, return_exported_model=True
+        )
 
         # Check that the original model's data is unchanged. It's not an exhaustive
         # check since we are only checking the number of nodes and edges.
@@ -672,7 +829,9 @@ class TestExportGEFF:
         simple_model.props_metadata._add_prop(
             create_absolute_age_property(unit="timepoint")
         )
-        exported_model = export_GEFF(simple_model, geff_out)
+        exported_model = export_GEFF(
+            simple_model, geff_out, return_exported_model=True
+        )
 
         # The absolute_age property is orphaned (no data in lineages), so it's removed.
         # All other properties are preserved, including multi-type ones (lineage_ID).
@@ -681,6 +840,149 @@ class TestExportGEFF:
         }
         assert expected_props == exported_model.get_properties()
 
+    def test_export_without_copy(self, simple_model, tmp_path):
+        """Test that the default export neither copies nor modifies the model."""
+        geff_out = str(tmp_path / "test.geff")
+        simple_model.props_metadata._add_prop(
+            create_absolute_age_property(unit="timepoint")
+        )
+        props = simple_model.get_properties()
+        assert export_GEFF(simple_model, geff_out) is None
+        assert simple_model.get_properties() == props
+        graph, metadata = geff.read(geff_out)
+        assert "absolute_age" not in metadata.node_props_metadata
+
+    def test_export_overlapping_ids(self, simple_model, tmp_path):
+        """Test that the export with and without copy write the same graph."""
+        lin = CellLineage()
+        lin.add_node(1, timepoint=0, cell_x=30.0, lineage_ID=2)
+        lin.add_node(4, timepoint=1, cell_x=32.0, lineage_ID=2)
+        lin.add_edge(1, 4, link_x=2.0)
+        lin.graph["lineage_ID"] = 2
+        simple_model.data.cell_data[2] = lin
+        graphs = []
+        for return_exported_model in [True, False]:
+            geff_out = str(tmp_path / f"test_{return_exported_model}.geff")
+            export_GEFF(
+                simple_model, geff_out, return_exported_model=return_exported_model
+            )
+            graph, _ = geff.read(geff_out, backend="networkx")
+            graphs.append(graph)
+        assert dict(graphs[0].nodes(data=True)) == dict(graphs[1].nodes(data=True))
+        assert set(graphs[0].edges) == set(graphs[1].edges)
+        assert graphs[1].number_of_nodes() == 6
+        assert sorted(simple_model.data.cell_data[2].nodes) == [1, 4]
+
+    def test_export_lineage_tables(self, model_with_cycles, tmp_path):
+        """Test that lineage properties and cycle lineages are exported
+        in nested GEFF files."""
+        geff_out = str(tmp_path / "test.geff")
+        export_GEFF(model_with_cycles, geff_out, zarr_format=3, chunk_size=2)
+        graph, _ = geff.read(geff_out, backend="networkx")
+        assert graph.number_of_nodes() == 7
+        cell_lineages = read_to_memory(f"{geff_out}/cell_lineages")
+        assert cell_lineages["node_ids"].tolist() == [1, 3, 7]
+        cell_cycles = read_to_memory(f"{geff_out}/cell_cycles")
+        assert cell_cycles["edge_ids"].tolist() == [[7, 8], [7, 6]]
+        assert "cycle_duration" in cell_cycles["node_props"]
+
+    def test_export_overwrites_lineage_tables(self, model_with_cycles, tmp_path):
+        """Test that the tables of a previous export are not left behind."""
+        geff_out = str(tmp_path / "test.geff")
+        export_GEFF(model_with_cycles, geff_out)
+        model_with_cycles.data.cycle_data = None
+        export_GEFF(model_with_cycles, geff_out)
+        root = zarr.open_group(geff_out, mode="r")
+        assert sorted(root.group_keys()) == ["cell_lineages", "edges", "nodes"]
+
+    def test_export_with_chunks_and_compressor(self, simple_model, tmp_path):
+        """Test export with custom chunk size and compressor."""
+        geff_out = str(tmp_path / "test.geff")
+        export_GEFF(simple_model, geff_out)
+        export_GEFF(
+            simple_model,
+            geff_out,
+            chunk_size=1,
+            compressor="zstd",
+            compression_level=9,
+        )
+        root = zarr.open_group(geff_out, mode="r")
+        cell_x = root["nodes/props/cell_x/values"]
+        assert cell_x.chunks == (1,)
+        assert cell_x.compressors[0].codec_id == "zstd"
+        assert root["edges/ids"].chunks == (1, 2)
+        graph, metadata = geff.read(geff_out, backend="networkx")
+        assert graph.number_of_nodes() == 4
+        assert graph.nodes[4]["cell_x"] == 22.0
+        assert metadata.axes[0].name == "timepoint"
+
+    def test_export_with_shards(self, simple_model, tmp_path):
+        """Test export with sharding in Zarr format 3."""
+        geff_out = str(tmp_path / "test.geff")
+        export_GEFF(
+            simple_model,
+            geff_out,
+            zarr_format=3,
+            chunk_size=1,
+            shard_size=2,
+            compressor="none",
+        )
+        cell_x = zarr.open_group(geff_out, mode="r")["nodes/props/cell_x/values"]
+        assert cell_x.chunks == (1,)
+        assert cell_x.shards == (2,)
+        assert cell_x.compressors == ()
+        graph, _ = geff.read(geff_out, backend="networkx")
+        assert set(graph.edges) == {(1, 2), (3, 4)}
+
+    def test_export_encoding_keeps_geff_defaults(self, simple_model, tmp_path):
+        """Test that unset encoding options keep the geff defaults."""
+        geff_out = str(tmp_path / "test.geff")
+        export_GEFF(simple_model, geff_out, zarr_format=3, chunk_size=1)
+        cell_x = zarr.open_group(geff_out, mode="r")["nodes/props/cell_x/values"]
+        assert cell_x.chunks == (1,)
+        assert cell_x.shards is None
+        assert cell_x.compressors[0].to_dict()["name"] == "zstd"
+
+    def test_export_encoding_writes_once(self, simple_model, tmp_path, monkeypatch):
+        """Test that custom encoding writes to the output without a staging copy."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("The GEFF file was staged.")
+
+        monkeypatch.setattr("tempfile.TemporaryDirectory", fail)
+        monkeypatch.setattr("pycellin.io.geff.exporter.write_arrays", fail)
+        geff_out = str(tmp_path / "test.geff")
+        export_GEFF(simple_model, geff_out, compressor="gzip")
+        graph, _ = geff.read(geff_out, backend="networkx")
+        assert graph.number_of_nodes() == 4
+
+    def test_export_sorted_by_time(self, simple_model, tmp_path):
+        """Test that nodes and edges can be sorted by time."""
+        geff_out = str(tmp_path / "test.geff")
+        lin = simple_model.data.cell_data[1]
+        lin.add_node(5, timepoint=2, cell_x=24.0, lineage_ID=1)
+        lin.add_edge(4, 5, link_x=2.0)
+        export_GEFF(simple_model, geff_out, sort_by_time=True)
+        root = zarr.open_group(geff_out, mode="r")
+        assert root["nodes/ids"][:].tolist() == [1, 3, 2, 4, 5]
+        assert root["nodes/props/timepoint/values"][:].tolist() == [0, 0, 1, 1, 2]
+        assert root["edges/ids"][:].tolist() == [[1, 2], [3, 4], [4, 5]]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"chunk_size": 0},
+            {"shard_size": 10},
+            {"shard_size": 0, "zarr_format": 3},
+            {"compressor": "lzma"},
+            {"compressor": "none", "compression_level": 5},
+        ],
+    )
+    def test_export_invalid_encoding(self, simple_model, tmp_path, kwargs):
+        """Test that invalid encoding options raise ValueError."""
+        with pytest.raises(ValueError):
+            export_GEFF(simple_model, str(tmp_path / "test.geff"), **kwargs)
+
     def test_empty_model_raises_error(self, tmp_path):
         """Test that exporting an empty model raises ValueError."""
         geff_out = str(tmp_path / "test.geff")
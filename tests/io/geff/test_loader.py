@@ -3,27 +3,38 @@
 import importlib.metadata
 import logging
 
+from pathlib import Path
+
 import geff
 import geff_spec
 import networkx as nx
+import numpy as np
 import pytest
 
-from pycellin.classes import CellLineage, Property
+from pycellin.classes import CellLineage, Data, Model, Property, PropsMetadata
 from pycellin.custom_types import PropertyType
 from pycellin.graph.properties.core import (
     create_cell_coord_property,
     create_cell_id_property,
+    create_frame_property,
     create_lineage_id_property,
 )
+from pycellin.io.geff.exporter import export_GEFF
 from pycellin.io.geff.loader import (
     _build_generic_metadata,
+    _build_lineages,
     _build_props_metadata,
     _ensure_valid_cell_ID,
     _extract_axes_metadata,
+    _extract_cycle_props_metadata,
     _extract_generic_metadata,
     _extract_lin_props_metadata,
     _extract_props_metadata,
     _fallback_to_node_keys,
+    _get_edge_rows,
+    _get_lineage_IDs,
+    _get_lineage_labels,
+    _get_node_rows,
     _get_prop_unit,
     _identify_lin_id_prop,
     _identify_space_props,
@@ -31,6 +42,7 @@ from pycellin.io.geff.loader import (
     _resolve_prop_key,
     _standardize_properties_data,
     _standardize_props_metadata,
+    load_GEFF,
 )
 
 # Fixtures ####################################################################
@@ -120,40 +132,48 @@ def geff_md_3d_axes(geff_node_props_md):
     )
 
 
+def _prop(values, missing=None):
+    """Build a GEFF property array, with an optional missing mask."""
+    if missing is not None:
+        missing = np.array(missing, dtype=bool)
+    return {"values": np.array(values), "missing": missing}
+
+
 @pytest.fixture
-def graph_lin_id():
-    """Graph with standard and custom lineage ID properties."""
-    g = nx.Graph()
-    g.add_node(0, frame=0, lineage_ID=0, my_lin_id=0)
-    g.add_node(1, frame=1, lineage_ID=1, my_lin_id=1)
-    return g
+def props_lin_id():
+    """Node properties with standard and custom lineage ID properties."""
+    return {
+        "frame": _prop([0, 1]),
+        "lineage_ID": _prop([0, 1]),
+        "my_lin_id": _prop([0, 1]),
+    }
 
 
 @pytest.fixture
-def graph_no_lin_id():
-    """Graph with no lineage ID property."""
-    g = nx.Graph()
-    g.add_node(0, frame=0)
-    g.add_node(1, frame=1)
-    return g
+def props_no_lin_id():
+    """Node properties with no lineage ID property."""
+    return {"frame": _prop([0, 1])}
 
 
 @pytest.fixture
-def graph_with_coords():
-    """Graph with 2D spatial coordinate properties."""
-    g = nx.Graph()
-    g.add_node(0, frame=0, position_x=1.0, position_y=2.0)
-    g.add_node(1, frame=1, position_x=3.0, position_y=4.0)
-    return g
+def props_with_coords():
+    """Node properties with 2D spatial coordinates."""
+    return {
+        "frame": _prop([0, 1]),
+        "position_x": _prop([1.0, 3.0]),
+        "position_y": _prop([2.0, 4.0]),
+    }
 
 
 @pytest.fixture
-def graph_with_3d_coords():
-    """Graph with 3D spatial coordinate properties."""
-    g = nx.Graph()
-    g.add_node(0, frame=0, position_x=1.0, position_y=2.0, position_z=3.0)
-    g.add_node(1, frame=1, position_x=4.0, position_y=5.0, position_z=6.0)
-    return g
+def props_with_3d_coords():
+    """Node properties with 3D spatial coordinates."""
+    return {
+        "frame": _prop([0, 1]),
+        "position_x": _prop([1.0, 4.0]),
+        "position_y": _prop([2.0, 5.0]),
+        "position_z": _prop([3.0, 6.0]),
+    }
 
 
 @pytest.fixture
@@ -337,45 +357,18 @@ def standardize_rename_map():
 
 
 @pytest.fixture
-def lineages_with_nonstandard_keys() -> list[CellLineage]:
-    """Two lineages carrying non-standard node and lineage property keys."""
-    lin_a = CellLineage(nx.DiGraph(), lid=None)
-    lin_a.add_node(
-        0,
-        custom_lin_id=11,
-        custom_cell_id=100,
-        pos_x=1.0,
-        pos_y=2.0,
-        pos_z=3.0,
-        old_node_key="node-a0",
-    )
-    lin_a.add_node(
-        1,
-        custom_lin_id=11,
-        custom_cell_id=101,
-        pos_x=4.0,
-        pos_y=5.0,
-        pos_z=6.0,
-        old_node_key="node-a1",
-    )
-    lin_a.add_edge(0, 1, old_edge_key=0.5)
-    lin_a.graph["custom_lin_id"] = 11
-    lin_a.graph["old_lin_key"] = "lin-a"
-
-    lin_b = CellLineage(nx.DiGraph(), lid=None)
-    lin_b.add_node(
-        2,
-        custom_lin_id=12,
-        custom_cell_id=102,
-        pos_x=7.0,
-        pos_y=8.0,
-        pos_z=9.0,
-        old_node_key="node-b2",
-    )
-    lin_b.graph["custom_lin_id"] = 12
-    lin_b.graph["old_lin_key"] = "lin-b"
-
-    return [lin_a, lin_b]
+def nonstandard_props() -> tuple[dict, dict]:
+    """Node and edge properties carrying non-standard keys."""
+    node_props = {
+        "custom_lin_id": _prop([11, 11, 12]),
+        "custom_cell_id": _prop([100, 101, 102]),
+        "pos_x": _prop([1.0, 4.0, 7.0]),
+        "pos_y": _prop([2.0, 5.0, 8.0]),
+        "pos_z": _prop([3.0, 6.0, 9.0]),
+        "old_node_key": _prop(["node-a0", "node-a1", "node-b2"]),
+    }
+    edge_props = {"old_edge_key": _prop([0.5])}
+    return node_props, edge_props
 
 
 # Test Classes ################################################################
@@ -384,13 +377,13 @@ def lineages_with_nonstandard_keys() -> list[CellLineage]:
 class TestIdentifyLinIdProp:
     """Test cases for _identify_lin_id_prop function."""
 
-    def test_provided_key_exists_in_graph(self, graph_lin_id):
+    def test_provided_key_exists_in_graph(self, props_lin_id):
         """When lin_id_prop is provided and the property exists, return it."""
-        result = _identify_lin_id_prop("my_lin_id", None, graph_lin_id)
+        result = _identify_lin_id_prop("my_lin_id", None, props_lin_id)
         assert result == "my_lin_id"
 
     def test_provided_key_not_in_graph_falls_back_to_track_node_props(
-        self, caplog, graph_lin_id
+        self, caplog, props_lin_id
     ):
         """When lin_id_prop is not in graph but geff_track_node_props has 'lineage',
         return the value from track_node_props and log."""
@@ -398,7 +391,7 @@ class TestIdentifyLinIdProp:
             result = _identify_lin_id_prop(
                 "missing_key",
                 {"lineage": "track_id"},
-                graph_lin_id,
+                props_lin_id,
             )
         assert len(caplog.records) == 2
         assert caplog.records[0].levelname == "INFO"
@@ -409,12 +402,12 @@ class TestIdentifyLinIdProp:
         assert result == "track_id"
 
     def test_provided_key_not_in_graph_falls_back_to_lineage_id(
-        self, caplog, graph_lin_id
+        self, caplog, props_lin_id
     ):
         """When lin_id_prop is not in graph and geff_track_node_props is None,
         fall back to 'lineage_ID' if present in graph and log."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
-            result = _identify_lin_id_prop("missing_key", None, graph_lin_id)
+            result = _identify_lin_id_prop("missing_key", None, props_lin_id)
         assert len(caplog.records) == 2
         assert caplog.records[0].levelname == "INFO"
         assert "infered from GEFF metadata" in caplog.records[0].message
@@ -423,11 +416,11 @@ class TestIdentifyLinIdProp:
 
         assert result == "lineage_ID"
 
-    def test_provided_key_not_in_graph_no_fallback(self, caplog, graph_no_lin_id):
+    def test_provided_key_not_in_graph_no_fallback(self, caplog, props_no_lin_id):
         """When lin_id_prop is not in graph, geff_track_node_props is None,
         and graph has no 'lineage_ID', log and return None."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
-            result = _identify_lin_id_prop("missing_key", None, graph_no_lin_id)
+            result = _identify_lin_id_prop("missing_key", None, props_no_lin_id)
         assert len(caplog.records) == 2
         assert caplog.records[0].levelname == "INFO"
         assert "infered from GEFF metadata" in caplog.records[0].message
@@ -436,30 +429,30 @@ class TestIdentifyLinIdProp:
 
         assert result is None
 
-    def test_none_prop_with_track_node_props_lineage(self, caplog, graph_lin_id):
+    def test_none_prop_with_track_node_props_lineage(self, caplog, props_lin_id):
         """When lin_id_prop is None and geff_track_node_props has 'lineage',
         return the value from track_node_props and log."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
-            result = _identify_lin_id_prop(None, {"lineage": "my_lin_id"}, graph_lin_id)
+            result = _identify_lin_id_prop(None, {"lineage": "my_lin_id"}, props_lin_id)
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "INFO"
         assert "inferred from GEFF track_node_props" in caplog.records[0].message
 
         assert result == "my_lin_id"
 
-    def test_none_prop_with_track_node_props_no_lineage_key(self, graph_lin_id):
+    def test_none_prop_with_track_node_props_no_lineage_key(self, props_lin_id):
         """When lin_id_prop is None and geff_track_node_props has no 'lineage' key,
         return None (dict.get default)."""
-        result = _identify_lin_id_prop(None, {"tracklet": "tracklet_id"}, graph_lin_id)
+        result = _identify_lin_id_prop(None, {"tracklet": "tracklet_id"}, props_lin_id)
         assert result is None
 
     def test_none_prop_no_track_node_props_graph_has_lineage_id(
-        self, caplog, graph_lin_id
+        self, caplog, props_lin_id
     ):
         """When lin_id_prop is None, geff_track_node_props is None,
         and graph has 'lineage_ID', return 'lineage_ID' and log."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
-            result = _identify_lin_id_prop(None, None, graph_lin_id)
+            result = _identify_lin_id_prop(None, None, props_lin_id)
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "INFO"
         assert "inferred from existing graph property" in caplog.records[0].message
@@ -467,12 +460,12 @@ class TestIdentifyLinIdProp:
         assert result == "lineage_ID"
 
     def test_none_prop_no_track_node_props_no_lineage_id_in_graph(
-        self, caplog, graph_no_lin_id
+        self, caplog, props_no_lin_id
     ):
         """When lin_id_prop is None, geff_track_node_props is None,
         and graph has no 'lineage_ID', log and return None."""
         with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _identify_lin_id_prop(None, None, graph_no_lin_id)
+            result = _identify_lin_id_prop(None, None, props_no_lin_id)
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "WARNING"
         assert "No lineage identifier found" in caplog.records[0].message
@@ -483,19 +476,19 @@ class TestIdentifyLinIdProp:
 class TestIdentifyTimeProp:
     """Test cases for _identify_time_prop function."""
 
-    def test_provided_key_exists_in_graph(self, graph_lin_id):
+    def test_provided_key_exists_in_graph(self, props_lin_id):
         """When time_key is provided and exists in the graph, return it."""
-        result = _identify_time_prop("frame", None, graph_lin_id)
+        result = _identify_time_prop("frame", None, props_lin_id)
         assert result == "frame"
 
     def test_provided_key_not_in_graph_falls_back_to_display_hints(
-        self, caplog, graph_lin_id, geff_md_display_hints
+        self, caplog, props_lin_id, geff_md_display_hints
     ):
         """When time_key is not in the graph but display hints have a valid time prop,
         log and return the hint key."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             result = _identify_time_prop(
-                "missing_key", geff_md_display_hints, graph_lin_id
+                "missing_key", geff_md_display_hints, props_lin_id
             )
         assert len(caplog.records) == 2
         assert caplog.records[0].levelname == "INFO"
@@ -506,12 +499,12 @@ class TestIdentifyTimeProp:
         assert result == "frame"
 
     def test_provided_key_not_in_graph_falls_back_to_axes(
-        self, caplog, graph_lin_id, geff_md_axes
+        self, caplog, props_lin_id, geff_md_axes
     ):
         """When time_key is not in the graph, no display hints are available,
         and the axes have a matching time prop, log and return the axis key."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
-            result = _identify_time_prop("missing_key", geff_md_axes, graph_lin_id)
+            result = _identify_time_prop("missing_key", geff_md_axes, props_lin_id)
         assert len(caplog.records) == 2
         assert caplog.records[0].levelname == "INFO"
         assert "not present in the graph" in caplog.records[0].message
@@ -520,46 +513,46 @@ class TestIdentifyTimeProp:
 
         assert result == "frame"
 
-    def test_provided_key_not_in_graph_no_geff_md_raises(self, caplog, graph_lin_id):
+    def test_provided_key_not_in_graph_no_geff_md_raises(self, caplog, props_lin_id):
         """When time_key is not in the graph and geff_md is None,
         log and raise ValueError."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             with pytest.raises(ValueError):
-                _identify_time_prop("missing_key", None, graph_lin_id)
+                _identify_time_prop("missing_key", None, props_lin_id)
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "INFO"
         assert "not present in the graph" in caplog.records[0].message
 
     def test_none_key_inferred_from_display_hints(
-        self, caplog, graph_lin_id, geff_md_display_hints
+        self, caplog, props_lin_id, geff_md_display_hints
     ):
         """When time_key is None and display hints have a valid time prop,
         log and return the hint key."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
-            result = _identify_time_prop(None, geff_md_display_hints, graph_lin_id)
+            result = _identify_time_prop(None, geff_md_display_hints, props_lin_id)
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "INFO"
         assert "inferred from display hints" in caplog.records[0].message
 
         assert result == "frame"
 
-    def test_none_key_inferred_from_axes(self, caplog, graph_lin_id, geff_md_axes):
+    def test_none_key_inferred_from_axes(self, caplog, props_lin_id, geff_md_axes):
         """When time_key is None, no display hints are available, and the axes
         have a matching time prop, log and return the axis key."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
-            result = _identify_time_prop(None, geff_md_axes, graph_lin_id)
+            result = _identify_time_prop(None, geff_md_axes, props_lin_id)
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "INFO"
         assert "inferred from axes" in caplog.records[0].message
 
         assert result == "frame"
 
-    def test_none_key_no_geff_md_raises(self, graph_lin_id):
+    def test_none_key_no_geff_md_raises(self, props_lin_id):
         """When time_key is None and geff_md is None, raise ValueError."""
         with pytest.raises(ValueError):
-            _identify_time_prop(None, None, graph_lin_id)
+            _identify_time_prop(None, None, props_lin_id)
 
-    def test_none_key_no_time_info_in_geff_md_raises(self, graph_lin_id):
+    def test_none_key_no_time_info_in_geff_md_raises(self, props_lin_id):
         """When time_key is None and geff_md has no usable time axes or display hints,
         raise ValueError."""
         geff_md_no_time = geff.GeffMetadata(
@@ -569,31 +562,33 @@ class TestIdentifyTimeProp:
             edge_props_metadata={},
         )
         with pytest.raises(ValueError):
-            _identify_time_prop(None, geff_md_no_time, graph_lin_id)
+            _identify_time_prop(None, geff_md_no_time, props_lin_id)
 
 
 class TestIdentifySpaceProps:
     """Test cases for _identify_space_props function."""
 
-    def test_provided_keys_returned_as_is(self, graph_with_coords):
+    def test_provided_keys_returned_as_is(self, props_with_coords):
         """When provided keys exist in the graph, return them unchanged with no logging."""
         result = _identify_space_props(
-            "position_x", "position_y", None, None, graph_with_coords
+            "position_x", "position_y", None, None, props_with_coords
         )
         assert result == ("position_x", "position_y", None)
 
-    def test_provided_z_key_returned(self, graph_with_3d_coords):
+    def test_provided_z_key_returned(self, props_with_3d_coords):
         """When all three coordinate keys are provided and in the graph, return all three."""
         result = _identify_space_props(
-            "position_x", "position_y", "position_z", None, graph_with_3d_coords
+            "position_x", "position_y", "position_z", None, props_with_3d_coords
         )
         assert result == ("position_x", "position_y", "position_z")
 
-    def test_provided_key_not_in_graph_logs_becomes_none(self, caplog, graph_with_coords):
+    def test_provided_key_not_in_graph_logs_becomes_none(
+        self, caplog, props_with_coords
+    ):
         """When a provided key is absent from the graph, log and set it to None."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             result = _identify_space_props(
-                "missing_x", None, None, None, graph_with_coords
+                "missing_x", None, None, None, props_with_coords
             )
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "INFO"
@@ -601,19 +596,19 @@ class TestIdentifySpaceProps:
 
         assert result == (None, None, None)
 
-    def test_all_none_no_geff_md_returns_none_tuple(self, graph_with_coords):
+    def test_all_none_no_geff_md_returns_none_tuple(self, props_with_coords):
         """When all keys are None and geff_md is None, return (None, None, None) with no logging."""
-        result = _identify_space_props(None, None, None, None, graph_with_coords)
+        result = _identify_space_props(None, None, None, None, props_with_coords)
         assert result == (None, None, None)
 
     def test_none_keys_inferred_from_display_hints(
-        self, caplog, graph_with_coords, geff_md_display_hints
+        self, caplog, props_with_coords, geff_md_display_hints
     ):
         """When keys are None and display hints have valid space props,
         infer x and y and log for each."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             result = _identify_space_props(
-                None, None, None, geff_md_display_hints, graph_with_coords
+                None, None, None, geff_md_display_hints, props_with_coords
             )
         assert len(caplog.records) == 2
         assert all(record.levelname == "INFO" for record in caplog.records)
@@ -623,11 +618,13 @@ class TestIdentifySpaceProps:
 
         assert result == ("position_x", "position_y", None)
 
-    def test_none_keys_inferred_from_axes(self, caplog, graph_with_coords, geff_md_axes):
+    def test_none_keys_inferred_from_axes(
+        self, caplog, props_with_coords, geff_md_axes
+    ):
         """When keys are None and axes have space props, infer x and y from axes and log."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             result = _identify_space_props(
-                None, None, None, geff_md_axes, graph_with_coords
+                None, None, None, geff_md_axes, props_with_coords
             )
         assert len(caplog.records) == 2
         assert all(record.levelname == "INFO" for record in caplog.records)
@@ -636,12 +633,12 @@ class TestIdentifySpaceProps:
         assert result == ("position_x", "position_y", None)
 
     def test_none_keys_all_three_inferred_from_axes(
-        self, caplog, graph_with_3d_coords, geff_md_3d_axes
+        self, caplog, props_with_3d_coords, geff_md_3d_axes
     ):
         """When all keys are None and 3D axes are present, infer x, y, and z from axes."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             result = _identify_space_props(
-                None, None, None, geff_md_3d_axes, graph_with_3d_coords
+                None, None, None, geff_md_3d_axes, props_with_3d_coords
             )
         assert len(caplog.records) == 3
         assert all(record.levelname == "INFO" for record in caplog.records)
@@ -650,12 +647,12 @@ class TestIdentifySpaceProps:
         assert result == ("position_x", "position_y", "position_z")
 
     def test_provided_key_not_in_graph_falls_back_to_display_hints(
-        self, caplog, graph_with_coords, geff_md_display_hints
+        self, caplog, props_with_coords, geff_md_display_hints
     ):
         """When x key is absent from the graph, log and infer it from display hints."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             result = _identify_space_props(
-                "missing_x", None, None, geff_md_display_hints, graph_with_coords
+                "missing_x", None, None, geff_md_display_hints, props_with_coords
             )
         assert len(caplog.records) == 3
         assert caplog.records[0].levelname == "INFO"
@@ -666,12 +663,12 @@ class TestIdentifySpaceProps:
         assert result == ("position_x", "position_y", None)
 
     def test_provided_key_not_in_graph_falls_back_to_axes(
-        self, caplog, graph_with_coords, geff_md_axes
+        self, caplog, props_with_coords, geff_md_axes
     ):
         """When x key is absent from the graph, log and infer it from axes."""
         with caplog.at_level(logging.INFO, logger="pycellin.io.geff.loader"):
             result = _identify_space_props(
-                "missing_x", None, None, geff_md_axes, graph_with_coords
+                "missing_x", None, None, geff_md_axes, props_with_coords
             )
         assert len(caplog.records) == 3
         assert caplog.records[0].levelname == "INFO"
@@ -682,12 +679,12 @@ class TestIdentifySpaceProps:
         assert result == ("position_x", "position_y", None)
 
     def test_display_hint_not_in_graph_silently_stays_none(
-        self, graph_no_lin_id, geff_md_display_hints
+        self, props_no_lin_id, geff_md_display_hints
     ):
         """When display hints point to props absent from the graph (and no axes),
         the slots stay None without any logging."""
         result = _identify_space_props(
-            None, None, None, geff_md_display_hints, graph_no_lin_id
+            None, None, None, geff_md_display_hints, props_no_lin_id
         )
         assert result == (None, None, None)
 
@@ -1531,163 +1528,249 @@ class TestBuildGenericMetadata:
 class TestFallbackToNodeKeys:
     """Test cases for _fallback_to_node_keys function."""
 
-    def test_sets_cell_id_from_node_keys(self, caplog, graph_no_lin_id):
+    def test_sets_cell_id_from_node_keys(self, caplog, props_no_lin_id):
         """When falling back, each node gets a cell_ID equal to its node key."""
         with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            _fallback_to_node_keys(graph_no_lin_id, "fallback reason")
+            _fallback_to_node_keys(np.array([0, 1]), props_no_lin_id, "fallback reason")
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "WARNING"
         assert "fallback" in caplog.records[0].message
 
-        assert graph_no_lin_id.nodes[0]["cell_ID"] == 0
-        assert graph_no_lin_id.nodes[1]["cell_ID"] == 1
-        assert graph_no_lin_id.nodes[0]["frame"] == 0
-        assert graph_no_lin_id.nodes[1]["frame"] == 1
+        assert props_no_lin_id["cell_ID"]["values"].tolist() == [0, 1]
+        assert props_no_lin_id["cell_ID"]["missing"] is None
+        assert props_no_lin_id["frame"]["values"].tolist() == [0, 1]
 
 
 class TestEnsureValidCellID:
     """Test cases for _ensure_valid_cell_ID function."""
 
-    def test_none_key_falls_back_to_node_keys(self, caplog, graph_no_lin_id):
+    def _check_fallback(self, caplog, node_props, message):
+        node_ids = np.array([0, 1])
+        with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
+            key, cell_ids = _ensure_valid_cell_ID(node_ids, node_props, "id")
+        assert len(caplog.records) == 1
+        assert caplog.records[0].levelname == "WARNING"
+        assert message in caplog.records[0].message
+        assert key == "cell_ID"
+        assert cell_ids is node_ids
+        assert node_props["cell_ID"]["values"].tolist() == [0, 1]
+
+    def test_none_key_falls_back_to_node_keys(self, caplog, props_no_lin_id):
         """When cell_id_key is None, create cell_ID from node keys and log."""
         with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _ensure_valid_cell_ID(graph_no_lin_id, None)
+            key, cell_ids = _ensure_valid_cell_ID(
+                np.array([0, 1]), props_no_lin_id, None
+            )
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "WARNING"
         assert "No cell identifier property provided" in caplog.records[0].message
 
-        assert result == "cell_ID"
-        assert graph_no_lin_id.nodes[0]["cell_ID"] == 0
-        assert graph_no_lin_id.nodes[1]["cell_ID"] == 1
-        assert graph_no_lin_id.nodes[0]["frame"] == 0
-        assert graph_no_lin_id.nodes[1]["frame"] == 1
+        assert key == "cell_ID"
+        assert cell_ids.tolist() == [0, 1]
+        assert props_no_lin_id["cell_ID"]["values"].tolist() == [0, 1]
+        assert props_no_lin_id["frame"]["values"].tolist() == [0, 1]
 
     def test_missing_prop_falls_back(self, caplog):
         """When cell_id_key is missing on some nodes, fall back and log."""
-        g = nx.Graph()
-        g.add_node(0, id=0)
-        g.add_node(1)
-        with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _ensure_valid_cell_ID(g, "id")
-        assert len(caplog.records) == 1
-        assert caplog.records[0].levelname == "WARNING"
-        assert "not present on all nodes" in caplog.records[0].message
+        node_props = {"id": _prop([0, 0], missing=[False, True])}
+        self._check_fallback(caplog, node_props, "not present on all nodes")
 
-        assert result == "cell_ID"
-        assert g.nodes[0]["cell_ID"] == 0
-        assert g.nodes[1]["cell_ID"] == 1
+    def test_absent_prop_falls_back(self, caplog):
+        """When cell_id_key is not a node property, fall back and log."""
+        self._check_fallback(caplog, {}, "not present on all nodes")
 
     def test_negative_value_fall_back(self, caplog):
         """When cell_id_key has a negative value, fall back and log."""
-        g = nx.Graph()
-        g.add_node(0, id=0)
-        g.add_node(1, id=-1)
-        with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _ensure_valid_cell_ID(g, "id")
-        assert len(caplog.records) == 1
-        assert caplog.records[0].levelname == "WARNING"
-        assert "not all positive integers" in caplog.records[0].message
-
-        assert result == "cell_ID"
-        assert g.nodes[0]["cell_ID"] == 0
-        assert g.nodes[1]["cell_ID"] == 1
+        node_props = {"id": _prop([0, -1])}
+        self._check_fallback(caplog, node_props, "not all positive integers")
 
     def test_string_value_fall_back(self, caplog):
-        """When cell_id_key has a string value, fall back and log."""
-        g = nx.Graph()
-        g.add_node(0, id=0)
-        g.add_node(1, id="1")
-        with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _ensure_valid_cell_ID(g, "id")
-        assert len(caplog.records) == 1
-        assert caplog.records[0].levelname == "WARNING"
-        assert "not all positive integers" in caplog.records[0].message
-
-        assert result == "cell_ID"
-        assert g.nodes[0]["cell_ID"] == 0
-        assert g.nodes[1]["cell_ID"] == 1
+        """When cell_id_key has string values, fall back and log."""
+        node_props = {"id": _prop(["0", "1"])}
+        self._check_fallback(caplog, node_props, "not all positive integers")
 
     def test_bool_value_fall_back(self, caplog):
-        """When cell_id_key has a boolean value, fall back and log."""
-        g = nx.Graph()
-        g.add_node(0, id=0)
-        g.add_node(1, id=True)
-        with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _ensure_valid_cell_ID(g, "id")
-        assert len(caplog.records) == 1
-        assert caplog.records[0].levelname == "WARNING"
-        assert "not all positive integers" in caplog.records[0].message
-
-        assert result == "cell_ID"
-        assert g.nodes[0]["cell_ID"] == 0
-        assert g.nodes[1]["cell_ID"] == 1
-
-    def test_none_value_fall_back(self, caplog):
-        """When cell_id_key has a None value, fall back and log."""
-        g = nx.Graph()
-        g.add_node(0, id=0)
-        g.add_node(1, id=None)
-        with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _ensure_valid_cell_ID(g, "id")
-        assert len(caplog.records) == 1
-        assert caplog.records[0].levelname == "WARNING"
-        assert "not all positive integers" in caplog.records[0].message
+        """When cell_id_key has boolean values, fall back and log."""
+        node_props = {"id": _prop([False, True])}
+        self._check_fallback(caplog, node_props, "not all positive integers")
 
-        assert result == "cell_ID"
-        assert g.nodes[0]["cell_ID"] == 0
-        assert g.nodes[1]["cell_ID"] == 1
+    def test_float_value_fall_back(self, caplog):
+        """When cell_id_key has float values, fall back and log."""
+        node_props = {"id": _prop([0.0, 1.0])}
+        self._check_fallback(caplog, node_props, "not all positive integers")
 
     def test_duplicate_prop_values_fall_back(self, caplog):
         """When cell_id_key has duplicate values, fall back and log."""
-        g = nx.Graph()
-        g.add_node(0, id=1)
-        g.add_node(1, id=1)
-        with caplog.at_level(logging.WARNING, logger="pycellin.io.geff.loader"):
-            result = _ensure_valid_cell_ID(g, "id")
-        assert len(caplog.records) == 1
-        assert caplog.records[0].levelname == "WARNING"
-        assert "Duplicate values found" in caplog.records[0].message
-
-        assert result == "cell_ID"
-        assert g.nodes[0]["cell_ID"] == 0
-        assert g.nodes[1]["cell_ID"] == 1
-
-    def test_valid_prop_relabels_nodes(self):
-        """When cell_id_key is valid, relabel nodes to match property values."""
-        g = nx.Graph()
-        g.add_node(1, id=10)
-        g.add_node(2, id=11)
-        result = _ensure_valid_cell_ID(g, "id")
-        assert result == "id"
-        assert set(g.nodes) == {10, 11}
-        assert g.nodes[10]["id"] == 10
-        assert g.nodes[11]["id"] == 11
-        assert "cell_ID" not in g.nodes[10]
-        assert "cell_ID" not in g.nodes[11]
+        node_props = {"id": _prop([1, 1])}
+        self._check_fallback(caplog, node_props, "Duplicate values found")
+
+    def test_valid_prop_returns_cell_ids(self):
+        """When cell_id_key is valid, its values are used as cell IDs."""
+        node_props = {"id": _prop([10, 11])}
+        key, cell_ids = _ensure_valid_cell_ID(np.array([1, 2]), node_props, "id")
+        assert key == "id"
+        assert cell_ids.tolist() == [10, 11]
+        assert "cell_ID" not in node_props
 
     def test_empty_graph(self):
         """When graph is empty, return the cell_id_key without modification."""
-        g = nx.Graph()
+        node_ids = np.array([], dtype=np.uint64)
+        node_props = {"id": _prop(np.array([], dtype=np.int64))}
+
+        key, cell_ids = _ensure_valid_cell_ID(node_ids, node_props, "id")
+        assert key == "id"
+        assert len(cell_ids) == 0
+
+        key, cell_ids = _ensure_valid_cell_ID(node_ids, node_props, None)
+        assert key == "cell_ID"
+        assert len(cell_ids) == 0
+
+
+class TestGetEdgeRows:
+    """Test cases for _get_edge_rows function."""
+
+    def test_edges_converted_to_rows(self):
+        node_ids = np.array([7, 3, 5, 9], dtype=np.uint64)
+        edge_ids = np.array([[3, 5], [7, 9], [5, 7]], dtype=np.uint64)
+        rows = _get_edge_rows(node_ids, edge_ids)
+        assert rows.tolist() == [[1, 2], [0, 3], [2, 0]]
+
+    def test_no_edges(self):
+        rows = _get_edge_rows(np.array([1, 2]), np.zeros((0, 2), dtype=np.int64))
+        assert rows.shape == (0, 2)
+
+
+class TestGetNodeRows:
+    """Test cases for _get_node_rows function."""
+
+    def test_ids_converted_to_rows(self):
+        node_ids = np.array([7, 3, 5], dtype=np.uint64)
+        ids = np.array([[5, 7], [3, 3]], dtype=np.uint64)
+        assert _get_node_rows(node_ids, ids).tolist() == [[2, 0], [1, 1]]
+
+    @pytest.mark.parametrize("ids", [[4], [8], [1]])
+    def test_unknown_ids_raise(self, ids):
+        node_ids = np.array([7, 3, 5], dtype=np.uint64)
+        with pytest.raises(ValueError, match="do not match any node"):
+            _get_node_rows(node_ids, np.array(ids, dtype=np.uint64))
+
+    def test_no_ids(self):
+        rows = _get_node_rows(np.array([], dtype=np.uint64), np.zeros((0, 2)))
+        assert rows.shape == (0, 2)
+
+
+class TestGetLineageLabels:
+    """Test cases for _get_lineage_labels function."""
+
+    def test_weakly_connected_components(self):
+        # 0 -> 1, 2 -> 1 (fusion), 3 alone, 5 -> 4.
+        edge_rows = np.array([[0, 1], [2, 1], [5, 4]])
+        labels = _get_lineage_labels(6, edge_rows)
+        assert labels.tolist() == [0, 0, 0, 1, 2, 2]
+
+    def test_no_nodes(self):
+        labels = _get_lineage_labels(0, np.zeros((0, 2), dtype=np.intp))
+        assert len(labels) == 0
+
+
+class TestExtractCyclePropsMetadata:
+    """Test cases for _extract_cycle_props_metadata function."""
+
+    def test_new_and_shared_properties(self):
+        props_dict = {
+            "lineage_ID": create_lineage_id_property(),
+            "area": Property(
+                identifier="area",
+                name="Area",
+                description="Area",
+                provenance="geff",
+                prop_type="lineage",
+                lin_type="CellLineage",
+                dtype="float",
+            ),
+        }
+        md = {
+            "area": geff_spec.PropMetadata(identifier="area", dtype="float64"),
+            "growth": geff_spec.PropMetadata(
+                identifier="growth", dtype="float64", unit="um/min"
+            ),
+        }
+        _extract_cycle_props_metadata(md, props_dict, PropertyType.LINEAGE)
+        assert props_dict["area"].lin_type == "Lineage"
+        assert props_dict["growth"].lin_type == "CycleLineage"
+        assert props_dict["growth"].prop_type == PropertyType.LINEAGE
+        assert props_dict["growth"].unit == "um/min"
+        assert props_dict["lineage_ID"].lin_type == "Lineage"
+
+    def test_other_property_type_raises(self):
+        props_dict = {"lineage_ID": create_lineage_id_property()}
+        md = {"lineage_ID": geff_spec.PropMetadata(identifier="a", dtype="int64")}
+        with pytest.raises(KeyError, match="lineage_ID"):
+            _extract_cycle_props_metadata(md, props_dict, PropertyType.EDGE)
+
+
+class TestGetLineageIDs:
+    """Test cases for _get_lineage_IDs function."""
+
+    def test_generated_ids(self):
+        """One-node lineages get minus their cell ID, others are numbered."""
+        labels = np.array([0, 0, 1, 2, 2])
+        cell_ids = np.array([10, 11, 12, 13, 14], dtype=np.uint64)
+        node_props = {}
+        lin_ids = _get_lineage_IDs(labels, cell_ids, node_props, None)
+        assert lin_ids.tolist() == [0, -12, 1]
+        assert node_props["lineage_ID"]["values"].tolist() == [0, 0, -12, 1, 1]
+
+    def test_ids_from_node_property(self):
+        labels = np.array([0, 0, 1])
+        node_props = {"track": _prop([4, 4, 2])}
+        lin_ids = _get_lineage_IDs(labels, np.arange(3), node_props, "track")
+        assert lin_ids.tolist() == [4, 2]
+        assert node_props["track"]["values"].tolist() == [4, 4, 2]
+
+    def test_partial_ids_completed(self):
+        """Nodes of a lineage without ID get the ID of the other nodes,
+        and lineages without ID on any node get the next available IDs."""
+        labels = np.array([0, 0, 1, 2, 2, 3, 3])
+        node_props = {
+            "track": _prop(
+                [4, 0, 2, 0, 0, 0, 0],
+                missing=[False, True, False, True, True, True, True],
+            )
+        }
+        lin_ids = _get_lineage_IDs(labels, np.arange(7), node_props, "track")
+        assert lin_ids.tolist() == [4, 2, 5, 6]
+        assert node_props["track"]["values"].tolist() == [4, 4, 2, 5, 5, 6, 6]
+        assert node_props["track"]["missing"] is None
 
-        result = _ensure_valid_cell_ID(g, "id")
-        assert result == "id"
-        assert len(g.nodes) == 0
+    def test_assigns_fallback_lineage_id_for_single_node_lineage_without_key(self):
+        """When a one-node lineage has no lineage ID, -cell_ID is used."""
+        labels = np.array([0, 0, 1, 2])
+        cell_ids = np.array([0, 1, 10, 11], dtype=np.uint64)
+        node_props = {"track": _prop([4, 4, 0, 7], missing=[False, False, True, False])}
+        lin_ids = _get_lineage_IDs(labels, cell_ids, node_props, "track")
+        assert lin_ids.tolist() == [4, -10, 7]
+        assert node_props["track"]["values"].tolist() == [4, 4, -10, 7]
 
-        result = _ensure_valid_cell_ID(g, None)
-        assert result == "cell_ID"
-        assert len(g.nodes) == 0
+    def test_inconsistent_ids_raise(self):
+        labels = np.array([0, 0])
+        node_props = {"track": _prop([1, 2])}
+        with pytest.raises(ValueError, match="inconsistent lineage ID values"):
+            _get_lineage_IDs(labels, np.arange(2), node_props, "track")
 
 
 class TestStandardizePropertiesData:
     """Test cases for _standardize_properties_data function."""
 
     def test_applies_collision_renames_and_standard_keys(
-        self, lineages_with_nonstandard_keys, standardize_rename_map
+        self, nonstandard_props, standardize_rename_map
     ):
-        """Rename-map keys and pycellin standard keys are applied on nodes, edges,
-        and lineage graph attributes."""
+        """Rename-map keys and pycellin standard keys are applied on node
+        and edge properties."""
+        node_props, edge_props = nonstandard_props
         _standardize_properties_data(
-            lineages_with_nonstandard_keys,
+            node_props,
+            edge_props,
             lin_id_key="custom_lin_id",
             cell_id_key="custom_cell_id",
             cell_x_key="pos_x",
@@ -1695,60 +1778,25 @@ class TestStandardizePropertiesData:
             cell_z_key="pos_z",
             rename_map=standardize_rename_map,
         )
+        assert list(node_props) == [
+            "lineage_ID",
+            "cell_ID",
+            "cell_x",
+            "cell_y",
+            "cell_z",
+            "new_node_key",
+        ]
+        assert node_props["cell_ID"]["values"].tolist() == [100, 101, 102]
+        assert node_props["cell_x"]["values"].tolist() == [1.0, 4.0, 7.0]
+        assert list(edge_props) == ["new_edge_key"]
+        assert edge_props["new_edge_key"]["values"].tolist() == [0.5]
 
-        lin_a, lin_b = lineages_with_nonstandard_keys
-
-        # Node-level updates.
-        for node in lin_a.nodes:
-            data = lin_a.nodes[node]
-            assert "custom_lin_id" not in data
-            assert "custom_cell_id" not in data
-            assert "pos_x" not in data
-            assert "pos_y" not in data
-            assert "pos_z" not in data
-            assert "old_node_key" not in data
-            assert "lineage_ID" in data
-            assert "cell_ID" in data
-            assert "cell_x" in data
-            assert "cell_y" in data
-            assert "cell_z" in data
-            assert "new_node_key" in data
-
-        for node in lin_b.nodes:
-            data = lin_b.nodes[node]
-            assert "custom_lin_id" not in data
-            assert "custom_cell_id" not in data
-            assert "pos_x" not in data
-            assert "pos_y" not in data
-            assert "pos_z" not in data
-            assert "old_node_key" not in data
-            assert "lineage_ID" in data
-            assert "cell_ID" in data
-            assert "cell_x" in data
-            assert "cell_y" in data
-            assert "cell_z" in data
-            assert "new_node_key" in data
-
-        # Edge-level updates.
-        assert "old_edge_key" not in lin_a.edges[(0, 1)]
-        assert lin_a.edges[(0, 1)]["new_edge_key"] == 0.5
-
-        # Lineage-level updates.
-        assert lin_a.graph["lineage_ID"] == 11
-        assert lin_b.graph["lineage_ID"] == 12
-        assert "custom_lin_id" not in lin_a.graph
-        assert "custom_lin_id" not in lin_b.graph
-        assert "old_lin_key" not in lin_a.graph
-        assert "old_lin_key" not in lin_b.graph
-        assert lin_a.graph["new_lin_key"] == "lin-a"
-        assert lin_b.graph["new_lin_key"] == "lin-b"
-
-    def test_skips_optional_coordinate_renames_when_none(
-        self, lineages_with_nonstandard_keys
-    ):
+    def test_skips_optional_coordinate_renames_when_none(self, nonstandard_props):
         """When x/y/z keys are None, coordinate properties are left unchanged."""
+        node_props, edge_props = nonstandard_props
         _standardize_properties_data(
-            lineages_with_nonstandard_keys,
+            node_props,
+            edge_props,
             lin_id_key="custom_lin_id",
             cell_id_key="custom_cell_id",
             cell_x_key=None,
@@ -1760,54 +1808,26 @@ class TestStandardizePropertiesData:
                 PropertyType.LINEAGE: {},
             },
         )
-
-        lin_a, _ = lineages_with_nonstandard_keys
-        assert lin_a.nodes[0]["cell_ID"] == 100
-        assert lin_a.nodes[0]["lineage_ID"] == 11
-        assert "pos_x" in lin_a.nodes[0]
-        assert "pos_y" in lin_a.nodes[0]
-        assert "pos_z" in lin_a.nodes[0]
-        assert "cell_x" not in lin_a.nodes[0]
-        assert "cell_y" not in lin_a.nodes[0]
-        assert "cell_z" not in lin_a.nodes[0]
-
-    def test_keeps_graph_lin_id_when_already_standard(self, standardize_rename_map):
-        """When lin_id_key is already 'lineage_ID', lineage graph IDs are preserved."""
-        lin = CellLineage()
-        lin.add_node(
-            1,
-            lineage_ID=0,
-            custom_cell_id=11,
-            pos_x=2.0,
-            old_node_key="node",
-        )
-        lin.graph["lineage_ID"] = 0
-        lin.graph["old_lin_key"] = "lineage"
-
-        _standardize_properties_data(
-            [lin],
-            lin_id_key="lineage_ID",
-            cell_id_key="custom_cell_id",
-            cell_x_key="pos_x",
-            cell_y_key=None,
-            cell_z_key=None,
-            rename_map=standardize_rename_map,
-        )
-
-        assert lin.graph["lineage_ID"] == 0
-        assert lin.nodes[1]["lineage_ID"] == 0
-
-    def test_skips_standard_cell_id_rename(self):
-        """When cell_id_key is already 'cell_ID', node cell IDs are preserved."""
-        lin = CellLineage()
-        lin.add_node(1, lineage_ID=0, cell_ID=11)
-        lin.graph["lineage_ID"] = 0
-
+        assert node_props["cell_ID"]["values"].tolist() == [100, 101, 102]
+        assert node_props["lineage_ID"]["values"].tolist() == [11, 11, 12]
+        assert {"pos_x", "pos_y", "pos_z"} <= set(node_props)
+        assert not {"cell_x", "cell_y", "cell_z"} & set(node_props)
+        assert list(edge_props) == ["old_edge_key"]
+
+    def test_standard_keys_left_unchanged(self):
+        """When keys already follow pycellin conventions, nothing is renamed."""
+        node_props = {
+            "lineage_ID": _prop([0]),
+            "cell_ID": _prop([11]),
+            "cell_x": _prop([1.0]),
+        }
+        expected = dict(node_props)
         _standardize_properties_data(
-            [lin],
+            node_props,
+            {},
             lin_id_key="lineage_ID",
             cell_id_key="cell_ID",
-            cell_x_key=None,
+            cell_x_key="cell_x",
             cell_y_key=None,
             cell_z_key=None,
             rename_map={
@@ -1816,43 +1836,17 @@ class TestStandardizePropertiesData:
                 PropertyType.LINEAGE: {},
             },
         )
+        assert node_props == expected
 
-        assert lin.nodes[1]["cell_ID"] == 11
-
-    def test_skips_standard_coordinate_renames(self):
-        """When x/y/z keys are already 'cell_x', 'cell_y', 'cell_z', they are left unchanged."""
-        lin = CellLineage()
-        lin.add_node(1, lineage_ID=0, cell_ID=11, cell_x=1.0, cell_y=2.0, cell_z=3.0)
-        lin.graph["lineage_ID"] = 0
-
+    def test_standard_rename_replaces_existing_key(self):
+        """A property renamed to a standard key replaces the existing one."""
+        node_props = {"cell_x": _prop([0.0]), "pos_x": _prop([1.0])}
         _standardize_properties_data(
-            [lin],
+            node_props,
+            {},
             lin_id_key="lineage_ID",
             cell_id_key="cell_ID",
-            cell_x_key="cell_x",
-            cell_y_key="cell_y",
-            cell_z_key="cell_z",
-            rename_map={
-                PropertyType.NODE: {},
-                PropertyType.EDGE: {},
-                PropertyType.LINEAGE: {},
-            },
-        )
-
-        assert lin.nodes[1]["cell_x"] == 1.0
-        assert lin.nodes[1]["cell_y"] == 2.0
-        assert lin.nodes[1]["cell_z"] == 3.0
-
-    def test_assigns_fallback_lineage_id_for_single_node_lineage_without_key(self):
-        """When lin_id_key is absent from a single-node lineage graph, -node_id is used."""
-        lin = CellLineage()
-        lin.add_node(1, custom_lin_id=0, custom_cell_id=10)
-
-        _standardize_properties_data(
-            [lin],
-            lin_id_key="custom_lin_id",
-            cell_id_key="custom_cell_id",
-            cell_x_key=None,
+            cell_x_key="pos_x",
             cell_y_key=None,
             cell_z_key=None,
             rename_map={
@@ -1861,36 +1855,119 @@ class TestStandardizePropertiesData:
                 PropertyType.LINEAGE: {},
             },
         )
+        assert list(node_props) == ["cell_x"]
+        assert node_props["cell_x"]["values"].tolist() == [1.0]
+
+
+class TestBuildLineages:
+    """Test cases for _build_lineages function."""
+
+    def test_lineages_built_from_arrays(self):
+        cell_ids = np.array([10, 11, 12, 13], dtype=np.uint64)
+        node_props = {
+            "frame": _prop([0, 1, 0, 2]),
+            "area": _prop([1.0, 0.0, 3.0, 4.0], missing=[False, True, False, False]),
+            "roi": {
+                "values": np.array(
+                    [np.zeros((2, 2)), np.ones((3, 2)), np.zeros((1, 2)), None],
+                    dtype=object,
+                ),
+                "missing": np.array([False, False, False, True]),
+            },
+        }
+        edge_rows = np.array([[0, 1], [1, 3]])
+        edge_props = {"speed": _prop([2.0, 3.0])}
+        labels = np.array([0, 0, 1, 0])
+        lineages = _build_lineages(
+            cell_ids, node_props, edge_rows, edge_props, labels, np.array([5, -12])
+        )
+        assert [lin.graph["lineage_ID"] for lin in lineages] == [5, -12]
+        lin = lineages[0]
+        assert list(lin.nodes) == [10, 11, 13]
+        assert lin.nodes[10]["frame"] == 0
+        assert type(lin.nodes[10]["frame"]) is int
+        assert "area" not in lin.nodes[11]
+        assert lin.nodes[11]["roi"].shape == (3, 2)
+        assert "roi" not in lin.nodes[13]
+        assert set(lin.edges) == {(10, 11), (11, 13)}
+        assert lin.edges[11, 13]["speed"] == 3.0
+        assert list(lineages[1].nodes) == [12]
+
+    def test_no_nodes(self):
+        lineages = _build_lineages(
+            np.array([], dtype=np.int64),
+            {},
+            np.zeros((0, 2), dtype=np.intp),
+            {},
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+        )
+        assert len(lineages) == 1
+        assert lineages[0].graph["lineage_ID"] == 0
+        assert len(lineages[0]) == 0
 
-        assert lin.graph["lineage_ID"] == -1
-
-    def test_assigns_fallback_lineage_id_for_multi_node_lineage_without_key(self):
-        """When lin_id_key is absent from a multi-node lineage graph, next available id is used."""
-        lin_with_id = CellLineage()
-        lin_with_id.add_node(0, custom_lin_id=10, custom_cell_id=100)
-        lin_with_id.add_node(1, custom_lin_id=10, custom_cell_id=101)
-        lin_with_id.graph["custom_lin_id"] = 10
 
-        lin_without_id = CellLineage()
-        lin_without_id.add_node(2, custom_lin_id=99, custom_cell_id=102)
-        lin_without_id.add_node(3, custom_lin_id=99, custom_cell_id=103)
+class TestLoadGEFF:
+    """Test cases for load_GEFF function."""
 
-        _standardize_properties_data(
-            [lin_with_id, lin_without_id],
-            lin_id_key="custom_lin_id",
-            cell_id_key="custom_cell_id",
-            cell_x_key=None,
-            cell_y_key=None,
-            cell_z_key=None,
-            rename_map={
-                PropertyType.NODE: {},
-                PropertyType.EDGE: {},
-                PropertyType.LINEAGE: {},
-            },
+    def test_load_sample_data(self):
+        geff_in = (
+            Path(__file__).parents[3] / "sample_data" / "Ecoli_growth_on_agar_pad.geff"
+        )
+        graph, _ = geff.read(geff_in)
+        model = load_GEFF(geff_in, cell_id_prop="cell_ID", time_prop="POSITION_T")
+        lineages = model.get_cell_lineages()
+        assert sum(len(lin) for lin in lineages) == graph.number_of_nodes()
+        lin_IDs = {
+            graph.nodes[nid]["lineage_ID"]: lin_ID
+            for lin_ID, lin in model.data.cell_data.items()
+            for nid in lin.nodes
+        }
+        assert len(lin_IDs) == len(model.data.cell_data)
+        for lin in model.data.cell_data.values():
+            for nid, attrs in lin.nodes(data=True):
+                assert attrs["cell_ID"] == nid
+                assert attrs["cell_x"] == graph.nodes[nid]["cell_x"]
+                assert np.array_equal(
+                    attrs["ROI_coords"], graph.nodes[nid]["ROI_coords"]
+                )
+            for source, target in lin.edges:
+                assert graph.has_edge(source, target)
+        assert sum(lin.number_of_edges() for lin in lineages) == (
+            graph.number_of_edges()
         )
 
-        assert lin_with_id.graph["lineage_ID"] == 10
-        assert lin_without_id.graph["lineage_ID"] == 11
+    def test_load_with_custom_keys(self, tmp_path):
+        graph = nx.DiGraph()
+        graph.add_node(1, t=0, x=0.0, y=1.0, my_id=10)
+        graph.add_node(2, t=1, x=1.0, y=1.0, my_id=20)
+        graph.add_node(3, t=2, x=2.0, y=1.0, my_id=30)
+        graph.add_node(4, t=0, x=5.0, y=5.0, my_id=40)
+        graph.add_edges_from([(1, 2), (2, 3)], dist=1.0)
+        geff_out = tmp_path / "test.geff"
+        geff.write(
+            graph,
+            geff_out,
+            axis_names=["t", "x", "y"],
+            axis_types=["time", "space", "space"],
+        )
+        model = load_GEFF(geff_out, cell_id_prop="my_id")
+        assert set(model.data.cell_data) == {0, -40}
+        lin = model.data.cell_data[0]
+        assert set(lin.nodes) == {10, 20, 30}
+        assert set(lin.edges) == {(10, 20), (20, 30)}
+        assert lin.nodes[20].items() >= {
+            "t": 1,
+            "cell_x": 1.0,
+            "cell_y": 1.0,
+            "cell_ID": 20,
+            "lineage_ID": 0,
+        }.items()
+        assert lin.edges[10, 20]["dist"] == 1.0
+        assert model.model_metadata.reference_time_property == "t"
+        assert {"cell_ID", "lineage_ID", "cell_x", "cell_y"} <= set(
+            model.props_metadata.props
+        )
 
 
 class TestStandardizePropsMetadata:
@@ -2146,3 +2223,61 @@ class TestStandardizePropsMetadata:
         assert "cell_x" in props_md
         assert props_md["cell_x"].identifier == "cell_x"
         assert props_md["cell_x"].unit == "um"
+
+    def test_round_trip_lineage_tables(self, tmp_path):
+        """Lineage properties and cycle lineages are restored without
+        recomputation, following the relabeling of overlapping node IDs."""
+        lin0 = CellLineage()
+        lin0.add_node(1, frame=0, lineage_ID=0)
+        lin0.add_node(2, frame=1, lineage_ID=0)
+        lin0.add_node(3, frame=1, lineage_ID=0)
+        lin0.add_edges_from([(1, 2), (1, 3)])
+        lin0.graph.update(lineage_ID=0, lineage_name="first")
+        lin1 = CellLineage()
+        lin1.add_node(1, frame=0, lineage_ID=1)
+        lin1.add_node(4, frame=1, lineage_ID=1)
+        lin1.add_edge(1, 4)
+        lin1.graph.update(lineage_ID=1, lineage_name="second")
+        props_metadata = PropsMetadata()
+        props_metadata._add_prop(create_frame_property())
+        props_metadata._add_prop(create_lineage_id_property())
+        props_metadata._add_prop(
+            Property(
+                identifier="lineage_name",
+                name="Lineage name",
+                description="Name of the lineage",
+                provenance="Test",
+                prop_type="lineage",
+                lin_type="CellLineage",
+                dtype="string",
+            )
+        )
+        model = Model(
+            data=Data({0: lin0, 1: lin1}),
+            props_metadata=props_metadata,
+            reference_time_property="frame",
+        )
+        model.add_cycle_data()
+        model.add_pycellin_properties(["division_time"])
+        model.update()
+        geff_out = tmp_path / "test.geff"
+        export_GEFF(model, geff_out)
+
+        loaded = load_GEFF(geff_out)
+        assert loaded.data.cell_data[0].graph["lineage_name"] == "first"
+        assert loaded.data.cell_data[1].graph["lineage_name"] == "second"
+        assert loaded.props_metadata.props["lineage_name"].name == "Lineage name"
+        assert loaded.has_cycle_data()
+        cycle_lin = loaded.data.cycle_data[0]
+        expected = model.data.cycle_data[0]
+        assert dict(cycle_lin.nodes(data=True)) == dict(expected.nodes(data=True))
+        assert set(cycle_lin.edges) == set(expected.edges)
+        assert cycle_lin.graph["lineage_ID"] == 0
+        # Node 1 of lineage 1 is relabeled 5 in the GEFF file.
+        cycle_lin = loaded.data.cycle_data[1]
+        expected_attrs = {**model.data.cycle_data[1].nodes[4], "cells": [5, 4]}
+        assert dict(cycle_lin.nodes(data=True)) == {4: expected_attrs}
+        props = loaded.props_metadata.props
+        assert props["division_time"].lin_type == "CycleLineage"
+        assert props["cells"].provenance == "pycellin"
+        assert "cells" in loaded.props_metadata._get_protected_props()
@@ -13,6 +13,8 @@ from pycellin.graph.properties.core import (
     create_timepoint_property,
 )
 from pycellin.io.utils import (
+    _AttrsTransform,
+    _ExportView,
     _add_lineage_props,
     _get_props_from_data,
     _graph_has_node_prop,
@@ -1106,3 +1108,73 @@ class TestUpdateLineagesIDsKey:
         assert lin1.graph["lineage_ID"] == 10
         assert lin1.graph["other_attr"] == "value"
         assert "TRACK_ID" not in lin1.graph
+
+
+class TestAttrsTransform:
+    """Test cases for _AttrsTransform class."""
+
+    def test_identity_returns_same_dict(self):
+        attrs = {"a": 1}
+        assert _AttrsTransform().is_identity()
+        assert _AttrsTransform().apply(attrs) is attrs
+
+    def test_apply(self):
+        """Test that overlays, renames, exclusions, constants and defaults apply."""
+        transform = _AttrsTransform(
+            renames={"a": "A", "b": "B"},
+            excluded={"B"},
+            constants={"C": 0},
+            defaults={"A": -1, "D": 2},
+            overlays=[lambda key, attrs: {"a": attrs["a"] + key}],
+        )
+        attrs = {"a": 1, "b": 2, "C": 3}
+        assert transform.apply(attrs, 10) == {"A": 11, "C": 0, "D": 2}
+        assert attrs == {"a": 1, "b": 2, "C": 3}
+        assert transform.get_source_key("A") == "a"
+        assert transform.get_source_key("D") == "D"
+
+
+class TestExportView:
+    """Test cases for _ExportView class."""
+
+    def test_view_shares_data_only(self, model):
+        view = _ExportView(model)
+        assert view.model.data is model.data
+        assert view.model.props_metadata is not model.props_metadata
+        view.model.props_metadata._remove_prop("link_x")
+        assert model.has_property("link_x")
+
+    def test_iterators(self, model):
+        view = _ExportView(model)
+        lin_ID, lin = next(iter(model.data.cell_data.items()))
+        view.relabel = {lin_ID: {nid: nid + 100 for nid in lin.nodes}}
+        view.node.renames["cell_x"] = "x"
+        view.lineage.constants["name"] = "lin"
+        nodes = dict(view.iter_nodes(lin_ID))
+        assert set(nodes) == {nid + 100 for nid in lin.nodes}
+        for nid, attrs in lin.nodes(data=True):
+            assert nodes[nid + 100]["x"] == attrs["cell_x"]
+            assert "x" not in attrs
+        edges = [(source, target) for source, target, _ in view.iter_edges(lin_ID)]
+        assert edges == [(source + 100, target + 100) for source, target in lin.edges]
+        assert view.get_lineage_attrs(lin_ID)["name"] == "lin"
+        assert "name" not in lin.graph
+
+    def test_materialize(self, model):
+        view = _ExportView(model)
+        lin_ID, lin = next(iter(model.data.cell_data.items()))
+        nodes = {nid: dict(attrs) for nid, attrs in lin.nodes(data=True)}
+        edges = list(lin.edges)
+        view.relabel = {lin_ID: {nid: nid + 100 for nid in lin.nodes}}
+        view.node.renames["cell_x"] = "x"
+        view.lineage.renames["lineage_ID"] = "TRACK_ID"
+        exported = view.materialize()
+        assert exported is view.model
+        assert exported.data.cell_data[lin_ID] is lin
+        for nid, attrs in nodes.items():
+            attrs["x"] = attrs.pop("cell_x")
+            assert lin.nodes[nid + 100] == attrs
+        expected_edges = [(source + 100, target + 100) for source, target in edges]
+        assert list(lin.edges) == expected_edges
+        assert lin.graph["TRACK_ID"] == lin_ID
+        assert "lineage_ID" not in lin.graph
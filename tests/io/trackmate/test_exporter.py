@@ -3,8 +3,11 @@
 """Unit test for TrackMate XML file exporter."""
 
 import logging
+import math
 
+import numpy as np
 import pytest
+from lxml import etree as ET
 
 from pycellin.classes import CellLineage, Data, Model, Property, PropsMetadata
 from pycellin.graph.properties.core import (
@@ -14,10 +17,19 @@ from pycellin.graph.properties.core import (
     create_timepoint_property,
 )
 from pycellin.io.trackmate.exporter import (
+    _add_relabel_overlay,
+    _batch_tasks,
+    _create_Spot,
+    _get_non_numeric_props,
+    _get_TrackMate_view,
+    _group_spots_by_frame,
     _is_numeric_dtype,
-    _remove_non_numeric_props,
-    _relabel_nodes,
+    _render_SpotsInFrame,
+    _render_Tracks,
+    _value_to_str,
+    export_TrackMate_XML,
 )
+from pycellin.io.utils import _ExportView
 
 
 # Fixtures ####################################################################
@@ -305,29 +317,31 @@ class TestIsNumericDtype:
         assert _is_numeric_dtype("") is False
 
 
-class TestRemoveNonNumericProps:
-    """Test cases for _remove_non_numeric_props function."""
+def _get_exported_props(model):
+    """Return the properties of a model as exported to TrackMate."""
+    return _get_TrackMate_view(model, propagate=False).model.get_properties()
+
+
+class TestGetNonNumericProps:
+    """Test cases for the removal of the non-numeric properties."""
 
     def test_preserves_numeric_properties(self, simple_model, numeric_float64_prop):
         """Test that numeric properties are preserved, numpy-style or not."""
         simple_model.props_metadata._add_prop(numeric_float64_prop)
         assert "intensity" in simple_model.get_properties()
 
-        _remove_non_numeric_props(simple_model)
-
-        assert "timepoint" in simple_model.get_properties()
-        assert "cell_x" in simple_model.get_properties()
-        assert "cell_y" in simple_model.get_properties()
-        assert "intensity" in simple_model.get_properties()
+        assert _get_non_numeric_props(simple_model) == []
+        assert "intensity" in _get_exported_props(simple_model)
 
     def test_removes_string_properties(self, simple_model, string_prop):
         """Test that string properties are removed."""
         simple_model.props_metadata._add_prop(string_prop)
         assert "label" in simple_model.get_properties()
 
-        _remove_non_numeric_props(simple_model)
-
-        assert "label" not in simple_model.get_properties()
+        assert _get_non_numeric_props(simple_model) == ["label"]
+        assert "label" not in _get_exported_props(simple_model)
+        # The model itself is not modified.
+        assert "label" in simple_model.get_properties()
 
     def test_preserves_properties_coming_from_trackmate(
         self, simple_model, trackmate_string_prop
@@ -336,9 +350,8 @@ class TestRemoveNonNumericProps:
         simple_model.props_metadata._add_prop(trackmate_string_prop)
         assert "name" in simple_model.get_properties()
 
-        _remove_non_numeric_props(simple_model)
-
-        assert "name" in simple_model.get_properties()
+        assert _get_non_numeric_props(simple_model) == []
+        assert "name" in _get_exported_props(simple_model)
 
     def test_mixed_numeric_and_non_numeric(
         self, simple_model, numeric_float32_prop, object_prop
@@ -347,19 +360,17 @@ class TestRemoveNonNumericProps:
         simple_model.props_metadata._add_prop(numeric_float32_prop)
         simple_model.props_metadata._add_prop(object_prop)
 
-        _remove_non_numeric_props(simple_model)
-
-        assert "area" in simple_model.get_properties()
-        assert "category" not in simple_model.get_properties()
+        assert _get_non_numeric_props(simple_model) == ["category"]
+        exported_props = _get_exported_props(simple_model)
+        assert "area" in exported_props
+        assert "category" not in exported_props
 
     def test_handles_protected_properties(self, simple_model, dict_prop):
         """Test that protected properties can still be removed if non-numeric."""
         simple_model.props_metadata._add_prop(dict_prop)
         simple_model.props_metadata._protect_prop("metadata")
 
-        _remove_non_numeric_props(simple_model)
-
-        assert "metadata" not in simple_model.get_properties()
+        assert "metadata" not in _get_exported_props(simple_model)
 
     def test_warns_about_removed_properties(
         self, caplog, simple_model, string_prop, list_prop
@@ -369,7 +380,7 @@ class TestRemoveNonNumericProps:
         simple_model.props_metadata._add_prop(list_prop)
 
         with caplog.at_level(logging.WARNING, logger="pycellin.io.trackmate.exporter"):
-            _remove_non_numeric_props(simple_model)
+            _get_TrackMate_view(simple_model, propagate=False)
         assert len(caplog.records) == 1
         assert caplog.records[0].levelname == "WARNING"
         assert "Ignoring properties: label, tags" in caplog.records[0].message
@@ -378,13 +389,19 @@ class TestRemoveNonNumericProps:
         """Test that boolean dtypes are preserved as numeric."""
         simple_model.props_metadata._add_prop(bool_prop)
 
-        _remove_non_numeric_props(simple_model)
+        assert "is_division" in _get_exported_props(simple_model)
+
 
-        assert "is_division" in simple_model.get_properties()
+def _relabel_nodes(model):
+    """Relabel the nodes of a model as for a TrackMate export."""
+    view = _ExportView(model)
+    _add_relabel_overlay(view)
+    view.materialize()
+    return view.relabel
 
 
 class TestRelabelNodes:
-    """Test cases for _relabel_nodes function."""
+    """Test cases for the relabeling of the nodes."""
 
     def test_unique_ids_no_relabel(self, model_unique_ids):
         """Test that nodes with unique IDs are not relabeled."""
@@ -392,7 +409,7 @@ class TestRelabelNodes:
         original_nodes = set(lin.nodes())
         original_cell_ids = {node: lin.nodes[node]["cell_ID"] for node in lin.nodes()}
 
-        _relabel_nodes(model_unique_ids)
+        assert _relabel_nodes(model_unique_ids) == {}
 
         # Nodes should remain unchanged
         assert set(lin.nodes()) == original_nodes
@@ -445,18 +462,30 @@ class TestRelabelNodes:
             for node in lin.nodes():
                 assert lin.nodes[node]["cell_ID"] == node
 
-    def test_with_cycle_lins(self, model_non_unique_ids):
-        """Test that cycle lineage nodes are also relabeled.."""
+    def test_with_cycle_lins(self, model_non_unique_ids, tmp_path):
+        """Test that cycle lineage nodes of the exported model are also relabeled."""
         model_non_unique_ids.add_cycle_data()
         original_ids = []
         for lin in model_non_unique_ids.data.cycle_data.values():
             original_ids.extend(lin.nodes())
 
-        _relabel_nodes(model_non_unique_ids)
+        exported = export_TrackMate_XML(
+            model_non_unique_ids,
+            tmp_path / "relabeled.xml",
+            units={"space": "pixel", "time": "frame"},
+            return_exported_model=True,
+        )
 
         new_ids = []
-        for lin in model_non_unique_ids.data.cycle_data.values():
+        for lin_id, lin in exported.data.cycle_data.items():
             new_ids.extend(lin.nodes())
+            cells = exported.data.cell_data[lin_id]
+            for cycle, attrs in lin.nodes(data=True):
+                # Cycle IDs are the IDs of the last cell of each cycle.
+                assert attrs["cycle_ID"] == cycle
+                assert cells.get_cell_cycle(cycle)[-1] == cycle
+            # Non-numeric properties are not exported.
+            assert "cells" not in exported.get_properties()
 
         assert len(original_ids) != len(set(original_ids))
         assert len(original_ids) == len(new_ids)
@@ -497,3 +526,233 @@ class TestRelabelNodes:
                     assert lin.nodes[node]["cell_name"] == f"ID{node}"
                 else:
                     assert lin.nodes[node]["cell_name"] == f"Cell{inv_mapping[node]}"
+
+
+class TestValueToStr:
+    """Test cases for _value_to_str function."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (0.1, "0.1"),
+            (1e20, "1e+20"),
+            (3, "3"),
+            (True, "1"),
+            (False, "0"),
+            (math.nan, "NaN"),
+            (math.inf, "Infinity"),
+            (-math.inf, "-Infinity"),
+            (np.float32(0.5), "0.5"),
+            (np.int64(7), "7"),
+            ("abc", "abc"),
+        ],
+    )
+    def test_conversion(self, value, expected):
+        """Test the conversion of the supported types."""
+        assert _value_to_str(value) == expected
+
+
+class TestWriteSpots:
+    """Test cases for the spot writing functions."""
+
+    def test_group_spots_by_frame(self, simple_model):
+        """Test that spots of all lineages are grouped by frame in lineage order."""
+        lin1 = CellLineage()
+        lin1.add_node(1, FRAME=0)
+        lin1.add_node(2, FRAME=1)
+        lin2 = CellLineage()
+        lin2.add_node(3, FRAME=1)
+        lin2.add_node(4, FRAME=0)
+        simple_model.data.cell_data = {1: lin1, 2: lin2}
+        spots = _group_spots_by_frame(_ExportView(simple_model))
+        assert {f: [(lid, nid) for lid, nid, _ in v] for f, v in spots.items()} == {
+            0: [(1, 1), (2, 4)],
+            1: [(1, 2), (2, 3)],
+        }
+        assert spots[0][0][2] is lin1.nodes[1]
+        assert spots[0][1][2] is lin2.nodes[4]
+
+    def test_create_spot_with_roi(self):
+        """Test that the ROI is written as the text of the spot."""
+        attrs = {
+            "ID": 1,
+            "TRACK_ID": 0,
+            "POSITION_X": 1.5,
+            "ROI_coords": np.array([[0.0, 1.0], [2.5, 3.0]]),
+        }
+        spot = _create_Spot(attrs)
+        assert dict(spot.attrib) == {
+            "ID": "1",
+            "POSITION_X": "1.5",
+            "ROI_N_POINTS": "2",
+        }
+        assert spot.text == "0.0 1.0 2.5 3.0"
+
+    def test_create_spot_without_roi(self):
+        """Test that a spot without ROI has no point."""
+        spot = _create_Spot({"ID": 1, "POSITION_X": math.nan})
+        assert dict(spot.attrib) == {
+            "ID": "1",
+            "POSITION_X": "NaN",
+            "ROI_N_POINTS": "0",
+        }
+        assert spot.text is None
+
+    def test_render_spots_in_frame(self):
+        """Test that the serialized frames match the streamed XML layout."""
+        block = _render_SpotsInFrame([(0, [{"ID": 1}, {"ID": 2}]), (1, [{"ID": 3}])])
+        assert block == (
+            b'\n      <SpotsInFrame frame="0">'
+            b'\n        <Spot ID="1" ROI_N_POINTS="0"/>'
+            b'\n        <Spot ID="2" ROI_N_POINTS="0"/>'
+            b"\n      </SpotsInFrame>"
+            b'\n      <SpotsInFrame frame="1">'
+            b'\n        <Spot ID="3" ROI_N_POINTS="0"/>'
+            b"\n      </SpotsInFrame>"
+        )
+
+    def test_render_tracks(self):
+        """Test that tracks are serialized with their edges, if any."""
+        block = _render_Tracks(
+            [
+                ({"TRACK_ID": 0, "FilteredTrack": True}, [{"SPOT_SOURCE_ID": 1}]),
+                ({"TRACK_ID": 1}, []),
+            ]
+        )
+        assert block == (
+            b'\n      <Track TRACK_ID="0">'
+            b'\n        <Edge SPOT_SOURCE_ID="1"/>'
+            b"\n      </Track>"
+            b'\n      <Track TRACK_ID="1">'
+            b"\n      </Track>"
+        )
+
+    @pytest.mark.parametrize("max_items", [1, 3, 100])
+    def test_batch_tasks(self, max_items):
+        """Test that batches keep all the tasks in order."""
+        tasks = [(i, list(range(i))) for i in range(5)]
+        batches = list(_batch_tasks(tasks, max_items))
+        assert [task for batch in batches for task in batch] == tasks
+        assert all(batches)
+
+    def test_export_with_workers(self, model_non_unique_ids, tmp_path):
+        """Test that the XML file does not depend on the number of workers."""
+        units = {"space": "pixel", "time": "frame"}
+        export_TrackMate_XML(model_non_unique_ids, tmp_path / "serial.xml", units)
+        export_TrackMate_XML(
+            model_non_unique_ids, tmp_path / "parallel.xml", units, workers=2
+        )
+        serial = (tmp_path / "serial.xml").read_bytes()
+        assert serial == (tmp_path / "parallel.xml").read_bytes()
+        assert serial.count(b"<Spot ") == 7
+
+    def test_export_with_invalid_workers(self, simple_model, tmp_path):
+        """Test that the number of workers must be positive."""
+        with pytest.raises(ValueError, match="workers"):
+            export_TrackMate_XML(
+                simple_model,
+                tmp_path / "model.xml",
+                units={"space": "pixel", "time": "frame"},
+                workers=0,
+            )
+
+    def test_export_spots_sorted_by_frame(self, model_unique_ids, tmp_path):
+        """Test that all the spots are exported, frame by frame."""
+        xml_path = tmp_path / "model.xml"
+        export_TrackMate_XML(
+            model_unique_ids, xml_path, units={"space": "pixel", "time": "frame"}
+        )
+        tree = ET.parse(xml_path)
+        all_spots = tree.find("Model/AllSpots")
+        assert all_spots.get("nspots") == "7"
+        frames = [int(el.get("frame")) for el in all_spots.iter("SpotsInFrame")]
+        assert frames == [0, 1, 2, 3]
+        for el in all_spots.iter("SpotsInFrame"):
+            assert {spot.get("FRAME") for spot in el.iter("Spot")} == {el.get("frame")}
+        assert len(list(all_spots.iter("Spot"))) == 7
+
+
+def _xml_to_tuple(el):
+    # The order of the spots of a frame and of the edges of a track is irrelevant.
+    return (
+        el.tag,
+        sorted(el.attrib.items()),
+        (el.text or "").strip(),
+        sorted(_xml_to_tuple(child) for child in el),
+    )
+
+
+def _assert_same_xml(el1, el2):
+    assert _xml_to_tuple(el1) == _xml_to_tuple(el2)
+
+
+class TestExportView:
+    """Test cases for the export without copy of the model."""
+
+    @pytest.fixture
+    def model(self, model_non_unique_ids):
+        model = model_non_unique_ids
+        for lid, lin in model.data.cell_data.items():
+            for nid in lin.nodes:
+                lin.nodes[nid]["cell_name"] = f"ID{nid}"
+                lin.nodes[nid]["label"] = f"cell {nid}"
+                lin.nodes[nid]["radius"] = 2.0 * nid
+        for identifier, dtype in [("label", "string"), ("radius", "float")]:
+            model.props_metadata._add_prop(
+                Property(
+                    identifier=identifier,
+                    name=identifier,
+                    description=identifier,
+                    provenance="test",
+                    prop_type="node",
+                    lin_type="CellLineage",
+                    dtype=dtype,
+                )
+            )
+        model.add_cycle_data()
+        model.add_pycellin_properties(["division_time", "cycle_completeness"])
+        model.update()
+        return model
+
+    @pytest.mark.parametrize("propagate", [False, True])
+    def test_same_xml_as_copy(self, model, tmp_path, propagate):
+        """Test that the XML is the same with or without copy of the model."""
+        units = {"space": "pixel", "time": "frame"}
+        copy_path = tmp_path / "copy.xml"
+        view_path = tmp_path / "view.xml"
+        exported = export_TrackMate_XML(
+            model,
+            copy_path,
+            units=units,
+            propagate_cycle_props=propagate,
+            return_exported_model=True,
+        )
+        assert isinstance(exported, Model)
+        result = export_TrackMate_XML(
+            model, view_path, units=units, propagate_cycle_props=propagate
+        )
+        assert result is None
+        _assert_same_xml(ET.parse(copy_path).getroot(), ET.parse(view_path).getroot())
+        spots = ET.parse(view_path).getroot().iter("Spot")
+        ids = [int(spot.get("ID")) for spot in spots]
+        assert len(ids) == len(set(ids))
+
+    def test_model_not_modified(self, model, tmp_path):
+        """Test that the data and metadata of the model are not modified."""
+        nodes = {
+            lid: {nid: dict(attrs) for nid, attrs in lin.nodes(data=True)}
+            for lid, lin in model.data.cell_data.items()
+        }
+        props = set(model.get_properties())
+        export_TrackMate_XML(
+            model,
+            tmp_path / "view.xml",
+            units={"space": "pixel", "time": "frame"},
+            propagate_cycle_props=True,
+        )
+        assert {
+            lid: {nid: dict(attrs) for nid, attrs in lin.nodes(data=True)}
+            for lid, lin in model.data.cell_data.items()
+        } == nodes
+        assert set(model.get_properties()) == props
+        assert "RADIUS" not in model.get_properties()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit test for trackpy exporter."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pycellin.classes import CellLineage, Data, Model
+from pycellin.io.trackmate.loader import load_TrackMate_XML
+from pycellin.io.trackpy.exporter import export_trackpy_dataframe
+
+
+# Fixtures ####################################################################
+
+
+@pytest.fixture
+def model():
+    # 1 -> 2 -> 3 (division) -> 4 -> 5 and 3 -> 6.
+    lin1 = CellLineage()
+    lin1.graph["lineage_ID"] = 1
+    lin1.add_edges_from([(1, 2), (2, 3), (3, 4), (4, 5), (3, 6)])
+    # 10 (division) -> 11 and 10 -> 12 -> 13.
+    lin2 = CellLineage()
+    lin2.graph["lineage_ID"] = 2
+    lin2.add_edges_from([(10, 11), (10, 12), (12, 13)])
+    # One-node lineage.
+    lin3 = CellLineage()
+    lin3.graph["lineage_ID"] = -20
+    lin3.add_node(20)
+    frames = {1: 0, 2: 1, 3: 2, 4: 3, 5: 4, 6: 3, 10: 0, 11: 1, 12: 1, 13: 2, 20: 0}
+    for lin in (lin1, lin2, lin3):
+        for cid in lin.nodes:
+            lin.nodes[cid]["cell_ID"] = cid
+            lin.nodes[cid]["timepoint"] = frames[cid]
+            lin.nodes[cid]["cell_x"] = float(cid)
+            lin.nodes[cid]["cell_y"] = -float(cid)
+    data = Data({1: lin1, 2: lin2, -20: lin3})
+    model = Model(data=data, reference_time_property="timepoint")
+    model.add_pycellin_properties(["is_division", "is_leaf", "is_root"])
+    model.update()
+    return model
+
+
+# export_trackpy_dataframe ####################################################
+
+
+def test_export_trackpy_dataframe(model):
+    df = export_trackpy_dataframe(model)
+    # Expected output of the export by division removal on a model copy:
+    # the largest track of a lineage keeps its ID, the other tracks get new IDs,
+    # one-cell tracks last, in lineage order.
+    expected = pd.DataFrame(
+        [
+            # cell_ID, frame, particle, lineage_ID_Pycellin, is_root, is_leaf
+            (1, 0, 1, 1, True, False),
+            (2, 1, 1, 1, False, False),
+            (3, 2, 1, 1, False, True),
+            (12, 1, 2, 2, True, False),
+            (13, 2, 2, 2, False, True),
+            (4, 3, 3, 1, True, False),
+            (5, 4, 3, 1, False, True),
+            (20, 0, 4, -20, True, True),
+            (6, 3, 5, 1, True, True),
+            (10, 0, 6, 2, True, True),
+            (11, 1, 7, 2, True, True),
+        ],
+        columns=[
+            "cell_ID",
+            "frame",
+            "particle",
+            "lineage_ID_Pycellin",
+            "is_root",
+            "is_leaf",
+        ],
+    )
+    assert list(df.columns[:2]) == ["y", "x"]
+    assert list(df.columns[-2:]) == ["frame", "particle"]
+    result = df[expected.columns].reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    assert not df["is_division"].any()
+    assert (df["x"] == df["cell_ID"]).all()
+
+
+def test_export_trackpy_dataframe_does_not_modify_model(model):
+    lin1_edges = list(model.data.cell_data[1].edges)
+    export_trackpy_dataframe(model)
+    assert list(model.data.cell_data) == [1, 2, -20]
+    assert list(model.data.cell_data[1].edges) == lin1_edges
+    assert model.data.cell_data[1].nodes[3]["is_division"]
+    assert not model.is_update_required()
+
+
+def test_export_trackpy_dataframe_sample_data():
+    xml_path = (
+        Path(__file__).resolve().parents[3]
+        / "sample_data"
+        / "Ecoli_growth_on_agar_pad.xml"
+    )
+    model = load_TrackMate_XML(str(xml_path))
+    model.add_pycellin_properties(["is_division", "is_leaf", "is_root"])
+    model.update()
+    df = export_trackpy_dataframe(model)
+    # Values of the export by division removal on a model copy.
+    assert len(df) == 526
+    assert sorted(df["particle"].unique()) == list(range(145))
+    track_sizes = df.groupby("particle").size().value_counts().to_dict()
+    assert track_sizes == {
+        1: 29, 2: 21, 3: 24, 4: 25, 5: 17, 6: 19, 7: 5, 8: 1, 10: 3, 11: 1
+    }
+    assert df[["cell_ID", "particle"]].head(3).values.tolist() == [
+        [9095, 0],
+        [9143, 0],
+        [9159, 0],
+    ]
+    assert df[["cell_ID", "particle"]].tail(3).values.tolist() == [
+        [9439, 142],
+        [9461, 143],
+        [8990, 144],
+    ]
+    assert df["is_root"].sum() == df["is_leaf"].sum() == 145
+    assert not df["is_division"].any()